@@ -0,0 +1,105 @@
+import os
+import random
+import threading
+import time
+from db import get_db_connection
+
+# Catalog configuration
+ACTIVITY_CATALOG_TTL = int(os.getenv('ACTIVITY_CATALOG_TTL', 0))  # seconds between refreshes, 0 = load once
+ACTIVITY_CATALOG_RETRY = 30  # seconds to wait before retrying a failed initial load
+
+class ActivityCatalog:
+    """Wellness activities loaded once per process and indexed by category"""
+
+    def __init__(self, ttl=ACTIVITY_CATALOG_TTL):
+        self.ttl = ttl
+        self._by_category = {}
+        self._by_id = {}
+        self._loaded_at = None
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+
+    def reload(self, activities=None):
+        """Rebuild the catalog from the database, or from the given activity rows"""
+        if activities is None:
+            conn = get_db_connection()
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute("SELECT * FROM wellness_activities")
+            activities = cursor.fetchall()
+            cursor.close()
+            conn.close()
+
+        by_category = {}
+        by_id = {}
+        for activity in activities:
+            by_category.setdefault(activity['category'], []).append(activity)
+            if activity.get('id') is not None:
+                by_id[activity['id']] = activity
+
+        now = time.monotonic()
+        with self._lock:
+            # Swap whole indexes so readers never see a half-built catalog
+            self._by_category = {category: tuple(rows) for category, rows in by_category.items()}
+            self._by_id = by_id
+            self._loaded_at = now
+            self._next_refresh = now + self.ttl if self.ttl else float('inf')
+
+        return len(activities)
+
+    def invalidate(self):
+        """Force a reload on next access"""
+        with self._lock:
+            self._next_refresh = 0.0
+
+    def _ensure_fresh(self):
+        if time.monotonic() < self._next_refresh:
+            return
+        with self._reload_lock:
+            # Another thread may have refreshed while we waited
+            if time.monotonic() < self._next_refresh:
+                return
+            try:
+                self.reload()
+            except Exception as e:
+                print(f"Error loading wellness activities: {e}")
+                with self._lock:
+                    # Keep serving what we have; retry later instead of on every call
+                    self._next_refresh = time.monotonic() + (self.ttl or ACTIVITY_CATALOG_RETRY)
+
+    def get_random(self, category):
+        """Return a random activity in category, or None"""
+        self._ensure_fresh()
+        activities = self._by_category.get(category)
+        if not activities:
+            return None
+        return dict(random.choice(activities))
+
+    def get(self, activity_id):
+        """Return the activity with the given id, or None"""
+        self._ensure_fresh()
+        activity = self._by_id.get(activity_id)
+        return dict(activity) if activity else None
+
+    def categories(self):
+        """Return the categories that have at least one activity"""
+        self._ensure_fresh()
+        return sorted(self._by_category)
+
+_catalog = ActivityCatalog()
+
+def get_wellness_activity_by_category(category='breathing'):
+    """Get a random wellness activity by category"""
+    return _catalog.get_random(category)
+
+def get_activity(activity_id):
+    """Get a wellness activity by id"""
+    return _catalog.get(activity_id)
+
+def reload_catalog(activities=None):
+    """Reload the activity catalog now (from the database unless rows are given)"""
+    return _catalog.reload(activities)
+
+def invalidate_catalog():
+    """Mark the activity catalog stale so it reloads on next use"""
+    _catalog.invalidate()
@@ -0,0 +1,146 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from activity_catalog import get_wellness_activity_by_category
+from metrics import span
+from sentiment_analysis import analyze_sentiment_and_recommend, analyze_sentiment_basic, fallback_result
+
+# Analysis worker pool configuration
+SENTIMENT_WORKERS = int(os.getenv('SENTIMENT_WORKERS', 0))  # 0 = analyze inline in the request thread
+SENTIMENT_TIMEOUT = float(os.getenv('SENTIMENT_TIMEOUT', 2.0))  # seconds a request waits before falling back
+SENTIMENT_MAX_PENDING = int(os.getenv('SENTIMENT_MAX_PENDING', max(1, SENTIMENT_WORKERS) * 4))
+
+def _warm_worker():
+    """Load and exercise the sentiment engine once so the first real request is fast"""
+    analyze_sentiment_basic("warming up the sentiment lexicon")
+
+class AnalysisPool:
+    """Runs sentiment analysis in worker processes with a bounded wait and queue"""
+
+    def __init__(self, workers=SENTIMENT_WORKERS, timeout=SENTIMENT_TIMEOUT, max_pending=SENTIMENT_MAX_PENDING):
+        self.workers = workers
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self._executor = None
+        self._slots = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.submitted = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.errors = 0
+
+    def _get_executor(self):
+        """Start the worker processes for this process (e.g. gunicorn worker)"""
+        if self._pid == os.getpid() and self._executor is not None:
+            return self._executor
+
+        with self._lock:
+            if self._pid != os.getpid() or self._executor is None:
+                # spawn, not fork: forking a threaded web worker can deadlock
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_warm_worker
+                )
+                self._slots = threading.BoundedSemaphore(self.max_pending)
+                self._pid = os.getpid()
+            return self._executor
+
+    def _reset_executor(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def start(self):
+        """Spin up the workers ahead of the first request"""
+        if self.workers > 0:
+            self._get_executor()
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        executor, self._executor = self._executor, None
+        if executor is not None and self._pid == os.getpid():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def analyze(self, text, question_index=0, all_answers=None):
+        """Analyze a check-in, falling back to a neutral result when overloaded or slow"""
+        if self.workers <= 0:
+            return analyze_sentiment_and_recommend(text, question_index, all_answers)
+
+        executor = self._get_executor()
+        slots = self._slots
+
+        # Backpressure: never queue more work than the workers can get through
+        if not slots.acquire(blocking=False):
+            self.rejected += 1
+            print("Sentiment analysis queue is full, using fallback result")
+            return self._finish(fallback_result())
+
+        try:
+            future = executor.submit(analyze_sentiment_and_recommend, text, question_index, all_answers, False)
+        except BrokenProcessPool as e:
+            slots.release()
+            self.errors += 1
+            print(f"Sentiment worker pool is broken, restarting: {e}")
+            self._reset_executor(executor)
+            return self._finish(fallback_result())
+
+        # The slot is held until the work really finishes, even if we stop waiting
+        future.add_done_callback(lambda _: slots.release())
+        self.submitted += 1
+
+        try:
+            result = future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            self.timeouts += 1
+            print(f"Sentiment analysis took longer than {self.timeout}s, using fallback result")
+            return self._finish(fallback_result())
+        except Exception as e:
+            self.errors += 1
+            print(f"Error in sentiment worker: {e}")
+            if isinstance(e, BrokenProcessPool):
+                self._reset_executor(executor)
+            return self._finish(fallback_result())
+
+        self.completed += 1
+        return self._finish(result)
+
+    def _finish(self, result):
+        """Resolve the suggested activity here; workers never touch the database"""
+        if result.get('suggested_activity') is None and result.get('activity_category'):
+            result['suggested_activity'] = get_wellness_activity_by_category(result['activity_category'])
+        return result
+
+    def stats(self):
+        """Return queue and outcome counters"""
+        return {
+            'workers': self.workers,
+            'timeout': self.timeout,
+            'max_pending': self.max_pending,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'timeouts': self.timeouts,
+            'rejected': self.rejected,
+            'errors': self.errors
+        }
+
+analysis_pool = AnalysisPool()
+atexit.register(analysis_pool.shutdown)
+
+def analyze_checkin(text, question_index=0, all_answers=None):
+    """Analyze a check-in using the configured execution mode"""
+    with span('sentiment.analyze'):
+        return analysis_pool.analyze(text, question_index, all_answers)
+
+def get_analysis_pool_stats():
+    """Return metrics for the analysis worker pool"""
+    return analysis_pool.stats()
@@ -1,13 +1,37 @@
-from flask import Flask, request, jsonify, session, render_template, redirect, url_for
+import time
+_import_started = time.perf_counter()
+
+from flask import Flask, Response, request, jsonify, session, render_template, redirect, url_for, g
 from flask_cors import CORS
 from werkzeug.security import generate_password_hash, check_password_hash
-import uuid
 import json
-import requests
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import os
-from db import get_db_connection, init_db
-from sentiment_analysis import analyze_sentiment_and_recommend
+import queue
+import uuid
+from db import get_db_connection, get_pool_stats, init_db
+from sentiment_analysis import (NUMERIC_QUESTION_INDEXES, analyze_batch, checkin_question_kind,
+                                get_analysis_cache_stats, get_contextual_response)
+from insights_job import insights_task
+from history import EXPORT_FORMATS, stream_checkin_export
+from dashboard import (DASHBOARD_CHECKINS_LIMIT, build_dashboard, checkin_history_payload, daily_tip,
+                       dashboard_etag_parts, get_cache_version, parse_sections, profile_payload,
+                       subscription_expired_at, wellness_stats_payload)
+from http_cache import (is_not_modified, last_modified, make_etag, not_modified, start_of_day, until_midnight,
+                        with_validators)
+from analysis_pool import analysis_pool, analyze_checkin, get_analysis_pool_stats
+from checkins import build_checkin_row, insert_checkins
+from checkin_writer import checkin_writer, write_behind_enabled
+from checkin_conversations import (CHECKIN_CONVERSATION_TTL, SUMMARY_QUESTION_INDEX, ConversationNotFound,
+                                   complete_conversation, record_answer, start_conversation)
+from session_store import SESSION_TTL, get_session_store
+from auth import login_required, page_login_required, premium_required
+from payment_client import PaymentGatewayError, get_payment_client_stats, intasend_client, intasend_configured
+from payment_webhooks import enqueue_webhook, webhook_processor
+from subscriptions import activate_premium, subscription_sweeper
+from entitlements import get_entitlement, get_entitlement_cache_stats, is_premium
+from metrics import (METRICS_TOKEN, TRACE_SAMPLE_RATE, Gauge, begin_request, end_request, recent_traces,
+                     register, render_prometheus, stats_gauge)
 
 app = Flask(__name__)
 app.secret_key = os.getenv('SECRET_KEY', 'your-secret-key-change-this')
@@ -15,158 +39,142 @@ app.secret_key = os.getenv('SECRET_KEY', 'your-secret-key-change-this')
 # Enable CORS for all routes
 CORS(app, supports_credentials=True)
 
-# In-memory session storage (in production, use Redis or database)
-user_sessions = {}
+# Shared, expiring session storage (database-backed with an in-process cache)
+session_store = get_session_store()
 
 # IntaSend configuration
-INTASEND_API_KEY = os.getenv('INTASEND_API_KEY', 'your-intasend-api-key')
-INTASEND_SECRET_KEY = os.getenv('INTASEND_SECRET_KEY', 'your-intasend-secret-key')
-INTASEND_BASE_URL = 'https://sandbox.intasend.com'  # Use production URL in production
 PREMIUM_PRICE = 4900  # $49.00 in cents
 
-# Initialize database on startup
-with app.app_context():
-    init_db()
+# Maximum number of messages accepted by /api/checkin/batch
+CHECKIN_BATCH_MAX = int(os.getenv('CHECKIN_BATCH_MAX', 100))
+
+# Schema setup is not run on import: use `python db.py migrate` (the Procfile
+# release step) so workers boot without touching MySQL
+
+# Startup timings in milliseconds, reported by /api/health
+startup_timings = {}
+
+_background_pid = None
+
+def start_background_workers():
+    """Start this process's background threads and worker pool
+
+    Called once per serving process: from gunicorn's post_fork hook (see
+    gunicorn.conf.py) or before the development server runs. Threads and
+    pools must not be started in a preloading master, they would not
+    survive the fork.
+    """
+    global _background_pid
+    started = time.perf_counter()
+    _background_pid = os.getpid()
+
+    # Warm the sentiment worker processes (no-op when analyzing inline)
+    analysis_pool.start()
+
+    # Refresh aggregate insights in the background (no-op unless INSIGHTS_JOB_INTERVAL is set)
+    insights_task.start()
+
+    # Apply queued payment webhooks in the background
+    webhook_processor.start()
+
+    # Downgrade subscriptions past their end date in the background
+    subscription_sweeper.start()
+
+    startup_timings['background_start_ms'] = round((time.perf_counter() - started) * 1000, 1)
+
+@app.before_request
+def ensure_background_workers():
+    """Start background work on first request under servers without a post_fork hook"""
+    if _background_pid != os.getpid():
+        start_background_workers()
+
+@app.before_request
+def start_request_metrics():
+    g.metrics_token = begin_request(f'{request.method} {request.path}')
+
+@app.after_request
+def record_request_metrics(response):
+    token = g.pop('metrics_token', None)
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    end_request(token, request.method, route, response.status_code)
+    return response
+
+@app.teardown_request
+def finish_failed_request_metrics(error=None):
+    # after_request is skipped when a view raises
+    token = g.pop('metrics_token', None)
+    if token is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        end_request(token, request.method, route, 500)
+
+# Point-in-time values from the existing stats, read at scrape time
+register(stats_gauge('mindease_db_pool_connections', 'Pooled database connections by state', 'state',
+                     get_pool_stats, ('in_use', 'idle', 'total')))
+register(stats_gauge('mindease_db_pool_events_total', 'Connection pool checkouts, waits and timeouts', 'event',
+                     get_pool_stats, ('checkouts', 'waits', 'timeouts'), 'counter'))
+register(stats_gauge('mindease_sentiment_cache_events_total', 'Sentiment analysis cache lookups', 'event',
+                     get_analysis_cache_stats, ('hits', 'misses', 'evictions'), 'counter'))
+register(stats_gauge('mindease_analysis_pool_events_total', 'Sentiment worker pool outcomes', 'event',
+                     get_analysis_pool_stats, ('completed', 'timeouts', 'rejected', 'errors'), 'counter'))
+register(stats_gauge('mindease_payment_webhooks_total', 'Payment webhook outcomes', 'outcome',
+                     webhook_processor.stats, ('applied', 'retried', 'dead_lettered'), 'counter'))
+register(Gauge('mindease_intasend_circuit_open', 'Whether the IntaSend circuit breaker is open', (),
+               lambda: {(): int(intasend_client.breaker.state == 'open')}))
 
 # IntaSend helper functions
 def create_intasend_customer(email, name):
     """Create a customer in IntaSend"""
+    demo_customer = {
+        'id': f'demo_customer_{hash(email) % 10000}',
+        'email': email,
+        'name': name
+    }
+    
+    # Check if we have valid API keys
+    if not intasend_configured():
+        app.logger.warning("IntaSend API keys not configured, using demo mode")
+        return demo_customer
+    
     try:
-        # Check if we have valid API keys
-        if INTASEND_API_KEY == 'your-intasend-api-key' or INTASEND_SECRET_KEY == 'your-intasend-secret-key':
-            app.logger.warning("IntaSend API keys not configured, using demo mode")
-            return {
-                'id': f'demo_customer_{hash(email) % 10000}',
-                'email': email,
-                'name': name
-            }
-        
-        headers = {
-            'Authorization': f'Bearer {INTASEND_API_KEY}',
-            'Content-Type': 'application/json'
-        }
-        
-        data = {
-            'email': email,
-            'name': name
-        }
-        
-        response = requests.post(
-            f'{INTASEND_BASE_URL}/api/v1/customers/',
-            headers=headers,
-            json=data,
-            timeout=10  # Add timeout
-        )
-        
-        if response.status_code == 201:
-            return response.json()
-        else:
-            app.logger.error(f"IntaSend customer creation failed: {response.status_code} - {response.text}")
-            # Return demo customer if IntaSend is down
-            return {
-                'id': f'demo_customer_{hash(email) % 10000}',
-                'email': email,
-                'name': name
-            }
-            
-    except requests.exceptions.RequestException as e:
-        app.logger.error(f"IntaSend connection error: {str(e)}")
-        # Return demo customer if IntaSend is unreachable
-        return {
-            'id': f'demo_customer_{hash(email) % 10000}',
-            'email': email,
-            'name': name
-        }
+        return intasend_client.create_customer(email, name)
+    except PaymentGatewayError as e:
+        app.logger.error(f"IntaSend customer creation error: {str(e)}")
+        # Return demo customer if IntaSend is down or unreachable
+        return demo_customer
     except Exception as e:
         app.logger.error(f"IntaSend customer creation error: {str(e)}")
         return None
 
 def create_intasend_payment_link(customer_id, amount, description):
     """Create a payment link in IntaSend"""
+    demo_link = {
+        'id': f'demo_payment_{hash(customer_id) % 10000}',
+        'payment_url': f'{request.host_url}payment/demo?amount={amount}&customer={customer_id}',
+        'amount': amount,
+        'currency': 'USD',
+        'status': 'pending'
+    }
+    
+    # Check if we have valid API keys or if customer is demo
+    if not intasend_configured() or customer_id.startswith('demo_customer_'):
+        app.logger.warning("IntaSend API keys not configured or demo mode, creating demo payment link")
+        return demo_link
+    
     try:
-        # Check if we have valid API keys or if customer is demo
-        if (INTASEND_API_KEY == 'your-intasend-api-key' or 
-            INTASEND_SECRET_KEY == 'your-intasend-secret-key' or
-            customer_id.startswith('demo_customer_')):
-            
-            app.logger.warning("IntaSend API keys not configured or demo mode, creating demo payment link")
-            return {
-                'id': f'demo_payment_{hash(customer_id) % 10000}',
-                'payment_url': f'{request.host_url}payment/demo?amount={amount}&customer={customer_id}',
-                'amount': amount,
-                'currency': 'USD',
-                'status': 'pending'
-            }
-        
-        headers = {
-            'Authorization': f'Bearer {INTASEND_API_KEY}',
-            'Content-Type': 'application/json'
-        }
-        
-        data = {
+        return intasend_client.create_payment_link({
             'customer': customer_id,
             'amount': amount,
             'currency': 'USD',
             'description': description,
             'redirect_url': f'{request.host_url}payment/success',
             'webhook_url': f'{request.host_url}api/payment/webhook'
-        }
-        
-        response = requests.post(
-            f'{INTASEND_BASE_URL}/api/v1/payment-links/',
-            headers=headers,
-            json=data,
-            timeout=10
-        )
-        
-        if response.status_code == 201:
-            return response.json()
-        else:
-            app.logger.error(f"IntaSend payment link creation failed: {response.status_code} - {response.text}")
-            # Return demo payment link if IntaSend is down
-            return {
-                'id': f'demo_payment_{hash(customer_id) % 10000}',
-                'payment_url': f'{request.host_url}payment/demo?amount={amount}&customer={customer_id}',
-                'amount': amount,
-                'currency': 'USD',
-                'status': 'pending'
-            }
-            
-    except requests.exceptions.RequestException as e:
-        app.logger.error(f"IntaSend connection error: {str(e)}")
-        # Return demo payment link if IntaSend is unreachable
-        return {
-            'id': f'demo_payment_{hash(customer_id) % 10000}',
-            'payment_url': f'{request.host_url}payment/demo?amount={amount}&customer={customer_id}',
-            'amount': amount,
-            'currency': 'USD',
-            'status': 'pending'
-        }
-    except Exception as e:
+        })
+    except PaymentGatewayError as e:
         app.logger.error(f"IntaSend payment link creation error: {str(e)}")
-        return None
-
-def verify_intasend_payment(payment_id):
-    """Verify payment status with IntaSend"""
-    try:
-        headers = {
-            'Authorization': f'Bearer {INTASEND_API_KEY}',
-            'Content-Type': 'application/json'
-        }
-        
-        response = requests.get(
-            f'{INTASEND_BASE_URL}/api/v1/payments/{payment_id}/',
-            headers=headers
-        )
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            app.logger.error(f"IntaSend payment verification failed: {response.text}")
-            return None
-            
+        # Return demo payment link if IntaSend is down or unreachable
+        return demo_link
     except Exception as e:
-        app.logger.error(f"IntaSend payment verification error: {str(e)}")
+        app.logger.error(f"IntaSend payment link creation error: {str(e)}")
         return None
 
 @app.route('/')
@@ -185,59 +193,21 @@ def login_page():
     return render_template('login.html')
 
 @app.route('/dashboard')
+@page_login_required
 def dashboard():
     """Serve the dashboard page"""
-    # Check if user is logged in
-    token = request.cookies.get('session_token')
-    if not token or token not in user_sessions:
-        return redirect(url_for('login_page'))
-    
     # Check if user is premium and redirect to premium dashboard
-    user_info = user_sessions[token]
-    user_id = user_info['user_id']
-    
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    cursor.execute(
-        "SELECT subscription_type FROM users WHERE id = %s",
-        (user_id,)
-    )
-    user = cursor.fetchone()
-    
-    cursor.close()
-    conn.close()
-    
-    if user and user['subscription_type'] == 'premium':
+    if is_premium(g.user):
         return redirect(url_for('premium_dashboard'))
     
     return render_template('dashboard.html')
 
 @app.route('/premium-dashboard')
+@page_login_required
 def premium_dashboard():
     """Serve the premium dashboard page"""
-    # Check if user is logged in
-    token = request.cookies.get('session_token')
-    if not token or token not in user_sessions:
-        return redirect(url_for('login_page'))
-    
     # Check if user is premium
-    user_info = user_sessions[token]
-    user_id = user_info['user_id']
-    
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    cursor.execute(
-        "SELECT subscription_type FROM users WHERE id = %s",
-        (user_id,)
-    )
-    user = cursor.fetchone()
-    
-    cursor.close()
-    conn.close()
-    
-    if not user or user['subscription_type'] != 'premium':
+    if not is_premium(g.user):
         return redirect(url_for('dashboard'))
     
     return render_template('premium-dashboard.html')
@@ -306,12 +276,7 @@ def signup():
         conn.close()
         
         # Create session
-        session_token = str(uuid.uuid4())
-        user_sessions[session_token] = {
-            'user_id': user_id,
-            'username': username,
-            'created_at': datetime.now().isoformat()
-        }
+        session_token = session_store.create(user_id, username)
         
         response = jsonify({
             'status': 'success',
@@ -323,7 +288,7 @@ def signup():
         })
         
         # Set session cookie
-        response.set_cookie('session_token', session_token, httponly=True, max_age=86400)  # 24 hours
+        response.set_cookie('session_token', session_token, httponly=True, max_age=SESSION_TTL)
         
         return response
         
@@ -366,12 +331,7 @@ def login():
             }), 401
         
         # Create session
-        session_token = str(uuid.uuid4())
-        user_sessions[session_token] = {
-            'user_id': user['id'],
-            'username': user['username'],
-            'created_at': datetime.now().isoformat()
-        }
+        session_token = session_store.create(user['id'], user['username'])
         
         response = jsonify({
             'status': 'success',
@@ -383,7 +343,7 @@ def login():
         })
         
         # Set session cookie
-        response.set_cookie('session_token', session_token, httponly=True, max_age=86400)  # 24 hours
+        response.set_cookie('session_token', session_token, httponly=True, max_age=SESSION_TTL)
         
         return response
         
@@ -398,8 +358,11 @@ def login():
 def logout():
     """Logout user and clear session"""
     token = request.cookies.get('session_token')
-    if token and token in user_sessions:
-        del user_sessions[token]
+    if token:
+        try:
+            session_store.delete(token)
+        except Exception as e:
+            app.logger.error(f"Logout error: {str(e)}")
     
     response = jsonify({
         'status': 'success',
@@ -410,19 +373,11 @@ def logout():
     return response
 
 @app.route('/api/checkin', methods=['POST'])
+@login_required
 def checkin():
     """Process daily check-in with sentiment analysis"""
     try:
-        # Check authentication
-        token = request.cookies.get('session_token')
-        if not token or token not in user_sessions:
-            return jsonify({
-                'status': 'error',
-                'message': 'Authentication required'
-            }), 401
-        
-        user_info = user_sessions[token]
-        user_id = user_info['user_id']
+        user_id = g.user['id']
         
         data = request.get_json()
         if not data or not data.get('message'):
@@ -436,29 +391,43 @@ def checkin():
         question = data.get('question', '')
         all_answers = data.get('all_answers', None)
         
-        # Analyze sentiment and get recommendation
-        analysis_result = analyze_sentiment_and_recommend(message, question_index, all_answers)
+        # Analyze sentiment and get recommendation (inline or in the worker pool)
+        analysis_result = analyze_checkin(message, question_index, all_answers)
         
-        # Store in database
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            """INSERT INTO checkins (user_id, message, sentiment, recommendation, 
-               question_index, question, created_at) 
-               VALUES (%s, %s, %s, %s, %s, %s, %s)""",
-            (user_id, message, analysis_result['sentiment'], 
-             analysis_result['recommendation'], question_index, question, datetime.now())
-        )
-        conn.commit()
-        checkin_id = cursor.lastrowid
-        
-        cursor.close()
-        conn.close()
+        # Idempotency key for retries: a UUID the client generated, or one of ours
+        client_id = data.get('client_id')
+        if client_id is not None:
+            try:
+                client_id = str(uuid.UUID(client_id))
+            except (TypeError, ValueError, AttributeError):
+                return jsonify({
+                    'status': 'error',
+                    'message': 'client_id must be a UUID'
+                }), 400
+        row = build_checkin_row(user_id, message, analysis_result, question_index, question,
+                                client_id=client_id)
+        
+        # Store in database: queued for the background writer, or inline.
+        # A queued check-in has no database id yet; client_id identifies it either way.
+        checkin_id = None
+        queued = False
+        if write_behind_enabled():
+            try:
+                checkin_writer.submit(row)
+                queued = True
+            except queue.Full:
+                app.logger.warning("Check-in write queue is full, inserting inline")
+        
+        if not queued:
+            conn = get_db_connection()
+            checkin_id = insert_checkins(conn, [row])
+            conn.commit()
+            conn.close()
         
         return jsonify({
             'status': 'success',
             'checkin_id': checkin_id,
+            'client_id': row['client_id'],
             'sentiment': analysis_result['sentiment'],
             'sentiment_score': analysis_result['sentiment_score'],
             'recommendation': analysis_result['recommendation'],
@@ -473,141 +442,295 @@ def checkin():
             'message': 'Internal server error'
         }), 500
 
-@app.route('/api/checkin-history', methods=['GET'])
-def get_checkin_history():
-    """Get user's check-in history"""
+@app.route('/api/checkin/batch', methods=['POST'])
+@login_required
+def checkin_batch():
+    """Analyze, and optionally store, many check-in messages in one request"""
     try:
-        # Check authentication
-        token = request.cookies.get('session_token')
-        if not token or token not in user_sessions:
+        user_id = g.user['id']
+        
+        data = request.get_json()
+        items = data.get('items') if data else None
+        if not isinstance(items, list) or not items:
             return jsonify({
                 'status': 'error',
-                'message': 'Authentication required'
-            }), 401
+                'message': 'A non-empty items list is required'
+            }), 400
         
-        user_info = user_sessions[token]
-        user_id = user_info['user_id']
+        if len(items) > CHECKIN_BATCH_MAX:
+            return jsonify({
+                'status': 'error',
+                'message': f'At most {CHECKIN_BATCH_MAX} items are allowed per batch'
+            }), 400
         
-        # Get limit from query params
-        limit = request.args.get('limit', 10, type=int)
+        persist = data.get('persist', True)
         
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        messages = []
+        question_indexes = []
+        questions = []
+        for index, item in enumerate(items):
+            item = item if isinstance(item, dict) else {}
+            question_index = item.get('question_index', 0)
+            if not isinstance(question_index, int) or isinstance(question_index, bool):
+                return jsonify({
+                    'status': 'error',
+                    'message': f'items[{index}].question_index must be an integer'
+                }), 400
+            message = item.get('message')
+            messages.append(message.strip() if isinstance(message, str) else None)
+            question_indexes.append(question_index)
+            questions.append(item.get('question', ''))
+        
+        # Repeated messages in the batch are only scored once
+        analyses = analyze_batch(messages, question_indexes)
+        
+        now = datetime.now()
+        results = []
+        rows = []
+        for index, analysis in enumerate(analyses):
+            if 'error' in analysis:
+                results.append({
+                    'index': index,
+                    'status': 'error',
+                    'message': analysis['error']
+                })
+                continue
+            
+            results.append({
+                'index': index,
+                'status': 'success',
+                'sentiment': analysis['sentiment'],
+                'sentiment_score': analysis['sentiment_score'],
+                'recommendation': analysis['recommendation'],
+                'wellness_tip': analysis.get('wellness_tip', '')
+            })
+            rows.append(build_checkin_row(user_id, messages[index], analysis, question_indexes[index],
+                                          questions[index], created_at=now))
         
-        cursor.execute(
-            """SELECT id, message, sentiment, recommendation, question_index, 
-               question, created_at FROM checkins 
-               WHERE user_id = %s ORDER BY created_at DESC LIMIT %s""",
-            (user_id, limit)
-        )
+        # Store all successful items in a single multi-row insert
+        if persist and rows:
+            conn = get_db_connection()
+            insert_checkins(conn, rows)
+            conn.commit()
+            conn.close()
         
-        checkins = cursor.fetchall()
+        return jsonify({
+            'status': 'success',
+            'results': results,
+            'stored': len(rows) if persist else 0
+        })
+        
+    except Exception as e:
+        app.logger.error(f"Batch check-in error: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Internal server error'
+        }), 500
+
+@app.route('/api/checkin/conversations', methods=['POST'])
+@login_required
+def start_checkin_conversation():
+    """Start a chatbot check-in whose answers are analyzed as they arrive"""
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        conversation_id = start_conversation(cursor, g.user['id'])
+        conn.commit()
         cursor.close()
         conn.close()
         
-        # Format response
-        history = []
-        for checkin in checkins:
-            history.append({
-                'id': checkin['id'],
-                'message': checkin['message'],
-                'sentiment': checkin['sentiment'],
-                'recommendation': checkin['recommendation'],
-                'question_index': checkin['question_index'],
-                'question': checkin['question'],
-                'created_at': checkin['created_at'].isoformat() if checkin['created_at'] else None
-            })
-        
         return jsonify({
             'status': 'success',
-            'checkins': history,
-            'total_count': len(history)
-        })
+            'conversation_id': conversation_id,
+            'expires_in': CHECKIN_CONVERSATION_TTL
+        }), 201
         
     except Exception as e:
-        app.logger.error(f"History error: {str(e)}")
+        app.logger.error(f"Check-in conversation error: {str(e)}")
         return jsonify({
             'status': 'error',
             'message': 'Internal server error'
         }), 500
 
-@app.route('/api/wellness-stats', methods=['GET'])
-def get_wellness_stats():
-    """Get user's wellness statistics"""
+@app.route('/api/checkin/conversations/<conversation_id>/answers', methods=['POST'])
+@login_required
+def answer_checkin_conversation(conversation_id):
+    """Analyze one answer and keep its parsed result with the conversation"""
     try:
-        # Check authentication
-        token = request.cookies.get('session_token')
-        if not token or token not in user_sessions:
+        data = request.get_json()
+        if not data or not isinstance(data.get('message'), str) or not data['message'].strip():
             return jsonify({
                 'status': 'error',
-                'message': 'Authentication required'
-            }), 401
+                'message': 'Message is required'
+            }), 400
         
-        user_info = user_sessions[token]
-        user_id = user_info['user_id']
+        message = data['message'].strip()
+        question = data.get('question', '')
+        question_index = data.get('question_index', 0)
+        if (not isinstance(question_index, int) or isinstance(question_index, bool)
+                or not 0 <= question_index < SUMMARY_QUESTION_INDEX):
+            return jsonify({
+                'status': 'error',
+                'message': f'question_index must be between 0 and {SUMMARY_QUESTION_INDEX - 1}'
+            }), 400
         
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        # Numeric answers are read on the scale of the question they answer
+        kind = checkin_question_kind(question)
+        analysis_result = analyze_checkin(message, NUMERIC_QUESTION_INDEXES.get(kind, question_index))
         
-        # Get sentiment distribution
-        cursor.execute(
-            """SELECT sentiment, COUNT(*) as count FROM checkins 
-               WHERE user_id = %s GROUP BY sentiment""",
-            (user_id,)
-        )
-        sentiment_stats = cursor.fetchall()
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        try:
+            # The partial reuses this analysis, so the answer isn't parsed twice
+            partial = record_answer(cursor, conversation_id, g.user['id'], question_index, question, message,
+                                    analysis_result)
+            conn.commit()
+        except ConversationNotFound:
+            return jsonify({
+                'status': 'error',
+                'message': 'Check-in conversation not found or expired'
+            }), 404
+        finally:
+            cursor.close()
+            conn.close()
         
-        # Get recent check-ins count
-        cursor.execute(
-            """SELECT COUNT(*) as total FROM checkins 
-               WHERE user_id = %s AND created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)""",
-            (user_id,)
-        )
-        weekly_checkins = cursor.fetchone()['total']
+        return jsonify({
+            'status': 'success',
+            'sentiment': analysis_result['sentiment'],
+            'sentiment_score': analysis_result['sentiment_score'],
+            'numeric_analysis': partial['numeric'],
+            'response': get_contextual_response(question_index + 1, message)
+        })
         
-        # Get total check-ins
-        cursor.execute(
-            "SELECT COUNT(*) as total FROM checkins WHERE user_id = %s",
-            (user_id,)
-        )
-        total_checkins = cursor.fetchone()['total']
+    except Exception as e:
+        app.logger.error(f"Check-in answer error: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Internal server error'
+        }), 500
+
+@app.route('/api/checkin/conversations/<conversation_id>/complete', methods=['POST'])
+@login_required
+def complete_checkin_conversation(conversation_id):
+    """Summarize a conversation from its stored answers and save it"""
+    try:
+        conn = get_db_connection()
+        try:
+            result = complete_conversation(conn, conversation_id, g.user['id'])
+        except ConversationNotFound:
+            return jsonify({
+                'status': 'error',
+                'message': 'Check-in conversation not found or expired'
+            }), 404
+        finally:
+            conn.close()
         
-        cursor.close()
-        conn.close()
+        return jsonify({
+            'status': 'success',
+            'checkin_id': result['checkin_id'],
+            'sentiment': result['sentiment'],
+            'sentiment_score': result['sentiment_score'],
+            'emotions': result['emotions'],
+            'recommendation': result['recommendation'],
+            'wellness_tip': result.get('wellness_tip', ''),
+            'suggested_activity': result.get('suggested_activity'),
+            'timestamp': datetime.now().isoformat()
+        })
         
-        # Calculate wellness score (simple algorithm)
-        positive_count = 0
-        neutral_count = 0
-        negative_count = 0
+    except Exception as e:
+        app.logger.error(f"Check-in completion error: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Internal server error'
+        }), 500
+
+@app.route('/api/checkin-history', methods=['GET'])
+@login_required
+def get_checkin_history():
+    """Get a page of the user's check-in history, newest first"""
+    try:
+        user_id = g.user['id']
         
-        for stat in sentiment_stats:
-            if stat['sentiment'] in ['POSITIVE', 'HAPPY', 'EXCITED']:
-                positive_count += stat['count']
-            elif stat['sentiment'] in ['NEGATIVE', 'SAD', 'STRESSED', 'ANXIOUS']:
-                negative_count += stat['count']
-            else:
-                neutral_count += stat['count']
+        # Page size (capped) and the cursor returned with the previous page
+        limit = request.args.get('limit', 10, type=int)
+        after = request.args.get('cursor')
         
-        total_sentiment_checkins = positive_count + neutral_count + negative_count
-        wellness_score = 50  # Default neutral score
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
         
-        if total_sentiment_checkins > 0:
-            wellness_score = int(((positive_count * 2 + neutral_count) / (total_sentiment_checkins * 2)) * 100)
+        try:
+            history, next_cursor = checkin_history_payload(cursor, user_id, limit, after)
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'Invalid cursor'
+            }), 400
+        finally:
+            cursor.close()
+            conn.close()
         
         return jsonify({
             'status': 'success',
-            'stats': {
-                'wellness_score': wellness_score,
-                'total_checkins': total_checkins,
-                'weekly_checkins': weekly_checkins,
-                'sentiment_distribution': {
-                    'positive': positive_count,
-                    'neutral': neutral_count,
-                    'negative': negative_count
-                }
-            }
+            'checkins': history,
+            'total_count': len(history),
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None
         })
         
+    except Exception as e:
+        app.logger.error(f"History error: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Internal server error'
+        }), 500
+
+@app.route('/api/checkin-history/export', methods=['GET'])
+@login_required
+def export_checkin_history():
+    """Stream the user's full check-in history as NDJSON (default) or CSV"""
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({
+            'status': 'error',
+            'message': f"format must be one of: {', '.join(EXPORT_FORMATS)}"
+        }), 400
+    
+    filename = f"mindease-checkins-{datetime.now().strftime('%Y%m%d')}.{export_format}"
+    return Response(
+        stream_checkin_export(g.user['id'], export_format),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
+@app.route('/api/wellness-stats', methods=['GET'])
+@login_required
+def get_wellness_stats():
+    """Get user's wellness statistics"""
+    try:
+        user_id = g.user['id']
+        
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        
+        try:
+            version = get_cache_version(cursor, user_id)
+            
+            # The weekly count rolls over at midnight even without new check-ins
+            etag = make_etag('stats', user_id, version['cache_version'], date.today())
+            modified = last_modified(version['updated_at'], start_of_day())
+            if is_not_modified(etag, modified):
+                return not_modified(etag, modified)
+            
+            stats = wellness_stats_payload(cursor, user_id)
+        finally:
+            cursor.close()
+            conn.close()
+        
+        return with_validators(jsonify({
+            'status': 'success',
+            'stats': stats
+        }), etag, modified)
+        
     except Exception as e:
         app.logger.error(f"Stats error: {str(e)}")
         return jsonify({
@@ -615,54 +738,77 @@ def get_wellness_stats():
             'message': 'Internal server error'
         }), 500
 
-@app.route('/api/user/profile', methods=['GET'])
-def get_user_profile():
-    """Get current user profile"""
+@app.route('/api/dashboard/bootstrap', methods=['GET'])
+@login_required
+def dashboard_bootstrap():
+    """Everything the dashboard needs on load in one response
+    
+    ?sections=profile,stats,checkins,tip picks a subset (default all);
+    ?limit= sets how many recent check-ins to include.
+    """
     try:
-        # Check authentication
-        token = request.cookies.get('session_token')
-        if not token or token not in user_sessions:
+        user = g.user
+        
+        try:
+            sections = parse_sections(request.args.get('sections'))
+        except ValueError as e:
             return jsonify({
                 'status': 'error',
-                'message': 'Authentication required'
-            }), 401
+                'message': str(e)
+            }), 400
+        checkins_limit = request.args.get('limit', DASHBOARD_CHECKINS_LIMIT, type=int)
         
-        user_info = user_sessions[token]
-        user_id = user_info['user_id']
+        if not {'stats', 'checkins'} & set(sections):
+            # Profile and tip come from the principal and the clock: no database work
+            etag = make_etag(*dashboard_etag_parts(user, sections, user, checkins_limit))
+            if is_not_modified(etag):
+                return not_modified(etag)
+            return with_validators(jsonify(dict(build_dashboard(user, sections), status='success')), etag)
         
+        # One connection and cursor shared by every section
         conn = get_db_connection()
         cursor = conn.cursor(dictionary=True)
         
-        cursor.execute(
-            """SELECT id, username, email, subscription_type, subscription_status, 
-               subscription_start_date, subscription_end_date, created_at 
-               FROM users WHERE id = %s""",
-            (user_id,)
-        )
-        user = cursor.fetchone()
-        
-        cursor.close()
-        conn.close()
+        try:
+            version = get_cache_version(cursor, user['id'])
+            etag = make_etag(*dashboard_etag_parts(user, sections, version, checkins_limit))
+            modified = last_modified(version['updated_at'], start_of_day(), subscription_expired_at(user))
+            if is_not_modified(etag, modified):
+                return not_modified(etag, modified)
+            
+            payload = build_dashboard(user, sections, cursor, checkins_limit)
+        finally:
+            cursor.close()
+            conn.close()
         
-        if not user:
-            return jsonify({
-                'status': 'error',
-                'message': 'User not found'
-            }), 404
+        return with_validators(jsonify(dict(payload, status='success')), etag, modified)
         
+    except Exception as e:
+        app.logger.error(f"Dashboard bootstrap error: {str(e)}")
         return jsonify({
+            'status': 'error',
+            'message': 'Internal server error'
+        }), 500
+
+@app.route('/api/user/profile', methods=['GET'])
+@login_required
+def get_user_profile():
+    """Get current user profile"""
+    try:
+        user = g.user
+        
+        # Served from the principal, so its version is exactly what the client would get;
+        # an expiring subscription changes the payload without bumping it
+        entitlement = get_entitlement(user)
+        etag = make_etag('profile', user['id'], user['cache_version'], entitlement.tier, entitlement.status)
+        modified = last_modified(user['updated_at'], subscription_expired_at(user))
+        if is_not_modified(etag, modified):
+            return not_modified(etag, modified)
+        
+        return with_validators(jsonify({
             'status': 'success',
-            'user': {
-                'id': user['id'],
-                'username': user['username'],
-                'email': user['email'],
-                'subscription_type': user['subscription_type'],
-                'subscription_status': user['subscription_status'],
-                'subscription_start_date': user['subscription_start_date'].isoformat() if user['subscription_start_date'] else None,
-                'subscription_end_date': user['subscription_end_date'].isoformat() if user['subscription_end_date'] else None,
-                'member_since': user['created_at'].isoformat() if user['created_at'] else None
-            }
-        })
+            'user': profile_payload(user)
+        }), etag, modified)
         
     except Exception as e:
         app.logger.error(f"Profile error: {str(e)}")
@@ -672,38 +818,15 @@ def get_user_profile():
         }), 500
 
 @app.route('/api/upgrade/premium', methods=['POST'])
+@login_required
 def upgrade_to_premium():
     """Create IntaSend payment link for premium upgrade"""
     try:
-        # Check authentication
-        token = request.cookies.get('session_token')
-        if not token or token not in user_sessions:
-            return jsonify({
-                'status': 'error',
-                'message': 'Authentication required'
-            }), 401
-        
-        user_info = user_sessions[token]
-        user_id = user_info['user_id']
-        
-        # Get user details
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        cursor.execute(
-            "SELECT username, email, subscription_type FROM users WHERE id = %s",
-            (user_id,)
-        )
-        user = cursor.fetchone()
-        
-        if not user:
-            return jsonify({
-                'status': 'error',
-                'message': 'User not found'
-            }), 404
+        user = g.user
+        user_id = user['id']
         
         # Check if already premium
-        if user['subscription_type'] == 'premium':
+        if is_premium(user):
             return jsonify({
                 'status': 'error',
                 'message': 'User is already a premium subscriber'
@@ -719,11 +842,18 @@ def upgrade_to_premium():
                 }), 500
             
             # Update user with IntaSend customer ID
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            
             cursor.execute(
-                "UPDATE users SET intasend_customer_id = %s WHERE id = %s",
+                "UPDATE users SET intasend_customer_id = %s, cache_version = cache_version + 1 WHERE id = %s",
                 (customer_data['id'], user_id)
             )
             conn.commit()
+            
+            cursor.close()
+            conn.close()
+            
             customer_id = customer_data['id']
         else:
             customer_id = user['intasend_customer_id']
@@ -741,9 +871,6 @@ def upgrade_to_premium():
                 'message': 'Failed to create payment link'
             }), 500
         
-        cursor.close()
-        conn.close()
-        
         return jsonify({
             'status': 'success',
             'payment_url': payment_data['payment_url'],
@@ -759,7 +886,7 @@ def upgrade_to_premium():
 
 @app.route('/api/payment/webhook', methods=['POST'])
 def payment_webhook():
-    """Handle IntaSend payment webhook"""
+    """Accept an IntaSend payment webhook into the inbox"""
     try:
         data = request.get_json()
         
@@ -770,98 +897,39 @@ def payment_webhook():
         if not payment_id:
             return jsonify({'status': 'error', 'message': 'No payment ID'}), 400
         
-        # Verify payment with IntaSend
-        payment_info = verify_intasend_payment(payment_id)
-        if not payment_info or payment_info.get('status') != 'completed':
-            return jsonify({'status': 'error', 'message': 'Payment not completed'}), 400
-        
-        # Find user by customer ID
-        customer_id = payment_info.get('customer_id')
-        if not customer_id:
-            return jsonify({'status': 'error', 'message': 'No customer ID'}), 400
-        
+        # Persist and acknowledge; webhook_processor verifies and applies it in the background
         conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        cursor.execute(
-            "SELECT id FROM users WHERE intasend_customer_id = %s",
-            (customer_id,)
-        )
-        user = cursor.fetchone()
-        
-        if not user:
-            return jsonify({'status': 'error', 'message': 'User not found'}), 404
-        
-        # Update user to premium
-        start_date = datetime.now()
-        end_date = start_date + timedelta(days=30)  # 30-day subscription
+        cursor = conn.cursor()
         
-        cursor.execute(
-            """UPDATE users SET 
-               subscription_type = 'premium',
-               subscription_status = 'active',
-               subscription_start_date = %s,
-               subscription_end_date = %s
-               WHERE id = %s""",
-            (start_date, end_date, user['id'])
-        )
+        first_delivery = enqueue_webhook(cursor, str(payment_id), data['event'], data)
         conn.commit()
         
         cursor.close()
         conn.close()
         
-        app.logger.info(f"User {user['id']} upgraded to premium successfully")
+        webhook_processor.start()
+        if not first_delivery:
+            app.logger.info(f"Duplicate webhook for payment {payment_id} ignored")
         
-        return jsonify({'status': 'success'}), 200
+        return jsonify({'status': 'accepted'}), 200
         
     except Exception as e:
         app.logger.error(f"Payment webhook error: {str(e)}")
         return jsonify({'status': 'error', 'message': 'Webhook processing failed'}), 500
 
 @app.route('/api/demo-payment/complete', methods=['POST'])
+@login_required
 def complete_demo_payment():
     """Complete a demo payment and upgrade user to premium"""
     try:
-        # Check authentication
-        token = request.cookies.get('session_token')
-        if not token or token not in user_sessions:
-            return jsonify({
-                'status': 'error',
-                'message': 'Authentication required'
-            }), 401
-        
-        user_info = user_sessions[token]
-        user_id = user_info['user_id']
+        user = g.user
+        user_id = user['id']
         
-        # Get user details
         conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        cursor.execute(
-            "SELECT id, username FROM users WHERE id = %s",
-            (user_id,)
-        )
-        user = cursor.fetchone()
-        
-        if not user:
-            return jsonify({
-                'status': 'error',
-                'message': 'User not found'
-            }), 404
+        cursor = conn.cursor()
         
         # Update user to premium
-        start_date = datetime.now()
-        end_date = start_date + timedelta(days=30)  # 30-day subscription
-        
-        cursor.execute(
-            """UPDATE users SET 
-               subscription_type = 'premium',
-               subscription_status = 'active',
-               subscription_start_date = %s,
-               subscription_end_date = %s
-               WHERE id = %s""",
-            (start_date, end_date, user_id)
-        )
+        activate_premium(cursor, user_id)
         conn.commit()
         
         cursor.close()
@@ -883,41 +951,19 @@ def complete_demo_payment():
         }), 500
 
 @app.route('/api/aggregate-insights', methods=['GET'])
+@login_required
+@premium_required
 def get_aggregate_insights():
     """Get anonymous aggregate insights for premium users"""
     try:
-        # Check authentication
-        token = request.cookies.get('session_token')
-        if not token or token not in user_sessions:
-            return jsonify({
-                'status': 'error',
-                'message': 'Authentication required'
-            }), 401
-        
-        user_info = user_sessions[token]
-        user_id = user_info['user_id']
-        
-        # Check if user is premium
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        cursor.execute(
-            "SELECT subscription_type FROM users WHERE id = %s",
-            (user_id,)
-        )
-        user = cursor.fetchone()
-        
-        if not user or user['subscription_type'] != 'premium':
-            return jsonify({
-                'status': 'error',
-                'message': 'Premium subscription required'
-            }), 403
-        
         # Get date range (default to last 30 days)
         days = request.args.get('days', 30, type=int)
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=days)
         
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        
         # Get aggregate insights
         cursor.execute(
             """SELECT date, total_users, total_checkins, avg_wellness_score,
@@ -930,13 +976,17 @@ def get_aggregate_insights():
         
         insights = cursor.fetchall()
         
-        # If no insights exist, generate some sample data
-        if not insights:
-            insights = generate_sample_insights(start_date, end_date)
-        
         cursor.close()
         conn.close()
         
+        # Rows are materialized by insights_job.py; JSON columns come back as strings
+        for insight in insights:
+            insight['date'] = insight['date'].isoformat()
+            insight['avg_wellness_score'] = float(insight['avg_wellness_score'])
+            for column in ('stress_levels', 'energy_levels', 'sleep_quality', 'common_concerns', 'popular_activities'):
+                if isinstance(insight[column], (str, bytes)):
+                    insight[column] = json.loads(insight[column])
+        
         return jsonify({
             'status': 'success',
             'insights': insights,
@@ -954,106 +1004,20 @@ def get_aggregate_insights():
             'message': 'Internal server error'
         }), 500
 
-def generate_sample_insights(start_date, end_date):
-    """Generate sample aggregate insights for demonstration"""
-    import random
-    from datetime import timedelta
-    
-    insights = []
-    current_date = start_date
-    
-    while current_date <= end_date:
-        insight = {
-            'date': current_date.isoformat(),
-            'total_users': random.randint(50, 200),
-            'total_checkins': random.randint(100, 500),
-            'avg_wellness_score': round(random.uniform(60, 85), 1),
-            'stress_levels': {
-                'low': random.randint(20, 40),
-                'moderate': random.randint(30, 50),
-                'high': random.randint(10, 30)
-            },
-            'energy_levels': {
-                'low': random.randint(15, 35),
-                'moderate': random.randint(35, 55),
-                'high': random.randint(20, 40)
-            },
-            'sleep_quality': {
-                'poor': random.randint(10, 25),
-                'moderate': random.randint(40, 60),
-                'good': random.randint(25, 45)
-            },
-            'common_concerns': [
-                'Work stress',
-                'Sleep quality',
-                'Energy levels',
-                'Time management',
-                'Work-life balance'
-            ],
-            'popular_activities': [
-                'Deep breathing exercises',
-                'Quick desk stretches',
-                'Mindful walking',
-                'Gratitude practice',
-                'Progressive muscle relaxation'
-            ]
-        }
-        insights.append(insight)
-        current_date += timedelta(days=1)
-    
-    return insights
-
 @app.route('/api/daily-tip', methods=['GET'])
 def get_daily_tip():
     """Get a daily wellness tip"""
     try:
-        # Daily wellness tips
-        daily_tips = [
-            "💧 Stay hydrated - even mild dehydration affects mood and energy.",
-            "🌱 Take micro-breaks every hour, even just 30 seconds of stretching helps.",
-            "🌞 Natural light exposure helps regulate your circadian rhythm.",
-            "🫂 Social connection is as important for health as diet and exercise.",
-            "🎯 Focus on progress, not perfection. Small steps lead to big changes.",
-            "🧘 Just 2 minutes of deep breathing can activate your relaxation response.",
-            "📱 Consider a 'phone-free' meal today to practice mindful eating.",
-            "🚶 A 5-minute walk can boost creativity and reduce stress hormones.",
-            "😴 Quality sleep is the foundation of good mental health.",
-            "🍎 Eating regular, balanced meals helps stabilize your mood and energy.",
-            "🎵 Music can be a powerful tool for mood regulation and stress relief.",
-            "📝 Journaling for just 5 minutes can help process emotions and reduce anxiety.",
-            "🌿 Spending time in nature, even just looking at plants, can reduce stress.",
-            "🤝 Reach out to a friend or family member today - connection matters.",
-            "🎨 Creative activities like drawing or coloring can be surprisingly therapeutic.",
-            "⏰ Set boundaries with your time - it's okay to say no to protect your energy.",
-            "🔄 Practice gratitude by writing down 3 things you're thankful for today.",
-            "🧠 Challenge negative thoughts by asking 'Is this thought helpful or true?'",
-            "🏃‍♀️ Even 10 minutes of physical activity can boost your mood and energy.",
-            "🌅 Start your day with intention - set one small goal for today.",
-            "💤 Create a relaxing bedtime routine to improve sleep quality.",
-            "🍃 Practice mindful breathing: 4 counts in, hold 4, 4 counts out.",
-            "📚 Reading for pleasure can be a great way to unwind and escape stress.",
-            "🎪 Laughter truly is medicine - watch something funny or call a funny friend.",
-            "🌙 Limit screen time 1 hour before bed for better sleep quality.",
-            "💝 Do something kind for yourself today - you deserve care and compassion.",
-            "🎯 Break large tasks into smaller, manageable steps to reduce overwhelm.",
-            "🌱 Try a new healthy recipe - cooking can be a mindful, creative activity.",
-            "🧘‍♀️ Practice body scanning: notice tension and consciously relax each muscle group.",
-            "📞 Call someone you haven't talked to in a while - connection is healing."
-        ]
-        
-        # Get today's date to determine which tip to show
         today = datetime.now()
-        day_of_year = today.timetuple().tm_yday
+        tip, tip_index = daily_tip(today)
         
-        # Use day of year to select a consistent tip for the day
-        tip_index = day_of_year % len(daily_tips)
-        daily_tip = daily_tips[tip_index]
+        # Same tip for everyone all day: shared caches may keep it until midnight
+        etag = make_etag('tip', today.date(), tip_index)
+        cache_control = f'public, max-age={until_midnight(today)}'
+        if is_not_modified(etag):
+            return not_modified(etag, cache_control=cache_control)
         
-        return jsonify({
-            'status': 'success',
-            'tip': daily_tip,
-            'date': today.strftime('%Y-%m-%d')
-        })
+        return with_validators(jsonify(dict(tip, status='success')), etag, cache_control=cache_control)
         
     except Exception as e:
         app.logger.error(f"Daily tip error: {str(e)}")
@@ -1077,7 +1041,15 @@ def health_check():
         return jsonify({
             'status': 'healthy',
             'timestamp': datetime.now().isoformat(),
-            'database': 'connected'
+            'database': 'connected',
+            'pool': get_pool_stats(),
+            'sentiment_cache': get_analysis_cache_stats(),
+            'analysis_pool': get_analysis_pool_stats(),
+            'checkin_writer': checkin_writer.stats(),
+            'payment_gateway': get_payment_client_stats(),
+            'payment_webhooks': webhook_processor.stats(),
+            'entitlement_cache': get_entitlement_cache_stats(),
+            'startup': startup_timings
         })
     except Exception as e:
         return jsonify({
@@ -1086,7 +1058,35 @@ def health_check():
             'timestamp': datetime.now().isoformat()
         }), 500
 
+def metrics_authorized():
+    return not METRICS_TOKEN or request.headers.get('Authorization') == f'Bearer {METRICS_TOKEN}'
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """This worker's request, span and pool metrics in Prometheus text format"""
+    if not metrics_authorized():
+        return Response('Unauthorized\n', status=401, mimetype='text/plain')
+    return Response(render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/metrics/traces', methods=['GET'])
+def sampled_traces():
+    """Detailed traces of this worker's recently sampled requests"""
+    if not metrics_authorized():
+        return jsonify({'status': 'error', 'message': 'Unauthorized'}), 401
+    return jsonify({
+        'sample_rate': TRACE_SAMPLE_RATE,
+        'traces': recent_traces()
+    })
+
+# Last route above: the import time covers every route definition
+startup_timings['app_import_ms'] = round((time.perf_counter() - _import_started) * 1000, 1)
+app.logger.info(f"App loaded in {startup_timings['app_import_ms']} ms")
+
 if __name__ == '__main__':
     import os
+    # Development convenience; deployments migrate with `python db.py migrate`
+    with app.app_context():
+        init_db()
+    start_background_workers()
     port = int(os.environ.get("PORT", 5000))  # Use Railway's PORT or 5000 locally
     app.run(debug=True, host='0.0.0.0', port=port)
\ No newline at end of file
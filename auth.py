@@ -0,0 +1,101 @@
+import os
+from functools import wraps
+from flask import current_app, g, jsonify, redirect, request, url_for
+from cache import TTLCache
+from db import get_db_connection
+from entitlements import is_premium
+from session_store import get_session_store
+
+# Principal cache configuration
+PRINCIPAL_CACHE_SIZE = int(os.getenv('PRINCIPAL_CACHE_SIZE', 10000))
+PRINCIPAL_CACHE_TTL = int(os.getenv('PRINCIPAL_CACHE_TTL', 60))
+
+# Keyed by (user_id, cache_version): profile and subscription writes bump the version,
+# so a change made through any worker is seen by every worker on its next request
+_principals = TTLCache(maxsize=PRINCIPAL_CACHE_SIZE, ttl=PRINCIPAL_CACHE_TTL)
+
+def load_principal(user_id):
+    """Return the user principal (profile plus subscription) for user_id
+
+    Reads the user's cache_version by primary key and reuses the cached
+    principal for that version; the full row is reloaded only after a
+    write has bumped it.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("SELECT cache_version FROM users WHERE id = %s", (user_id,))
+        version = cursor.fetchone()
+        if version is None:
+            return None
+
+        principal = _principals.get((user_id, version['cache_version']))
+        if principal is not None:
+            return principal
+
+        cursor.execute(
+            """SELECT id, username, email, subscription_type, subscription_status,
+               subscription_start_date, subscription_end_date, intasend_customer_id,
+               cache_version, created_at, updated_at
+               FROM users WHERE id = %s""",
+            (user_id,)
+        )
+        principal = cursor.fetchone()
+        if principal is None:
+            return None
+
+        _principals.set((user_id, principal['cache_version']), principal)
+        return principal
+    finally:
+        cursor.close()
+        conn.close()
+
+def get_current_user():
+    """Resolve the session cookie to a user principal once per request"""
+    if 'user' not in g:
+        session = get_session_store().get(request.cookies.get('session_token'))
+        g.user = load_principal(session['user_id']) if session else None
+    return g.user
+
+def login_required(view):
+    """Require an authenticated user for a JSON API route"""
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        try:
+            user = get_current_user()
+        except Exception as e:
+            current_app.logger.error(f"Authentication error: {str(e)}")
+            return jsonify({
+                'status': 'error',
+                'message': 'Internal server error'
+            }), 500
+
+        if not user:
+            return jsonify({
+                'status': 'error',
+                'message': 'Authentication required'
+            }), 401
+
+        return view(*args, **kwargs)
+    return wrapped
+
+def page_login_required(view):
+    """Require an authenticated user for a page, redirecting to login otherwise"""
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        if not get_current_user():
+            return redirect(url_for('login_page'))
+        return view(*args, **kwargs)
+    return wrapped
+
+def premium_required(view):
+    """Require a premium subscriber; use after login_required"""
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        if not is_premium(g.user):
+            return jsonify({
+                'status': 'error',
+                'message': 'Premium subscription required'
+            }), 403
+        return view(*args, **kwargs)
+    return wrapped
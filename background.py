@@ -0,0 +1,44 @@
+import os
+import threading
+
+class PeriodicTask:
+    """Run a function every `interval` seconds on a daemon thread
+
+    Threads do not survive fork(), so start() is safe to call from every
+    request: it (re)starts the thread once per process and is a no-op after.
+    """
+
+    def __init__(self, name, interval, func):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._thread = None
+        self._pid = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the background thread for this process if it is not running"""
+        if self.interval <= 0:
+            return
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+                return
+            self._stop = threading.Event()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Ask the background thread to exit after its current run"""
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.func()
+            except Exception as e:
+                print(f"Error in background task {self.name}: {e}")
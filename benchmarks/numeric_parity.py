@@ -0,0 +1,130 @@
+"""Compare the numeric-answer parser with the previous regex on a labelled fixture set
+
+    python benchmarks/numeric_parity.py
+    python benchmarks/numeric_parity.py --show-misses
+
+Reads the score each answer in fixtures/numeric_answers.txt should give,
+reports how many answers the previous first-number regex and the current
+analyze_numeric_response() get right, and times both over the fixtures
+and the check-in and journal corpora (the parser cold, with its cache
+cleared before every pass, and warm). Exits non-zero when the current
+parser is less accurate than the previous one.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sentiment_analysis import (NUMERIC_CATEGORIES, analyze_numeric_response, clear_analysis_cache,  # noqa: E402
+                                numeric_level)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+DEFAULT_ANSWERS = os.path.join(FIXTURES, 'numeric_answers.txt')
+TIMING_CORPORA = {
+    'short': os.path.join(FIXTURES, 'checkin_corpus.txt'),
+    'journal': os.path.join(FIXTURES, 'journal_corpus.txt')
+}
+
+def legacy_numeric_response(text, question_index):
+    """The previous analyze_numeric_response(): the first 1-2 digit number, if it is 1-10"""
+    numbers = re.findall(r'\b(\d{1,2})\b', text)
+    if not numbers:
+        return None
+    score = int(numbers[0])
+    if score < 1 or score > 10:
+        return None
+    category = NUMERIC_CATEGORIES.get(question_index)
+    if category:
+        return {'level': numeric_level(category, score), 'category': category, 'score': score}
+    if score >= 7:
+        return {'level': 'good', 'category': 'general', 'score': score}
+    elif score >= 4:
+        return {'level': 'moderate', 'category': 'general', 'score': score}
+    return {'level': 'poor', 'category': 'general', 'score': score}
+
+def legacy_score(text, question_index):
+    result = legacy_numeric_response(text, question_index)
+    return result['score'] if result else None
+
+def current_score(text, question_index):
+    result = analyze_numeric_response(text, question_index)
+    return result['score'] if result else None
+
+def load_answers(path=DEFAULT_ANSWERS):
+    """(expected score or None, question_index, answer) per fixture line"""
+    answers = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            expected, question_index, text = line.rstrip('\n').split('\t', 2)
+            answers.append((None if expected == '-' else int(expected), int(question_index), text))
+    return answers
+
+def load_corpus(path):
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def accuracy(parser, answers):
+    """(fraction correct, misses as (expected, actual, text))"""
+    misses = []
+    for expected, question_index, text in answers:
+        actual = parser(text, question_index)
+        if actual != expected:
+            misses.append((expected, actual, text))
+    return 1 - len(misses) / len(answers), misses
+
+def ns_per_op(analyze, items, passes, before_pass=None, repeat=5):
+    """Best of `repeat` runs of `passes` passes over items"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for _ in range(passes):
+            if before_pass is not None:
+                before_pass()
+            for text, question_index in items:
+                analyze(text, question_index)
+        timings.append((time.perf_counter_ns() - started) / (passes * len(items)))
+    return min(timings)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare numeric-answer parsing with the previous regex')
+    parser.add_argument('--answers', default=DEFAULT_ANSWERS)
+    parser.add_argument('--passes', type=int, default=100)
+    parser.add_argument('--show-misses', action='store_true')
+    args = parser.parse_args(argv)
+
+    answers = load_answers(args.answers)
+    legacy_accuracy, legacy_misses = accuracy(legacy_score, answers)
+    current_accuracy, current_misses = accuracy(current_score, answers)
+    print(f"{len(answers)} labelled answers: previous regex {legacy_accuracy:.1%}, "
+          f"current parser {current_accuracy:.1%} correct")
+
+    if args.show_misses:
+        for name, misses in (('previous', legacy_misses), ('current', current_misses)):
+            print(f"\n{name} misses:")
+            for expected, actual, text in misses:
+                print(f"  expected {expected if expected is not None else '-':>2}  got {actual if actual is not None else '-':>2}  {text}")
+
+    timing_sets = {'answers': [(text, question_index) for _, question_index, text in answers]}
+    for name, path in TIMING_CORPORA.items():
+        timing_sets[name] = [(text, position % 4) for position, text in enumerate(load_corpus(path))]
+
+    print(f"\n{'ns/op':<10}{'previous':>12}{'cold':>12}{'warm':>12}")
+    for name, items in timing_sets.items():
+        legacy = ns_per_op(legacy_numeric_response, items, args.passes)
+        cold = ns_per_op(analyze_numeric_response, items, args.passes, clear_analysis_cache)
+        warm = ns_per_op(analyze_numeric_response, items, args.passes)
+        print(f"{name:<10}{legacy:>12,.0f}{cold:>12,.0f}{warm:>12,.0f}")
+
+    if current_accuracy < legacy_accuracy:
+        print("\n✗ Current parser is less accurate than the previous regex")
+        return 1
+    print("\n✓ Current parser is at least as accurate as the previous regex")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
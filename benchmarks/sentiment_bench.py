@@ -0,0 +1,289 @@
+"""Micro-benchmarks for the sentiment analysis pipeline
+
+    python benchmarks/sentiment_bench.py
+    python benchmarks/sentiment_bench.py --engine lexicon --stage basic --stage numeric
+    python benchmarks/sentiment_bench.py --profile sentiment.prof --flamegraph sentiment.folded
+
+Times each stage of sentiment_analysis over two corpora, short check-in
+answers and long journal entries, and reports ns/op (best and median of
+--repeat runs) plus tracemalloc's peak and retained bytes per op:
+
+    basic           analyze_sentiment_basic
+    emotions        detect_emotions
+    numeric         analyze_numeric_response
+    recommendation  generate_recommendation on precomputed features
+    end_to_end      analyze_sentiment_and_recommend with an empty analysis cache
+    cached          analyze_sentiment_and_recommend served from the analysis cache
+
+The activity catalog is loaded from fixture rows, so nothing touches the
+database. --profile writes cProfile stats and prints the top functions;
+--flamegraph writes folded stacks from a sampling profiler for
+flamegraph.pl or speedscope. Save a run with --save-baseline and compare
+later runs against it with --baseline.
+"""
+import argparse
+import cProfile
+import json
+import os
+import platform
+import pstats
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sentiment_engines  # noqa: E402
+from activity_catalog import reload_catalog  # noqa: E402
+from sentiment_analysis import (analyze_numeric_response, analyze_sentiment_and_recommend,  # noqa: E402
+                                analyze_sentiment_basic, clear_analysis_cache, detect_emotions,
+                                generate_recommendation)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+CORPORA = {
+    'short': os.path.join(FIXTURES, 'checkin_corpus.txt'),
+    'journal': os.path.join(FIXTURES, 'journal_corpus.txt')
+}
+STAGES = ('basic', 'emotions', 'numeric', 'recommendation', 'end_to_end', 'cached')
+
+# One activity per category the recommendations can ask for
+BENCH_ACTIVITIES = [
+    {'id': index, 'title': f'{category.title()} activity', 'description': 'Benchmark fixture',
+     'category': category, 'duration_minutes': 5, 'instructions': '[]'}
+    for index, category in enumerate(('breathing', 'energy', 'relaxation', 'mindfulness'), 1)
+]
+
+DEFAULT_TOLERANCE = 0.25
+
+def load_corpus(path):
+    """Non-empty, non-comment lines of a corpus file"""
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def build_items(texts, engine):
+    """(text, question_index, features) per text; question indexes cycle over the check-in questions"""
+    items = []
+    for position, text in enumerate(texts):
+        question_index = position % 4
+        features = (analyze_sentiment_basic(text, engine), detect_emotions(text),
+                    analyze_numeric_response(text, question_index))
+        items.append((text, question_index, features))
+    return items
+
+def stage_functions(engine):
+    """stage -> (call(item), setup before each pass or None)"""
+    return {
+        'basic': (lambda item: analyze_sentiment_basic(item[0], engine), None),
+        'emotions': (lambda item: detect_emotions(item[0]), None),
+        'numeric': (lambda item: analyze_numeric_response(item[0], item[1]), None),
+        'recommendation': (lambda item: generate_recommendation(*item[2], item[1]), None),
+        'end_to_end': (lambda item: analyze_sentiment_and_recommend(item[0], item[1]), clear_analysis_cache),
+        'cached': (lambda item: analyze_sentiment_and_recommend(item[0], item[1]), None)
+    }
+
+def run_pass(call, setup, items):
+    if setup is not None:
+        setup()
+    for item in items:
+        call(item)
+
+def time_stage(call, setup, items, repeat, min_time):
+    """ns/op for each of `repeat` runs, each long enough to last min_time seconds"""
+    run_pass(call, setup, items)  # warm up caches and lazy imports
+    passes = 1
+    while True:
+        started = time.perf_counter_ns()
+        for _ in range(passes):
+            run_pass(call, setup, items)
+        elapsed = time.perf_counter_ns() - started
+        if elapsed >= min_time * 1e9:
+            break
+        passes *= 2
+
+    timings = [elapsed / (passes * len(items))]
+    for _ in range(repeat - 1):
+        started = time.perf_counter_ns()
+        for _ in range(passes):
+            run_pass(call, setup, items)
+        timings.append((time.perf_counter_ns() - started) / (passes * len(items)))
+    return timings
+
+def measure_allocations(call, setup, items):
+    """(peak bytes per op, bytes still allocated after the pass per op)"""
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        peaks = 0
+        for item in items:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            call(item)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks += peak - before
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peaks / len(items), (end - start) / len(items)
+
+def run_benchmarks(corpora, stages, engine, repeat, min_time):
+    """{'corpus/stage': result dict} for every combination"""
+    functions = stage_functions(engine)
+    results = {}
+    for corpus, items in corpora.items():
+        for stage in stages:
+            call, setup = functions[stage]
+            timings = time_stage(call, setup, items, repeat, min_time)
+            peak, retained = measure_allocations(call, setup, items)
+            results[f'{corpus}/{stage}'] = {
+                'ns_per_op': round(min(timings)),
+                'median_ns_per_op': round(statistics.median(timings)),
+                'peak_bytes_per_op': round(peak),
+                'retained_bytes_per_op': round(retained),
+                'items': len(items)
+            }
+    return results
+
+class StackSampler:
+    """Samples one thread's Python stack on an interval and counts folded stacks
+
+    The output is the "folded" format (frames joined by ';', then a count)
+    read by flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+
+    def __enter__(self):
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval / 2)  # let the sampler run while the benchmark holds the GIL
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+        return False
+
+    def write(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f'{stack} {count}\n')
+
+def profile_workload(corpora, stages, engine, passes):
+    functions = stage_functions(engine)
+    for _ in range(passes):
+        for items in corpora.values():
+            for stage in stages:
+                call, setup = functions[stage]
+                run_pass(call, setup, items)
+
+def compare_to_baseline(results, baseline, tolerance):
+    """List stages whose best ns/op regressed beyond tolerance"""
+    regressions = []
+    for name, base in baseline['results'].items():
+        current = results.get(name)
+        if current is not None and current['ns_per_op'] > base['ns_per_op'] * (1 + tolerance):
+            regressions.append(f"{name}: {current['ns_per_op']} ns/op vs baseline {base['ns_per_op']}")
+    return regressions
+
+def print_results(results):
+    print(f"{'benchmark':<28}{'ns/op':>12}{'median':>12}{'peak B/op':>12}{'kept B/op':>12}")
+    for name, result in results.items():
+        print(f"{name:<28}{result['ns_per_op']:>12,}{result['median_ns_per_op']:>12,}"
+              f"{result['peak_bytes_per_op']:>12,}{result['retained_bytes_per_op']:>12,}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the sentiment analysis stages')
+    parser.add_argument('--engine', default=sentiment_engines.SENTIMENT_ENGINE,
+                        choices=sorted(sentiment_engines.SENTIMENT_ENGINES))
+    parser.add_argument('--stage', action='append', choices=STAGES, help='repeatable; default all stages')
+    parser.add_argument('--corpus', action='append', choices=sorted(CORPORA), help='repeatable; default both')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per timed run')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the random recommendation choices')
+    parser.add_argument('--profile', help='write cProfile stats for the selected stages to this file')
+    parser.add_argument('--flamegraph', help='write folded stacks for the selected stages to this file')
+    parser.add_argument('--profile-passes', type=int, default=50, help='corpus passes when profiling')
+    parser.add_argument('--save-baseline', help='write results to this JSON file')
+    parser.add_argument('--baseline', help='compare against this JSON file and exit 1 on regression')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    # analyze_sentiment_and_recommend scores with the default engine
+    sentiment_engines.SENTIMENT_ENGINE = args.engine
+    random.seed(args.seed)
+    reload_catalog(BENCH_ACTIVITIES)
+
+    stages = args.stage or list(STAGES)
+    corpora = {name: build_items(load_corpus(CORPORA[name]), args.engine)
+               for name in (args.corpus or CORPORA)}
+
+    print(f"Engine {args.engine}, " + ', '.join(f"{name}: {len(items)} texts" for name, items in corpora.items()))
+    results = run_benchmarks(corpora, stages, args.engine, args.repeat, args.min_time)
+    print()
+    print_results(results)
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(profile_workload, corpora, stages, args.engine, args.profile_passes)
+        profiler.dump_stats(args.profile)
+        print(f"\n✓ cProfile stats written to {args.profile}\n")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+
+    if args.flamegraph:
+        with StackSampler(threading.get_ident()) as sampler:
+            profile_workload(corpora, stages, args.engine, args.profile_passes)
+        sampler.write(args.flamegraph)
+        print(f"\n✓ {sum(sampler.stacks.values())} stack samples written to {args.flamegraph}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, 'w') as f:
+            json.dump({
+                'meta': {
+                    'created_at': datetime.now().isoformat(),
+                    'python': platform.python_version(),
+                    'machine': platform.machine(),
+                    'engine': args.engine
+                },
+                'results': results
+            }, f, indent=2)
+        print(f"\n✓ Baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regressions against {args.baseline} (tolerance {args.tolerance:.0%}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\n✓ No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Compare sentiment labels between engines on a fixture corpus
+
+    python benchmarks/sentiment_parity.py
+    python benchmarks/sentiment_parity.py --candidate lexicon --min-agreement 0.8 --show-disagreements
+
+Scores every line of the corpus with the reference and candidate engines,
+prints label agreement and a confusion table, and exits non-zero when
+agreement falls below --min-agreement, so it can gate engine changes.
+Most expected disagreements are check-in words from LEXICON_ADDITIONS
+("stressed", "drained", "grateful") that TextBlob scores as neutral.
+"""
+import argparse
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sentiment_analysis import analyze_sentiment_basic  # noqa: E402
+from sentiment_engines import SENTIMENT_ENGINES  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'checkin_corpus.txt')
+LABELS = ('POSITIVE', 'NEUTRAL', 'NEGATIVE')
+
+def load_corpus(path=DEFAULT_CORPUS):
+    """Non-empty, non-comment lines of a corpus file"""
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def compare_engines(texts, reference='textblob', candidate='lexicon'):
+    """Label both engines' results; returns (agreement, confusion Counter, disagreements)"""
+    confusion = Counter()
+    disagreements = []
+    for text in texts:
+        expected = analyze_sentiment_basic(text, reference)
+        actual = analyze_sentiment_basic(text, candidate)
+        confusion[(expected['sentiment'], actual['sentiment'])] += 1
+        if expected['sentiment'] != actual['sentiment']:
+            disagreements.append((text, expected, actual))
+
+    agreement = 1 - len(disagreements) / len(texts) if texts else 1.0
+    return agreement, confusion, disagreements
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare sentiment labels between two engines')
+    parser.add_argument('--reference', default='textblob', choices=sorted(SENTIMENT_ENGINES))
+    parser.add_argument('--candidate', default='lexicon', choices=sorted(SENTIMENT_ENGINES))
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--min-agreement', type=float, default=0.8)
+    parser.add_argument('--show-disagreements', action='store_true')
+    args = parser.parse_args(argv)
+
+    texts = load_corpus(args.corpus)
+    agreement, confusion, disagreements = compare_engines(texts, args.reference, args.candidate)
+
+    print(f"{args.reference} vs {args.candidate} on {len(texts)} texts: {agreement:.1%} label agreement")
+    print()
+    header = f'{args.reference} / {args.candidate}'
+    print(f"{header:<22}" + ''.join(f"{label:>10}" for label in LABELS))
+    for expected in LABELS:
+        print(f"{expected:<22}" + ''.join(f"{confusion[(expected, actual)]:>10}" for actual in LABELS))
+
+    if args.show_disagreements and disagreements:
+        print()
+        for text, expected, actual in disagreements:
+            print(f"{expected['sentiment']:>8} {expected['polarity']:+.2f}  "
+                  f"{actual['sentiment']:>8} {actual['polarity']:+.2f}  {text}")
+
+    if agreement < args.min_agreement:
+        print(f"\n✗ Agreement below {args.min_agreement:.0%}")
+        return 1
+    print(f"\n✓ Agreement at or above {args.min_agreement:.0%}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
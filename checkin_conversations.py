@@ -0,0 +1,129 @@
+import json
+import os
+import uuid
+from datetime import datetime, timedelta
+from activity_catalog import get_wellness_activity_by_category
+from checkins import build_checkin_row, insert_checkins
+from sentiment_analysis import parse_checkin_answer, summarize_checkin
+
+# Check-in conversation configuration
+CHECKIN_CONVERSATION_TTL = int(os.getenv('CHECKIN_CONVERSATION_TTL', 3600))  # seconds of inactivity before a conversation is dropped
+
+PURGE_BATCH_SIZE = 100
+
+SUMMARY_QUESTION_INDEX = 4
+SUMMARY_QUESTION = 'Complete wellness check-in analysis'
+
+# Summary fields kept so a repeated complete call can be answered without redoing it
+RESULT_FIELDS = ('sentiment', 'sentiment_score', 'confidence', 'emotions', 'recommendation',
+                 'wellness_tip', 'activity_category', 'numeric_analysis')
+
+class ConversationNotFound(Exception):
+    """No open conversation with that id for this user (unknown, expired or someone else's)"""
+
+def _encode(value):
+    return json.dumps(value, default=lambda v: v.isoformat() if isinstance(v, datetime) else str(v))
+
+def start_conversation(cursor, user_id):
+    """Open a check-in conversation for a user (caller commits); returns its id"""
+    # Abandoned conversations are cleaned up a few at a time as new ones start
+    cursor.execute(
+        "DELETE FROM checkin_conversations WHERE expires_at <= %s LIMIT %s",
+        (datetime.now(), PURGE_BATCH_SIZE)
+    )
+
+    conversation_id = str(uuid.uuid4())
+    cursor.execute(
+        """INSERT INTO checkin_conversations (id, user_id, answers, expires_at)
+           VALUES (%s, %s, JSON_OBJECT(), %s)""",
+        (conversation_id, user_id, datetime.now() + timedelta(seconds=CHECKIN_CONVERSATION_TTL))
+    )
+    return conversation_id
+
+def record_answer(cursor, conversation_id, user_id, question_index, question, answer, analysis=None):
+    """Store one analyzed answer in its conversation (caller commits)
+
+    Keeps the parse_checkin_answer() partial used by the final summary,
+    taken from analysis (the answer's analyze_checkin() result) when given.
+    Answering the same question_index again replaces the earlier answer.
+    Raises ConversationNotFound if the conversation is not open.
+    """
+    entry = {
+        'question': question,
+        'answer': answer,
+        'partial': parse_checkin_answer(question, answer, analysis)
+    }
+
+    cursor.execute(
+        """UPDATE checkin_conversations
+           SET answers = JSON_SET(answers, %s, CAST(%s AS JSON)), expires_at = %s
+           WHERE id = %s AND user_id = %s AND status = 'open' AND expires_at > %s""",
+        (f'$."{int(question_index)}"', _encode(entry),
+         datetime.now() + timedelta(seconds=CHECKIN_CONVERSATION_TTL),
+         conversation_id, user_id, datetime.now())
+    )
+    if cursor.rowcount == 0:
+        raise ConversationNotFound(conversation_id)
+    return entry['partial']
+
+def transcript(entries):
+    """The combined message stored with the summary check-in"""
+    return ' '.join(
+        f"Question {number}: {entry['question']} Answer: {entry['answer']}"
+        for number, entry in enumerate(entries, start=1)
+    )
+
+def complete_conversation(conn, conversation_id, user_id):
+    """Summarize a conversation and store it as one check-in (commits)
+
+    The summary is built from the partial results stored with each
+    answer, so no answer is parsed again. Only the summary row is stored,
+    as with the all_answers request to /api/checkin, so stats and history
+    count a check-in once whichever way it was sent. It is inserted in the
+    same transaction that closes the conversation. Calling this again for
+    a completed conversation returns the stored result.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            """SELECT answers, status, result FROM checkin_conversations
+               WHERE id = %s AND user_id = %s AND (status = 'completed' OR expires_at > %s)
+               FOR UPDATE""",
+            (conversation_id, user_id, datetime.now())
+        )
+        conversation = cursor.fetchone()
+        if conversation is None:
+            raise ConversationNotFound(conversation_id)
+
+        answers, status, result = conversation
+        if status == 'completed':
+            conn.rollback()
+            result = json.loads(result)
+            result['suggested_activity'] = get_wellness_activity_by_category(result['activity_category'])
+            return result
+
+        answers = json.loads(answers) if isinstance(answers, (str, bytes)) else answers
+        entries = [answers[key] for key in sorted(answers, key=int)]
+
+        summary = summarize_checkin([entry['partial'] for entry in entries])
+        summary_row = build_checkin_row(user_id, transcript(entries), summary,
+                                        SUMMARY_QUESTION_INDEX, SUMMARY_QUESTION)
+
+        insert_checkins(conn, [summary_row])
+
+        result = {field: summary.get(field) for field in RESULT_FIELDS}
+        result['checkin_id'] = summary_row['client_id']
+        cursor.execute(
+            """UPDATE checkin_conversations SET status = 'completed', result = %s
+               WHERE id = %s""",
+            (_encode(result), conversation_id)
+        )
+        conn.commit()
+
+        result['suggested_activity'] = summary.get('suggested_activity')
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
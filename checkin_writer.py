@@ -0,0 +1,312 @@
+import atexit
+import glob
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from mysql.connector.errors import DataError, IntegrityError, ProgrammingError
+from checkins import insert_checkins
+from db import get_db_connection
+
+try:
+    import fcntl
+except ImportError:  # Windows: spool files are not locked
+    fcntl = None
+
+# Write-behind configuration
+CHECKIN_WRITE_MODE = os.getenv('CHECKIN_WRITE_MODE', 'sync')  # 'sync' or 'write_behind'
+CHECKIN_SPOOL_DIR = os.getenv('CHECKIN_SPOOL_DIR', 'spool')
+CHECKIN_SPOOL_FSYNC = os.getenv('CHECKIN_SPOOL_FSYNC', 'false').lower() in ('1', 'true', 'yes')
+CHECKIN_QUEUE_MAX = int(os.getenv('CHECKIN_QUEUE_MAX', 10000))
+CHECKIN_BATCH_SIZE = int(os.getenv('CHECKIN_BATCH_SIZE', 200))
+CHECKIN_FLUSH_INTERVAL = float(os.getenv('CHECKIN_FLUSH_INTERVAL', 0.05))  # group commit window in seconds
+
+RETRY_DELAY_MAX = 30
+ISOLATE_ATTEMPTS = int(os.getenv('CHECKIN_ISOLATE_ATTEMPTS', 5))  # tries per row when isolating bad rows
+
+# Errors that retrying the same rows won't fix
+PERMANENT_ERRORS = (DataError, IntegrityError, ProgrammingError)
+
+def _encode_row(row):
+    return json.dumps(row, default=lambda value: value.isoformat() if isinstance(value, datetime) else str(value))
+
+class CheckinWriter:
+    """Queues check-in rows and writes them in batches on a background thread
+
+    Every row is appended to a per-process spool file before it is queued,
+    so rows accepted but not yet committed survive a crash: spool files
+    left behind by dead processes are replayed on startup. Inserts are
+    idempotent on client_id, so replaying rows that did commit is harmless.
+
+    Rows are committed in the order they were spooled, so after each batch
+    the committed rows are a prefix of the spool; the spool is truncated
+    or compacted then, and holds at most about twice the uncommitted rows.
+    A row that keeps failing while a bad batch is isolated is held: it is
+    kept at the head of the spool and retried by the next start.
+    """
+
+    def __init__(self, spool_dir=CHECKIN_SPOOL_DIR, batch_size=CHECKIN_BATCH_SIZE,
+                 flush_interval=CHECKIN_FLUSH_INTERVAL, queue_max=CHECKIN_QUEUE_MAX,
+                 fsync=CHECKIN_SPOOL_FSYNC):
+        self.spool_dir = spool_dir
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue_max = queue_max
+        self.fsync = fsync
+
+        self._pid = None
+        self._queue = None
+        self._thread = None
+        self._spool = None
+        self._spool_path = None
+        self._spool_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._spooled = deque()  # encoded lines of rows spooled but not yet committed, in spool order
+        self._held = []  # encoded lines of rows left in the spool for the next start
+        self._spool_rows = 0  # lines in the spool file, committed or not
+
+        # Metrics
+        self.enqueued = 0
+        self.written = 0
+        self.batches = 0
+        self.failures = 0
+        self.dropped = 0
+        self.recovered = 0
+        self.held = 0
+
+    def start(self):
+        """Open this process's spool and start the writer thread"""
+        if self._pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+
+            os.makedirs(self.spool_dir, exist_ok=True)
+            recovered, orphan_paths = self._claim_orphaned_spools()
+
+            self._queue = queue.Queue(maxsize=self.queue_max)
+            self._spool_lock = threading.Lock()
+            self._stopping = threading.Event()
+            # A fresh name per start: PIDs are reused (PID 1 in every container restart), and a
+            # dead process's spool with our PID must be recovered, not reopened as our own
+            self._spool_path = os.path.join(self.spool_dir, f'checkins-{os.getpid()}-{uuid.uuid4().hex[:8]}.jsonl')
+            self._spool = self._open_spool(self._spool_path)
+
+            # Take over recovered rows in our own spool before deleting the orphans
+            self._spooled = deque(_encode_row(row) + '\n' for row in recovered)
+            self._held = []
+            self._spool.writelines(self._spooled)
+            self._spool.flush()
+            os.fsync(self._spool.fileno())
+            self._spool_rows = len(self._spooled)
+            for path in orphan_paths:
+                os.remove(path)
+
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, args=(recovered,),
+                                            name='checkin-writer', daemon=True)
+            self._thread.start()
+
+    def _open_spool(self, path):
+        spool = open(path, 'w', encoding='utf-8')
+        if fcntl:
+            fcntl.flock(spool, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return spool
+
+    def _claim_orphaned_spools(self):
+        """Read rows from spool files whose owning process has gone away"""
+        rows = []
+        paths = []
+        for path in glob.glob(os.path.join(self.spool_dir, 'checkins-*.jsonl')):
+            if path == self._spool_path:
+                continue
+            try:
+                with open(path, 'r+', encoding='utf-8') as spool:
+                    if fcntl:
+                        try:
+                            fcntl.flock(spool, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        except OSError:
+                            continue  # Still owned by a live worker
+                        if os.fstat(spool.fileno()).st_ino != os.stat(path).st_ino:
+                            continue  # Compacted by its live owner while we waited
+                    for line in spool:
+                        line = line.strip()
+                        if line:
+                            try:
+                                rows.append(json.loads(line))
+                            except ValueError:
+                                pass  # Torn final line from a crash mid-write
+                paths.append(path)
+            except OSError as e:
+                print(f"Error recovering check-in spool {path}: {e}")
+
+        if rows:
+            print(f"✓ Recovered {len(rows)} spooled check-ins")
+        return rows, paths
+
+    def submit(self, row):
+        """Spool and enqueue a row; raises queue.Full when the writer is backed up"""
+        self.start()
+
+        line = _encode_row(row) + '\n'
+        with self._spool_lock:
+            if self._queue.full():
+                raise queue.Full
+            self._spool.write(line)
+            self._spool.flush()
+            if self.fsync:
+                os.fsync(self._spool.fileno())
+            self._spooled.append(line)
+            self._spool_rows += 1
+            self._queue.put_nowait(row)
+        self.enqueued += 1
+
+    def _run(self, recovered):
+        # Replay anything a crashed process left behind before taking new work
+        for start in range(0, len(recovered), self.batch_size):
+            self._write(recovered[start:start + self.batch_size], recovered=True)
+
+        while not (self._stopping.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+
+            # Group commit: gather whatever arrives within the flush window
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+
+    def _insert(self, rows):
+        conn = get_db_connection()
+        try:
+            insert_checkins(conn, rows)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _insert_retrying(self, rows, attempts=None):
+        """Insert rows, retrying transient errors until they commit or attempts run out
+
+        Raises PERMANENT_ERRORS at once, and the last transient error once
+        attempts (unlimited when None) are used up.
+        """
+        delay = 0.5
+        while True:
+            try:
+                self._insert(rows)
+                return
+            except PERMANENT_ERRORS:
+                raise
+            except Exception as e:
+                self.failures += 1
+                if attempts is not None:
+                    attempts -= 1
+                    if attempts <= 0:
+                        raise
+                print(f"Error writing {len(rows)} queued check-ins, retrying in {delay}s: {e}")
+                time.sleep(delay)
+                delay = min(delay * 2, RETRY_DELAY_MAX)
+
+    def _write(self, batch, recovered=False):
+        """Insert a batch in one transaction, retrying until it commits"""
+        held = set()
+        try:
+            self._insert_retrying(batch)
+        except PERMANENT_ERRORS as e:
+            # Retrying the batch won't help; write rows one by one and drop only the bad ones.
+            # A row that still fails transiently after a few tries is held in the spool for the
+            # next start rather than retried forever, which would stall every row behind it.
+            self.failures += 1
+            print(f"Error writing {len(batch)} queued check-ins, isolating bad rows: {e}")
+            for index, row in enumerate(batch):
+                try:
+                    self._insert_retrying([row], attempts=ISOLATE_ATTEMPTS)
+                except PERMANENT_ERRORS as row_error:
+                    self.dropped += 1
+                    print(f"Dropping queued check-in {row.get('client_id')}: {row_error}")
+                except Exception as row_error:
+                    held.add(index)
+                    print(f"Holding queued check-in {row.get('client_id')} for the next start: {row_error}")
+
+        self.batches += 1
+        self.held += len(held)
+        if recovered:
+            self.recovered += len(batch) - len(held)
+        else:
+            self.written += len(batch) - len(held)
+        self._release_spooled(len(batch), held)
+
+    def _release_spooled(self, count, held=()):
+        """Forget the oldest count spooled rows, now committed or held, and shrink the spool"""
+        with self._spool_lock:
+            for index in range(count):
+                line = self._spooled.popleft()
+                if index in held:
+                    self._held.append(line)
+
+            if not self._spooled and not self._held:
+                # Everything spooled so far is committed; start the spool afresh
+                self._spool.seek(0)
+                self._spool.truncate()
+                self._spool_rows = 0
+            elif self._spool_rows >= 2 * (len(self._held) + len(self._spooled)):
+                self._compact_spool()
+
+    def _compact_spool(self):
+        """Replace the spool with one holding only held and uncommitted rows (caller holds _spool_lock)"""
+        temp_path = self._spool_path + '.tmp'  # not matched by the orphan glob
+        spool = self._open_spool(temp_path)
+        spool.writelines(self._held)
+        spool.writelines(self._spooled)
+        spool.flush()
+        if self.fsync:
+            os.fsync(spool.fileno())
+        os.replace(temp_path, self._spool_path)
+
+        self._spool.close()
+        self._spool = spool
+        self._spool_rows = len(self._held) + len(self._spooled)
+
+    def flush(self, timeout=10):
+        """Stop accepting work and wait for queued rows to be written"""
+        if self._pid != os.getpid() or self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+
+    def stats(self):
+        """Return queue depth and write counters"""
+        return {
+            'mode': CHECKIN_WRITE_MODE,
+            'queued': self._queue.qsize() if self._queue is not None else 0,
+            'enqueued': self.enqueued,
+            'written': self.written,
+            'batches': self.batches,
+            'failures': self.failures,
+            'dropped': self.dropped,
+            'recovered': self.recovered,
+            'held': self.held
+        }
+
+checkin_writer = CheckinWriter()
+atexit.register(checkin_writer.flush)
+
+def write_behind_enabled():
+    """Whether check-ins should be queued instead of inserted inline"""
+    return CHECKIN_WRITE_MODE == 'write_behind'
@@ -0,0 +1,122 @@
+import uuid
+from datetime import datetime
+from metrics import span
+from rollups import apply_checkin_rollups
+from sentiment_analysis import encode_emotions
+
+# Columns written for every check-in, in insert order
+CHECKIN_COLUMNS = ['client_id', 'user_id', 'message', 'sentiment', 'sentiment_score', 'confidence',
+                   'energy_score', 'stress_score', 'sleep_score', 'emotion_mask', 'activity_id',
+                   'recommendation', 'question_index', 'question', 'created_at']
+
+INSERT_CHECKIN_SQL = f"""INSERT INTO checkins ({', '.join(CHECKIN_COLUMNS)})
+    VALUES ({', '.join(['%s'] * len(CHECKIN_COLUMNS))})
+    ON DUPLICATE KEY UPDATE id = id"""
+
+def new_client_id():
+    """Generate an id for a check-in before it reaches the database"""
+    return str(uuid.uuid4())
+
+def numeric_scores(numeric_analysis):
+    """Return (energy, stress, sleep) 1-10 scores from an analysis' numeric_analysis"""
+    scores = {'energy': None, 'stress': None, 'sleep': None}
+    if not numeric_analysis:
+        return scores['energy'], scores['stress'], scores['sleep']
+
+    if 'category' in numeric_analysis:
+        # Single answer: {'category': 'stress', 'score': 8, ...}
+        if numeric_analysis['category'] in scores:
+            scores[numeric_analysis['category']] = numeric_analysis['score']
+    else:
+        # Whole check-in: {'energy': {...}, 'stress': {...}, 'sleep': {...}}
+        for category in scores:
+            if numeric_analysis.get(category):
+                scores[category] = numeric_analysis[category]['score']
+
+    return scores['energy'], scores['stress'], scores['sleep']
+
+def build_checkin_row(user_id, message, analysis, question_index=0, question='', created_at=None, client_id=None):
+    """Build the row stored for one analyzed check-in"""
+    energy_score, stress_score, sleep_score = numeric_scores(analysis.get('numeric_analysis'))
+    activity = analysis.get('suggested_activity')
+
+    return {
+        'client_id': client_id or new_client_id(),
+        'user_id': user_id,
+        'message': message,
+        'sentiment': analysis['sentiment'],
+        'sentiment_score': analysis.get('sentiment_score', 0.0),
+        'confidence': analysis.get('confidence', 0.0),
+        'energy_score': energy_score,
+        'stress_score': stress_score,
+        'sleep_score': sleep_score,
+        'emotion_mask': encode_emotions(analysis.get('emotions')),
+        'activity_id': activity.get('id') if activity else None,
+        'recommendation': analysis['recommendation'],
+        'question_index': question_index,
+        'question': question,
+        'created_at': created_at or datetime.now()
+    }
+
+def insert_checkins(conn, rows):
+    """Insert check-in rows and update the wellness rollups (caller commits)
+
+    Rows are keyed by client_id: rows that are already stored are skipped,
+    so replaying a batch neither duplicates check-ins nor counts them twice
+    in the rollups. Each affected user's cache_version is bumped. Returns
+    the id of the first row (the stored id when the only row was a replay),
+    or None when nothing was given.
+    """
+    with span('checkins.insert', rows=len(rows)):
+        return _insert_checkins(conn, rows)
+
+def _insert_checkins(conn, rows):
+    rows = [dict(row, created_at=datetime.fromisoformat(row['created_at']))
+            if isinstance(row['created_at'], str) else row
+            for row in rows]
+    if not rows:
+        return None
+
+    cursor = conn.cursor()
+    client_ids = [row['client_id'] for row in rows if row.get('client_id')]
+    existing = {}
+    if client_ids:
+        # A locking read: it waits for a writer inserting the same client_id to finish and sees its row,
+        # and two transactions that both find an id missing deadlock on the insert instead of both
+        # counting it (the loser is rolled back, retried and then skips it)
+        cursor.execute(
+            f"""SELECT client_id, id FROM checkins
+                WHERE client_id IN ({', '.join(['%s'] * len(client_ids))}) FOR UPDATE""",
+            client_ids
+        )
+        existing = dict(cursor.fetchall())
+
+    new_rows = []
+    for row in rows:
+        client_id = row.get('client_id')
+        if client_id is None or client_id not in existing:
+            new_rows.append(row)
+            if client_id is not None:
+                existing[client_id] = None  # a repeat later in this batch is a replay too
+    if not new_rows:
+        cursor.close()
+        return existing[rows[0]['client_id']]
+
+    # Invalidates cached dashboard reads; taking the users row locks first also
+    # avoids upgrading the foreign-key share locks the inserts below would take
+    user_ids = sorted({row['user_id'] for row in new_rows})
+    cursor.execute(
+        f"UPDATE users SET cache_version = cache_version + 1 WHERE id IN ({', '.join(['%s'] * len(user_ids))})",
+        user_ids
+    )
+
+    values = [tuple(row.get(column) for column in CHECKIN_COLUMNS) for row in new_rows]
+    if len(values) == 1:
+        cursor.execute(INSERT_CHECKIN_SQL, values[0])
+    else:
+        cursor.executemany(INSERT_CHECKIN_SQL, values)
+    first_id = cursor.lastrowid
+
+    apply_checkin_rollups(cursor, new_rows)
+    cursor.close()
+    return first_id
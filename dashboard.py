@@ -0,0 +1,177 @@
+from datetime import date, datetime
+from entitlements import get_entitlement
+from history import fetch_history_page
+from rollups import get_user_rollup
+from sentiment_analysis import wellness_score
+
+# Sections the dashboard bootstrap endpoint can return
+DASHBOARD_SECTIONS = ('profile', 'stats', 'checkins', 'tip')
+DASHBOARD_CHECKINS_LIMIT = 5
+
+# Daily wellness tips
+DAILY_TIPS = [
+    "💧 Stay hydrated - even mild dehydration affects mood and energy.",
+    "🌱 Take micro-breaks every hour, even just 30 seconds of stretching helps.",
+    "🌞 Natural light exposure helps regulate your circadian rhythm.",
+    "🫂 Social connection is as important for health as diet and exercise.",
+    "🎯 Focus on progress, not perfection. Small steps lead to big changes.",
+    "🧘 Just 2 minutes of deep breathing can activate your relaxation response.",
+    "📱 Consider a 'phone-free' meal today to practice mindful eating.",
+    "🚶 A 5-minute walk can boost creativity and reduce stress hormones.",
+    "😴 Quality sleep is the foundation of good mental health.",
+    "🍎 Eating regular, balanced meals helps stabilize your mood and energy.",
+    "🎵 Music can be a powerful tool for mood regulation and stress relief.",
+    "📝 Journaling for just 5 minutes can help process emotions and reduce anxiety.",
+    "🌿 Spending time in nature, even just looking at plants, can reduce stress.",
+    "🤝 Reach out to a friend or family member today - connection matters.",
+    "🎨 Creative activities like drawing or coloring can be surprisingly therapeutic.",
+    "⏰ Set boundaries with your time - it's okay to say no to protect your energy.",
+    "🔄 Practice gratitude by writing down 3 things you're thankful for today.",
+    "🧠 Challenge negative thoughts by asking 'Is this thought helpful or true?'",
+    "🏃‍♀️ Even 10 minutes of physical activity can boost your mood and energy.",
+    "🌅 Start your day with intention - set one small goal for today.",
+    "💤 Create a relaxing bedtime routine to improve sleep quality.",
+    "🍃 Practice mindful breathing: 4 counts in, hold 4, 4 counts out.",
+    "📚 Reading for pleasure can be a great way to unwind and escape stress.",
+    "🎪 Laughter truly is medicine - watch something funny or call a funny friend.",
+    "🌙 Limit screen time 1 hour before bed for better sleep quality.",
+    "💝 Do something kind for yourself today - you deserve care and compassion.",
+    "🎯 Break large tasks into smaller, manageable steps to reduce overwhelm.",
+    "🌱 Try a new healthy recipe - cooking can be a mindful, creative activity.",
+    "🧘‍♀️ Practice body scanning: notice tension and consciously relax each muscle group.",
+    "📞 Call someone you haven't talked to in a while - connection is healing."
+]
+
+def daily_tip(today=None):
+    """Return today's tip (the same for everyone all day) and its index"""
+    today = today or datetime.now()
+
+    # Use day of year to select a consistent tip for the day
+    tip_index = today.timetuple().tm_yday % len(DAILY_TIPS)
+    return {
+        'tip': DAILY_TIPS[tip_index],
+        'date': today.strftime('%Y-%m-%d')
+    }, tip_index
+
+def profile_payload(user):
+    """Public view of a user principal, with the subscription as currently in effect"""
+    entitlement = get_entitlement(user)
+    return {
+        'id': user['id'],
+        'username': user['username'],
+        'email': user['email'],
+        'subscription_type': entitlement.tier,
+        'subscription_status': entitlement.status,
+        'subscription_start_date': user['subscription_start_date'].isoformat() if user['subscription_start_date'] else None,
+        'subscription_end_date': user['subscription_end_date'].isoformat() if user['subscription_end_date'] else None,
+        'member_since': user['created_at'].isoformat() if user['created_at'] else None
+    }
+
+def subscription_expired_at(user, now=None):
+    """When the principal's subscription ran out, if it has
+
+    The profile changes then without a write, so nothing bumps
+    cache_version or updated_at.
+    """
+    now = now or datetime.now()
+    end_date = user['subscription_end_date']
+    return end_date if end_date is not None and end_date <= now else None
+
+def get_cache_version(cursor, user_id):
+    """Read a user's cache_version and updated_at straight from the database
+
+    Check-ins handled by other workers bump the version, so this skips the
+    principal cache.
+    """
+    cursor.execute("SELECT cache_version, updated_at FROM users WHERE id = %s", (user_id,))
+    row = cursor.fetchone()
+    if row is not None and not isinstance(row, dict):
+        row = dict(zip(cursor.column_names, row))
+    return row
+
+def wellness_stats_payload(cursor, user_id):
+    """Wellness statistics from the user's rollups"""
+    # Incrementally maintained counters: one primary-key lookup plus a week of daily buckets
+    rollup = get_user_rollup(cursor, user_id)
+
+    total_checkins = int(rollup['checkins'])
+    positive_count = int(rollup['positive_count'])
+    neutral_count = int(rollup['neutral_count'])
+    negative_count = int(rollup['negative_count'])
+
+    def average(total, count, digits):
+        return round(float(total) / count, digits) if count else None
+
+    return {
+        'wellness_score': wellness_score(positive_count, neutral_count, negative_count),
+        'total_checkins': total_checkins,
+        'weekly_checkins': int(rollup['weekly_checkins']),
+        'sentiment_distribution': {
+            'positive': positive_count,
+            'neutral': neutral_count,
+            'negative': negative_count
+        },
+        'averages': {
+            'sentiment_score': average(rollup['sentiment_score_sum'], total_checkins, 2),
+            'energy': average(rollup['energy_sum'], rollup['energy_count'], 1),
+            'stress': average(rollup['stress_sum'], rollup['stress_count'], 1),
+            'sleep': average(rollup['sleep_sum'], rollup['sleep_count'], 1)
+        }
+    }
+
+def checkin_history_payload(cursor, user_id, limit, after=None):
+    """Return (formatted check-ins, next_cursor) for one history page"""
+    checkins, next_cursor = fetch_history_page(cursor, user_id, limit, after)
+
+    history = []
+    for checkin in checkins:
+        history.append({
+            'id': checkin['id'],
+            'message': checkin['message'],
+            'sentiment': checkin['sentiment'],
+            'recommendation': checkin['recommendation'],
+            'question_index': checkin['question_index'],
+            'question': checkin['question'],
+            'created_at': checkin['created_at'].isoformat() if checkin['created_at'] else None
+        })
+    return history, next_cursor
+
+def parse_sections(value):
+    """Parse a comma-separated ?sections= value; raises ValueError on unknown names"""
+    if not value:
+        return list(DASHBOARD_SECTIONS)
+    sections = [section.strip() for section in value.split(',') if section.strip()]
+    unknown = [section for section in sections if section not in DASHBOARD_SECTIONS]
+    if unknown or not sections:
+        raise ValueError(f"Unknown sections: {', '.join(unknown)}")
+    return sections
+
+def build_dashboard(user, sections, cursor=None, checkins_limit=DASHBOARD_CHECKINS_LIMIT):
+    """Build the requested dashboard sections
+
+    user is the request's principal; cursor is a dictionary cursor, needed
+    only for the 'stats' and 'checkins' sections and shared between them.
+    """
+    payload = {}
+    for section in sections:
+        if section == 'profile':
+            payload['user'] = profile_payload(user)
+        elif section == 'stats':
+            payload['stats'] = wellness_stats_payload(cursor, user['id'])
+        elif section == 'checkins':
+            payload['checkins'], payload['checkins_next_cursor'] = checkin_history_payload(
+                cursor, user['id'], checkins_limit)
+        elif section == 'tip':
+            payload['tip'] = daily_tip()[0]
+    return payload
+
+def dashboard_etag_parts(user, sections, version, checkins_limit):
+    """Everything a bootstrap response depends on, for its ETag
+
+    version is a get_cache_version() row, or the principal itself when no
+    database-backed section was requested. The entitlement is included
+    because it expires without bumping cache_version.
+    """
+    entitlement = get_entitlement(user)
+    return ('dashboard', user['id'], version['cache_version'], entitlement.tier, entitlement.status, date.today(),
+            ','.join(sorted(sections)), checkins_limit)
@@ -0,0 +1,55 @@
+import os
+from collections import namedtuple
+from datetime import datetime
+from cache import TTLCache
+
+# Entitlement cache configuration
+ENTITLEMENT_CACHE_SIZE = int(os.getenv('ENTITLEMENT_CACHE_SIZE', 10000))
+ENTITLEMENT_CACHE_TTL = int(os.getenv('ENTITLEMENT_CACHE_TTL', 3600))  # upper bound when there is no nearer boundary
+
+Entitlement = namedtuple('Entitlement', ['tier', 'status', 'valid_until'])
+
+# Keyed by (user_id, cache_version): upgrades and expiries bump the version, so stale decisions are never hit
+_decisions = TTLCache(maxsize=ENTITLEMENT_CACHE_SIZE, ttl=ENTITLEMENT_CACHE_TTL)
+
+def evaluate_entitlement(user, now=None):
+    """Decide a user's effective tier from subscription type, status and end date
+
+    A premium subscription past its end date is treated as expired even
+    before the sweeper has flipped the row. valid_until is the moment the
+    decision may change on its own (None if only a write can change it).
+    """
+    now = now or datetime.now()
+    end_date = user.get('subscription_end_date')
+
+    if user.get('subscription_type') != 'premium':
+        return Entitlement('free', user.get('subscription_status') or 'active', None)
+    if user.get('subscription_status') not in (None, 'active'):
+        return Entitlement('free', user['subscription_status'], None)
+    if end_date is not None and end_date <= now:
+        return Entitlement('free', 'expired', None)
+    return Entitlement('premium', 'active', end_date)
+
+def get_entitlement(user, now=None):
+    """Cached evaluate_entitlement() for a principal, reused until its next boundary"""
+    now = now or datetime.now()
+    key = (user['id'], user.get('cache_version'))
+
+    decision = _decisions.get(key)
+    if decision is not None and (decision.valid_until is None or now < decision.valid_until):
+        return decision
+
+    decision = evaluate_entitlement(user, now)
+    ttl = ENTITLEMENT_CACHE_TTL
+    if decision.valid_until is not None:
+        ttl = max(1, min(ttl, int((decision.valid_until - now).total_seconds())))
+    _decisions.set(key, decision, ttl=ttl)
+    return decision
+
+def is_premium(user):
+    """Whether a principal currently has premium access"""
+    return get_entitlement(user).tier == 'premium'
+
+def get_entitlement_cache_stats():
+    """Return hit/miss statistics for the entitlement cache"""
+    return _decisions.stats()
@@ -0,0 +1,166 @@
+"""Local stand-in for the IntaSend API, for development and tests
+
+Run it and point the app at it:
+
+    python fake_intasend.py --port 8765 --latency 0.05 --fail-rate 0.1
+    INTASEND_BASE_URL=http://127.0.0.1:8765 python app.py
+
+or start it in-process:
+
+    with FakeIntaSend(fail_rate=0.5) as server:
+        client = IntaSendClient(base_url=server.url)
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class FakeIntaSendHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real gateway
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            return json.loads(raw or b'{}')
+        except ValueError:
+            return None
+
+    def _simulate(self):
+        """Apply injected latency and failures; returns True if a failure was sent"""
+        server = self.server
+        server.requests += 1
+        if server.latency:
+            time.sleep(server.latency)
+        if server.hang and random.random() < server.hang:
+            time.sleep(server.hang_seconds)
+        if server.fail_rate and random.random() < server.fail_rate:
+            self._send(server.fail_status, {'detail': 'Injected failure'})
+            return True
+        if not self.headers.get('Authorization', '').startswith('Bearer '):
+            self._send(401, {'detail': 'Authentication credentials were not provided.'})
+            return True
+        return False
+
+    def do_POST(self):
+        body = self._read_json()
+        if self._simulate():
+            return
+        if body is None:
+            self._send(400, {'detail': 'Invalid JSON'})
+            return
+
+        if self.path == '/api/v1/customers/':
+            customer = {'id': f'cus_{uuid.uuid4().hex[:12]}', 'email': body.get('email'), 'name': body.get('name')}
+            self.server.customers[customer['id']] = customer
+            self._send(201, customer)
+        elif self.path == '/api/v1/payment-links/':
+            payment_id = f'pay_{uuid.uuid4().hex[:12]}'
+            payment = {
+                'id': payment_id,
+                'payment_url': f'{self.server.url}/checkout/{payment_id}',
+                'amount': body.get('amount'),
+                'currency': body.get('currency', 'USD'),
+                'customer': body.get('customer'),
+                'customer_id': body.get('customer'),
+                'status': self.server.payment_status
+            }
+            self.server.payments[payment_id] = payment
+            self._send(201, payment)
+        else:
+            self._send(404, {'detail': 'Not found.'})
+
+    def do_GET(self):
+        if self._simulate():
+            return
+        prefix = '/api/v1/payments/'
+        if self.path.startswith(prefix):
+            payment_id = self.path[len(prefix):].strip('/')
+            payment = self.server.payments.get(payment_id)
+            if payment is None:
+                # Unknown ids are treated as completed payments so webhooks can be replayed by hand
+                payment = {'id': payment_id, 'status': self.server.payment_status, 'amount': 49, 'currency': 'USD'}
+            self._send(200, payment)
+        else:
+            self._send(404, {'detail': 'Not found.'})
+
+class FakeIntaSend(ThreadingHTTPServer):
+    """In-memory IntaSend API with latency and failure injection"""
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, fail_rate=0.0, fail_status=503,
+                 hang=0.0, hang_seconds=30.0, payment_status='COMPLETE', verbose=False):
+        super().__init__((host, port), FakeIntaSendHandler)
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.fail_status = fail_status
+        self.hang = hang
+        self.hang_seconds = hang_seconds
+        self.payment_status = payment_status
+        self.verbose = verbose
+        self.customers = {}
+        self.payments = {}
+        self.requests = 0
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """Serve on a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name='fake-intasend', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run a fake IntaSend API server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every request')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='fraction of requests answered with --fail-status')
+    parser.add_argument('--fail-status', type=int, default=503)
+    parser.add_argument('--hang', type=float, default=0.0, help='fraction of requests that stall for --hang-seconds')
+    parser.add_argument('--hang-seconds', type=float, default=30.0)
+    parser.add_argument('--payment-status', default='COMPLETE')
+    args = parser.parse_args(argv)
+
+    server = FakeIntaSend(args.host, args.port, args.latency, args.fail_rate, args.fail_status,
+                          args.hang, args.hang_seconds, args.payment_status, verbose=True)
+    print(f"Fake IntaSend listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
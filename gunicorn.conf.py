@@ -0,0 +1,36 @@
+"""Gunicorn settings (picked up automatically from the working directory)
+
+The app and the sentiment engine are loaded once in the master and shared
+with workers through fork, so booting a worker, including autoscaling
+out, costs milliseconds instead of a fresh import. Background threads and
+pools are started per worker in post_fork; schema setup is a separate
+release step (`python db.py migrate`).
+"""
+import os
+import time
+
+# Worker count still comes from WEB_CONCURRENCY / --workers as usual
+preload_app = os.getenv('GUNICORN_PRELOAD', '1') != '0'
+
+# Load the sentiment engine in the master so workers inherit it (0 = load on first use)
+PRELOAD_SENTIMENT = os.getenv('PRELOAD_SENTIMENT', '1') != '0'
+
+def when_ready(server):
+    if preload_app and PRELOAD_SENTIMENT:
+        from sentiment_engines import SENTIMENT_ENGINE, get_sentiment_engine
+        started = time.perf_counter()
+        get_sentiment_engine()
+        server.log.info(f"Preloaded sentiment engine '{SENTIMENT_ENGINE}' in "
+                        f"{(time.perf_counter() - started) * 1000:.0f} ms")
+
+def pre_fork(server, worker):
+    worker.forked_at = time.perf_counter()
+
+def post_fork(server, worker):
+    from app import start_background_workers
+    start_background_workers()
+
+def post_worker_init(worker):
+    from app import startup_timings
+    startup_timings['worker_boot_ms'] = round((time.perf_counter() - worker.forked_at) * 1000, 1)
+    worker.log.info(f"Worker {worker.pid} booted in {startup_timings['worker_boot_ms']} ms")
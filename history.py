@@ -0,0 +1,120 @@
+import base64
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from db import get_db_connection
+from sentiment_analysis import decode_emotions
+
+# History paging configuration
+CHECKIN_HISTORY_PAGE_MAX = int(os.getenv('CHECKIN_HISTORY_PAGE_MAX', 100))
+CHECKIN_EXPORT_CHUNK_SIZE = int(os.getenv('CHECKIN_EXPORT_CHUNK_SIZE', 500))  # rows fetched and emitted per chunk
+
+HISTORY_FIELDS = ['id', 'message', 'sentiment', 'recommendation', 'question_index', 'question', 'created_at']
+
+EXPORT_FIELDS = ['id', 'created_at', 'question_index', 'question', 'message', 'sentiment', 'sentiment_score',
+                 'confidence', 'energy_score', 'stress_score', 'sleep_score', 'emotions', 'recommendation']
+
+# Newest first, walking the (user_id, created_at) index; id breaks ties within a timestamp
+HISTORY_ORDER = "ORDER BY created_at DESC, id DESC"
+AFTER_CURSOR = "AND (created_at < %s OR (created_at = %s AND id < %s))"
+
+def encode_cursor(created_at, checkin_id):
+    """Opaque page cursor pointing just past the given check-in"""
+    raw = f"{created_at.isoformat()}|{checkin_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(token):
+    """Return (created_at, id) from a page cursor; raises ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+        created_at, checkin_id = raw.split('|')
+        return datetime.fromisoformat(created_at), int(checkin_id)
+    except (UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {token!r}") from e
+
+def fetch_history_page(cursor, user_id, limit, after=None):
+    """Return (rows, next_cursor) for one page of a user's check-ins
+
+    limit is clamped to 1..CHECKIN_HISTORY_PAGE_MAX. One extra row is
+    fetched to tell whether another page exists; next_cursor is None on
+    the last page.
+    """
+    limit = max(1, min(limit, CHECKIN_HISTORY_PAGE_MAX))
+    sql = f"SELECT {', '.join(HISTORY_FIELDS)} FROM checkins WHERE user_id = %s"
+    params = [user_id]
+    if after is not None:
+        created_at, checkin_id = decode_cursor(after)
+        sql += f" {AFTER_CURSOR}"
+        params += [created_at, created_at, checkin_id]
+    sql += f" {HISTORY_ORDER} LIMIT %s"
+    params.append(limit + 1)
+
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]['created_at'], rows[-1]['id'])
+    return rows, next_cursor
+
+def _export_record(row):
+    record = dict(zip(EXPORT_FIELDS, row))
+    record['created_at'] = record['created_at'].isoformat() if record['created_at'] else None
+    for column in ('sentiment_score', 'confidence'):
+        if record[column] is not None:
+            record[column] = float(record[column])
+    record['emotions'] = decode_emotions(record['emotions'] or 0)
+    return record
+
+def _ndjson_chunk(records):
+    return ''.join(json.dumps(record) + '\n' for record in records)
+
+def _csv_chunk(records, header=False):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    if header:
+        writer.writeheader()
+    for record in records:
+        writer.writerow(dict(record, emotions=';'.join(record['emotions'])))
+    return buffer.getvalue()
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+def stream_checkin_export(user_id, export_format='ndjson'):
+    """Yield a user's full check-in history as NDJSON or CSV text chunks
+
+    Rows are read through an unbuffered (server-side) cursor in chunks of
+    CHECKIN_EXPORT_CHUNK_SIZE, so memory use does not grow with history
+    length. The connection is held until the stream finishes or the client
+    goes away.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor(buffered=False)
+    try:
+        cursor.execute(
+            f"""SELECT id, created_at, question_index, question, message, sentiment, sentiment_score,
+                       confidence, energy_score, stress_score, sleep_score, emotion_mask, recommendation
+                FROM checkins WHERE user_id = %s {HISTORY_ORDER}""",
+            (user_id,)
+        )
+        if export_format == 'csv':
+            yield _csv_chunk([], header=True)
+
+        while True:
+            rows = cursor.fetchmany(CHECKIN_EXPORT_CHUNK_SIZE)
+            if not rows:
+                break
+            records = [_export_record(row) for row in rows]
+            yield _csv_chunk(records) if export_format == 'csv' else _ndjson_chunk(records)
+    finally:
+        try:
+            cursor.close()
+        except Exception:
+            pass  # Client went away mid-stream; the pool drains the unread rows on release
+        conn.close()
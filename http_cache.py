@@ -0,0 +1,62 @@
+import hashlib
+from datetime import datetime, time, timedelta, timezone
+from flask import current_app, request
+
+# Cache-Control policies for dashboard reads
+PRIVATE_REVALIDATE = 'private, no-cache'  # per-user data: browsers keep it but check the ETag every time
+
+def make_etag(*parts):
+    """Build an ETag value from the things a response depends on"""
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()[:20]
+
+def http_date(value):
+    """Convert a naive local datetime from MySQL to an aware UTC one for Last-Modified
+
+    MySQL returns TIMESTAMPs in the server's time zone, the same local time
+    as datetime.now().
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = datetime.fromtimestamp(value.timestamp(), timezone.utc)  # timestamp() reads naive values as local
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+def last_modified(*changes):
+    """Last-Modified for a response that last changed at the latest of changes (None entries skipped)"""
+    changes = [change for change in changes if change is not None]
+    return http_date(max(changes)) if changes else None
+
+def is_not_modified(etag, last_modified=None):
+    """Whether the request's validators show the client already has this version
+
+    If-None-Match wins over If-Modified-Since when both are sent.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+def with_validators(response, etag, last_modified=None, cache_control=PRIVATE_REVALIDATE):
+    """Attach ETag, Last-Modified and Cache-Control to a response"""
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+def not_modified(etag, last_modified=None, cache_control=PRIVATE_REVALIDATE):
+    """Empty 304 response carrying the same validators"""
+    response = current_app.response_class('', status=304)
+    return with_validators(response, etag, last_modified, cache_control)
+
+def start_of_day(now=None):
+    """Local midnight that began the current day (content that changes daily changed then)"""
+    now = now or datetime.now()
+    return datetime.combine(now.date(), time.min)
+
+def until_midnight(now=None):
+    """Seconds left in the current local day (for content that changes daily)"""
+    now = now or datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+    return max(1, int((midnight - now).total_seconds()))
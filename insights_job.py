@@ -0,0 +1,204 @@
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from datetime import date, datetime, timedelta
+from activity_catalog import get_activity
+from background import PeriodicTask
+from db import get_db_connection
+from sentiment_analysis import EMOTION_BITS, decode_emotions, numeric_level, sentiment_bucket, wellness_score
+
+# Aggregation job configuration
+INSIGHTS_JOB_INTERVAL = int(os.getenv('INSIGHTS_JOB_INTERVAL', 0))  # seconds between in-app runs, 0 = cron only
+INSIGHTS_LOOKBACK_DAYS = int(os.getenv('INSIGHTS_LOOKBACK_DAYS', 35))  # days checked for new check-ins each run
+INSIGHTS_FETCH_SIZE = 1000  # rows pulled from the server per round trip
+INSIGHTS_TOP_N = 5
+
+JOB_LOCK_NAME = 'mindease_insights_job'
+
+# Emotions that count as concerns; positive ones are left out
+CONCERN_MASK = sum(bit for name, bit in EMOTION_BITS.items() if name not in ('happy', 'motivated', 'calm'))
+
+CHECKIN_FIELDS = "user_id, sentiment, energy_score, stress_score, sleep_score, emotion_mask, activity_id"
+
+UPSERT_INSIGHT_SQL = """INSERT INTO aggregate_insights
+    (date, total_users, total_checkins, avg_wellness_score, stress_levels, energy_levels,
+     sleep_quality, common_concerns, popular_activities, source_checkins, source_max_id)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        total_users = VALUES(total_users), total_checkins = VALUES(total_checkins),
+        avg_wellness_score = VALUES(avg_wellness_score), stress_levels = VALUES(stress_levels),
+        energy_levels = VALUES(energy_levels), sleep_quality = VALUES(sleep_quality),
+        common_concerns = VALUES(common_concerns), popular_activities = VALUES(popular_activities),
+        source_checkins = VALUES(source_checkins), source_max_id = VALUES(source_max_id)"""
+
+class DayAggregate:
+    """Running totals for one day of check-ins"""
+
+    def __init__(self):
+        self.checkins = 0
+        self.user_sentiments = {}  # user_id -> [positive, neutral, negative]
+        self.stress = Counter({'low': 0, 'moderate': 0, 'high': 0})
+        self.energy = Counter({'low': 0, 'moderate': 0, 'high': 0})
+        self.sleep = Counter({'poor': 0, 'moderate': 0, 'good': 0})
+        self.concerns = Counter()
+        self.activities = Counter()
+
+    def add(self, user_id, sentiment, energy_score, stress_score, sleep_score, emotion_mask, activity_id):
+        self.checkins += 1
+        counts = self.user_sentiments.setdefault(user_id, [0, 0, 0])
+        counts[('positive', 'neutral', 'negative').index(sentiment_bucket(sentiment))] += 1
+
+        for counter, category, score in ((self.energy, 'energy', energy_score),
+                                         (self.stress, 'stress', stress_score),
+                                         (self.sleep, 'sleep', sleep_score)):
+            if score is not None:
+                counter[numeric_level(category, score)] += 1
+
+        if emotion_mask:
+            self.concerns.update(decode_emotions(emotion_mask & CONCERN_MASK))
+        if activity_id is not None:
+            self.activities[activity_id] += 1
+
+    def avg_wellness_score(self):
+        """Mean of each active user's wellness score for the day"""
+        if not self.user_sentiments:
+            return 0
+        scores = [wellness_score(*counts) for counts in self.user_sentiments.values()]
+        return round(sum(scores) / len(scores), 2)
+
+    def popular_activities(self):
+        titles = []
+        for activity_id, _ in self.activities.most_common():
+            activity = get_activity(activity_id)
+            if activity:
+                titles.append(activity['title'])
+            if len(titles) == INSIGHTS_TOP_N:
+                break
+        return titles
+
+    def common_concerns(self):
+        return [name.capitalize() for name, _ in self.concerns.most_common(INSIGHTS_TOP_N)]
+
+def day_fingerprints(cursor, start_date, end_date):
+    """Return {day: (checkins, max id)} for days in [start_date, end_date] that have check-ins
+
+    Check-ins are append-only, so a day whose count and highest id are
+    unchanged since the last run does not need to be recomputed.
+    """
+    cursor.execute(
+        """SELECT DATE(created_at), COUNT(*), MAX(id) FROM checkins
+           WHERE created_at >= %s AND created_at < %s
+           GROUP BY DATE(created_at)""",
+        (start_date, end_date + timedelta(days=1))
+    )
+    return {day: (int(count), int(max_id)) for day, count, max_id in cursor.fetchall()}
+
+def stored_fingerprints(cursor, start_date, end_date):
+    """Return {day: (checkins, max id)} recorded when each day was last materialized"""
+    cursor.execute(
+        """SELECT date, source_checkins, source_max_id FROM aggregate_insights
+           WHERE date BETWEEN %s AND %s""",
+        (start_date, end_date)
+    )
+    return {day: (count, max_id) for day, count, max_id in cursor.fetchall()}
+
+def aggregate_day(conn, day):
+    """Stream one day's check-ins through an unbuffered cursor into a DayAggregate"""
+    cursor = conn.cursor(buffered=False)
+    cursor.execute(
+        f"SELECT {CHECKIN_FIELDS} FROM checkins WHERE created_at >= %s AND created_at < %s",
+        (day, day + timedelta(days=1))
+    )
+    aggregate = DayAggregate()
+    while True:
+        rows = cursor.fetchmany(INSIGHTS_FETCH_SIZE)
+        if not rows:
+            break
+        for row in rows:
+            aggregate.add(*row)
+    cursor.close()
+    return aggregate
+
+def materialize_day(conn, day, fingerprint):
+    """Recompute and upsert the aggregate_insights row for one day"""
+    aggregate = aggregate_day(conn, day)
+    cursor = conn.cursor()
+    cursor.execute(UPSERT_INSIGHT_SQL, (
+        day,
+        len(aggregate.user_sentiments),
+        aggregate.checkins,
+        aggregate.avg_wellness_score(),
+        json.dumps(aggregate.stress),
+        json.dumps(aggregate.energy),
+        json.dumps(aggregate.sleep),
+        json.dumps(aggregate.common_concerns()),
+        json.dumps(aggregate.popular_activities()),
+        fingerprint[0],
+        fingerprint[1]
+    ))
+    cursor.close()
+    conn.commit()
+
+def run_insights_job(days=INSIGHTS_LOOKBACK_DAYS, full=False, today=None):
+    """Materialize aggregate_insights for the last `days` days
+
+    Only days whose check-ins changed since the last run are recomputed
+    (all of them with full=True). Rows for days that no longer have any
+    check-ins are removed. Runs are serialized across processes with a
+    MySQL named lock; returns None if another run holds it, otherwise the
+    list of days that were recomputed.
+    """
+    end_date = today or date.today()
+    start_date = end_date - timedelta(days=days - 1)
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, 0)", (JOB_LOCK_NAME,))
+        if cursor.fetchone()[0] != 1:
+            print("Aggregate insights job already running elsewhere, skipping")
+            return None
+
+        try:
+            current = day_fingerprints(cursor, start_date, end_date)
+            stored = stored_fingerprints(cursor, start_date, end_date)
+
+            changed = sorted(day for day, fingerprint in current.items()
+                             if full or stored.get(day) != fingerprint)
+            for day in changed:
+                materialize_day(conn, day, current[day])
+
+            emptied = sorted(set(stored) - set(current))
+            if emptied:
+                cursor.execute(
+                    f"DELETE FROM aggregate_insights WHERE date IN ({', '.join(['%s'] * len(emptied))})",
+                    emptied
+                )
+                conn.commit()
+
+            print(f"✓ Aggregate insights: {len(changed)} days recomputed, "
+                  f"{len(current) - len(changed)} unchanged, {len(emptied)} removed")
+            return changed
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (JOB_LOCK_NAME,))
+            cursor.fetchone()
+    finally:
+        cursor.close()
+        conn.close()
+
+insights_task = PeriodicTask('insights-job', INSIGHTS_JOB_INTERVAL, run_insights_job)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Materialize daily aggregate insights from check-ins')
+    parser.add_argument('--days', type=int, default=INSIGHTS_LOOKBACK_DAYS, help='how many days back to check')
+    parser.add_argument('--full', action='store_true', help='recompute every day, changed or not')
+    parser.add_argument('--date', type=lambda value: datetime.strptime(value, '%Y-%m-%d').date(),
+                        help='last day to materialize (default today)')
+    args = parser.parse_args(argv)
+
+    return 0 if run_insights_job(args.days, args.full, args.date) is not None else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,255 @@
+"""In-process metrics and request tracing
+
+Every span feeds a latency histogram, which /metrics renders in the
+Prometheus text format. A TRACE_SAMPLE_RATE fraction of requests also
+records a detailed trace: each span with its offset and duration, kept
+in a ring buffer and logged as one JSON line.
+
+    with span('sentiment.score'):
+        ...
+
+Aggregates are per process; scrape each worker, or sum them with
+Prometheus' usual aggregation.
+"""
+import bisect
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+
+# Instrumentation configuration
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')  # if set, /metrics requires "Authorization: Bearer <token>"
+TRACE_SAMPLE_RATE = float(os.getenv('TRACE_SAMPLE_RATE', 0.01))  # fraction of requests traced in detail
+TRACE_BUFFER_SIZE = int(os.getenv('TRACE_BUFFER_SIZE', 100))  # recent traces kept per process
+TRACE_LOG = os.getenv('TRACE_LOG', 'true').lower() in ('1', 'true', 'yes')
+
+# Seconds; covers a cached lookup up to a slow gateway call
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{_escape(value)}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+class Counter:
+    """Monotonic counter with labels"""
+
+    type = 'counter'
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = list(self._values.items())
+        return [(self.name, _labels(self.labelnames, labels), value) for labels, value in values]
+
+class Histogram:
+    """Latency histogram with labels and fixed buckets"""
+
+    type = 'histogram'
+
+    def __init__(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}  # labels -> [count per bucket (+Inf last), sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def samples(self):
+        with self._lock:
+            series = [(labels, list(counts), total) for labels, (counts, total) in self._series.items()]
+
+        samples = []
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += count
+                samples.append((f'{self.name}_bucket', _labels(self.labelnames, labels, [('le', bound)]), cumulative))
+            samples.append((f'{self.name}_sum', _labels(self.labelnames, labels), round(total, 6)))
+            samples.append((f'{self.name}_count', _labels(self.labelnames, labels), cumulative))
+        return samples
+
+class Gauge:
+    """Value read from a callback at scrape time: {labels tuple: value}
+
+    type='counter' exposes counters that are already kept elsewhere.
+    """
+
+    def __init__(self, name, help, labelnames, callback, type='gauge'):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        self.type = type
+
+    def samples(self):
+        try:
+            values = self.callback() or {}
+        except Exception:
+            return []
+        return [(self.name, _labels(self.labelnames, labels), value) for labels, value in values.items()
+                if value is not None]
+
+def stats_gauge(name, help, label, stats_func, keys, type='gauge'):
+    """Gauge exposing selected keys of a get_*_stats() style dict, one label value per key"""
+    def read():
+        stats = stats_func() or {}
+        return {(key,): stats.get(key) for key in keys}
+    return Gauge(name, help, (label,), read, type)
+
+_registry = []
+
+def register(metric):
+    _registry.append(metric)
+    return metric
+
+REQUEST_LATENCY = register(Histogram(
+    'mindease_http_request_duration_seconds', 'HTTP request latency by route',
+    ('method', 'route', 'status')
+))
+SPAN_LATENCY = register(Histogram(
+    'mindease_span_duration_seconds', 'Latency of instrumented operations (DB, sentiment, IntaSend)',
+    ('span',)
+))
+SPAN_ERRORS = register(Counter(
+    'mindease_span_errors_total', 'Instrumented operations that raised', ('span',)
+))
+TRACES_SAMPLED = register(Counter('mindease_traces_sampled_total', 'Requests traced in detail'))
+
+_current_trace = contextvars.ContextVar('mindease_trace', default=None)
+_recent_traces = deque(maxlen=TRACE_BUFFER_SIZE)
+
+class Trace:
+    """Spans recorded for one sampled request"""
+
+    __slots__ = ('name', 'started', 'spans')
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.spans = []
+
+    def to_dict(self, status=None):
+        return {
+            'name': self.name,
+            'status': status,
+            'duration_ms': round((time.perf_counter() - self.started) * 1000, 3),
+            'spans': self.spans
+        }
+
+class _Span:
+    __slots__ = ('name', 'attributes', 'started')
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.started
+        SPAN_LATENCY.observe(elapsed, self.name)
+        if exc_type is not None:
+            SPAN_ERRORS.inc(self.name)
+
+        trace = _current_trace.get()
+        if trace is not None:
+            entry = {
+                'span': self.name,
+                'offset_ms': round((self.started - trace.started) * 1000, 3),
+                'duration_ms': round(elapsed * 1000, 3)
+            }
+            if self.attributes:
+                entry.update(self.attributes)
+            trace.spans.append(entry)
+        return False
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NO_SPAN = _NoSpan()
+
+def span(name, **attributes):
+    """Time a with-block: always aggregated, recorded in detail when the request is sampled"""
+    if not METRICS_ENABLED:
+        return _NO_SPAN
+    return _Span(name, attributes)
+
+def tracing():
+    """Whether the current request is being traced in detail"""
+    return _current_trace.get() is not None
+
+def begin_request(name):
+    """Start request timing; samples the request for detailed tracing. Returns a token for end_request()"""
+    if not METRICS_ENABLED:
+        return None
+    trace = None
+    if TRACE_SAMPLE_RATE > 0 and random.random() < TRACE_SAMPLE_RATE:
+        trace = Trace(name)
+        TRACES_SAMPLED.inc()
+    return time.perf_counter(), _current_trace.set(trace)
+
+def end_request(token, method, route, status):
+    """Record the request latency and finish its trace, if sampled"""
+    if token is None:
+        return
+    started, context_token = token
+    REQUEST_LATENCY.observe(time.perf_counter() - started, method, route, str(status))
+
+    trace = _current_trace.get()
+    _current_trace.reset(context_token)
+    if trace is not None:
+        record = trace.to_dict(status)
+        _recent_traces.append(record)
+        if TRACE_LOG:
+            print(json.dumps({'trace': record}))
+
+def recent_traces():
+    """Detailed traces of recently sampled requests, newest first"""
+    return list(reversed(_recent_traces))
+
+def render_prometheus():
+    """All registered metrics in the Prometheus text exposition format"""
+    lines = []
+    for metric in _registry:
+        samples = metric.samples()
+        if not samples:
+            continue
+        lines.append(f'# HELP {metric.name} {metric.help}')
+        lines.append(f'# TYPE {metric.name} {metric.type}')
+        lines.extend(f'{name}{labels} {value}' for name, labels, value in samples)
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,265 @@
+import os
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from metrics import span
+
+# IntaSend client configuration
+INTASEND_API_KEY = os.getenv('INTASEND_API_KEY', 'your-intasend-api-key')
+INTASEND_SECRET_KEY = os.getenv('INTASEND_SECRET_KEY', 'your-intasend-secret-key')
+INTASEND_BASE_URL = os.getenv('INTASEND_BASE_URL', 'https://sandbox.intasend.com')  # Use production URL in production
+INTASEND_CONNECT_TIMEOUT = float(os.getenv('INTASEND_CONNECT_TIMEOUT', 3.05))
+INTASEND_READ_TIMEOUT = float(os.getenv('INTASEND_READ_TIMEOUT', 10))
+INTASEND_MAX_RETRIES = int(os.getenv('INTASEND_MAX_RETRIES', 2))  # extra attempts after the first
+INTASEND_POOL_SIZE = int(os.getenv('INTASEND_POOL_SIZE', 10))  # keep-alive connections per worker
+INTASEND_BREAKER_THRESHOLD = int(os.getenv('INTASEND_BREAKER_THRESHOLD', 5))  # consecutive failures before opening
+INTASEND_BREAKER_RESET = float(os.getenv('INTASEND_BREAKER_RESET', 30))  # seconds open before a trial call
+
+RETRY_BACKOFF_BASE = 0.2
+RETRY_BACKOFF_MAX = 2.0
+RETRY_STATUSES = {429, 502, 503, 504}
+
+class PaymentGatewayError(Exception):
+    """A payment gateway call failed; status is the HTTP status if there was a response"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+class CircuitOpenError(PaymentGatewayError):
+    """The circuit breaker is open, so the call was not attempted"""
+
+class CircuitBreaker:
+    """Fail fast after repeated gateway failures instead of tying up workers
+
+    closed -> open after `threshold` consecutive failures; open -> half-open
+    after `reset_timeout` seconds, letting one trial call through; a success
+    closes the circuit again, a failure reopens it.
+    """
+
+    def __init__(self, threshold=INTASEND_BREAKER_THRESHOLD, reset_timeout=INTASEND_BREAKER_RESET):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = None  # ident of the thread making the half-open trial call
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Whether a call may go ahead now"""
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = 'half-open'
+                self._trial_in_flight = None
+            if self.state == 'half-open' and self._trial_in_flight is None:
+                self._trial_in_flight = threading.get_ident()
+                return True
+            return False
+
+    def release_trial(self):
+        """Give up this thread's half-open trial if it ended without a recorded outcome"""
+        with self._lock:
+            if self._trial_in_flight == threading.get_ident():
+                self._trial_in_flight = None
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+            self._trial_in_flight = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half-open' or self.failures >= self.threshold:
+                if self.state != 'open':
+                    self.opened += 1
+                self.state = 'open'
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = None
+
+    def stats(self):
+        return {
+            'state': self.state,
+            'consecutive_failures': self.failures,
+            'times_opened': self.opened
+        }
+
+class OperationMetrics:
+    """Call, error and latency counters for one gateway operation"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.short_circuited = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_error = None
+
+    def record(self, latency, error=None):
+        self.calls += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if error is not None:
+            self.errors += 1
+            self.last_error = str(error)
+
+    def stats(self):
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'retries': self.retries,
+            'short_circuited': self.short_circuited,
+            'avg_latency_ms': round(self.total_latency / self.calls * 1000, 1) if self.calls else None,
+            'max_latency_ms': round(self.max_latency * 1000, 1),
+            'last_error': self.last_error
+        }
+
+class IntaSendClient:
+    """Shared IntaSend API client
+
+    One requests.Session per process keeps connections to the gateway
+    alive. Every call has connect/read timeouts; transient failures are
+    retried with jittered exponential backoff (POSTs only when the request
+    cannot have reached the gateway), and a circuit breaker short-circuits
+    calls while the gateway is down.
+    """
+
+    def __init__(self, base_url=INTASEND_BASE_URL, api_key=INTASEND_API_KEY,
+                 connect_timeout=INTASEND_CONNECT_TIMEOUT, read_timeout=INTASEND_READ_TIMEOUT,
+                 max_retries=INTASEND_MAX_RETRIES, pool_size=INTASEND_POOL_SIZE, breaker=None):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.pool_size = pool_size
+        self.breaker = breaker or CircuitBreaker()
+        self.metrics = {}
+        self._session = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_session(self):
+        # Sockets must not be shared with a forked parent
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    session.headers.update({
+                        'Authorization': f'Bearer {self.api_key}',
+                        'Content-Type': 'application/json'
+                    })
+                    self._session = session
+                    self._pid = os.getpid()
+        return self._session
+
+    def _metrics(self, operation):
+        metrics = self.metrics.get(operation)
+        if metrics is None:
+            metrics = self.metrics.setdefault(operation, OperationMetrics())
+        return metrics
+
+    def _backoff(self, attempt):
+        # Full jitter keeps workers that failed together from retrying together
+        return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2 ** attempt)))
+
+    def request(self, operation, method, path, expected=(200,), idempotent=True, **kwargs):
+        """Call the gateway and return the decoded JSON body
+
+        Raises CircuitOpenError without calling out while the breaker is
+        open, and PaymentGatewayError once retries are exhausted or the
+        gateway answers with an unexpected status.
+        """
+        metrics = self._metrics(operation)
+        if not self.breaker.allow():
+            metrics.short_circuited += 1
+            raise CircuitOpenError(f"IntaSend circuit open, skipping {operation}")
+
+        try:
+            session = self._get_session()
+            url = f'{self.base_url}{path}'
+            started = time.monotonic()
+            attempt = 0
+            while True:
+                try:
+                    with span(f'intasend.{operation}', attempt=attempt):
+                        response = session.request(method, url, timeout=self.timeout, **kwargs)
+                    error = None
+                    if response.status_code in expected:
+                        break
+                    error = PaymentGatewayError(
+                        f"IntaSend {operation} failed: {response.status_code} - {response.text[:200]}",
+                        status=response.status_code
+                    )
+                    retryable = response.status_code in RETRY_STATUSES and (idempotent or response.status_code == 429)
+                except requests.exceptions.ConnectTimeout as e:
+                    error = PaymentGatewayError(f"IntaSend {operation} connect timeout: {e}")
+                    retryable = True  # Never reached the gateway, safe to resend
+                except requests.exceptions.RequestException as e:
+                    error = PaymentGatewayError(f"IntaSend {operation} connection error: {e}")
+                    retryable = idempotent
+
+                if not retryable or attempt >= self.max_retries:
+                    metrics.record(time.monotonic() - started, error)
+                    # 4xx means the gateway is up and rejected this request
+                    if error.status is None or error.status >= 500 or error.status == 429:
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                    raise error
+
+                attempt += 1
+                metrics.retries += 1
+                time.sleep(self._backoff(attempt))
+
+            metrics.record(time.monotonic() - started)
+            self.breaker.record_success()
+        finally:
+            # An exception other than RequestException skips recording an outcome; don't hold
+            # the half-open trial forever, or the breaker never lets another call through
+            self.breaker.release_trial()
+
+        try:
+            return response.json()
+        except ValueError as e:
+            raise PaymentGatewayError(f"IntaSend {operation} returned invalid JSON: {e}",
+                                      status=response.status_code) from e
+
+    def create_customer(self, email, name):
+        return self.request('create_customer', 'POST', '/api/v1/customers/',
+                            expected=(201,), idempotent=False, json={'email': email, 'name': name})
+
+    def create_payment_link(self, data):
+        return self.request('create_payment_link', 'POST', '/api/v1/payment-links/',
+                            expected=(201,), idempotent=False, json=data)
+
+    def get_payment(self, payment_id):
+        return self.request('get_payment', 'GET', f'/api/v1/payments/{payment_id}/')
+
+    def stats(self):
+        """Return breaker state and per-operation metrics"""
+        return {
+            'base_url': self.base_url,
+            'breaker': self.breaker.stats(),
+            'operations': {operation: metrics.stats() for operation, metrics in self.metrics.items()}
+        }
+
+intasend_client = IntaSendClient()
+
+def intasend_configured():
+    """Whether real IntaSend credentials are set (otherwise the app runs in demo mode)"""
+    return INTASEND_API_KEY != 'your-intasend-api-key' and INTASEND_SECRET_KEY != 'your-intasend-secret-key'
+
+def get_payment_client_stats():
+    """Return metrics for the IntaSend client"""
+    return intasend_client.stats()
@@ -0,0 +1,242 @@
+import argparse
+import json
+import os
+import sys
+from background import PeriodicTask
+from db import get_db_connection
+from payment_client import PaymentGatewayError, intasend_client
+from subscriptions import activate_premium
+
+# Webhook inbox configuration
+WEBHOOK_POLL_INTERVAL = float(os.getenv('WEBHOOK_POLL_INTERVAL', 2))  # seconds between inbox polls, 0 = off
+WEBHOOK_BATCH_SIZE = int(os.getenv('WEBHOOK_BATCH_SIZE', 20))
+WEBHOOK_MAX_ATTEMPTS = int(os.getenv('WEBHOOK_MAX_ATTEMPTS', 8))  # then the webhook is dead-lettered
+WEBHOOK_CLAIM_TIMEOUT = int(os.getenv('WEBHOOK_CLAIM_TIMEOUT', 300))  # seconds before a stuck claim is retried
+
+RETRY_DELAY_BASE = 30  # seconds; doubles per attempt
+RETRY_DELAY_MAX = 3600
+
+COMPLETED_STATUSES = ('completed', 'complete')
+
+class PermanentWebhookError(Exception):
+    """The webhook can never be applied; retrying is pointless"""
+
+def enqueue_webhook(cursor, payment_id, event, payload):
+    """Persist a webhook in the inbox (caller commits)
+
+    Keyed by payment_id, so provider retries of the same payment only bump
+    received_count. Returns True if this is the first delivery.
+    """
+    cursor.execute(
+        """INSERT INTO payment_webhook_inbox (payment_id, event, payload)
+           VALUES (%s, %s, %s)
+           ON DUPLICATE KEY UPDATE received_count = received_count + 1""",
+        (payment_id, event, json.dumps(payload))
+    )
+    # 1 row affected for an insert, 2 for an update of an existing row
+    return cursor.rowcount == 1
+
+def verify_and_apply(conn, payment_id):
+    """Verify a payment with IntaSend and upgrade its customer
+
+    The upgrade and marking the inbox row done commit together, so a
+    webhook is applied at most once however often it is delivered or
+    retried. Returns the upgraded user id.
+    """
+    payment_info = intasend_client.get_payment(payment_id)
+    status = str(payment_info.get('status', '')).lower()
+    if status not in COMPLETED_STATUSES:
+        # May still settle; retried with backoff until attempts run out
+        raise PaymentGatewayError(f"Payment {payment_id} not completed (status {status or 'missing'})")
+
+    customer_id = payment_info.get('customer_id')
+    if not customer_id:
+        raise PermanentWebhookError(f"Payment {payment_id} has no customer ID")
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT status FROM payment_webhook_inbox WHERE payment_id = %s FOR UPDATE",
+            (payment_id,)
+        )
+        row = cursor.fetchone()
+        if row is None or row[0] == 'done':
+            conn.rollback()
+            return None  # Applied by someone else in the meantime
+
+        cursor.execute("SELECT id FROM users WHERE intasend_customer_id = %s", (customer_id,))
+        user = cursor.fetchone()
+        if not user:
+            raise PermanentWebhookError(f"No user for IntaSend customer {customer_id}")
+
+        activate_premium(cursor, user[0])
+        cursor.execute(
+            """UPDATE payment_webhook_inbox
+               SET status = 'done', user_id = %s, last_error = NULL, processed_at = NOW()
+               WHERE payment_id = %s""",
+            (user[0], payment_id)
+        )
+        conn.commit()
+        return user[0]
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+class WebhookProcessor:
+    """Background worker draining the payment webhook inbox
+
+    Every web worker may run one; rows are claimed with SELECT ... FOR
+    UPDATE SKIP LOCKED so no two workers process the same webhook.
+    Failures are retried with exponential backoff and dead-lettered
+    (status 'dead') after WEBHOOK_MAX_ATTEMPTS.
+    """
+
+    def __init__(self, batch_size=WEBHOOK_BATCH_SIZE, max_attempts=WEBHOOK_MAX_ATTEMPTS,
+                 claim_timeout=WEBHOOK_CLAIM_TIMEOUT, poll_interval=WEBHOOK_POLL_INTERVAL):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.claim_timeout = claim_timeout
+        self.task = PeriodicTask('payment-webhooks', poll_interval, self.process_pending)
+
+        # Metrics
+        self.applied = 0
+        self.retried = 0
+        self.dead_lettered = 0
+
+    def start(self):
+        self.task.start()
+
+    def _claim(self, conn):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                """SELECT payment_id FROM payment_webhook_inbox
+                   WHERE (status = 'pending' AND next_attempt_at <= NOW())
+                      OR (status = 'processing' AND claimed_at < NOW() - INTERVAL %s SECOND)
+                   ORDER BY next_attempt_at
+                   LIMIT %s
+                   FOR UPDATE SKIP LOCKED""",
+                (self.claim_timeout, self.batch_size)
+            )
+            payment_ids = [row[0] for row in cursor.fetchall()]
+            if payment_ids:
+                cursor.execute(
+                    f"""UPDATE payment_webhook_inbox
+                        SET status = 'processing', claimed_at = NOW(), attempts = attempts + 1
+                        WHERE payment_id IN ({', '.join(['%s'] * len(payment_ids))})""",
+                    payment_ids
+                )
+            conn.commit()
+            return payment_ids
+        finally:
+            cursor.close()
+
+    def _record_failure(self, conn, payment_id, error, permanent):
+        cursor = conn.cursor()
+        cursor.execute("SELECT attempts FROM payment_webhook_inbox WHERE payment_id = %s", (payment_id,))
+        attempts = cursor.fetchone()[0]
+
+        if permanent or attempts >= self.max_attempts:
+            cursor.execute(
+                """UPDATE payment_webhook_inbox SET status = 'dead', last_error = %s
+                   WHERE payment_id = %s""",
+                (str(error)[:1000], payment_id)
+            )
+            self.dead_lettered += 1
+            print(f"Payment webhook {payment_id} dead-lettered after {attempts} attempts: {error}")
+        else:
+            delay = min(RETRY_DELAY_MAX, RETRY_DELAY_BASE * 2 ** (attempts - 1))
+            cursor.execute(
+                """UPDATE payment_webhook_inbox
+                   SET status = 'pending', last_error = %s, next_attempt_at = NOW() + INTERVAL %s SECOND
+                   WHERE payment_id = %s""",
+                (str(error)[:1000], delay, payment_id)
+            )
+            self.retried += 1
+        conn.commit()
+        cursor.close()
+
+    def process_pending(self):
+        """Claim and apply a batch of webhooks; returns how many were claimed"""
+        conn = get_db_connection()
+        try:
+            payment_ids = self._claim(conn)
+            for payment_id in payment_ids:
+                try:
+                    user_id = verify_and_apply(conn, payment_id)
+                    if user_id is not None:
+                        self.applied += 1
+                        print(f"User {user_id} upgraded to premium from payment {payment_id}")
+                except PermanentWebhookError as e:
+                    self._record_failure(conn, payment_id, e, permanent=True)
+                except Exception as e:
+                    self._record_failure(conn, payment_id, e, permanent=False)
+            return len(payment_ids)
+        finally:
+            conn.close()
+
+    def stats(self):
+        """Return outcome counters for this process"""
+        return {
+            'applied': self.applied,
+            'retried': self.retried,
+            'dead_lettered': self.dead_lettered
+        }
+
+webhook_processor = WebhookProcessor()
+
+def requeue_webhook(cursor, payment_id):
+    """Send a dead-lettered (or failed) webhook back for processing (caller commits)"""
+    cursor.execute(
+        """UPDATE payment_webhook_inbox
+           SET status = 'pending', attempts = 0, next_attempt_at = NOW()
+           WHERE payment_id = %s AND status <> 'done'""",
+        (payment_id,)
+    )
+    return cursor.rowcount
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Inspect and drain the payment webhook inbox')
+    subcommands = parser.add_subparsers(dest='command', required=True)
+    subcommands.add_parser('process', help='process pending webhooks until none are due')
+    subcommands.add_parser('dead', help='list dead-lettered webhooks')
+    requeue = subcommands.add_parser('requeue', help='retry a dead-lettered webhook')
+    requeue.add_argument('payment_id')
+    args = parser.parse_args(argv)
+
+    if args.command == 'process':
+        total = 0
+        while True:
+            claimed = webhook_processor.process_pending()
+            if not claimed:
+                break
+            total += claimed
+        print(f"✓ Processed {total} webhooks: {webhook_processor.stats()}")
+        return 0
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        if args.command == 'dead':
+            cursor.execute(
+                """SELECT payment_id, attempts, received_count, last_error, updated_at
+                   FROM payment_webhook_inbox WHERE status = 'dead' ORDER BY updated_at DESC"""
+            )
+            for payment_id, attempts, received, error, updated_at in cursor.fetchall():
+                print(f"{payment_id}\tattempts={attempts}\treceived={received}\t{updated_at}\t{error}")
+            return 0
+
+        if requeue_webhook(cursor, args.payment_id):
+            conn.commit()
+            print(f"✓ Requeued {args.payment_id}")
+            return 0
+        print(f"✗ No retryable webhook {args.payment_id}")
+        return 1
+    finally:
+        cursor.close()
+        conn.close()
+
+if __name__ == '__main__':
+    sys.exit(main())
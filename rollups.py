@@ -0,0 +1,199 @@
+import argparse
+import sys
+from datetime import date, timedelta
+from db import get_db_connection
+from sentiment_analysis import NEGATIVE_SENTIMENTS, POSITIVE_SENTIMENTS, sentiment_bucket
+
+# Counters kept per user (user_wellness_rollups) and per user and day (user_daily_rollups).
+# Score sums are kept next to the number of check-ins that had a score so averages stay exact.
+ROLLUP_COUNTERS = ['checkins', 'positive_count', 'neutral_count', 'negative_count',
+                   'sentiment_score_sum', 'energy_sum', 'energy_count',
+                   'stress_sum', 'stress_count', 'sleep_sum', 'sleep_count']
+
+WEEKLY_DAYS = 7
+
+def _add_counters(totals, row):
+    totals['checkins'] += 1
+    totals[f"{sentiment_bucket(row['sentiment'])}_count"] += 1
+    # Rounded like the DECIMAL(3,2) column so sums match a rebuild exactly
+    totals['sentiment_score_sum'] += round(float(row.get('sentiment_score') or 0), 2)
+    for category in ('energy', 'stress', 'sleep'):
+        score = row.get(f'{category}_score')
+        if score is not None:
+            totals[f'{category}_sum'] += int(score)
+            totals[f'{category}_count'] += 1
+
+def _upsert_sql(table, keys, extremes=None):
+    """INSERT ... ON DUPLICATE KEY UPDATE adding to the counters of an existing row"""
+    extremes = extremes or {}
+    columns = keys + ROLLUP_COUNTERS + list(extremes)
+    updates = [f"{column} = {column} + VALUES({column})" for column in ROLLUP_COUNTERS]
+    updates += [f"{column} = {func}({column}, VALUES({column}))" for column, func in extremes.items()]
+    return f"""INSERT INTO {table} ({', '.join(columns)})
+        VALUES ({', '.join(['%s'] * len(columns))})
+        ON DUPLICATE KEY UPDATE {', '.join(updates)}"""
+
+USER_ROLLUP_SQL = _upsert_sql('user_wellness_rollups', ['user_id'],
+                              {'first_checkin_at': 'LEAST', 'last_checkin_at': 'GREATEST'})
+DAILY_ROLLUP_SQL = _upsert_sql('user_daily_rollups', ['user_id', 'day'])
+
+def apply_checkin_rollups(cursor, rows):
+    """Add newly inserted check-in rows to the rollups (same transaction as the insert)
+
+    Rows must have created_at as a datetime. Upserts are issued in key
+    order so concurrent batches touching the same users lock rows in the
+    same order.
+    """
+    users = {}
+    days = {}
+    for row in rows:
+        created_at = row['created_at']
+        user = users.setdefault(row['user_id'], dict(dict.fromkeys(ROLLUP_COUNTERS, 0),
+                                                     first_checkin_at=created_at, last_checkin_at=created_at))
+        user['first_checkin_at'] = min(user['first_checkin_at'], created_at)
+        user['last_checkin_at'] = max(user['last_checkin_at'], created_at)
+        _add_counters(user, row)
+        _add_counters(days.setdefault((row['user_id'], created_at.date()), dict.fromkeys(ROLLUP_COUNTERS, 0)), row)
+
+    user_values = [(user_id, *(totals[c] for c in ROLLUP_COUNTERS), totals['first_checkin_at'], totals['last_checkin_at'])
+                   for user_id, totals in sorted(users.items())]
+    day_values = [(user_id, day, *(totals[c] for c in ROLLUP_COUNTERS))
+                  for (user_id, day), totals in sorted(days.items())]
+
+    for sql, values in ((USER_ROLLUP_SQL, user_values), (DAILY_ROLLUP_SQL, day_values)):
+        if len(values) == 1:
+            cursor.execute(sql, values[0])
+        elif values:
+            cursor.executemany(sql, values)
+
+def get_user_rollup(cursor, user_id, today=None):
+    """Return a user's lifetime rollup plus their check-ins over the last week
+
+    One primary-key lookup plus a range over at most WEEKLY_DAYS daily
+    buckets. Returns zeroed counters for users with no check-ins yet.
+    """
+    week_start = (today or date.today()) - timedelta(days=WEEKLY_DAYS - 1)
+    cursor.execute(
+        f"""SELECT {', '.join('r.' + c for c in ROLLUP_COUNTERS)}, r.first_checkin_at, r.last_checkin_at,
+                   (SELECT COALESCE(SUM(d.checkins), 0) FROM user_daily_rollups d
+                    WHERE d.user_id = r.user_id AND d.day >= %s) AS weekly_checkins
+            FROM user_wellness_rollups r WHERE r.user_id = %s""",
+        (week_start, user_id)
+    )
+    row = cursor.fetchone()
+    if row is None:
+        return dict(dict.fromkeys(ROLLUP_COUNTERS, 0), weekly_checkins=0,
+                    first_checkin_at=None, last_checkin_at=None)
+    if not isinstance(row, dict):
+        row = dict(zip(cursor.column_names, row))
+    return row
+
+def _aggregate_select(group_by, user_id=None, extra=()):
+    """SELECT computing rollup counters straight from checkins"""
+    positive = ', '.join(['%s'] * len(POSITIVE_SENTIMENTS))
+    negative = ', '.join(['%s'] * len(NEGATIVE_SENTIMENTS))
+    sql = f"""SELECT {', '.join(list(group_by) + list(extra))},
+               COUNT(*),
+               SUM(sentiment IN ({positive})),
+               COUNT(*) - SUM(sentiment IN ({positive})) - SUM(sentiment IN ({negative})),
+               SUM(sentiment IN ({negative})),
+               COALESCE(SUM(sentiment_score), 0),
+               COALESCE(SUM(energy_score), 0), COUNT(energy_score),
+               COALESCE(SUM(stress_score), 0), COUNT(stress_score),
+               COALESCE(SUM(sleep_score), 0), COUNT(sleep_score)
+        FROM checkins"""
+    params = [*POSITIVE_SENTIMENTS, *POSITIVE_SENTIMENTS, *NEGATIVE_SENTIMENTS, *NEGATIVE_SENTIMENTS]
+    if user_id is not None:
+        sql += " WHERE user_id = %s"
+        params.append(user_id)
+    sql += f" GROUP BY {', '.join(group_by)}"
+    return sql, params
+
+def rebuild_rollups(cursor, user_id=None):
+    """Recompute rollups from checkins for one user, or everyone (caller commits)"""
+    where = " WHERE user_id = %s" if user_id is not None else ""
+    params = (user_id,) if user_id is not None else ()
+    cursor.execute("DELETE FROM user_daily_rollups" + where, params)
+    cursor.execute("DELETE FROM user_wellness_rollups" + where, params)
+
+    select, select_params = _aggregate_select(['user_id'], user_id, ['MIN(created_at)', 'MAX(created_at)'])
+    cursor.execute(
+        f"""INSERT INTO user_wellness_rollups (user_id, first_checkin_at, last_checkin_at, {', '.join(ROLLUP_COUNTERS)})
+            {select}""",
+        select_params
+    )
+    users = cursor.rowcount
+
+    select, select_params = _aggregate_select(['user_id', 'DATE(created_at)'], user_id)
+    cursor.execute(
+        f"""INSERT INTO user_daily_rollups (user_id, day, {', '.join(ROLLUP_COUNTERS)})
+            {select}""",
+        select_params
+    )
+    return users
+
+def check_rollups(cursor, user_id=None):
+    """Compare rollups with a fresh aggregate of checkins
+
+    Returns a sorted list of user ids whose lifetime or daily rollups
+    disagree with their check-ins.
+    """
+    mismatched = set()
+    for table, group_by in (('user_wellness_rollups', ['user_id']),
+                            ('user_daily_rollups', ['user_id', 'DATE(created_at)'])):
+        keys = ['user_id', 'day'][:len(group_by)]
+        select, params = _aggregate_select(group_by, user_id)
+        cursor.execute(select, params)
+        expected = {tuple(row[:len(keys)]): _normalize(row[len(keys):]) for row in cursor.fetchall()}
+
+        sql = f"SELECT {', '.join(keys + ROLLUP_COUNTERS)} FROM {table}"
+        if user_id is not None:
+            sql += " WHERE user_id = %s"
+        cursor.execute(sql, (user_id,) if user_id is not None else ())
+        actual = {tuple(row[:len(keys)]): _normalize(row[len(keys):]) for row in cursor.fetchall()}
+
+        for key in expected.keys() | actual.keys():
+            if expected.get(key) != actual.get(key):
+                mismatched.add(key[0])
+
+    return sorted(mismatched)
+
+def _normalize(counters):
+    # DECIMAL sums come back as Decimal, counts as int or Decimal depending on the expression
+    return tuple(round(float(value or 0), 2) for value in counters)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Maintain per-user wellness rollups')
+    parser.add_argument('command', choices=['rebuild', 'check'])
+    parser.add_argument('--user', type=int, help='only this user id')
+    parser.add_argument('--fix', action='store_true', help='rebuild users that fail the check')
+    args = parser.parse_args(argv)
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        if args.command == 'rebuild':
+            users = rebuild_rollups(cursor, args.user)
+            conn.commit()
+            print(f"✓ Rebuilt rollups for {users} users")
+            return 0
+
+        mismatched = check_rollups(cursor, args.user)
+        if not mismatched:
+            print("✓ Rollups match check-ins")
+            return 0
+
+        print(f"✗ Rollups out of date for {len(mismatched)} users: {', '.join(map(str, mismatched[:20]))}")
+        if args.fix:
+            for user_id in mismatched:
+                rebuild_rollups(cursor, user_id)
+            conn.commit()
+            print(f"✓ Rebuilt rollups for {len(mismatched)} users")
+            return 0
+        return 1
+    finally:
+        cursor.close()
+        conn.close()
+
+if __name__ == '__main__':
+    sys.exit(main())
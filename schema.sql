@@ -28,14 +28,24 @@ CREATE TABLE IF NOT EXISTS checkins (
     message TEXT NOT NULL,
     sentiment VARCHAR(20) DEFAULT 'NEUTRAL',
     sentiment_score DECIMAL(3,2) DEFAULT 0.0,
+    confidence DECIMAL(3,2) DEFAULT 0.0,
+    energy_score TINYINT UNSIGNED DEFAULT NULL,   -- 1-10, from the energy answer
+    stress_score TINYINT UNSIGNED DEFAULT NULL,   -- 1-10, from the stress answer
+    sleep_score TINYINT UNSIGNED DEFAULT NULL,    -- 1-10, from the sleep answer
+    emotion_mask SMALLINT UNSIGNED DEFAULT 0,     -- see sentiment_analysis.EMOTION_BITS
+    activity_id INT DEFAULT NULL,                 -- suggested wellness activity
     recommendation TEXT,
     question_index INT DEFAULT 0,
     question TEXT,
+    client_id VARCHAR(36) DEFAULT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
     -- Foreign key relationship
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     
+    -- Idempotency key for write-behind inserts
+    UNIQUE KEY uniq_client_id (client_id),
+    
     -- Indexes for performance
     INDEX idx_user_id (user_id),
     INDEX idx_created_at (created_at),
@@ -72,6 +82,65 @@ CREATE TABLE IF NOT EXISTS wellness_activities (
     INDEX idx_category (category)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- In-progress chatbot check-ins (answers and their parsed results, stored as the conversation goes)
+CREATE TABLE IF NOT EXISTS checkin_conversations (
+    id CHAR(36) PRIMARY KEY,
+    user_id INT NOT NULL,
+    answers JSON NOT NULL,
+    status ENUM('open', 'completed') NOT NULL DEFAULT 'open',
+    result JSON,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    expires_at TIMESTAMP NOT NULL,
+    
+    -- Foreign key relationship
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    
+    -- Indexes
+    INDEX idx_expires_at (expires_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Per-user wellness rollups (maintained on every check-in insert; rebuild with `python rollups.py rebuild`)
+CREATE TABLE IF NOT EXISTS user_wellness_rollups (
+    user_id INT PRIMARY KEY,
+    checkins INT UNSIGNED NOT NULL DEFAULT 0,
+    positive_count INT UNSIGNED NOT NULL DEFAULT 0,
+    neutral_count INT UNSIGNED NOT NULL DEFAULT 0,
+    negative_count INT UNSIGNED NOT NULL DEFAULT 0,
+    sentiment_score_sum DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    energy_sum INT UNSIGNED NOT NULL DEFAULT 0,    -- sums and counts of non-NULL scores
+    energy_count INT UNSIGNED NOT NULL DEFAULT 0,
+    stress_sum INT UNSIGNED NOT NULL DEFAULT 0,
+    stress_count INT UNSIGNED NOT NULL DEFAULT 0,
+    sleep_sum INT UNSIGNED NOT NULL DEFAULT 0,
+    sleep_count INT UNSIGNED NOT NULL DEFAULT 0,
+    first_checkin_at TIMESTAMP NULL,
+    last_checkin_at TIMESTAMP NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    
+    -- Foreign key relationship
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Per-user, per-day buckets of the same counters
+CREATE TABLE IF NOT EXISTS user_daily_rollups (
+    user_id INT NOT NULL,
+    day DATE NOT NULL,
+    checkins INT UNSIGNED NOT NULL DEFAULT 0,
+    positive_count INT UNSIGNED NOT NULL DEFAULT 0,
+    neutral_count INT UNSIGNED NOT NULL DEFAULT 0,
+    negative_count INT UNSIGNED NOT NULL DEFAULT 0,
+    sentiment_score_sum DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    energy_sum INT UNSIGNED NOT NULL DEFAULT 0,
+    energy_count INT UNSIGNED NOT NULL DEFAULT 0,
+    stress_sum INT UNSIGNED NOT NULL DEFAULT 0,
+    stress_count INT UNSIGNED NOT NULL DEFAULT 0,
+    sleep_sum INT UNSIGNED NOT NULL DEFAULT 0,
+    sleep_count INT UNSIGNED NOT NULL DEFAULT 0,
+    
+    PRIMARY KEY (user_id, day),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- Sample data for wellness activities
 INSERT IGNORE INTO wellness_activities (title, description, category, duration_minutes, instructions) VALUES
 ('4-7-8 Breathing Exercise', 'A calming breathing technique to reduce stress instantly.', 'breathing', 3, 
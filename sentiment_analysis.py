@@ -1,7 +1,18 @@
+import os
 import re
 import random
-from textblob import TextBlob # type: ignore
-from db import get_wellness_activity_by_category
+from collections import namedtuple
+from functools import lru_cache
+from activity_catalog import get_wellness_activity_by_category
+from cache import TTLCache
+from metrics import span
+from sentiment_engines import get_sentiment_engine
+
+# Memoization of the deterministic part of the analysis
+SENTIMENT_CACHE_SIZE = int(os.getenv('SENTIMENT_CACHE_SIZE', 4096))
+SENTIMENT_CACHE_TTL = int(os.getenv('SENTIMENT_CACHE_TTL', 3600))
+
+_analysis_cache = TTLCache(maxsize=SENTIMENT_CACHE_SIZE, ttl=SENTIMENT_CACHE_TTL)
 
 # Keywords for different emotional states
 EMOTION_KEYWORDS = {
@@ -27,12 +38,200 @@ WORKLOAD_INDICATORS = {
     'light': ['light', 'easy', 'not much', 'quiet', 'slow']
 }
 
-def analyze_sentiment_basic(text):
-    """Basic sentiment analysis using TextBlob"""
-    blob = TextBlob(text)
-    polarity = blob.sentiment.polarity  # -1 (negative) to 1 (positive)
-    subjectivity = blob.sentiment.subjectivity  # 0 (objective) to 1 (subjective)
-    
+# Bit positions for emotions and check-in concerns stored in checkins.emotion_mask.
+# Append only: reordering would change the meaning of stored rows.
+EMOTION_BITS = {
+    name: 1 << position
+    for position, name in enumerate(
+        list(EMOTION_KEYWORDS) + ['low energy', 'high stress', 'poor sleep', 'workload overwhelm']
+    )
+}
+
+def encode_emotions(emotions):
+    """Pack a list of emotions/concerns into an integer bitmask"""
+    mask = 0
+    for emotion in emotions or []:
+        mask |= EMOTION_BITS.get(emotion, 0)
+    return mask
+
+def decode_emotions(mask):
+    """Unpack an emotion bitmask into a list of names"""
+    return [name for name, bit in EMOTION_BITS.items() if mask & bit]
+
+# Keyword tables scanned by the indicator matcher
+INDICATOR_TABLES = {
+    'emotion': EMOTION_KEYWORDS,
+    'sleep': SLEEP_INDICATORS,
+    'workload': WORKLOAD_INDICATORS
+}
+
+# Forms that indicate the same thing as their keyword but that inflected_forms()
+# doesn't generate. Only whole words match: 'mad' is not found in 'made' or 'madness'.
+KEYWORD_FORMS = {
+    'stress': ['stressful'],
+    'joy': ['joyful'],
+    'inspired': ['inspiring'],
+    'bad': ['badly'],
+    'terrible': ['terribly'],
+    'awful': ['awfully']
+}
+
+# Regular forms that mean something else ("the contents", "that sounds good")
+NOT_KEYWORD_FORMS = frozenset(('contents', 'goods', 'downs', 'downed', 'downing', 'wells', 'sounds', 'sounded',
+                               'sounding', 'lights', 'lighted', 'lighting', 'fines', 'fined'))
+
+VOWELS = 'aeiou'
+
+def inflected_forms(word):
+    """Regular -s, -ed, -ing, -er, -est and -en forms of a one-word keyword
+
+    'pressure' -> 'pressured', 'calm' -> 'calmer', 'upset' -> 'upsetting',
+    'sad' -> 'saddened'. Forms that aren't English words are harmless, they
+    just never occur; NOT_KEYWORD_FORMS are left out.
+    """
+    if not word.isalpha() or len(word) < 3 or word.endswith(('ed', 'ing')):
+        return []
+    if word.endswith('e'):
+        forms = [word + suffix for suffix in ('s', 'd', 'r', 'st')] + [word[:-1] + 'ing']
+    elif word.endswith('y') and word[-2] not in VOWELS:
+        forms = [word[:-1] + suffix for suffix in ('ies', 'ied', 'ier', 'iest')] + [word + 'ing']
+    else:
+        # Consonant-vowel-consonant endings double the consonant: sad -> sadder, upset -> upsetting
+        doubles = word[-1] not in VOWELS + 'wxy' and word[-2] in VOWELS and word[-3] not in VOWELS
+        stem = word + word[-1] if doubles else word
+        forms = [word + ('es' if word.endswith(('s', 'sh', 'ch', 'x', 'z')) else 's')]
+        forms += [stem + suffix for suffix in ('ed', 'ing', 'er', 'est', 'en', 'ened', 'ening')]
+    return [form for form in forms if form not in NOT_KEYWORD_FORMS]
+
+IndicatorMatch = namedtuple('IndicatorMatch', ['table', 'label', 'keyword', 'start', 'end'])
+
+# Byte table that lowercases ASCII letters and turns everything else but digits
+# into spaces, so one translate() and split() break UTF-8 text into words
+WORD_BYTES = bytes(
+    byte + 32 if 65 <= byte <= 90 else byte if 97 <= byte <= 122 or 48 <= byte <= 57 else 32
+    for byte in range(256)
+)
+
+# Lowercases ASCII letters only, so the result is as long as the text and offsets carry over
+ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+def split_words(text):
+    """Lowercase ASCII words and numbers in text, as bytes"""
+    return text.encode('utf-8').translate(WORD_BYTES).split()
+
+def build_indicator_index(tables, forms=KEYWORD_FORMS):
+    """Index every keyword in tables, and its forms, by what they indicate
+
+    Returns a map from single words (as bytes, like split_words) to their
+    (table, label, keyword) list and a list of (words, entries) for
+    multi-word keywords.
+    """
+    words = {}
+    phrases = {}
+    indexed = set()
+    for table, groups in tables.items():
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                for form in [keyword] + inflected_forms(keyword) + forms.get(keyword, []):
+                    if (form, table, label) in indexed:
+                        continue  # 'stressed' is a keyword and a form of 'stress'
+                    indexed.add((form, table, label))
+                    form_words = tuple(form.encode('utf-8').split())
+                    if len(form_words) > 1:
+                        phrases.setdefault(form_words, []).append((table, label, keyword))
+                    else:
+                        words.setdefault(form_words[0], []).append((table, label, keyword))
+    return words, list(phrases.items())
+
+INDICATOR_WORDS, INDICATOR_PHRASES = build_indicator_index(INDICATOR_TABLES)
+# Every word the matcher needs to see, phrase words included
+INDICATOR_VOCABULARY = frozenset(INDICATOR_WORDS).union(*(phrase for phrase, _ in INDICATOR_PHRASES))
+
+@lru_cache(maxsize=None)
+def form_pattern(form_words):
+    """Regex for a keyword form as whole words, on ASCII-lowercased text
+
+    Compiled the first time the form is found. It starts with a literal so
+    the regex engine can skip ahead to it; the lookbehind after the first
+    character checks the word boundary in front.
+    """
+    first = re.escape(chr(form_words[0][0]))
+    body = r'[^a-z0-9]+'.join(re.escape(word.decode('ascii')) for word in form_words)
+    return re.compile(first + r'(?<![a-z0-9]' + first + ')' + body[len(first):] + r'(?![a-z0-9])')
+
+def find_indicators(text):
+    """Find every emotion, sleep and workload keyword in text as whole words
+
+    Returns an IndicatorMatch per occurrence, with its start and end
+    offsets in text, in text order. The text is split into words once and
+    intersected with the keyword vocabulary; only the keyword forms found
+    that way are located.
+    """
+    found = INDICATOR_VOCABULARY.intersection(split_words(text))
+    if not found:
+        return []
+
+    candidates = [((word,), INDICATOR_WORDS[word]) for word in found if word in INDICATOR_WORDS]
+    candidates += [(phrase, entries) for phrase, entries in INDICATOR_PHRASES if found.issuperset(phrase)]
+
+    folded = text.translate(ASCII_LOWER)
+    matches = []
+    for form_words, entries in candidates:
+        for occurrence in form_pattern(form_words).finditer(folded):
+            start, end = occurrence.span()
+            matches.extend(IndicatorMatch(table, label, keyword, start, end) for table, label, keyword in entries)
+    matches.sort(key=lambda match: match.start)
+    return matches
+
+def indicator_labels(text):
+    """{table: set of labels} for the keywords find_indicators() would find, without locating them
+
+    A phrase is only looked for when all of its words occur.
+    """
+    labels = {table: set() for table in INDICATOR_TABLES}
+    words = split_words(text)
+    found = INDICATOR_VOCABULARY.intersection(words)
+    for word in found:
+        for table, label, _ in INDICATOR_WORDS.get(word, ()):
+            labels[table].add(label)
+
+    joined = None
+    for phrase, entries in INDICATOR_PHRASES:
+        if found.issuperset(phrase):
+            if joined is None:
+                joined = b' ' + b' '.join(words) + b' '
+            if b' ' + b' '.join(phrase) + b' ' in joined:
+                for table, label, _ in entries:
+                    labels[table].add(label)
+    return labels
+
+# Labels counted as positive / negative in wellness statistics; everything else is neutral
+POSITIVE_SENTIMENTS = ('POSITIVE', 'HAPPY', 'EXCITED')
+NEGATIVE_SENTIMENTS = ('NEGATIVE', 'SAD', 'STRESSED', 'ANXIOUS')
+
+def sentiment_bucket(sentiment):
+    """Map a stored sentiment label to 'positive', 'neutral' or 'negative'"""
+    if sentiment in POSITIVE_SENTIMENTS:
+        return 'positive'
+    if sentiment in NEGATIVE_SENTIMENTS:
+        return 'negative'
+    return 'neutral'
+
+def wellness_score(positive_count, neutral_count, negative_count):
+    """0-100 score from a sentiment distribution (50 when there is no data)"""
+    total = positive_count + neutral_count + negative_count
+    if total == 0:
+        return 50
+    return int(((positive_count * 2 + neutral_count) / (total * 2)) * 100)
+
+def analyze_sentiment_basic(text, engine=None):
+    """Basic sentiment analysis with the configured engine (see sentiment_engines)"""
+    polarity, subjectivity = get_sentiment_engine(engine)(text)
+    return sentiment_from_scores(polarity, subjectivity)
+
+def sentiment_from_scores(polarity, subjectivity):
+    """Build a sentiment result from polarity (-1 to 1) and subjectivity (0 to 1)"""
     # Convert polarity to sentiment label
     if polarity >= 0.3:
         sentiment = 'POSITIVE'
@@ -50,65 +249,259 @@ def analyze_sentiment_basic(text):
 
 def detect_emotions(text):
     """Detect specific emotions based on keywords"""
-    text_lower = text.lower()
-    detected_emotions = []
-    
-    for emotion, keywords in EMOTION_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                detected_emotions.append(emotion)
-                break
-    
-    return detected_emotions
+    return ordered_emotions(indicator_labels(text)['emotion'])
+
+def ordered_emotions(found):
+    """Emotion labels in the EMOTION_KEYWORDS order, which recommendations rely on"""
+    return [emotion for emotion in EMOTION_KEYWORDS if emotion in found]
+
+# Check-in questions answered on a 1-10 scale
+NUMERIC_CATEGORIES = {1: 'energy', 2: 'stress', 3: 'sleep'}
+
+# Level names for low / middle / high scores in each category
+NUMERIC_LEVEL_NAMES = {
+    'energy': ('low', 'moderate', 'high'),
+    'stress': ('low', 'moderate', 'high'),
+    'sleep': ('poor', 'moderate', 'good')
+}
+
+def numeric_level(category, score):
+    """Bucket a 1-10 energy/stress/sleep score into its level name"""
+    low, moderate, high = NUMERIC_LEVEL_NAMES[category]
+    if score >= 8:
+        return high
+    elif score >= 5:
+        return moderate
+    return low
+
+NUMBER_WORDS = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
+}
+
+# Words after a number that make it a quantity rather than a rating ("3am", "2 days")
+QUANTITY_UNITS = frozenset(('minutes', 'minute', 'mins', 'min', 'days', 'day', 'weeks', 'week', 'months', 'month',
+                            'years', 'year', 'times', 'am', 'pm', "o'clock", 'kids', 'people', 'cups', 'coffees'))
+HOUR_UNITS = frozenset(('hours', 'hour', 'hrs', 'hr', 'h'))
+PERCENT_UNITS = frozenset(('%', 'percent'))
+
+# Words that introduce a spelled-out rating ("maybe a seven"); "one" also needs a scale or range
+RATING_CUES = frozenset(('a', 'an', 'about', 'around', 'maybe', 'like', 'probably', 'roughly', 'solid', 'say',
+                         'is', 'was', 'it'))
+
+_UNITS = QUANTITY_UNITS | HOUR_UNITS | PERCENT_UNITS
+
+# Grouped by first letter, so the pattern starts with a character set (see below)
+_WORDS = r'(?:t(?:en|wo|hree)|f(?:our|ive)|s(?:even|ix)|eight|nine|one|zero)\b'
+# Digits not inside "2023", "3:30" or "3.5"
+_DIGITS = r'\d+(?:\.\d+)?(?![\d:]|\.\d)'
+
+# A known unit right after a number ("3am", "7 hours", "80%"); the lookahead on first letters
+# fails fast before trying every unit
+_UNIT = (r'(?=[' + ''.join(sorted({unit[0] for unit in _UNITS})) + r'])(?:'
+         + '|'.join(re.escape(unit) for unit in sorted(_UNITS, key=len, reverse=True)) + r")(?![\w'])")
+
+# What may follow a number: a range ("6-7", "six or seven"), a scale ("3/10", "8 out of ten")
+# and a unit; without a unit no letters may be glued on ("3rd", "2x")
+_NUMBER_CONTEXT = (
+    r'(?:\s*(?:-|–|to|or)\s*(?P<high>' + _DIGITS + '|' + _WORDS + r'))?'
+    r'(?:\s*(?:/|out\s+of|outta)\s*(?P<scale>' + _DIGITS + '|' + _WORDS + r'))?'
+    r'(?:\s*(?P<unit>' + _UNIT + r')|(?![a-z]))'
+)
+
+# The pattern starts with a character set, which lets the regex engine skip straight to digits;
+# a leading lookbehind would make it try every position instead. The lookbehind after the first
+# digit rejects digits inside "v2", "3.5", "1:30" and negative numbers ("-3").
+DIGIT_SCALE_PATTERN = re.compile(r'(?P<value>\d(?<![\w.:/-]\d)\d*(?:\.\d+)?(?![\d:]|\.\d))' + _NUMBER_CONTEXT)
+
+# Spelled-out numbers are read from split_words() tokens and the words around them, as the
+# digits they stand for so they share _COMMON_READINGS
+SPELLED_NUMBERS = {word.encode('utf-8'): str(value) for word, value in NUMBER_WORDS.items()}
+RANGE_WORDS = frozenset((b'to', b'or'))
+CUE_WORDS = frozenset(cue.encode('utf-8') for cue in RATING_CUES)
+UNIT_WORDS = {split_words(unit)[0]: unit for unit in _UNITS if split_words(unit)}  # "o'clock" -> b'o'
+
+ScaleReading = namedtuple('ScaleReading', ['score', 'value', 'scale', 'kind'])
+ScaleReading.__doc__ = """A number found in an answer
+
+score is value rescaled to 1-10, or None for kind 'hours' (a sleep
+duration, value in hours). scale is the stated scale ("3/5" -> 5), or
+None when the answer gives a bare number.
+"""
+
+def _rating(value, scale=None):
+    """ScaleReading for value out of scale (None: already 1-10), or None if out of range"""
+    if scale:
+        if value > scale:
+            return None
+        score = max(1, int(value * 10 / scale + 0.5))
+    else:
+        score = int(value + 0.5)
+    if not 1 <= score <= 10:
+        return None
+    return ScaleReading(score, value, scale, 'score')
+
+# Shared results for bare whole numbers, the most common answer
+_BARE_READINGS = {str(score): _rating(float(score)) for score in range(1, 11)}
+# Answers that are just a number, digits or spelled out
+_WHOLE_ANSWER_READINGS = dict(_BARE_READINGS, **{
+    word: _BARE_READINGS[str(score)] for word, score in NUMBER_WORDS.items() if score
+})
+
+_NUMBER_VALUES = dict({word: float(value) for word, value in NUMBER_WORDS.items()},
+                      **{str(value): float(value) for value in range(11)})
+
+def _number(token):
+    value = _NUMBER_VALUES.get(token)
+    return float(token) if value is None else value
+
+def _read_scale(value_token, high_token, scale_token, unit):
+    """ScaleReading for the groups of a DIGIT_SCALE_PATTERN match, or None if it isn't a rating"""
+    if unit in QUANTITY_UNITS:
+        return None
+
+    value = _number(value_token)
+    if high_token:
+        high = _number(high_token)
+        if (value, high) == (1, 10) or (value, high) == (0, 10):
+            return None  # the scale itself, echoed from the question ("1-10")
+        value = (value + high) / 2
+
+    if not unit:
+        return _rating(value, _number(scale_token) if scale_token else None)
+    if unit in HOUR_UNITS:
+        return ScaleReading(None, value, None, 'hours') if value <= 24 else None
+    return _rating(value, 100)
+
+def _common_groups():
+    """DIGIT_SCALE_PATTERN.findall() groups for the whole-number forms answers mostly use"""
+    numbers = [str(value) for value in range(11)]
+    for value in numbers:
+        for high in [''] + numbers:
+            for scale in ('', '5', '10'):
+                yield value, high, scale, ''
+    for value in range(11, 101):
+        yield str(value), '', '', ''
+    for value in range(25):
+        for unit in HOUR_UNITS | QUANTITY_UNITS:
+            yield str(value), '', '', unit
+    for value in range(101):
+        for unit in PERCENT_UNITS:
+            yield str(value), '', '', unit
+
+# Readings worked out once at import, so most numbers cost one dict lookup
+_COMMON_READINGS = {groups: _read_scale(*groups) for groups in _common_groups()}
+
+def _number_token(word):
+    """A split_words() token as a _read_scale() number, or '' if it isn't one"""
+    if word in SPELLED_NUMBERS:
+        return SPELLED_NUMBERS[word]
+    return word.decode('ascii') if word.isdigit() else ''
+
+def _read_spelled_scale(words, index):
+    """ScaleReading for the spelled-out number words[index], given the words around it"""
+    value_token = SPELLED_NUMBERS[words[index]]
+    count = len(words)
+    position = index + 1
+    high_token = scale_token = unit = ''
+    if position < count:
+        if words[position] in RANGE_WORDS and position + 1 < count:
+            high_token = _number_token(words[position + 1])
+            if high_token:
+                position += 2
+
+        if words[position:position + 2] == [b'out', b'of']:
+            scale_token = _number_token(words[position + 2]) if position + 2 < count else ''
+            position += 3
+        elif position < count and words[position] == b'outta':
+            scale_token = _number_token(words[position + 1]) if position + 1 < count else ''
+            position += 2
+
+        if position < count:
+            unit = UNIT_WORDS.get(words[position], '')
+
+    if high_token or scale_token or unit:
+        groups = (value_token, high_token, scale_token, unit)
+        reading = _COMMON_READINGS.get(groups, False)
+        return _read_scale(*groups) if reading is False else reading
+    # "no one", "the two of us": words alone count only after a cue ("maybe a seven")
+    if count > 1 and (value_token == '1' or not index or words[index - 1] not in CUE_WORDS):
+        return None
+    return _WHOLE_ANSWER_READINGS.get(value_token)
+
+# A pure function of the text, so answers parsed again (comprehensive pass, retries) are one lookup
+@lru_cache(maxsize=SENTIMENT_CACHE_SIZE)
+def extract_scale(text):
+    """Find the 1-10 rating in an answer as a ScaleReading
+
+    Understands "7", "3/10", "8 out of 10", "4/5", "80%", spelled-out
+    numbers ("maybe a seven") and ranges ("6-7", "six or seven", read as
+    their midpoint). Times, durations, counts ("3am", "2 days") and
+    negative numbers are skipped. Returns the first rating written in
+    digits, else the first spelled-out one, else the first number of
+    hours ("10 hours of sleep"), else None.
+    """
+    reading = _WHOLE_ANSWER_READINGS.get(text)  # answers arrive stripped; padded ones take the long way
+    if reading is not None:
+        return reading
+
+    # findall() is one C call that returns plain group tuples, [] at once when there are no digits
+    text = text.lower()
+    hours = None
+    for groups in DIGIT_SCALE_PATTERN.findall(text):
+        reading = _COMMON_READINGS.get(groups, False)
+        if reading is False:
+            reading = _read_scale(*groups)
+        if reading is not None:
+            if reading.kind == 'score':
+                return reading
+            if hours is None:
+                hours = reading
+
+    # Most answers without a digit have no number words either
+    words = split_words(text)
+    if SPELLED_NUMBERS.keys().isdisjoint(words):
+        return hours
+    for index, word in enumerate(words):
+        if word in SPELLED_NUMBERS:
+            reading = _read_spelled_scale(words, index)
+            if reading is not None:
+                if reading.kind == 'score':
+                    return reading
+                if hours is None:
+                    hours = reading
+    return hours
+
+def sleep_hours_score(hours):
+    """1-10 sleep score for a night's sleep in hours: 7 hours and up is good, under 6 is poor"""
+    return max(1, min(10, int((hours - 3) * 2 + 0.5)))
 
 def analyze_numeric_response(text, question_index):
     """Analyze numeric responses (1-10 scale questions)"""
-    # Extract numbers from text
-    numbers = re.findall(r'\b(\d{1,2})\b', text)
-    
-    if not numbers:
+    reading = extract_scale(text)
+    if reading is None:
         return None
-    
-    try:
-        score = int(numbers[0])
-        if score < 1 or score > 10:
+
+    # Different interpretations based on question type
+    category = NUMERIC_CATEGORIES.get(question_index)
+    if reading.kind == 'hours':
+        # Hours only answer the sleep question ("worked 10 hours" is not a stress level)
+        if category != 'sleep':
             return None
-        
-        # Different interpretations based on question type
-        if question_index == 1:  # Energy level
-            if score >= 8:
-                return {'level': 'high', 'category': 'energy', 'score': score}
-            elif score >= 5:
-                return {'level': 'moderate', 'category': 'energy', 'score': score}
-            else:
-                return {'level': 'low', 'category': 'energy', 'score': score}
-        
-        elif question_index == 2:  # Stress level
-            if score >= 8:
-                return {'level': 'high', 'category': 'stress', 'score': score}
-            elif score >= 5:
-                return {'level': 'moderate', 'category': 'stress', 'score': score}
-            else:
-                return {'level': 'low', 'category': 'stress', 'score': score}
-        
-        elif question_index == 3:  # Sleep quality
-            if score >= 8:
-                return {'level': 'good', 'category': 'sleep', 'score': score}
-            elif score >= 5:
-                return {'level': 'moderate', 'category': 'sleep', 'score': score}
-            else:
-                return {'level': 'poor', 'category': 'sleep', 'score': score}
-        
-        # Default interpretation
-        if score >= 7:
-            return {'level': 'good', 'category': 'general', 'score': score}
-        elif score >= 4:
-            return {'level': 'moderate', 'category': 'general', 'score': score}
-        else:
-            return {'level': 'poor', 'category': 'general', 'score': score}
-        
-    except ValueError:
-        return None
+        score = sleep_hours_score(reading.value)
+    else:
+        score = reading.score
+
+    if category:
+        return {'level': numeric_level(category, score), 'category': category, 'score': score}
+
+    # Default interpretation
+    if score >= 7:
+        return {'level': 'good', 'category': 'general', 'score': score}
+    elif score >= 4:
+        return {'level': 'moderate', 'category': 'general', 'score': score}
+    else:
+        return {'level': 'poor', 'category': 'general', 'score': score}
 
 def generate_recommendation(sentiment_result, emotions, numeric_analysis, question_index):
     """Generate personalized recommendations based on analysis"""
@@ -224,93 +617,245 @@ def generate_recommendation(sentiment_result, emotions, numeric_analysis, questi
         'wellness_tip': random.choice(wellness_tips)
     }
 
-def analyze_sentiment_and_recommend(text, question_index=0, all_answers=None):
-    """Main function to analyze sentiment and generate recommendations"""
+def normalize_text(text):
+    """Cache key form of a message: case and runs of whitespace don't affect the analysis"""
+    return ' '.join(text.split()).lower()
+
+def analyze_features(text, question_index=0):
+    """Return (sentiment_result, emotions, numeric_analysis, indicators) for text, memoized
+
+    These parts of the analysis are deterministic, so repeated answers
+    like "5" or "tired" are only analyzed once. indicators holds the
+    sleep and workload labels found in the text, from the same keyword
+    pass as the emotions. Callers get copies and may modify them freely.
+    """
+    key = (normalize_text(text), question_index)
+    features = _analysis_cache.get(key)
+    if features is None:
+        with span('sentiment.score'):
+            sentiment_result = analyze_sentiment_basic(text)
+        with span('sentiment.emotions'):
+            labels = indicator_labels(text)
+            emotions = tuple(ordered_emotions(labels['emotion']))
+            indicators = {'sleep': tuple(sorted(labels['sleep'])), 'workload': tuple(sorted(labels['workload']))}
+        with span('sentiment.numeric'):
+            numeric_analysis = analyze_numeric_response(text, question_index)
+        features = (sentiment_result, emotions, numeric_analysis, indicators)
+        _analysis_cache.set(key, features)
+
+    return copy_features(*features)
+
+def copy_features(sentiment_result, emotions, numeric_analysis, indicators):
+    """Fresh copies of analyze_features() results, for a caller to keep or modify"""
+    return (dict(sentiment_result), list(emotions), dict(numeric_analysis) if numeric_analysis else None,
+            {table: list(labels) for table, labels in indicators.items()})
+
+def get_analysis_cache_stats():
+    """Return hit, miss and eviction counters for the analysis cache"""
+    return _analysis_cache.stats()
+
+def clear_analysis_cache():
+    """Drop all memoized analysis results"""
+    _analysis_cache.clear()
+    extract_scale.cache_clear()
+
+def fallback_result(recommendation="Thank you for your check-in. Take care of yourself today."):
+    """Safe neutral result used when analysis fails"""
+    return {
+        'sentiment': 'NEUTRAL',
+        'sentiment_score': 0.0,
+        'confidence': 0.0,
+        'emotions': [],
+        'recommendation': recommendation,
+        'wellness_tip': "🧘 Remember to breathe deeply and be kind to yourself.",
+        'suggested_activity': None,
+        'activity_category': None,
+        'numeric_analysis': None
+    }
+
+def analyze_sentiment_and_recommend(text, question_index=0, all_answers=None, include_activity=True):
+    """Main function to analyze sentiment and generate recommendations
+
+    With include_activity=False the activity lookup is skipped and only
+    'activity_category' is filled in, so the caller can resolve it.
+    """
     try:
         # For comprehensive analysis (question_index 4), analyze all answers
         if question_index == 4 and all_answers:
-            return analyze_comprehensive_checkin(all_answers)
-        
-        # Basic sentiment analysis
-        sentiment_result = analyze_sentiment_basic(text)
-        
-        # Detect specific emotions
-        emotions = detect_emotions(text)
-        
-        # Analyze numeric responses
-        numeric_analysis = analyze_numeric_response(text, question_index)
-        
-        # Generate recommendations
-        recommendation_data = generate_recommendation(
-            sentiment_result, emotions, numeric_analysis, question_index
-        )
-        
-        # Get a wellness activity
-        activity = get_wellness_activity_by_category(recommendation_data['activity_category'])
+            return analyze_comprehensive_checkin(all_answers, include_activity)
         
-        # Determine final sentiment label
-        final_sentiment = sentiment_result['sentiment']
-        
-        # Override based on detected emotions or numeric analysis
-        if 'stress' in emotions or (numeric_analysis and numeric_analysis.get('category') == 'stress' and numeric_analysis.get('level') == 'high'):
-            final_sentiment = 'STRESSED'
-        elif 'tired' in emotions or (numeric_analysis and numeric_analysis.get('category') == 'energy' and numeric_analysis.get('level') == 'low'):
-            final_sentiment = 'TIRED'
-        elif 'sad' in emotions:
-            final_sentiment = 'SAD'
-        elif 'happy' in emotions:
-            final_sentiment = 'HAPPY'
-        elif 'angry' in emotions:
-            final_sentiment = 'ANGRY'
-        elif 'calm' in emotions:
-            final_sentiment = 'CALM'
-        
-        return {
-            'sentiment': final_sentiment,
-            'sentiment_score': round(sentiment_result['polarity'], 2),
-            'confidence': round(sentiment_result['confidence'], 2),
-            'emotions': emotions,
-            'recommendation': recommendation_data['recommendation'],
-            'wellness_tip': recommendation_data['wellness_tip'],
-            'suggested_activity': activity,
-            'numeric_analysis': numeric_analysis
-        }
+        return build_analysis(text, question_index, *analyze_features(text, question_index),
+                              include_activity=include_activity)
         
     except Exception as e:
         print(f"Error in sentiment analysis: {e}")
         # Return safe fallback
-        return {
-            'sentiment': 'NEUTRAL',
-            'sentiment_score': 0.0,
-            'confidence': 0.0,
-            'emotions': [],
-            'recommendation': "Thank you for your check-in. Take care of yourself today.",
-            'wellness_tip': "🧘 Remember to breathe deeply and be kind to yourself.",
-            'suggested_activity': None,
-            'numeric_analysis': None
-        }
+        return fallback_result()
+
+def analyze_batch(texts, question_indexes=None):
+    """Analyze many texts, returning results in input order
+
+    Each result has the same shape as analyze_sentiment_and_recommend();
+    items that could not be analyzed are returned as {'error': message}.
+    Texts are still scored one at a time, but each distinct (text,
+    question_index) in the batch is scored only once, even with the
+    analysis cache disabled or full; recommendations are built per item.
+    """
+    if question_indexes is None:
+        question_indexes = [0] * len(texts)
+    elif len(question_indexes) != len(texts):
+        raise ValueError("texts and question_indexes must be the same length")
+
+    features = {}
+    results = []
+    for text, question_index in zip(texts, question_indexes):
+        if not isinstance(text, str) or not text.strip():
+            results.append({'error': 'Message is required'})
+            continue
+
+        try:
+            key = (normalize_text(text), question_index)
+            if key not in features:
+                features[key] = analyze_features(text, question_index)
+            # Each result holds its own copies, like analyze_features() hands out
+            results.append(build_analysis(text, question_index, *copy_features(*features[key])))
+        except Exception as e:
+            results.append({'error': f"Analysis failed: {e}"})
+
+    return results
+
+def build_analysis(text, question_index, sentiment_result, emotions, numeric_analysis, indicators=None,
+                   include_activity=True):
+    """Combine the analyzed features with a recommendation and activity"""
+    # Generate recommendations
+    recommendation_data = generate_recommendation(
+        sentiment_result, emotions, numeric_analysis, question_index
+    )
+    
+    # Get a wellness activity
+    activity = None
+    if include_activity:
+        with span('activity.lookup'):
+            activity = get_wellness_activity_by_category(recommendation_data['activity_category'])
+    
+    # Determine final sentiment label
+    final_sentiment = sentiment_result['sentiment']
+    
+    # Override based on detected emotions or numeric analysis
+    if 'stress' in emotions or (numeric_analysis and numeric_analysis.get('category') == 'stress' and numeric_analysis.get('level') == 'high'):
+        final_sentiment = 'STRESSED'
+    elif 'tired' in emotions or (numeric_analysis and numeric_analysis.get('category') == 'energy' and numeric_analysis.get('level') == 'low'):
+        final_sentiment = 'TIRED'
+    elif 'sad' in emotions:
+        final_sentiment = 'SAD'
+    elif 'happy' in emotions:
+        final_sentiment = 'HAPPY'
+    elif 'angry' in emotions:
+        final_sentiment = 'ANGRY'
+    elif 'calm' in emotions:
+        final_sentiment = 'CALM'
+    
+    return {
+        'sentiment': final_sentiment,
+        'sentiment_score': round(sentiment_result['polarity'], 2),
+        'confidence': round(sentiment_result['confidence'], 2),
+        'emotions': emotions,
+        'recommendation': recommendation_data['recommendation'],
+        'wellness_tip': recommendation_data['wellness_tip'],
+        'suggested_activity': activity,
+        'activity_category': recommendation_data['activity_category'],
+        'numeric_analysis': numeric_analysis,
+        'indicators': indicators
+    }
+
+# Check-in questions, recognized by these phrases in the question text
+CHECKIN_QUESTION_KINDS = (
+    ('energized', 'energy'),
+    ('stress level', 'stress'),
+    ('sleep', 'sleep'),
+    ('workload', 'workload')
+)
+
+# question_index analyze_numeric_response() expects for each numeric kind
+NUMERIC_QUESTION_INDEXES = {category: index for index, category in NUMERIC_CATEGORIES.items()}
+
+def checkin_question_kind(question):
+    """Which check-in question a question text asks, or None"""
+    question = (question or '').lower()
+    return next((kind for phrase, kind in CHECKIN_QUESTION_KINDS if phrase in question), None)
+
+def sleep_quality(labels):
+    """'good' or 'poor' from an answer's sleep indicator labels, None if mixed or missing"""
+    if len(labels) == 1:
+        return next(iter(labels))
+    return None
+
+def parse_checkin_answer(question, answer, analysis=None):
+    """Parse one answer of the check-in conversation
+
+    Returns the partial result the final summary is built from:
+    {'kind': 'energy' | 'stress' | 'sleep' | 'workload' | None,
+     'numeric': analyze_numeric_response() result or None,
+     'sleep_quality': 'good' | 'poor' | None, from words when the sleep
+     answer gives no rating ("terribly"),
+     'workload_overwhelmed': bool}. Plain data, so it can be stored as JSON.
+
+    analysis is the answer's analyze_sentiment_and_recommend() result on
+    its question's scale, if the caller has one; its numeric_analysis and
+    indicators are used instead of parsing the answer again. Fallback
+    results have no indicators, so the answer is parsed then.
+    """
+    kind = checkin_question_kind(question)
+    indicators = analysis.get('indicators') if analysis else None
 
-def analyze_comprehensive_checkin(all_answers):
+    numeric = None
+    quality = None
+    overwhelmed = False
+    if kind in NUMERIC_QUESTION_INDEXES:
+        if indicators is not None:
+            numeric = analysis['numeric_analysis']
+        else:
+            numeric = analyze_numeric_response(answer, NUMERIC_QUESTION_INDEXES[kind])
+        if kind == 'sleep' and numeric is None:
+            quality = sleep_quality((indicators or indicator_labels(answer))['sleep'])
+    elif kind == 'workload':
+        overwhelmed = 'overwhelmed' in (indicators or indicator_labels(answer))['workload']
+
+    return {'kind': kind, 'numeric': numeric, 'sleep_quality': quality, 'workload_overwhelmed': overwhelmed}
+
+def analyze_comprehensive_checkin(all_answers, include_activity=True):
     """Analyze all answers from a complete check-in session"""
     try:
-        # Extract numeric scores from answers
+        partials = [parse_checkin_answer(answer.get('question', ''), answer.get('answer', ''))
+                    for answer in all_answers]
+    except Exception as e:
+        print(f"Error in comprehensive analysis: {e}")
+        return fallback_result("Thank you for completing your check-in. Take care of yourself today.")
+    return summarize_checkin(partials, include_activity)
+
+def summarize_checkin(partials, include_activity=True):
+    """Build the whole-check-in analysis from parse_checkin_answer() results"""
+    try:
         energy_score = None
         stress_score = None
         sleep_score = None
-        workload_text = ""
+        sleep_words = None
+        workload_seen = False
+        workload_overwhelmed = False
         
-        for answer in all_answers:
-            question = answer.get('question', '')
-            answer_text = answer.get('answer', '')
-            
-            if 'energized' in question.lower():
-                energy_score = analyze_numeric_response(answer_text, 1)
-            elif 'stress level' in question.lower():
-                stress_score = analyze_numeric_response(answer_text, 2)
-            elif 'sleep' in question.lower():
-                sleep_score = analyze_numeric_response(answer_text, 3)
-            elif 'workload' in question.lower():
-                workload_text = answer_text
+        # Later answers to the same question win
+        for partial in partials:
+            kind = partial.get('kind')
+            if kind == 'energy':
+                energy_score = partial.get('numeric')
+            elif kind == 'stress':
+                stress_score = partial.get('numeric')
+            elif kind == 'sleep':
+                sleep_score = partial.get('numeric')
+                sleep_words = partial.get('sleep_quality')
+            elif kind == 'workload':
+                workload_seen = True
+                workload_overwhelmed = partial.get('workload_overwhelmed', False)
         
         # Determine overall wellness state
         overall_sentiment = 'NEUTRAL'
@@ -332,16 +877,15 @@ def analyze_comprehensive_checkin(all_answers):
             overall_sentiment = 'STRESSED'
         
         # Analyze sleep
-        if sleep_score and sleep_score['level'] == 'poor':
+        if (sleep_score['level'] if sleep_score else sleep_words) == 'poor':
             primary_concerns.append('poor sleep')
             recommendations.append("Poor sleep affects everything. Consider establishing a calming bedtime routine.")
             if activity_category == 'breathing':
                 activity_category = 'relaxation'
         
         # Analyze workload
-        if workload_text:
-            workload_lower = workload_text.lower()
-            if any(word in workload_lower for word in ['overwhelming', 'too much', 'crazy', 'insane', 'impossible']):
+        if workload_seen:
+            if workload_overwhelmed:
                 primary_concerns.append('workload overwhelm')
                 recommendations.append("Your workload seems overwhelming. Consider breaking tasks into smaller chunks.")
                 if not primary_concerns or primary_concerns == ['workload overwhelm']:
@@ -366,7 +910,7 @@ def analyze_comprehensive_checkin(all_answers):
             wellness_tip = "💚 Keep up the great work! Regular check-ins like this are powerful for maintaining wellness."
         
         # Get appropriate wellness activity
-        activity = get_wellness_activity_by_category(activity_category)
+        activity = get_wellness_activity_by_category(activity_category) if include_activity else None
         
         return {
             'sentiment': overall_sentiment,
@@ -376,6 +920,7 @@ def analyze_comprehensive_checkin(all_answers):
             'recommendation': main_recommendation,
             'wellness_tip': wellness_tip,
             'suggested_activity': activity,
+            'activity_category': activity_category,
             'numeric_analysis': {
                 'energy': energy_score,
                 'stress': stress_score,
@@ -385,16 +930,7 @@ def analyze_comprehensive_checkin(all_answers):
         
     except Exception as e:
         print(f"Error in comprehensive analysis: {e}")
-        return {
-            'sentiment': 'NEUTRAL',
-            'sentiment_score': 0.0,
-            'confidence': 0.0,
-            'emotions': [],
-            'recommendation': "Thank you for completing your check-in. Take care of yourself today.",
-            'wellness_tip': "🧘 Remember to breathe deeply and be kind to yourself.",
-            'suggested_activity': None,
-            'numeric_analysis': None
-        }
+        return fallback_result("Thank you for completing your check-in. Take care of yourself today.")
 
 def get_contextual_response(question_index, user_response):
     """Get contextual responses based on the specific question asked"""
@@ -0,0 +1,247 @@
+"""Sentiment scoring backends
+
+Every engine is a callable text -> (polarity, subjectivity) with polarity
+in -1..1 and subjectivity in 0..1. SENTIMENT_ENGINE picks the one used by
+sentiment_analysis:
+
+    textblob  TextBlob's pattern analyzer, the reference implementation
+    lexicon   one-pass scorer over the precompiled table in sentiment_lexicon.py
+
+Regenerate the lexicon table after changing LEXICON_ADDITIONS or upgrading
+TextBlob with:
+
+    python sentiment_engines.py compile
+"""
+import argparse
+import os
+import re
+import sys
+import threading
+
+SENTIMENT_ENGINE = os.getenv('SENTIMENT_ENGINE', 'textblob')
+
+LEXICON_MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sentiment_lexicon.py')
+
+# Check-in vocabulary missing from the pattern lexicon: word -> (polarity, subjectivity, intensity)
+LEXICON_ADDITIONS = {
+    'stressed': (-0.5, 0.8, 1.0),
+    'stress': (-0.4, 0.6, 1.0),
+    'stressful': (-0.5, 0.8, 1.0),
+    'overwhelmed': (-0.6, 0.9, 1.0),
+    'anxiety': (-0.5, 0.8, 1.0),
+    'worried': (-0.4, 0.8, 1.0),
+    'nervous': (-0.3, 0.8, 1.0),
+    'scared': (-0.5, 0.9, 1.0),
+    'panic': (-0.6, 0.9, 1.0),
+    'restless': (-0.3, 0.7, 1.0),
+    'drained': (-0.5, 0.8, 1.0),
+    'fatigued': (-0.4, 0.7, 1.0),
+    'sleepy': (-0.2, 0.6, 1.0),
+    'burnout': (-0.6, 0.8, 1.0),
+    'depressed': (-0.7, 0.9, 1.0),
+    'hopeless': (-0.8, 0.9, 1.0),
+    'upset': (-0.5, 0.8, 1.0),
+    'irritated': (-0.4, 0.8, 1.0),
+    'motivated': (0.5, 0.7, 1.0),
+    'energized': (0.5, 0.7, 1.0),
+    'rested': (0.4, 0.6, 1.0),
+    'refreshed': (0.5, 0.7, 1.0),
+    'relaxed': (0.4, 0.7, 1.0),
+    'productive': (0.4, 0.5, 1.0),
+    'focused': (0.3, 0.5, 1.0),
+    'grateful': (0.6, 0.8, 1.0),
+    'thankful': (0.6, 0.8, 1.0),
+    'content': (0.4, 0.7, 1.0),
+}
+
+NEGATIONS = frozenset(('no', 'not', 'never', "n't", 'cannot', 'nothing', 'nobody', 'neither', 'nor', 'none'))
+
+TOKEN_PATTERN = re.compile(
+    r"\(!\)"                                   # sarcasm marker
+    r"|>?[:;=][-^o']?[)(\]\[dpb/\\|*3@$]+"      # western emoticons
+    r"|<3"
+    r"|[a-z]+(?:[-'][a-z]+)*"                  # words, hyphenated words and contractions
+    r"|\d+(?:[./]\d+)?"
+    r"|\.\.\.|[^\s\w]"
+)
+
+def _is_negation(token):
+    return token in NEGATIONS or token.endswith("n't")
+
+class LexiconSentiment:
+    """Pattern-compatible sentiment scorer over a flat, precompiled lexicon
+
+    Scores in a single pass over the tokens, keeping only the pending
+    negation and modifier: intensifiers ("very good") scale the next known
+    word, a negation within a word or two flips it to half strength in the
+    opposite direction ("not good" = slightly bad), and "!" boosts the
+    preceding word. Unlike TextBlob's tokenizer, contractions such as
+    "don't" and "isn't" count as negations.
+    """
+
+    def __init__(self, lexicon, emoticons):
+        self.lexicon = lexicon
+        self.emoticons = emoticons
+
+    def __call__(self, text):
+        lexicon = self.lexicon
+        polarities = []
+        subjectivities = []
+        negated = []
+        intensity = None   # intensity of the last known word, if it can modify the next one
+        modifier = None    # the last known word, if it is an adverb
+        negation = None
+
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            entry = lexicon.get(token)
+            if entry is not None:
+                p, s, i, is_modifier = entry
+                if modifier is None:
+                    polarities.append(p)
+                    subjectivities.append(s)
+                    negated.append(False)
+                else:
+                    # "very good": the adverb's intensity scales this word
+                    polarities[-1] = max(-1.0, min(p * intensity, 1.0))
+                    subjectivities[-1] = max(-1.0, min(s * intensity, 1.0))
+                intensity = i
+                if negation is not None:
+                    intensity = 1.0 / intensity
+                    negated[-1] = True
+
+                modifier = token if is_modifier else None
+                negation = token if _is_negation(token) else None
+                continue
+
+            if _is_negation(token):
+                negation = token
+            elif negation and len(token.strip("'")) > 1:
+                # Negation carries across small words only ("not a good day")
+                negation = None
+
+            if negation is not None and modifier is not None and modifier.endswith('ly'):
+                # "really not good"
+                negated[-1] = True
+                negation = None
+            elif modifier and len(token) > 2:
+                modifier = None
+
+            if token == '!' and polarities:
+                polarities[-1] = max(-1.0, min(polarities[-1] * 1.25, 1.0))
+            elif token == '(!)':
+                polarities.append(0.0)
+                subjectivities.append(1.0)
+                negated.append(False)
+            else:
+                emoticon = self.emoticons.get(token)
+                if emoticon is not None:
+                    polarities.append(emoticon)
+                    subjectivities.append(1.0)
+                    negated.append(False)
+
+        if not polarities:
+            return 0.0, 0.0
+        polarity = sum(p * -0.5 if n else p for p, n in zip(polarities, negated))
+        return polarity / len(polarities), sum(subjectivities) / len(subjectivities)
+
+def _load_textblob():
+    # TextBlob is slow to import; only pay for it when this engine is used
+    from textblob.en import sentiment as pattern_sentiment  # type: ignore
+    pattern_sentiment.load()
+
+    def score(text):
+        # TextBlob(text).sentiment is a thin wrapper around the pattern lexicon
+        # scorer; calling it directly scores once instead of once per attribute
+        polarity, subjectivity = pattern_sentiment(text)
+        return polarity, subjectivity
+    return score
+
+def _load_lexicon():
+    from sentiment_lexicon import EMOTICONS, LEXICON
+    return LexiconSentiment(LEXICON, EMOTICONS)
+
+# name -> factory returning the scoring callable; factories run once per process
+SENTIMENT_ENGINES = {
+    'textblob': _load_textblob,
+    'lexicon': _load_lexicon
+}
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+def register_engine(name, factory):
+    """Make another backend selectable through SENTIMENT_ENGINE"""
+    SENTIMENT_ENGINES[name] = factory
+    _engines.pop(name, None)
+
+def get_sentiment_engine(name=None):
+    """Return the scoring callable for an engine (SENTIMENT_ENGINE by default)"""
+    name = name or SENTIMENT_ENGINE
+    engine = _engines.get(name)
+    if engine is None:
+        if name not in SENTIMENT_ENGINES:
+            raise ValueError(f"Unknown sentiment engine '{name}' (available: {', '.join(SENTIMENT_ENGINES)})")
+        with _engines_lock:
+            engine = _engines.get(name)
+            if engine is None:
+                engine = _engines[name] = SENTIMENT_ENGINES[name]()
+    return engine
+
+def compile_lexicon(path=LEXICON_MODULE_PATH):
+    """Flatten TextBlob's pattern lexicon plus LEXICON_ADDITIONS into a Python module
+
+    Each word keeps pattern's part-of-speech-averaged (polarity,
+    subjectivity, intensity) and a flag for whether it can act as an
+    adverbial modifier. As a module the table is loaded from bytecode
+    instead of being parsed from XML on every start.
+    """
+    from textblob._text import EMOTICONS as PATTERN_EMOTICONS  # type: ignore
+    from textblob.en import sentiment as pattern_sentiment  # type: ignore
+    pattern_sentiment.load()
+
+    lexicon = {}
+    for word, senses in dict.items(pattern_sentiment):
+        p, s, i = senses[None]
+        lexicon[word.lower()] = (round(p, 4), round(s, 4), round(i, 4), 1 if 'RB' in senses else 0)
+    for word, (p, s, i) in LEXICON_ADDITIONS.items():
+        lexicon.setdefault(word, (p, s, i, 0))
+
+    emoticons = {}
+    for (_, polarity), faces in PATTERN_EMOTICONS.items():
+        for face in faces:
+            emoticons[face.lower()] = polarity
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('# Generated by `python sentiment_engines.py compile`; do not edit by hand.\n')
+        f.write('# word -> (polarity, subjectivity, intensity, is_modifier)\n')
+        f.write('LEXICON = {\n')
+        for word in sorted(lexicon):
+            f.write(f'    {word!r}: {lexicon[word]!r},\n')
+        f.write('}\n\n')
+        f.write('# emoticon -> polarity\n')
+        f.write('EMOTICONS = {\n')
+        for face in sorted(emoticons):
+            f.write(f'    {face!r}: {emoticons[face]!r},\n')
+        f.write('}\n')
+    return len(lexicon), len(emoticons)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sentiment engine utilities')
+    subcommands = parser.add_subparsers(dest='command', required=True)
+    subcommands.add_parser('compile', help='regenerate sentiment_lexicon.py from the TextBlob lexicon')
+    score = subcommands.add_parser('score', help='score text with every engine')
+    score.add_argument('text')
+    args = parser.parse_args(argv)
+
+    if args.command == 'compile':
+        words, emoticons = compile_lexicon()
+        print(f"✓ Wrote {words} words and {emoticons} emoticons to {LEXICON_MODULE_PATH}")
+        return 0
+
+    for name in SENTIMENT_ENGINES:
+        polarity, subjectivity = get_sentiment_engine(name)(args.text)
+        print(f"{name}\tpolarity={polarity:.3f}\tsubjectivity={subjectivity:.3f}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,2963 @@
+# Generated by `python sentiment_engines.py compile`; do not edit by hand.
+# word -> (polarity, subjectivity, intensity, is_modifier)
+LEXICON = {
+    '13th': (0.0, 0.0, 1.0, 0),
+    '13thly': (0.0, 0.0, 1.0, 1),
+    '20th': (0.0, 0.0, 1.0, 0),
+    '20thly': (0.0, 0.0, 1.0, 1),
+    '21st': (0.0, 0.0, 1.0, 0),
+    '21stly': (0.0, 0.0, 1.0, 1),
+    '2nd': (0.0, 0.0, 1.0, 0),
+    '2ndly': (0.0, 0.0, 1.0, 1),
+    '3rd': (0.0, 0.0, 1.0, 0),
+    '3rdly': (0.0, 0.0, 1.0, 1),
+    'abhorrent': (-0.7, 0.8, 1.0, 0),
+    'abhorrently': (-0.7, 0.8, 1.0, 1),
+    'able': (0.5, 0.625, 1.0, 0),
+    'ably': (0.5, 0.625, 1.0, 1),
+    'above': (0.0, 0.1, 1.0, 0),
+    'abovely': (0.0, 0.1, 1.0, 1),
+    'abridged': (0.1, 0.5, 1.0, 0),
+    'abridgedly': (0.1, 0.5, 1.0, 1),
+    'abrupt': (-0.125, 1.0, 1.0, 0),
+    'abruptly': (-0.125, 1.0, 1.0, 1),
+    'absence': (-0.0125, 0.0, 1.0, 0),
+    'absolute': (0.2, 0.9, 1.0, 0),
+    'absolutely': (0.2, 0.9, 1.0, 1),
+    'absorbed': (0.3, 0.9, 1.0, 0),
+    'absorbedly': (0.3, 0.9, 1.0, 1),
+    'absorbing': (0.2, 0.95, 1.0, 0),
+    'absorbingly': (0.2, 0.95, 1.0, 1),
+    'absurd': (-0.5, 1.0, 1.0, 0),
+    'absurdly': (-0.5, 1.0, 1.0, 1),
+    'abundant': (0.6, 0.95, 1.0, 0),
+    'abundantly': (0.6, 0.95, 1.0, 1),
+    'academic': (0.0, 0.0, 1.0, 0),
+    'academicly': (0.0, 0.0, 1.0, 1),
+    'accessible': (0.375, 0.375, 1.0, 0),
+    'accessibly': (0.375, 0.375, 1.0, 1),
+    'accomplished': (0.2, 0.5, 1.0, 0),
+    'accomplishedly': (0.2, 0.5, 1.0, 1),
+    'accurate': (0.4, 0.6333, 1.0, 0),
+    'accurately': (0.4, 0.6333, 1.0, 1),
+    'acquainted': (0.5, 0.6, 1.0, 0),
+    'acquaintedly': (0.5, 0.6, 1.0, 1),
+    'across-the-board': (0.1, 0.9, 1.0, 0),
+    'across-the-boardly': (0.1, 0.9, 1.0, 1),
+    'acting': (0.0, 0.0, 1.0, 0),
+    'actingly': (0.0, 0.0, 1.0, 1),
+    'action': (0.1, 0.1, 1.0, 0),
+    'active': (-0.1333, 0.6, 1.0, 0),
+    'actively': (-0.1333, 0.6, 1.0, 1),
+    'actual': (0.0, 0.1, 1.0, 0),
+    'actually': (0.0, 0.1, 1.0, 1),
+    'acuate': (0.1, 0.4, 1.0, 0),
+    'acuately': (0.1, 0.4, 1.0, 1),
+    'acute': (0.6, 0.9, 1.0, 0),
+    'acutely': (0.6, 0.9, 1.0, 1),
+    'adamant': (0.1, 0.7, 1.0, 0),
+    'adamantly': (0.1, 0.7, 1.0, 1),
+    'addicted': (-0.4, 0.6, 1.0, 0),
+    'addictedly': (-0.4, 0.6, 1.0, 1),
+    'addictive': (0.0, 0.9, 1.0, 0),
+    'addictively': (0.0, 0.9, 1.0, 1),
+    'addled': (-0.4667, 0.8333, 1.0, 0),
+    'addledly': (-0.4667, 0.8333, 1.0, 1),
+    'adept': (0.6, 0.9, 1.0, 0),
+    'adeptly': (0.6, 0.9, 1.0, 1),
+    'adequate': (0.3333, 0.3333, 1.0, 0),
+    'adequate to': (-0.4, 0.6, 1.0, 0),
+    'adequate toly': (-0.4, 0.6, 1.0, 1),
+    'adequately': (0.3333, 0.3333, 1.0, 1),
+    'adjectival': (0.1, 0.1, 1.0, 0),
+    'adjectivally': (0.1, 0.1, 1.0, 1),
+    'administrable': (0.0, 0.3, 1.0, 0),
+    'administrably': (0.0, 0.3, 1.0, 1),
+    'adorable': (0.5, 1.0, 1.0, 0),
+    'adorably': (0.5, 1.0, 1.0, 1),
+    'adoring': (0.2, 0.9, 1.0, 0),
+    'adoringly': (0.2, 0.9, 1.0, 1),
+    'adult': (0.1, 0.3, 1.0, 0),
+    'adultly': (0.1, 0.3, 1.0, 1),
+    'advanced': (0.4, 0.6, 1.0, 0),
+    'advancedly': (0.4, 0.6, 1.0, 1),
+    'adventurous': (0.5, 0.9, 1.0, 0),
+    'adventurously': (0.5, 0.9, 1.0, 1),
+    'adversative': (-0.1, 0.3, 1.0, 0),
+    'adversatively': (-0.1, 0.3, 1.0, 1),
+    'advertent': (0.5, 0.9, 1.0, 0),
+    'advertently': (0.5, 0.9, 1.0, 1),
+    'aeriform': (-0.25, 0.75, 1.0, 0),
+    'aeriformly': (-0.25, 0.75, 1.0, 1),
+    'affable': (0.8, 1.0, 1.0, 0),
+    'affably': (0.8, 1.0, 1.0, 1),
+    'affirmative': (0.6, 0.9, 1.0, 0),
+    'affirmatively': (0.6, 0.9, 1.0, 1),
+    'affluent': (0.65, 0.95, 1.0, 0),
+    'affluently': (0.65, 0.95, 1.0, 1),
+    'afloat': (0.0, 0.1, 1.0, 0),
+    'afloatly': (0.0, 0.1, 1.0, 1),
+    'aforementioned': (0.0, 0.0, 1.0, 0),
+    'aforementionedly': (0.0, 0.0, 1.0, 1),
+    'afraid': (-0.6, 0.9, 1.0, 0),
+    'afraidly': (-0.6, 0.9, 1.0, 1),
+    'african': (0.0, 0.0, 1.0, 0),
+    'africanly': (0.0, 0.0, 1.0, 1),
+    'aged': (-0.1, 0.4, 1.0, 0),
+    'agedly': (-0.1, 0.4, 1.0, 1),
+    'aghast': (-0.6, 0.9, 1.0, 0),
+    'aghastly': (-0.6, 0.9, 1.0, 1),
+    'agile': (0.5, 0.75, 1.0, 0),
+    'agily': (0.5, 0.75, 1.0, 1),
+    'agitative': (-0.6, 1.0, 1.0, 0),
+    'agitatively': (-0.6, 1.0, 1.0, 1),
+    'aglow': (0.0, 0.2, 1.0, 0),
+    'aglowly': (0.0, 0.2, 1.0, 1),
+    'ahw': (0.3, 0.9, 1.0, 0),
+    'aired': (0.1, 0.7, 1.0, 0),
+    'airedly': (0.1, 0.7, 1.0, 1),
+    'airheaded': (0.5, 1.0, 1.0, 0),
+    'airheadedly': (0.5, 1.0, 1.0, 1),
+    'alarming': (-0.1, 0.6, 1.0, 0),
+    'alarmingly': (-0.1, 0.6, 1.0, 1),
+    'alas': (-0.4, 1.0, 1.0, 0),
+    'alcoholic': (-0.25, 0.5, 1.0, 0),
+    'alcoholicly': (-0.25, 0.5, 1.0, 1),
+    'algid': (-0.4, 0.9, 1.0, 0),
+    'algidly': (-0.4, 0.9, 1.0, 1),
+    'alien': (-0.25, 0.75, 1.0, 0),
+    'alienating': (-0.3, 0.3, 1.0, 0),
+    'alienatingly': (-0.3, 0.3, 1.0, 1),
+    'alienly': (-0.25, 0.75, 1.0, 1),
+    'alive': (0.1, 0.4, 1.0, 0),
+    'alively': (0.1, 0.4, 1.0, 1),
+    'all-around': (0.2, 0.4, 1.0, 0),
+    'all-aroundly': (0.2, 0.4, 1.0, 1),
+    'alleged': (-0.1, 0.1, 1.0, 0),
+    'allegedly': (-0.1, 0.1, 1.0, 1),
+    'alleviated': (0.5, 0.8, 1.0, 0),
+    'alleviatedly': (0.5, 0.8, 1.0, 1),
+    'allusions': (-0.1, 0.1, 1.0, 0),
+    'alternate': (0.0, 0.0, 1.0, 0),
+    'alternately': (0.0, 0.0, 1.0, 1),
+    'amateur': (-0.25, 0.25, 1.0, 0),
+    'amateurish': (-0.4, 0.8, 1.0, 0),
+    'amateurishly': (-0.4, 0.8, 1.0, 1),
+    'amateurly': (-0.25, 0.25, 1.0, 1),
+    'amatorily': (0.1, 0.1, 1.0, 1),
+    'amatory': (0.1, 0.1, 1.0, 0),
+    'amazing': (0.6, 0.9, 1.0, 0),
+    'amazingly': (0.6, 0.9, 1.0, 1),
+    'ambitious': (0.25, 0.75, 1.0, 0),
+    'ambitiously': (0.25, 0.75, 1.0, 1),
+    'amenable': (0.2, 0.6, 1.0, 0),
+    'amenably': (0.2, 0.6, 1.0, 1),
+    'american': (0.0, 0.0, 1.0, 0),
+    'americanly': (0.0, 0.0, 1.0, 1),
+    'amusing': (0.6, 1.0, 1.0, 0),
+    'amusingly': (0.6, 1.0, 1.0, 1),
+    'anger': (-0.7, 0.2, 1.0, 0),
+    'angered': (-0.75, 0.85, 1.0, 0),
+    'angeredly': (-0.75, 0.85, 1.0, 1),
+    'angrily': (-0.5, 1.0, 1.0, 1),
+    'angry': (-0.5, 1.0, 1.0, 0),
+    'annoyed': (-0.4, 0.8, 1.0, 0),
+    'annoyedly': (-0.4, 0.8, 1.0, 1),
+    'annoying': (-0.8, 0.9, 1.0, 0),
+    'annoyingly': (-0.8, 0.9, 1.0, 1),
+    'anxiety': (-0.5, 0.8, 1.0, 0),
+    'anxious': (-0.25, 1.0, 1.0, 0),
+    'anxiously': (-0.25, 1.0, 1.0, 1),
+    'aphonic': (-0.1, 0.1, 1.0, 0),
+    'aphonicly': (-0.1, 0.1, 1.0, 1),
+    'appalled': (-0.8, 1.0, 1.0, 0),
+    'appalledly': (-0.8, 1.0, 1.0, 1),
+    'appalling': (-0.35, 0.9, 1.0, 0),
+    'appallingly': (-0.35, 0.9, 1.0, 1),
+    'apparent': (0.05, 0.35, 1.0, 0),
+    'apparently': (0.05, 0.35, 1.0, 1),
+    'appealing': (0.5, 0.5, 1.0, 0),
+    'appealingly': (0.5, 0.5, 1.0, 1),
+    'appetizing': (0.2, 0.6, 1.0, 0),
+    'appetizingly': (0.2, 0.6, 1.0, 1),
+    'applaudable': (0.7, 0.9, 1.0, 0),
+    'applaudably': (0.7, 0.9, 1.0, 1),
+    'applicative': (0.4, 0.5, 1.0, 0),
+    'applicatively': (0.4, 0.5, 1.0, 1),
+    'apportioned': (0.3, 0.6, 1.0, 0),
+    'apportionedly': (0.3, 0.6, 1.0, 1),
+    'apposite': (0.4, 0.8, 1.0, 0),
+    'appositely': (0.4, 0.8, 1.0, 1),
+    'appreciated': (0.2, 0.1, 1.0, 0),
+    'appreciatedly': (0.2, 0.1, 1.0, 1),
+    'appreciative': (0.6, 0.9, 1.0, 0),
+    'appreciatively': (0.6, 0.9, 1.0, 1),
+    'approaching': (0.0, 0.0, 1.0, 0),
+    'approachingly': (0.0, 0.0, 1.0, 1),
+    'appropriate': (0.5, 0.5, 1.0, 0),
+    'appropriately': (0.5, 0.5, 1.0, 1),
+    'approximate': (-0.4, 0.6, 1.0, 0),
+    'approximately': (-0.4, 0.6, 1.0, 1),
+    'apt': (0.6, 1.0, 1.0, 0),
+    'aptly': (0.6, 1.0, 1.0, 1),
+    'arbitrarily': (-0.1, 0.6, 1.0, 1),
+    'arbitrary': (-0.1, 0.6, 1.0, 0),
+    'archaeological': (0.0, 0.0, 1.0, 0),
+    'archaeologically': (0.0, 0.0, 1.0, 1),
+    'arduous': (-0.35, 0.85, 1.0, 0),
+    'arduously': (-0.35, 0.85, 1.0, 1),
+    'aroused': (0.1, 0.6, 1.0, 0),
+    'arousedly': (0.1, 0.6, 1.0, 1),
+    'arrest': (-0.05, 0.0, 1.0, 0),
+    'artesian': (0.9, 0.9, 1.0, 0),
+    'artesianly': (0.9, 0.9, 1.0, 1),
+    'artificial': (-0.6, 1.0, 1.0, 0),
+    'artificially': (-0.6, 1.0, 1.0, 1),
+    'artistic': (0.3333, 1.0, 1.0, 0),
+    'artisticly': (0.3333, 1.0, 1.0, 1),
+    'ascetic': (-0.5, 0.9, 1.0, 0),
+    'asceticly': (-0.5, 0.9, 1.0, 1),
+    'ashen': (-0.5, 0.6, 1.0, 0),
+    'ashenly': (-0.5, 0.6, 1.0, 1),
+    'asian': (0.0, 0.0, 1.0, 0),
+    'asianly': (0.0, 0.0, 1.0, 1),
+    'askew': (-0.1, 0.4, 1.0, 0),
+    'askewly': (-0.1, 0.4, 1.0, 1),
+    'assumptive': (-0.5, 1.0, 1.0, 0),
+    'assumptively': (-0.5, 1.0, 1.0, 1),
+    'astonishing': (0.5, 1.0, 1.0, 0),
+    'astonishingly': (0.5, 1.0, 1.0, 1),
+    'astounding': (0.6, 1.0, 1.0, 0),
+    'astoundingly': (0.6, 1.0, 1.0, 1),
+    'astute': (0.55, 0.9, 1.0, 0),
+    'astutely': (0.55, 0.9, 1.0, 1),
+    'atmospheric': (0.0, 0.0, 1.0, 0),
+    'atmosphericly': (0.0, 0.0, 1.0, 1),
+    'atrocious': (-0.7, 1.0, 1.0, 0),
+    'atrociously': (-0.7, 1.0, 1.0, 1),
+    'attendant': (0.2, 0.4, 1.0, 0),
+    'attendantly': (0.2, 0.4, 1.0, 1),
+    'attention-getting': (0.4, 0.8, 1.0, 0),
+    'attention-gettingly': (0.4, 0.8, 1.0, 1),
+    'attentive': (0.4, 0.9, 1.0, 0),
+    'attentively': (0.4, 0.9, 1.0, 1),
+    'attractive': (0.8, 1.0, 1.0, 0),
+    'attractively': (0.8, 1.0, 1.0, 1),
+    'atypical': (0.0, 0.2, 1.0, 0),
+    'atypically': (0.0, 0.2, 1.0, 1),
+    'aureate': (0.2, 0.2, 1.0, 0),
+    'aureately': (0.2, 0.2, 1.0, 1),
+    'australian': (0.0, 0.0, 1.0, 0),
+    'australianly': (0.0, 0.0, 1.0, 1),
+    'authentic': (0.5, 0.75, 1.0, 0),
+    'authenticly': (0.5, 0.75, 1.0, 1),
+    'authoritative': (0.3, 0.9, 1.0, 0),
+    'authoritatively': (0.3, 0.9, 1.0, 1),
+    'autistic': (-0.2, 0.2, 1.0, 0),
+    'autisticly': (-0.2, 0.2, 1.0, 1),
+    'autobiographical': (0.0, 0.0, 1.0, 0),
+    'autobiographically': (0.0, 0.0, 1.0, 1),
+    'autonomous': (0.4, 0.7, 1.0, 0),
+    'autonomously': (0.4, 0.7, 1.0, 1),
+    'available': (0.4, 0.4, 1.0, 0),
+    'availably': (0.4, 0.4, 1.0, 1),
+    'average': (-0.15, 0.4, 1.0, 0),
+    'averagely': (-0.15, 0.4, 1.0, 1),
+    'avid': (0.25, 1.0, 1.0, 0),
+    'avidly': (0.25, 1.0, 1.0, 1),
+    'aware': (0.25, 0.25, 1.0, 0),
+    'awarely': (0.25, 0.25, 1.0, 1),
+    'awearily': (-0.5, 0.6, 1.0, 1),
+    'aweary': (-0.5, 0.6, 1.0, 0),
+    'awesome': (1.0, 1.0, 1.0, 0),
+    'awesomely': (1.0, 1.0, 1.0, 1),
+    'awful': (-1.0, 1.0, 1.0, 0),
+    'awfully': (-1.0, 1.0, 1.0, 1),
+    'awkward': (-0.6, 1.0, 1.0, 0),
+    'awkwardly': (-0.6, 1.0, 1.0, 1),
+    'aww': (0.3, 0.9, 1.0, 0),
+    'awww': (0.4, 0.9, 1.0, 0),
+    'awwww': (0.5, 0.9, 1.0, 0),
+    'axiomatic': (0.0, 0.3, 1.0, 0),
+    'axiomaticly': (0.0, 0.3, 1.0, 1),
+    'back': (0.0, 0.0, 1.0, 0),
+    'backly': (0.0, 0.0, 1.0, 1),
+    'bad': (-0.7, 0.6667, 1.0, 0),
+    'badly': (-0.7, 0.6667, 1.0, 1),
+    'badness': (-0.3, 0.2, 1.0, 0),
+    'balmily': (0.1, 0.85, 1.0, 1),
+    'balmy': (0.1, 0.85, 1.0, 0),
+    'banal': (-0.3, 0.5, 1.0, 0),
+    'banally': (-0.3, 0.5, 1.0, 1),
+    'banded': (0.0, 0.1, 1.0, 0),
+    'bandedly': (0.0, 0.1, 1.0, 1),
+    'bang-up': (0.4, 0.7, 1.0, 0),
+    'bang-uply': (0.4, 0.7, 1.0, 1),
+    'barbarian': (-0.7, 0.95, 1.0, 0),
+    'barbarianly': (-0.7, 0.95, 1.0, 1),
+    'barbarous': (0.0, 0.9, 1.0, 0),
+    'barbarously': (0.0, 0.9, 1.0, 1),
+    'bare': (0.05, 0.1, 1.0, 0),
+    'barely': (0.05, 0.1, 1.0, 1),
+    'base': (-0.8, 1.0, 1.0, 0),
+    'basely': (-0.8, 1.0, 1.0, 1),
+    'basic': (0.0, 0.125, 1.0, 0),
+    'basicly': (0.0, 0.125, 1.0, 1),
+    'bass': (-0.15, 0.5, 1.0, 0),
+    'bassly': (-0.15, 0.5, 1.0, 1),
+    'battleful': (-0.6, 0.9, 1.0, 0),
+    'battlefully': (-0.6, 0.9, 1.0, 1),
+    'beautiful': (0.85, 1.0, 1.0, 0),
+    'beautifully': (0.85, 1.0, 1.0, 1),
+    'becoming': (0.45, 0.85, 1.0, 0),
+    'becomingly': (0.45, 0.85, 1.0, 1),
+    'beefily': (0.2, 0.9, 1.0, 1),
+    'beefy': (0.2, 0.9, 1.0, 0),
+    'behind': (-0.4, 0.7, 1.0, 0),
+    'behindly': (-0.4, 0.7, 1.0, 1),
+    'believable': (0.5, 0.5, 1.0, 0),
+    'believably': (0.5, 0.5, 1.0, 1),
+    'beloved': (0.7, 1.0, 1.0, 0),
+    'belovedly': (0.7, 1.0, 1.0, 1),
+    'best': (1.0, 0.3, 1.0, 0),
+    'bestly': (1.0, 0.3, 1.0, 1),
+    'better': (0.5, 0.5, 1.0, 0),
+    'betterly': (0.5, 0.5, 1.0, 1),
+    'bewitching': (0.7, 1.0, 1.0, 0),
+    'bewitchingly': (0.7, 1.0, 1.0, 1),
+    'big': (0.0, 0.1, 1.0, 0),
+    'bigger': (0.0, 0.5, 1.0, 0),
+    'biggerly': (0.0, 0.5, 1.0, 1),
+    'bigly': (0.0, 0.1, 1.0, 1),
+    'biographic': (0.0, 0.0, 1.0, 0),
+    'biographicly': (0.0, 0.0, 1.0, 1),
+    'bitter': (-0.1, 0.5, 1.0, 0),
+    'bitterly': (-0.1, 0.5, 1.0, 1),
+    'bizarre': (0.4, 0.6, 1.0, 0),
+    'bizarrely': (0.4, 0.6, 1.0, 1),
+    'black': (-0.1667, 0.4333, 1.0, 0),
+    'blackly': (-0.1667, 0.4333, 1.0, 1),
+    'bland': (-0.1667, 0.8333, 1.0, 0),
+    'blandly': (-0.1667, 0.8333, 1.0, 1),
+    'blank': (0.0, 0.0, 1.0, 0),
+    'blankly': (0.0, 0.0, 1.0, 1),
+    'blasted': (-0.6, 0.9, 1.0, 0),
+    'blastedly': (-0.6, 0.9, 1.0, 1),
+    'blatant': (-0.5, 0.5, 1.0, 0),
+    'blatantly': (-0.5, 0.5, 1.0, 1),
+    'bleak': (-1.0, 1.0, 1.0, 0),
+    'bleakly': (-1.0, 1.0, 1.0, 1),
+    'blech': (-0.8, 1.0, 1.0, 0),
+    'blind': (-0.5, 0.6667, 1.0, 0),
+    'blindly': (-0.5, 0.6667, 1.0, 1),
+    'blonde': (0.0, 0.0, 1.0, 0),
+    'blondely': (0.0, 0.0, 1.0, 1),
+    'bloodily': (-0.8, 0.9, 1.0, 1),
+    'bloodstained': (-0.6, 0.8, 1.0, 0),
+    'bloodstainedly': (-0.6, 0.8, 1.0, 1),
+    'bloodthirstily': (-0.5, 0.9, 1.0, 1),
+    'bloodthirsty': (-0.5, 0.9, 1.0, 0),
+    'bloody': (-0.8, 0.9, 1.0, 0),
+    'blue': (0.0, 0.1, 1.0, 0),
+    'bluely': (0.0, 0.1, 1.0, 1),
+    'bodilily': (0.0, 0.1, 1.0, 1),
+    'bodily': (0.0, 0.1, 1.0, 0),
+    'bogged': (-0.2, 0.1, 1.0, 0),
+    'boilerplate': (-0.1, 0.0, 1.0, 0),
+    'bold': (0.3333, 0.6667, 1.0, 0),
+    'boldly': (0.3333, 0.6667, 1.0, 1),
+    'bonnily': (0.3, 0.9, 1.0, 1),
+    'bonny': (0.3, 0.9, 1.0, 0),
+    'bootleg': (-0.4, 0.9, 1.0, 0),
+    'bootlegly': (-0.4, 0.9, 1.0, 1),
+    'bored': (-0.5, 1.0, 1.0, 0),
+    'boredly': (-0.5, 1.0, 1.0, 1),
+    'boring': (-1.0, 1.0, 1.0, 0),
+    'boringly': (-1.0, 1.0, 1.0, 1),
+    'boundless': (-0.2, 0.7, 1.0, 0),
+    'boundlessly': (-0.2, 0.7, 1.0, 1),
+    'brainsick': (-0.5, 0.9, 1.0, 0),
+    'brainsickly': (-0.5, 0.9, 1.0, 1),
+    'brash': (-0.2, 0.9, 1.0, 0),
+    'brashly': (-0.2, 0.9, 1.0, 1),
+    'bravado': (-0.2, 0.4, 1.0, 0),
+    'brave': (0.8, 1.0, 1.0, 0),
+    'bravely': (0.8, 1.0, 1.0, 1),
+    'breathtaking': (1.0, 1.0, 1.0, 0),
+    'breathtakingly': (1.0, 1.0, 1.0, 1),
+    'brief': (0.0, 0.3333, 1.0, 0),
+    'briefly': (0.0, 0.3333, 1.0, 1),
+    'bright': (0.7, 0.8, 1.0, 0),
+    'brightly': (0.7, 0.8, 1.0, 1),
+    'brilliant': (0.9, 1.0, 1.0, 0),
+    'brilliantly': (0.9, 1.0, 1.0, 1),
+    'british': (0.0, 0.0, 1.0, 0),
+    'britishly': (0.0, 0.0, 1.0, 1),
+    'broad': (0.0625, 0.3125, 1.0, 0),
+    'broad-minded': (0.0, 0.6, 1.0, 0),
+    'broad-mindedly': (0.0, 0.6, 1.0, 1),
+    'broadly': (0.0625, 0.3125, 1.0, 1),
+    'broken': (-0.4, 0.4, 1.0, 0),
+    'brokenly': (-0.4, 0.4, 1.0, 1),
+    'brushed': (0.0, 0.1, 1.0, 0),
+    'brushedly': (0.0, 0.1, 1.0, 1),
+    'brutal': (-0.875, 1.0, 1.0, 0),
+    'brutally': (-0.875, 1.0, 1.0, 1),
+    'budding': (0.1, 0.2, 1.0, 0),
+    'buddingly': (0.1, 0.2, 1.0, 1),
+    'burnout': (-0.6, 0.8, 1.0, 0),
+    'busily': (0.1, 0.3, 1.0, 1),
+    'busy': (0.1, 0.3, 1.0, 0),
+    'cacophonous': (-0.4, 0.8, 1.0, 0),
+    'cacophonously': (-0.4, 0.8, 1.0, 1),
+    'calculable': (-0.5, 0.8, 1.0, 0),
+    'calculably': (-0.5, 0.8, 1.0, 1),
+    'calm': (0.3, 0.75, 1.0, 0),
+    'calmly': (0.3, 0.75, 1.0, 1),
+    "can't": (-0.1, 0.1, 1.0, 0),
+    'candid': (0.6, 0.8, 1.0, 0),
+    'candidly': (0.6, 0.8, 1.0, 1),
+    'capable': (0.2, 0.4, 1.0, 0),
+    'capably': (0.2, 0.4, 1.0, 1),
+    'captivating': (0.5, 1.0, 1.0, 0),
+    'captivatingly': (0.5, 1.0, 1.0, 1),
+    'captive': (0.2, 0.6, 1.0, 0),
+    'captively': (0.2, 0.6, 1.0, 1),
+    'cardiac': (-0.05, 0.0, 1.0, 0),
+    'cardiacly': (-0.05, 0.0, 1.0, 1),
+    'careful': (-0.1, 1.0, 1.0, 0),
+    'carefully': (-0.1, 1.0, 1.0, 1),
+    'careless': (-0.5, 0.9, 1.0, 0),
+    'carelessly': (-0.5, 0.9, 1.0, 1),
+    'cast-iron': (0.9, 0.9, 1.0, 0),
+    'cast-ironly': (0.9, 0.9, 1.0, 1),
+    'casual': (-0.5, 0.8667, 1.0, 0),
+    'casually': (-0.5, 0.8667, 1.0, 1),
+    'catching': (0.6, 0.9, 1.0, 0),
+    'catchingly': (0.6, 0.9, 1.0, 1),
+    'catholic': (0.0, 0.1, 1.0, 0),
+    'catholicly': (0.0, 0.1, 1.0, 1),
+    'caustic': (-0.4, 0.6, 1.0, 0),
+    'causticly': (-0.4, 0.6, 1.0, 1),
+    'ceaseless': (-0.1, 0.4, 1.0, 0),
+    'ceaselessly': (-0.1, 0.4, 1.0, 1),
+    'celebrated': (0.35, 0.75, 1.0, 0),
+    'celebratedly': (0.35, 0.75, 1.0, 1),
+    'center': (-0.1, 0.1, 1.0, 0),
+    'centerly': (-0.1, 0.1, 1.0, 1),
+    'central': (0.0, 0.25, 1.0, 0),
+    'centrally': (0.0, 0.25, 1.0, 1),
+    'centric': (0.0, 0.1, 1.0, 0),
+    'centricly': (0.0, 0.1, 1.0, 1),
+    'ceremonial': (0.05, 0.35, 1.0, 0),
+    'ceremonially': (0.05, 0.35, 1.0, 1),
+    'certain': (0.2143, 0.5714, 1.0, 0),
+    'certainly': (0.2143, 0.5714, 1.0, 1),
+    'challenging': (0.5, 1.0, 1.0, 0),
+    'challengingly': (0.5, 1.0, 1.0, 1),
+    'changeless': (-0.05, 0.15, 1.0, 0),
+    'changelessly': (-0.05, 0.15, 1.0, 1),
+    'characteristic': (-0.0667, 0.4667, 1.0, 0),
+    'characteristicly': (-0.0667, 0.4667, 1.0, 1),
+    'charismatic': (0.5, 1.0, 1.0, 0),
+    'charismaticly': (0.5, 1.0, 1.0, 1),
+    'charitable': (0.6, 0.8, 1.0, 0),
+    'charitably': (0.6, 0.8, 1.0, 1),
+    'charming': (0.7, 1.0, 1.0, 0),
+    'charmingly': (0.7, 1.0, 1.0, 1),
+    'cheap': (0.4, 0.7, 1.0, 0),
+    'cheaply': (0.4, 0.7, 1.0, 1),
+    'cheerful': (0.4, 1.0, 1.0, 0),
+    'cheerfully': (0.4, 1.0, 1.0, 1),
+    'cheerily': (0.7, 1.0, 1.0, 1),
+    'cheery': (0.7, 1.0, 1.0, 0),
+    'cheesiest': (-0.4, 0.5, 1.0, 0),
+    'cheesily': (-0.5, 1.0, 1.0, 1),
+    'cheesy': (-0.5, 1.0, 1.0, 0),
+    'chicken': (-0.6, 0.95, 1.0, 0),
+    'chickenly': (-0.6, 0.95, 1.0, 1),
+    'childish': (-0.2, 0.8, 1.0, 0),
+    'childishly': (-0.2, 0.8, 1.0, 1),
+    'chillily': (-0.6, 0.9, 1.0, 1),
+    'chilling': (-0.5, 0.9, 1.0, 0),
+    'chillingly': (-0.5, 0.9, 1.0, 1),
+    'chilly': (-0.6, 0.9, 1.0, 0),
+    'chinese': (0.0, 0.0, 1.0, 0),
+    'chinesely': (0.0, 0.0, 1.0, 1),
+    'chitchat': (-0.2, 0.3, 1.0, 0),
+    'choppily': (-0.2, 0.2, 1.0, 1),
+    'choppy': (-0.2, 0.2, 1.0, 0),
+    'christian': (0.0, 0.0, 1.0, 0),
+    'christianly': (0.0, 0.0, 1.0, 1),
+    'chronological': (0.0, 0.0, 1.0, 0),
+    'chronologically': (0.0, 0.0, 1.0, 1),
+    'churning': (-0.5, 0.9, 1.0, 0),
+    'churningly': (-0.5, 0.9, 1.0, 1),
+    'cinematic': (0.0, 0.2, 1.0, 0),
+    'cinematicly': (0.0, 0.2, 1.0, 1),
+    'civilized': (0.4, 0.9, 1.0, 0),
+    'civilizedly': (0.4, 0.9, 1.0, 1),
+    'classic': (0.1667, 0.1667, 1.0, 0),
+    'classical': (0.0, 0.0, 1.0, 0),
+    'classically': (0.0, 0.0, 1.0, 1),
+    'classicly': (0.1667, 0.1667, 1.0, 1),
+    'classily': (0.1, 0.9, 1.0, 1),
+    'classy': (0.1, 0.9, 1.0, 0),
+    'claustrophobic': (-0.75, 0.75, 1.0, 0),
+    'claustrophobicly': (-0.75, 0.75, 1.0, 1),
+    'clean': (0.3667, 0.7, 1.0, 0),
+    'cleanlily': (0.3, 0.7, 1.0, 1),
+    'cleanly': (0.3667, 0.7, 1.0, 1),
+    'clear': (0.1, 0.3833, 1.0, 0),
+    'clearly': (0.1, 0.3833, 1.0, 1),
+    'clever': (0.1667, 0.8333, 1.0, 0),
+    'cleverly': (0.1667, 0.8333, 1.0, 1),
+    'closed': (-0.1, 0.1, 1.0, 0),
+    'closedly': (-0.1, 0.1, 1.0, 1),
+    'cloud-covered': (-0.2, 0.6, 1.0, 0),
+    'cloud-coveredly': (-0.2, 0.6, 1.0, 1),
+    'cloudless': (0.1, 0.1, 1.0, 0),
+    'cloudlessly': (0.1, 0.1, 1.0, 1),
+    'cluelessness': (-0.1, 0.2, 1.0, 0),
+    'clumsily': (-0.3, 0.4, 1.0, 1),
+    'clumsy': (-0.3, 0.4, 1.0, 0),
+    'coarse': (0.0, 0.5, 1.0, 0),
+    'coarsely': (0.0, 0.5, 1.0, 1),
+    'cockily': (-0.2, 0.9, 1.0, 1),
+    'cocky': (-0.2, 0.9, 1.0, 0),
+    'coherent': (0.5, 0.7, 1.0, 0),
+    'coherently': (0.5, 0.7, 1.0, 1),
+    'cold': (-0.6, 1.0, 1.0, 0),
+    'coldly': (-0.6, 1.0, 1.0, 1),
+    'collectible': (-0.5, 0.8, 1.0, 0),
+    'collectibly': (-0.5, 0.8, 1.0, 1),
+    'colorful': (0.3, 0.4, 1.0, 0),
+    'colorfully': (0.3, 0.4, 1.0, 1),
+    'colossal': (0.3, 0.8, 1.0, 0),
+    'colossally': (0.3, 0.8, 1.0, 1),
+    'coma': (-0.1, 0.0, 1.0, 0),
+    'come-at-able': (0.3, 0.5, 1.0, 0),
+    'come-at-ably': (0.3, 0.5, 1.0, 1),
+    'comfortable': (0.4, 0.8, 1.0, 0),
+    'comfortably': (0.4, 0.8, 1.0, 1),
+    'comic': (0.25, 0.5, 1.0, 0),
+    'comical': (0.5, 1.0, 1.0, 0),
+    'comically': (0.5, 1.0, 1.0, 1),
+    'comicly': (0.25, 0.5, 1.0, 1),
+    'commercial': (0.0, 0.0, 1.0, 0),
+    'commercialism': (-0.1, 0.0, 1.0, 0),
+    'commercially': (0.0, 0.0, 1.0, 1),
+    'common': (-0.3, 0.5, 1.0, 0),
+    'commonly': (-0.3, 0.5, 1.0, 1),
+    'compelling': (0.3, 0.6, 1.0, 0),
+    'compellingly': (0.3, 0.6, 1.0, 1),
+    'competent': (0.5, 0.6667, 1.0, 0),
+    'competently': (0.5, 0.6667, 1.0, 1),
+    'complained': (-0.3, 0.2, 1.0, 0),
+    'complaint': (-0.3, 0.2, 1.0, 0),
+    'complete': (0.1, 0.4, 1.0, 0),
+    'completely': (0.1, 0.4, 1.0, 1),
+    'complex': (-0.3, 0.4, 1.0, 0),
+    'complexly': (-0.3, 0.4, 1.0, 1),
+    'complicated': (-0.5, 1.0, 1.0, 0),
+    'complicatedly': (-0.5, 1.0, 1.0, 1),
+    'complimentarily': (0.3, 0.5, 1.0, 1),
+    'complimentary': (0.3, 0.5, 1.0, 0),
+    'comprehensible': (0.4, 0.7, 1.0, 0),
+    'comprehensibly': (0.4, 0.7, 1.0, 1),
+    'concavo-convex': (0.0, 0.0, 1.0, 0),
+    'concavo-convexly': (0.0, 0.0, 1.0, 1),
+    'conceivable': (0.1, 0.3, 1.0, 0),
+    'conceivably': (0.1, 0.3, 1.0, 1),
+    'conceptional': (0.0, 0.5, 1.0, 0),
+    'conceptionally': (0.0, 0.5, 1.0, 1),
+    'concise': (0.1, 0.6, 1.0, 0),
+    'concisely': (0.1, 0.6, 1.0, 1),
+    'concrete': (0.15, 0.3, 1.0, 0),
+    'concretely': (0.15, 0.3, 1.0, 1),
+    'confident': (0.5, 0.8333, 1.0, 0),
+    'confidently': (0.5, 0.8333, 1.0, 1),
+    'confirmed': (0.4, 1.0, 1.0, 0),
+    'confirmedly': (0.4, 1.0, 1.0, 1),
+    'confused': (-0.4, 0.7, 1.0, 0),
+    'confusedly': (-0.4, 0.7, 1.0, 1),
+    'confusing': (-0.3, 0.4, 1.0, 0),
+    'confusingly': (-0.3, 0.4, 1.0, 1),
+    'conscious': (0.1, 0.5, 1.0, 0),
+    'consciously': (0.1, 0.5, 1.0, 1),
+    'consecrated': (0.2, 0.6, 1.0, 0),
+    'consecratedly': (0.2, 0.6, 1.0, 1),
+    'considerable': (0.1, 0.45, 1.0, 0),
+    'considerably': (0.1, 0.45, 1.0, 1),
+    'consistent': (0.25, 0.25, 1.0, 0),
+    'consistently': (0.25, 0.25, 1.0, 1),
+    'constant': (0.0, 0.3333, 1.0, 0),
+    'constantly': (0.0, 0.3333, 1.0, 1),
+    'consummate': (0.95, 1.0, 1.0, 0),
+    'consummately': (0.95, 1.0, 1.0, 1),
+    'contemporarily': (0.1667, 0.1667, 1.0, 1),
+    'contemporary': (0.1667, 0.1667, 1.0, 0),
+    'content': (0.4, 0.7, 1.0, 0),
+    'contestable': (-0.4, 0.9, 1.0, 0),
+    'contestably': (-0.4, 0.9, 1.0, 1),
+    'contingent': (-0.1, 0.6, 1.0, 0),
+    'contingently': (-0.1, 0.6, 1.0, 1),
+    'contrived': (-0.5, 0.75, 1.0, 0),
+    'contrivedly': (-0.5, 0.75, 1.0, 1),
+    'controversial': (0.55, 0.95, 1.0, 0),
+    'controversially': (0.55, 0.95, 1.0, 1),
+    'conventional': (-0.1429, 0.3571, 1.0, 0),
+    'conventionally': (-0.1429, 0.3571, 1.0, 1),
+    'convex': (0.2, 0.6, 1.0, 0),
+    'convexly': (0.2, 0.6, 1.0, 1),
+    'convincing': (0.5, 1.0, 1.0, 0),
+    'convincingly': (0.5, 1.0, 1.0, 1),
+    'cool': (0.35, 0.65, 1.0, 0),
+    'coolly': (0.35, 0.65, 1.0, 1),
+    'coriaceous': (-0.3, 1.0, 1.0, 0),
+    'coriaceously': (-0.3, 1.0, 1.0, 1),
+    'corporate': (0.0, 0.0, 1.0, 0),
+    'corporately': (0.0, 0.0, 1.0, 1),
+    'corpulent': (-0.5, 0.9, 1.0, 0),
+    'corpulently': (-0.5, 0.9, 1.0, 1),
+    'corrupt': (-0.5, 1.0, 1.0, 0),
+    'corruptible': (-0.6, 0.9, 1.0, 0),
+    'corruptibly': (-0.6, 0.9, 1.0, 1),
+    'corruptly': (-0.5, 1.0, 1.0, 1),
+    'cosmopolitan': (0.0, 0.1, 1.0, 0),
+    'cosmopolitanly': (0.0, 0.1, 1.0, 1),
+    'countless': (0.0, 0.5, 1.0, 0),
+    'countlessly': (0.0, 0.5, 1.0, 1),
+    'courteous': (0.6, 1.0, 1.0, 0),
+    'courteously': (0.6, 1.0, 1.0, 1),
+    'cow': (-0.1333, 0.1667, 1.0, 0),
+    'cozily': (-0.2, 0.75, 1.0, 1),
+    'cozy': (-0.2, 0.75, 1.0, 0),
+    'craftily': (0.4, 0.9, 1.0, 1),
+    'crafty': (0.4, 0.9, 1.0, 0),
+    'crap': (-0.8, 0.8, 1.0, 0),
+    'crazily': (-0.6, 0.9, 1.0, 1),
+    'crazy': (-0.6, 0.9, 1.0, 0),
+    'creative': (0.5, 1.0, 1.0, 0),
+    'creatively': (0.5, 1.0, 1.0, 1),
+    'credible': (0.4, 0.7, 1.0, 0),
+    'credibly': (0.4, 0.7, 1.0, 1),
+    'creepily': (-0.5, 1.0, 1.0, 1),
+    'creepy': (-0.5, 1.0, 1.0, 0),
+    'criminal': (-0.4, 0.55, 1.0, 0),
+    'criminally': (-0.4, 0.55, 1.0, 1),
+    'crisp': (0.25, 0.4167, 1.0, 0),
+    'crisply': (0.25, 0.4167, 1.0, 1),
+    'critical': (0.0, 0.8, 1.0, 0),
+    'critically': (0.0, 0.8, 1.0, 1),
+    'crooked': (0.0, 0.1, 1.0, 0),
+    'crookedly': (0.0, 0.1, 1.0, 1),
+    'cross': (0.0, 0.0, 1.0, 0),
+    'crossly': (0.0, 0.0, 1.0, 1),
+    'crucial': (0.0, 1.0, 1.0, 0),
+    'crucially': (0.0, 1.0, 1.0, 1),
+    'cruddily': (-0.9, 0.9, 1.0, 1),
+    'cruddy': (-0.9, 0.9, 1.0, 0),
+    'crude': (-0.7, 1.0, 1.0, 0),
+    'crudely': (-0.7, 1.0, 1.0, 1),
+    'cruel': (-1.0, 1.0, 1.0, 0),
+    'cruelly': (-1.0, 1.0, 1.0, 1),
+    'crushed': (-0.1, 0.1, 1.0, 0),
+    'crushedly': (-0.1, 0.1, 1.0, 1),
+    'crushing': (0.4, 0.9, 1.0, 0),
+    'crushingly': (0.4, 0.9, 1.0, 1),
+    'crying': (-0.2, 0.6, 1.0, 0),
+    'cryingly': (-0.2, 0.6, 1.0, 1),
+    'culinarily': (0.0, 0.0, 1.0, 1),
+    'culinary': (0.0, 0.0, 1.0, 0),
+    'cultural': (0.1, 0.1, 1.0, 0),
+    'culturally': (0.1, 0.1, 1.0, 1),
+    'cunning': (0.0, 0.7, 1.0, 0),
+    'cunningly': (0.0, 0.7, 1.0, 1),
+    'curious': (-0.1, 1.0, 1.0, 0),
+    'curiously': (-0.1, 1.0, 1.0, 1),
+    'current': (0.0, 0.4, 1.0, 0),
+    'currently': (0.0, 0.4, 1.0, 1),
+    'cursive': (0.0, 0.0, 1.0, 0),
+    'cursively': (0.0, 0.0, 1.0, 1),
+    'cushily': (0.9, 1.0, 1.0, 1),
+    'cushy': (0.9, 1.0, 1.0, 0),
+    'cute': (0.5, 1.0, 1.0, 0),
+    'cutely': (0.5, 1.0, 1.0, 1),
+    'cutting': (-0.6, 0.9, 1.0, 0),
+    'cuttingly': (-0.6, 0.9, 1.0, 1),
+    'cynical': (-0.6, 1.0, 1.0, 0),
+    'cynically': (-0.6, 1.0, 1.0, 1),
+    'dailily': (0.0, 0.0, 1.0, 1),
+    'daily': (0.0, 0.0, 1.0, 0),
+    'daintily': (0.9, 1.0, 1.0, 1),
+    'dainty': (0.9, 1.0, 1.0, 0),
+    'dangerous': (-0.6, 0.9, 1.0, 0),
+    'dangerously': (-0.6, 0.9, 1.0, 1),
+    'dark': (-0.15, 0.4, 1.0, 0),
+    'darkly': (-0.15, 0.4, 1.0, 1),
+    'dazed': (-0.5, 0.8, 1.0, 0),
+    'dazedly': (-0.5, 0.8, 1.0, 1),
+    'dazzling': (0.75, 1.0, 1.0, 0),
+    'dazzlingly': (0.75, 1.0, 1.0, 1),
+    'dead': (-0.2, 0.4, 1.0, 0),
+    'deadlily': (-0.8333, 1.0, 1.0, 1),
+    'deadly': (-0.2, 0.4, 1.0, 1),
+    'deadpan': (-0.55, 0.85, 1.0, 0),
+    'deadpanly': (-0.55, 0.85, 1.0, 1),
+    'debauched': (-0.8, 0.9, 1.0, 0),
+    'debauchedly': (-0.8, 0.9, 1.0, 1),
+    'decent': (0.1667, 0.6667, 1.0, 0),
+    'decently': (0.1667, 0.6667, 1.0, 1),
+    'decreased': (-0.4, 0.7, 1.0, 0),
+    'decreasedly': (-0.4, 0.7, 1.0, 1),
+    'deep': (0.0, 0.4, 1.0, 0),
+    'deeply': (0.0, 0.4, 1.0, 1),
+    'defecates': (-0.1, 0.0, 1.0, 0),
+    'defenseless': (-0.4, 0.8, 1.0, 0),
+    'defenselessly': (-0.4, 0.8, 1.0, 1),
+    'deficient': (-0.4, 0.7, 1.0, 0),
+    'deficiently': (-0.4, 0.7, 1.0, 1),
+    'definite': (0.0, 0.5, 1.0, 0),
+    'definitely': (0.0, 0.5, 1.0, 1),
+    'deft': (0.6, 0.9, 1.0, 0),
+    'deftly': (0.6, 0.9, 1.0, 1),
+    'delicate': (-0.3, 0.9, 1.0, 0),
+    'delicately': (-0.3, 0.9, 1.0, 1),
+    'delicious': (1.0, 1.0, 1.0, 0),
+    'deliciously': (1.0, 1.0, 1.0, 1),
+    'delighted': (0.7, 0.7, 1.0, 0),
+    'delightedly': (0.7, 0.7, 1.0, 1),
+    'delightful': (1.0, 1.0, 1.0, 0),
+    'delightfully': (1.0, 1.0, 1.0, 1),
+    'deluxe': (0.6, 0.9, 1.0, 0),
+    'deluxely': (0.6, 0.9, 1.0, 1),
+    'denominational': (0.0, 0.0, 1.0, 0),
+    'denominationally': (0.0, 0.0, 1.0, 1),
+    'deplorable': (-0.6, 0.9, 1.0, 0),
+    'deplorably': (-0.6, 0.9, 1.0, 1),
+    'depress': (-0.0667, 0.0333, 1.0, 0),
+    'depressed': (-0.7, 0.9, 1.0, 0),
+    'depressing': (-0.6, 0.9, 1.0, 0),
+    'depressingly': (-0.6, 0.9, 1.0, 1),
+    'deserving': (0.6, 0.8, 1.0, 0),
+    'deservingly': (0.6, 0.8, 1.0, 1),
+    'desperate': (-0.6, 1.0, 1.0, 0),
+    'desperately': (-0.6, 1.0, 1.0, 1),
+    'destroy': (-0.2, 0.0, 1.0, 0),
+    'destroying': (-0.2, 0.0, 1.0, 0),
+    'destructive': (-0.6, 0.6, 1.0, 0),
+    'destructively': (-0.6, 0.6, 1.0, 1),
+    'detailed': (0.4, 0.75, 1.0, 0),
+    'detailedly': (0.4, 0.75, 1.0, 1),
+    'devastating': (-1.0, 1.0, 1.0, 0),
+    'devastatingly': (-1.0, 1.0, 1.0, 1),
+    'developed': (0.1, 0.3, 1.0, 0),
+    'developedly': (0.1, 0.3, 1.0, 1),
+    'devoid': (-0.1, 0.2, 1.0, 0),
+    'dextral': (0.0, 0.1, 1.0, 0),
+    'dextrally': (0.0, 0.1, 1.0, 1),
+    'dialectal': (-0.2, 0.7, 1.0, 0),
+    'dialectally': (-0.2, 0.7, 1.0, 1),
+    'diaphanous': (-0.2, 0.6, 1.0, 0),
+    'diaphanously': (-0.2, 0.6, 1.0, 1),
+    'didactic': (-0.5, 0.8, 1.0, 0),
+    'didacticly': (-0.5, 0.8, 1.0, 1),
+    'different': (0.0, 0.6, 1.0, 0),
+    'differently': (0.0, 0.6, 1.0, 1),
+    'difficult': (-0.5, 1.0, 1.0, 0),
+    'difficultly': (-0.5, 1.0, 1.0, 1),
+    'diffident': (-0.2, 0.8, 1.0, 0),
+    'diffidently': (-0.2, 0.8, 1.0, 1),
+    'digital': (0.0, 0.0, 1.0, 0),
+    'digitally': (0.0, 0.0, 1.0, 1),
+    'dim': (0.1, 0.5, 1.0, 0),
+    'dim-witted': (-0.6, 1.0, 1.0, 0),
+    'dim-wittedly': (-0.6, 1.0, 1.0, 1),
+    'dimly': (0.1, 0.5, 1.0, 1),
+    'direct': (0.1, 0.4, 1.0, 0),
+    'directly': (0.1, 0.4, 1.0, 1),
+    'dirtily': (-0.6, 0.8, 1.0, 1),
+    'dirty': (-0.6, 0.8, 1.0, 0),
+    'disabled': (-0.2, 0.3, 1.0, 0),
+    'disabledly': (-0.2, 0.3, 1.0, 1),
+    'disappointed': (-0.75, 0.75, 1.0, 0),
+    'disappointedly': (-0.75, 0.75, 1.0, 1),
+    'disappointing': (-0.6, 0.7, 1.0, 0),
+    'disappointingly': (-0.6, 0.7, 1.0, 1),
+    'disappointment': (-0.6, 0.4, 1.0, 0),
+    'disastrous': (-0.7, 0.8, 1.0, 0),
+    'disastrously': (-0.7, 0.8, 1.0, 1),
+    'disbelieving': (-0.1, 0.8, 1.0, 0),
+    'disbelievingly': (-0.1, 0.8, 1.0, 1),
+    'discourteous': (-0.65, 0.95, 1.0, 0),
+    'discourteously': (-0.65, 0.95, 1.0, 1),
+    'diseased': (-0.6, 0.75, 1.0, 0),
+    'diseasedly': (-0.6, 0.75, 1.0, 1),
+    'disgusted': (-1.0, 1.0, 1.0, 0),
+    'disgustedly': (-1.0, 1.0, 1.0, 1),
+    'disgusting': (-1.0, 1.0, 1.0, 0),
+    'disgustingly': (-1.0, 1.0, 1.0, 1),
+    'dishonest': (-0.3, 0.5, 1.0, 0),
+    'dishonestly': (-0.3, 0.5, 1.0, 1),
+    'disliked': (-0.2, 0.6, 1.0, 0),
+    'dislikedly': (-0.2, 0.6, 1.0, 1),
+    'dispossessed': (-0.1, 0.1, 1.0, 0),
+    'dispossessedly': (-0.1, 0.1, 1.0, 1),
+    'distant': (-0.1, 0.35, 1.0, 0),
+    'distantly': (-0.1, 0.35, 1.0, 1),
+    'distasteful': (-0.5, 0.7, 1.0, 0),
+    'distastefully': (-0.5, 0.7, 1.0, 1),
+    'distinct': (0.3, 0.3, 1.0, 0),
+    'distinctly': (0.3, 0.3, 1.0, 1),
+    'distraught': (-0.6, 1.0, 1.0, 0),
+    'distraughtly': (-0.6, 1.0, 1.0, 1),
+    'disturbing': (-0.5, 0.8, 1.0, 0),
+    'disturbingly': (-0.5, 0.8, 1.0, 1),
+    'diurnal': (0.0, 0.0, 1.0, 0),
+    'diurnally': (0.0, 0.0, 1.0, 1),
+    'documentarily': (0.0, 0.0, 1.0, 1),
+    'documentary': (0.0, 0.0, 1.0, 0),
+    'domestic': (0.0, 0.1, 1.0, 0),
+    'domesticly': (0.0, 0.1, 1.0, 1),
+    'done with': (-0.6, 0.9, 1.0, 0),
+    'done withly': (-0.6, 0.9, 1.0, 1),
+    'double': (0.0, 0.0, 1.0, 0),
+    'doubly': (0.0, 0.0, 1.0, 1),
+    'doubtful': (-0.8, 0.9, 1.0, 0),
+    'doubtfully': (-0.8, 0.9, 1.0, 1),
+    'dowdily': (-0.5, 0.8, 1.0, 1),
+    'dowdy': (-0.5, 0.8, 1.0, 0),
+    'down': (-0.1556, 0.2889, 1.0, 0),
+    'downly': (-0.1556, 0.2889, 1.0, 1),
+    'drag': (-0.1, 0.0708, 1.0, 0),
+    'drained': (-0.5, 0.8, 1.0, 0),
+    'dramatic': (-0.4333, 0.6, 1.0, 0),
+    'dramaticly': (-0.4333, 0.6, 1.0, 1),
+    'dreadful': (-1.0, 1.0, 1.0, 0),
+    'dreadfully': (-1.0, 1.0, 1.0, 1),
+    'dried': (-0.2, 0.6, 1.0, 0),
+    'driedly': (-0.2, 0.6, 1.0, 1),
+    'drily': (-0.0667, 0.6, 1.0, 1),
+    'drowned': (-0.1, 0.1, 1.0, 0),
+    'drunk': (-0.5, 1.0, 1.0, 0),
+    'drunkly': (-0.5, 1.0, 1.0, 1),
+    'dry': (-0.0667, 0.6, 1.0, 0),
+    'dudsville': (-0.2, 0.7, 1.0, 0),
+    'due': (-0.125, 0.375, 1.0, 0),
+    'duely': (-0.125, 0.375, 1.0, 1),
+    'duh': (-0.3, 0.6, 1.0, 0),
+    'duhhh': (-0.5, 0.6, 1.0, 0),
+    'duhhhh': (-0.5, 0.6, 1.0, 0),
+    'dull': (-0.2917, 0.5, 1.0, 0),
+    'dullly': (-0.2917, 0.5, 1.0, 1),
+    'dulls': (-0.1, 0.1, 1.0, 0),
+    'dumb': (-0.375, 0.5, 1.0, 0),
+    'dumbly': (-0.375, 0.5, 1.0, 1),
+    'dustily': (-0.4, 0.6, 1.0, 1),
+    'dusty': (-0.4, 0.6, 1.0, 0),
+    'duuuh': (-0.5, 0.6, 1.0, 0),
+    'dynamic': (0.0, 0.1667, 1.0, 0),
+    'dynamicly': (0.0, 0.1667, 1.0, 1),
+    'earlier': (0.0, 0.5, 1.0, 0),
+    'earlierly': (0.0, 0.5, 1.0, 1),
+    'earlily': (0.1, 0.3, 1.0, 1),
+    'early': (0.1, 0.3, 1.0, 0),
+    'easily': (0.4333, 0.8333, 1.0, 1),
+    'easy': (0.4333, 0.8333, 1.0, 0),
+    'eccentric': (0.0, 0.5, 1.0, 0),
+    'eccentricly': (0.0, 0.5, 1.0, 1),
+    'ecological': (0.4, 0.6, 1.0, 0),
+    'ecologically': (0.4, 0.6, 1.0, 1),
+    'economic': (0.2, 0.2, 1.0, 0),
+    'economical': (0.3, 0.9, 1.0, 0),
+    'economically': (0.3, 0.9, 1.0, 1),
+    'economicly': (0.2, 0.2, 1.0, 1),
+    'edgily': (-0.3, 0.75, 1.0, 1),
+    'edgy': (-0.3, 0.75, 1.0, 0),
+    'educational': (0.25, 0.25, 1.0, 0),
+    'educationally': (0.25, 0.25, 1.0, 1),
+    'eerie': (-0.5, 1.0, 1.0, 0),
+    'eeriely': (-0.5, 1.0, 1.0, 1),
+    'effective': (0.6, 0.8, 1.0, 0),
+    'effectively': (0.6, 0.8, 1.0, 1),
+    'effing': (-0.5, 0.7, 1.0, 0),
+    'effingly': (-0.5, 0.7, 1.0, 1),
+    'egoistic': (-0.8, 1.0, 1.0, 0),
+    'egoisticly': (-0.8, 1.0, 1.0, 1),
+    'elaborate': (0.5, 1.0, 1.0, 0),
+    'elaborately': (0.5, 1.0, 1.0, 1),
+    'elect': (0.8, 0.9, 1.0, 0),
+    'electly': (0.8, 0.9, 1.0, 1),
+    'elegant': (0.5, 1.0, 1.0, 0),
+    'elegantly': (0.5, 1.0, 1.0, 1),
+    'elementarily': (0.3, 0.9, 1.0, 1),
+    'elementary': (0.3, 0.9, 1.0, 0),
+    'emotional': (0.0, 0.65, 1.0, 0),
+    'emotionally': (0.0, 0.65, 1.0, 1),
+    'empirical': (0.1, 0.1, 1.0, 0),
+    'empirically': (0.1, 0.1, 1.0, 1),
+    'emptily': (-0.1, 0.5, 1.0, 1),
+    'empty': (-0.1, 0.5, 1.0, 0),
+    'endearing': (0.5, 0.5, 1.0, 0),
+    'endearingly': (0.5, 0.5, 1.0, 1),
+    'endless': (-0.125, 0.75, 1.0, 0),
+    'endlessly': (-0.125, 0.75, 1.0, 1),
+    'energetic': (0.5, 0.5, 1.0, 0),
+    'energeticly': (0.5, 0.5, 1.0, 1),
+    'energized': (0.5, 0.7, 1.0, 0),
+    'engaging': (0.4, 0.7, 1.0, 0),
+    'engagingly': (0.4, 0.7, 1.0, 1),
+    'english': (0.0, 0.0, 1.0, 0),
+    'englishly': (0.0, 0.0, 1.0, 1),
+    'engrossing': (0.6, 0.7, 1.0, 0),
+    'engrossingly': (0.6, 0.7, 1.0, 1),
+    'enigmatic': (0.1, 0.6, 1.0, 0),
+    'enigmaticly': (0.1, 0.6, 1.0, 1),
+    'enjoy': (0.4, 0.5, 1.0, 0),
+    'enjoyable': (0.5, 0.6, 1.0, 0),
+    'enjoyably': (0.5, 0.6, 1.0, 1),
+    'enjoyed': (0.5, 0.7, 1.0, 0),
+    'enjoying': (0.5, 0.6, 1.0, 0),
+    'enlightening': (0.3, 0.4, 1.0, 0),
+    'enlighteningly': (0.3, 0.4, 1.0, 1),
+    'enormous': (0.0, 0.9, 1.0, 0),
+    'enormously': (0.0, 0.9, 1.0, 1),
+    'enough': (0.0, 0.5, 1.0, 0),
+    'enoughly': (0.0, 0.5, 1.0, 1),
+    'entertaining': (0.5, 0.7, 1.0, 0),
+    'entertainingly': (0.5, 0.7, 1.0, 1),
+    'enthusiastic': (0.6, 0.9, 1.0, 0),
+    'enthusiasticly': (0.6, 0.9, 1.0, 1),
+    'entire': (0.0, 0.625, 1.0, 0),
+    'entirely': (0.0, 0.625, 1.0, 1),
+    'epic': (0.1, 0.4, 1.0, 0),
+    'epicly': (0.1, 0.4, 1.0, 1),
+    'equal': (0.0, 0.25, 1.0, 0),
+    'equally': (0.0, 0.25, 1.0, 1),
+    'erotic': (0.7, 0.9, 1.0, 0),
+    'eroticly': (0.7, 0.9, 1.0, 1),
+    'erroneous': (-0.5, 0.6, 1.0, 0),
+    'erroneously': (-0.5, 0.6, 1.0, 1),
+    'erstwhile': (0.0, 0.1, 1.0, 0),
+    'erstwhily': (0.0, 0.1, 1.0, 1),
+    'erudite': (0.1, 0.2, 1.0, 0),
+    'eruditely': (0.1, 0.2, 1.0, 1),
+    'especially': (0.0, 1.0, 2.0, 1),
+    'essential': (0.0, 0.3, 1.0, 0),
+    'essentially': (0.0, 0.3, 1.0, 1),
+    'ethical': (0.2, 0.6, 1.0, 0),
+    'ethically': (0.2, 0.6, 1.0, 1),
+    'european': (0.0, 0.0, 1.0, 0),
+    'europeanly': (0.0, 0.0, 1.0, 1),
+    'everydaily': (-0.2, 0.6, 1.0, 1),
+    'everyday': (-0.2, 0.6, 1.0, 0),
+    'evident': (0.25, 0.25, 1.0, 0),
+    'evidently': (0.25, 0.25, 1.0, 1),
+    'evil': (-1.0, 1.0, 1.0, 0),
+    'evilly': (-1.0, 1.0, 1.0, 1),
+    'exact': (0.25, 0.25, 1.0, 0),
+    'exactly': (0.25, 0.25, 1.0, 1),
+    'exaggerated': (-0.5, 1.0, 1.0, 0),
+    'exaggeratedly': (-0.5, 1.0, 1.0, 1),
+    'excellent': (1.0, 1.0, 1.0, 0),
+    'excellently': (1.0, 1.0, 1.0, 1),
+    'exceptional': (0.6667, 1.0, 1.0, 0),
+    'exceptionally': (0.6667, 1.0, 1.0, 1),
+    'excessive': (-0.25, 1.0, 1.0, 0),
+    'excessively': (-0.25, 1.0, 1.0, 1),
+    'excited': (0.375, 0.75, 1.0, 0),
+    'excitedly': (0.375, 0.75, 1.0, 1),
+    'exciting': (0.3, 0.8, 1.0, 0),
+    'excitingly': (0.3, 0.8, 1.0, 1),
+    'excruciatingly': (-0.1, 0.3, 1.3, 1),
+    'excuse': (-0.05, 0.05, 1.0, 0),
+    'exhausted': (-0.4, 0.7, 1.0, 0),
+    'exhaustedly': (-0.4, 0.7, 1.0, 1),
+    'exhausting': (-0.4, 0.5, 1.0, 0),
+    'exhaustingly': (-0.4, 0.5, 1.0, 1),
+    'exhilarating': (0.7, 0.9, 1.0, 0),
+    'exhilaratingly': (0.7, 0.9, 1.0, 1),
+    'exotic': (0.5, 1.0, 1.0, 0),
+    'exoticly': (0.5, 1.0, 1.0, 1),
+    'expected': (-0.1, 0.4, 1.0, 0),
+    'expectedly': (-0.1, 0.4, 1.0, 1),
+    'expensive': (-0.5, 0.7, 1.0, 0),
+    'expensively': (-0.5, 0.7, 1.0, 1),
+    'experienced': (0.8, 0.9, 1.0, 0),
+    'experiencedly': (0.8, 0.9, 1.0, 1),
+    'experimental': (0.1, 0.4, 1.0, 0),
+    'experimentally': (0.1, 0.4, 1.0, 1),
+    'exploitative': (-0.3, 0.3, 1.0, 0),
+    'exploitatively': (-0.3, 0.3, 1.0, 1),
+    'expressive': (0.8, 1.0, 1.0, 0),
+    'expressively': (0.8, 1.0, 1.0, 1),
+    'exquisite': (1.0, 1.0, 1.0, 0),
+    'exquisitely': (1.0, 1.0, 1.0, 1),
+    'extensive': (0.0, 0.3333, 1.0, 0),
+    'extensively': (0.0, 0.3333, 1.0, 1),
+    'external': (0.0, 0.1, 1.0, 0),
+    'externally': (0.0, 0.1, 1.0, 1),
+    'extinct': (-0.4, 0.6, 1.0, 0),
+    'extinctly': (-0.4, 0.6, 1.0, 1),
+    'extra': (0.0, 0.1, 1.0, 0),
+    'extraly': (0.0, 0.1, 1.0, 1),
+    'extraordinarily': (0.3333, 1.0, 1.0, 1),
+    'extraordinary': (0.3333, 1.0, 1.0, 0),
+    'extreme': (-0.125, 1.0, 1.0, 0),
+    'extremely': (-0.125, 1.0, 1.0, 1),
+    'exuberant': (0.05, 0.9, 1.0, 0),
+    'exuberantly': (0.05, 0.9, 1.0, 1),
+    'f*cking': (-0.6, 0.8, 1.0, 1),
+    'fabled': (0.7, 0.9, 1.0, 0),
+    'fabledly': (0.7, 0.9, 1.0, 1),
+    'fabricated': (0.0, 0.75, 1.0, 0),
+    'fabricatedly': (0.0, 0.75, 1.0, 1),
+    'fabulous': (0.4, 1.0, 1.0, 0),
+    'fabulously': (0.4, 1.0, 1.0, 1),
+    'facial': (0.0, 0.0, 1.0, 0),
+    'facially': (0.0, 0.0, 1.0, 1),
+    'fail': (-0.5, 0.3, 1.0, 0),
+    'failed': (-0.5, 0.3, 1.0, 0),
+    'fails': (-0.5, 0.3, 1.0, 0),
+    'failure': (-0.3167, 0.3, 1.0, 0),
+    'faint': (-0.5, 1.0, 1.0, 0),
+    'faintly': (-0.5, 1.0, 1.0, 1),
+    'fair': (0.7, 0.9, 1.0, 0),
+    'fairly': (0.7, 0.9, 1.0, 1),
+    'fake': (-0.5, 1.0, 1.0, 0),
+    'fakely': (-0.5, 1.0, 1.0, 1),
+    'false': (-0.4, 0.6, 1.0, 0),
+    'falsely': (-0.4, 0.6, 1.0, 1),
+    'familiar': (0.375, 0.5, 1.0, 0),
+    'familiarly': (0.375, 0.5, 1.0, 1),
+    'famous': (0.5, 1.0, 1.0, 0),
+    'famously': (0.5, 1.0, 1.0, 1),
+    'fanatic': (-0.3, 0.8, 1.0, 0),
+    'fanaticly': (-0.3, 0.8, 1.0, 1),
+    'fantastic': (0.4, 0.9, 1.0, 0),
+    'fantasticly': (0.4, 0.9, 1.0, 1),
+    'far': (0.1, 1.0, 1.0, 0),
+    'far-out': (0.4, 1.0, 1.0, 0),
+    'far-outly': (0.4, 1.0, 1.0, 1),
+    'farce': (-0.4, 0.5, 1.0, 0),
+    'farcical': (-0.4, 0.4, 1.0, 0),
+    'farcically': (-0.4, 0.4, 1.0, 1),
+    'farly': (0.1, 1.0, 1.0, 1),
+    'farthermost': (0.0, 0.8, 1.0, 0),
+    'farthermostly': (0.0, 0.8, 1.0, 1),
+    'fascinating': (0.7, 0.85, 1.0, 0),
+    'fascinatingly': (0.7, 0.85, 1.0, 1),
+    'fast': (0.2, 0.6, 1.0, 0),
+    'fastly': (0.2, 0.6, 1.0, 1),
+    'fatigued': (-0.4, 0.7, 1.0, 0),
+    'fattily': (-0.2, 0.4, 1.0, 1),
+    'fatty': (-0.2, 0.4, 1.0, 0),
+    'faultless': (1.0, 1.0, 1.0, 0),
+    'faultlessly': (1.0, 1.0, 1.0, 1),
+    'favored': (0.8, 0.9, 1.0, 0),
+    'favoredly': (0.8, 0.9, 1.0, 1),
+    'favorite': (0.5, 1.0, 1.0, 0),
+    'favoritely': (0.5, 1.0, 1.0, 1),
+    'fearful': (-0.9, 1.0, 1.0, 0),
+    'fearfully': (-0.9, 1.0, 1.0, 1),
+    'feeble': (-0.5, 1.0, 1.0, 0),
+    'feebly': (-0.5, 1.0, 1.0, 1),
+    'felicitous': (0.7, 1.0, 1.0, 0),
+    'felicitously': (0.7, 1.0, 1.0, 1),
+    'female': (0.0, 0.1667, 1.0, 0),
+    'femaly': (0.0, 0.1667, 1.0, 1),
+    'feverish': (-0.1, 0.4, 1.0, 0),
+    'feverishly': (-0.1, 0.4, 1.0, 1),
+    'few': (-0.2, 0.1, 1.0, 0),
+    'fewly': (-0.2, 0.1, 1.0, 1),
+    'fictional': (0.0, 0.25, 1.0, 0),
+    'fictionally': (0.0, 0.25, 1.0, 1),
+    'fiendish': (-0.6, 0.7, 1.0, 0),
+    'fiendishly': (-0.6, 0.7, 1.0, 1),
+    'fiftieth': (0.1, 0.1, 1.0, 0),
+    'fiftiethly': (0.1, 0.1, 1.0, 1),
+    'filled': (0.4, 0.9, 1.0, 0),
+    'filledly': (0.4, 0.9, 1.0, 1),
+    'filthily': (-0.8, 1.0, 1.0, 1),
+    'filthy': (-0.8, 1.0, 1.0, 0),
+    'final': (0.0, 1.0, 1.0, 0),
+    'finally': (0.0, 1.0, 1.0, 1),
+    'financial': (0.0, 0.0, 1.0, 0),
+    'financially': (0.0, 0.0, 1.0, 1),
+    'fine': (0.4167, 0.5, 1.0, 0),
+    'fine-looking': (0.6, 1.0, 1.0, 0),
+    'fine-lookingly': (0.6, 1.0, 1.0, 1),
+    'finely': (0.4167, 0.5, 1.0, 1),
+    'firm': (-0.2, 0.4, 1.0, 0),
+    'firmly': (-0.2, 0.4, 1.0, 1),
+    'first': (0.25, 0.3333, 1.0, 0),
+    'first-string': (0.6, 0.9, 1.0, 0),
+    'first-stringly': (0.6, 0.9, 1.0, 1),
+    'firstly': (0.25, 0.3333, 1.0, 1),
+    'fit': (0.4, 0.4, 1.0, 0),
+    'fitly': (0.4, 0.4, 1.0, 1),
+    'fitting': (0.5, 0.5, 1.0, 0),
+    'fittingly': (0.5, 0.5, 1.0, 1),
+    'fixed': (0.1, 0.2, 1.0, 0),
+    'fixedly': (0.1, 0.2, 1.0, 1),
+    'flashily': (-0.5, 0.5, 1.0, 1),
+    'flashy': (-0.5, 0.5, 1.0, 0),
+    'flat': (-0.025, 0.125, 1.0, 0),
+    'flatly': (-0.025, 0.125, 1.0, 1),
+    'flawed': (-0.5, 0.5, 1.0, 0),
+    'flawedly': (-0.5, 0.5, 1.0, 1),
+    'flawless': (1.0, 1.0, 1.0, 0),
+    'flawlessly': (1.0, 1.0, 1.0, 1),
+    'flily': (0.8, 0.9, 1.0, 1),
+    'flippant': (0.4, 0.9, 1.0, 0),
+    'flippantly': (0.4, 0.9, 1.0, 1),
+    'fluff': (-0.1, 0.3, 1.0, 0),
+    'fluffily': (-0.2, 0.4, 1.0, 1),
+    'fluffy': (-0.2, 0.4, 1.0, 0),
+    'fluid': (0.0, 0.1, 1.0, 0),
+    'fluidly': (0.0, 0.1, 1.0, 1),
+    'fly': (0.8, 0.9, 1.0, 0),
+    'focused': (0.3, 0.5, 1.0, 0),
+    'following': (0.0, 0.1, 1.0, 0),
+    'followingly': (0.0, 0.1, 1.0, 1),
+    'for sure': (0.3, 0.5, 1.0, 0),
+    'for surely': (0.3, 0.5, 1.0, 1),
+    'forced': (-0.3, 0.2, 1.0, 0),
+    'forcedly': (-0.3, 0.2, 1.0, 1),
+    'forcible': (0.5, 1.0, 1.0, 0),
+    'forcibly': (0.5, 1.0, 1.0, 1),
+    'foreign': (-0.125, 0.125, 1.0, 0),
+    'foreignly': (-0.125, 0.125, 1.0, 1),
+    'forgetful': (-0.1, 0.4, 1.0, 0),
+    'forgetfully': (-0.1, 0.4, 1.0, 1),
+    'forgettable': (-0.5, 0.5, 1.0, 0),
+    'forgettably': (-0.5, 0.5, 1.0, 1),
+    'former': (0.0, 0.0, 1.0, 0),
+    'formerly': (0.0, 0.0, 1.0, 1),
+    'formulaic': (0.0, 0.0, 1.0, 0),
+    'formulaicly': (0.0, 0.0, 1.0, 1),
+    'fortunate': (0.4, 0.7, 1.0, 0),
+    'fortunately': (0.4, 0.7, 1.0, 1),
+    'fourth': (0.0, 0.0, 1.0, 0),
+    'fourthly': (0.0, 0.0, 1.0, 1),
+    'fragile': (0.0, 0.5, 1.0, 0),
+    'fragily': (0.0, 0.5, 1.0, 1),
+    'free': (0.4, 0.8, 1.0, 0),
+    'free-thinking': (0.0, 0.9, 1.0, 0),
+    'free-thinkingly': (0.0, 0.9, 1.0, 1),
+    'freely': (0.4, 0.8, 1.0, 1),
+    'freestanding': (0.0, 0.1, 1.0, 0),
+    'freestandingly': (0.0, 0.1, 1.0, 1),
+    'french': (0.0, 0.0, 1.0, 0),
+    'frenchly': (0.0, 0.0, 1.0, 1),
+    'frequent': (0.1, 0.3, 1.0, 0),
+    'frequently': (0.1, 0.3, 1.0, 1),
+    'fresh': (0.3, 0.5, 1.0, 0),
+    'freshly': (0.3, 0.5, 1.0, 1),
+    'friendlily': (0.375, 0.5, 1.0, 1),
+    'friendly': (0.375, 0.5, 1.0, 0),
+    'frightening': (-0.5, 1.0, 1.0, 0),
+    'frighteningly': (-0.5, 1.0, 1.0, 1),
+    'frigid': (-0.9, 1.0, 1.0, 0),
+    'frigidly': (-0.9, 1.0, 1.0, 1),
+    'fringily': (0.3, 0.9, 1.0, 1),
+    'fringy': (0.3, 0.9, 1.0, 0),
+    'frostbitten': (-0.5, 0.6, 1.0, 0),
+    'frostbittenly': (-0.5, 0.6, 1.0, 1),
+    'frustrated': (-0.7, 0.2, 1.0, 0),
+    'frustratedly': (-0.7, 0.2, 1.0, 1),
+    'frustrating': (-0.4, 0.9, 1.0, 0),
+    'frustratingly': (-0.4, 0.9, 1.0, 1),
+    'fuck': (-0.4, 0.6, 1.0, 0),
+    'fucked': (-0.6, 0.7, 1.0, 0),
+    'fuckedly': (-0.6, 0.7, 1.0, 1),
+    'fucking': (-0.6, 0.8, 1.0, 1),
+    'full': (0.35, 0.55, 1.0, 0),
+    'full of life': (-0.2, 0.9, 1.0, 0),
+    'full of lifely': (-0.2, 0.9, 1.0, 1),
+    'full-bodied': (-0.1, 0.6, 1.0, 0),
+    'full-bodiedly': (-0.1, 0.6, 1.0, 1),
+    'full-fledged': (0.6, 0.9, 1.0, 0),
+    'full-fledgedly': (0.6, 0.9, 1.0, 1),
+    'full-length': (0.0333, 0.4333, 1.0, 0),
+    'full-lengthly': (0.0333, 0.4333, 1.0, 1),
+    'fullly': (0.35, 0.55, 1.0, 1),
+    'fun': (0.3, 0.2, 1.0, 0),
+    'funnily': (0.25, 1.0, 1.0, 1),
+    'funny': (0.25, 1.0, 1.0, 0),
+    'further': (0.0, 0.5, 1.0, 0),
+    'furtherly': (0.0, 0.5, 1.0, 1),
+    'furtive': (-0.1, 0.5, 1.0, 0),
+    'furtively': (-0.1, 0.5, 1.0, 1),
+    'future': (0.0, 0.125, 1.0, 0),
+    'futurely': (0.0, 0.125, 1.0, 1),
+    'gaily': (0.4167, 0.5833, 1.0, 1),
+    'game': (-0.4, 0.4, 1.0, 0),
+    'gamechanger': (0.3, 0.0, 1.0, 0),
+    'gamely': (-0.4, 0.4, 1.0, 1),
+    'gargantuan': (-0.05, 0.8, 1.0, 0),
+    'gargantuanly': (-0.05, 0.8, 1.0, 1),
+    'gawkily': (-0.55, 0.95, 1.0, 1),
+    'gawky': (-0.55, 0.95, 1.0, 0),
+    'gay': (0.4167, 0.5833, 1.0, 0),
+    'general': (0.05, 0.5, 1.0, 0),
+    'generally': (0.05, 0.5, 1.0, 1),
+    'generic': (0.0, 0.0, 1.0, 0),
+    'genericly': (0.0, 0.0, 1.0, 1),
+    'gentle': (0.2, 0.8, 1.0, 0),
+    'gently': (0.2, 0.8, 1.0, 1),
+    'genuine': (0.4, 0.5, 1.0, 0),
+    'genuinely': (0.4, 0.5, 1.0, 1),
+    'german': (0.0, 0.0, 1.0, 0),
+    'germanly': (0.0, 0.0, 1.0, 1),
+    'gettable': (0.1, 0.1, 1.0, 0),
+    'gettably': (0.1, 0.1, 1.0, 1),
+    'giant': (0.0, 1.0, 1.0, 0),
+    'giantly': (0.0, 1.0, 1.0, 1),
+    'gifted': (0.5, 1.0, 1.0, 0),
+    'giftedly': (0.5, 1.0, 1.0, 1),
+    'gimmickily': (-0.2, 0.5, 1.0, 1),
+    'gimmicky': (-0.2, 0.5, 1.0, 0),
+    'glad': (0.5, 1.0, 1.0, 0),
+    'gladly': (0.5, 1.0, 1.0, 1),
+    'global': (0.0, 0.0, 1.0, 0),
+    'globally': (0.0, 0.0, 1.0, 1),
+    'gloom': (-0.1333, 0.1333, 1.0, 0),
+    'glueily': (-0.4, 0.5, 1.0, 1),
+    'gluey': (-0.4, 0.5, 1.0, 0),
+    'godforsaken': (-0.4, 0.75, 1.0, 0),
+    'godforsakenly': (-0.4, 0.75, 1.0, 1),
+    'golden': (0.3, 0.5, 1.0, 0),
+    'goldenly': (0.3, 0.5, 1.0, 1),
+    'good': (0.7, 0.6, 1.0, 0),
+    'goodly': (0.7, 0.6, 1.0, 1),
+    'goody-goodily': (-0.5, 1.0, 1.0, 1),
+    'goody-goody': (-0.5, 1.0, 1.0, 0),
+    'goofily': (0.5, 1.0, 1.0, 1),
+    'goofy': (0.5, 1.0, 1.0, 0),
+    'gorgeous': (0.7, 0.9, 1.0, 0),
+    'gorgeously': (0.7, 0.9, 1.0, 1),
+    'gorily': (-0.5, 1.0, 1.0, 1),
+    'gory': (-0.5, 1.0, 1.0, 0),
+    'grand': (0.5, 1.0, 1.0, 0),
+    'grandiloquent': (-0.6, 0.9, 1.0, 0),
+    'grandiloquently': (-0.6, 0.9, 1.0, 1),
+    'grandly': (0.5, 1.0, 1.0, 1),
+    'graphic': (0.0, 0.4, 1.0, 0),
+    'graphicly': (0.0, 0.4, 1.0, 1),
+    'grateful': (0.6, 0.8, 1.0, 0),
+    'gratuitous': (-0.5, 0.8333, 1.0, 0),
+    'gratuitously': (-0.5, 0.8333, 1.0, 1),
+    'great': (0.8, 0.75, 1.0, 0),
+    'greater': (0.5, 0.5, 1.0, 0),
+    'greaterly': (0.5, 0.5, 1.0, 1),
+    'greatest': (1.0, 1.0, 1.0, 0),
+    'greatestly': (1.0, 1.0, 1.0, 1),
+    'greatly': (0.8, 0.75, 1.0, 1),
+    'greek': (0.0, 0.0, 1.0, 0),
+    'greekly': (0.0, 0.0, 1.0, 1),
+    'green': (-0.2, 0.3, 1.0, 0),
+    'greenly': (-0.2, 0.3, 1.0, 1),
+    'greily': (-0.05, 0.1, 1.0, 1),
+    'grey': (-0.05, 0.1, 1.0, 0),
+    'grief': (-0.8, 0.2, 1.0, 0),
+    'grievous': (-0.8, 1.0, 1.0, 0),
+    'grievously': (-0.8, 1.0, 1.0, 1),
+    'grim': (-1.0, 1.0, 1.0, 0),
+    'grimly': (-1.0, 1.0, 1.0, 1),
+    'gripping': (0.5, 1.0, 1.0, 0),
+    'grippingly': (0.5, 1.0, 1.0, 1),
+    'grittily': (0.0, 0.75, 1.0, 1),
+    'gritty': (0.0, 0.75, 1.0, 0),
+    'gross': (0.0, 0.0, 1.0, 0),
+    'grossly': (0.0, 0.0, 1.0, 1),
+    'grotesque': (-0.55, 1.0, 1.0, 0),
+    'grotesquely': (-0.55, 1.0, 1.0, 1),
+    'grr': (-0.7, 0.8, 1.0, 0),
+    'grrr': (-0.7, 0.8, 1.0, 0),
+    'grrrr': (-0.7, 0.8, 1.0, 0),
+    'grudging': (-0.6, 1.0, 1.0, 0),
+    'grudgingly': (-0.6, 1.0, 1.0, 1),
+    'gruesome': (-1.0, 1.0, 1.0, 0),
+    'gruesomely': (-1.0, 1.0, 1.0, 1),
+    'guarded': (0.4, 0.6, 1.0, 0),
+    'guardedly': (0.4, 0.6, 1.0, 1),
+    'guiltily': (-0.5, 1.0, 1.0, 1),
+    'guilty': (-0.5, 1.0, 1.0, 0),
+    'haha': (0.2, 0.3, 1.0, 0),
+    'hahaha': (0.2, 0.4, 1.0, 0),
+    'hahahaha': (0.2, 0.5, 1.0, 0),
+    'hahahahaha': (0.2, 0.6, 1.0, 0),
+    'half': (-0.1667, 0.1667, 1.0, 0),
+    'halfly': (-0.1667, 0.1667, 1.0, 1),
+    'hand-held': (0.0, 0.0, 1.0, 0),
+    'hand-heldly': (0.0, 0.0, 1.0, 1),
+    'handily': (0.6, 0.9, 1.0, 1),
+    'handsome': (0.5, 1.0, 1.0, 0),
+    'handsomely': (0.5, 1.0, 1.0, 1),
+    'handy': (0.6, 0.9, 1.0, 0),
+    'haphazard': (-0.6, 0.8, 1.0, 0),
+    'haphazardly': (-0.6, 0.8, 1.0, 1),
+    'hapless': (-0.6, 1.0, 1.0, 0),
+    'haplessly': (-0.6, 1.0, 1.0, 1),
+    'happily': (0.8, 1.0, 1.0, 1),
+    'happiness': (0.7, 0.2, 1.0, 0),
+    'happy': (0.8, 1.0, 1.0, 0),
+    'hard': (-0.2917, 0.5417, 1.0, 0),
+    'harder': (-0.1, 0.0, 1.0, 0),
+    'harderly': (-0.1, 0.0, 1.0, 1),
+    'hardly': (-0.2917, 0.5417, 1.0, 1),
+    'harsh': (-0.2, 0.7, 1.0, 0),
+    'harshly': (-0.2, 0.7, 1.0, 1),
+    'hate': (-0.8, 0.9, 1.0, 0),
+    'hated': (-0.9, 0.7, 1.0, 0),
+    'hazardous': (0.6, 0.9, 1.0, 0),
+    'hazardously': (0.6, 0.9, 1.0, 1),
+    'healthily': (0.5, 0.5, 1.0, 1),
+    'healthy': (0.5, 0.5, 1.0, 0),
+    'heartfelt': (0.0, 1.0, 1.0, 0),
+    'heartfeltly': (0.0, 1.0, 1.0, 1),
+    'heavily': (-0.2, 0.5, 1.0, 1),
+    'heavy': (-0.2, 0.5, 1.0, 0),
+    'heroic': (0.7, 0.9, 1.0, 0),
+    'heroicly': (0.7, 0.9, 1.0, 1),
+    'hidden': (-0.1667, 0.3333, 1.0, 0),
+    'hiddenly': (-0.1667, 0.3333, 1.0, 1),
+    'high': (0.16, 0.54, 1.0, 0),
+    'higher': (0.25, 0.5, 1.0, 0),
+    'higherly': (0.25, 0.5, 1.0, 1),
+    'highly': (0.16, 0.54, 1.0, 1),
+    'hilarious': (0.5, 1.0, 1.0, 0),
+    'hilariously': (0.5, 1.0, 1.0, 1),
+    'hindered': (-0.2, 0.1, 1.0, 0),
+    'historic': (0.0, 0.0, 1.0, 0),
+    'historical': (0.0, 0.0, 1.0, 0),
+    'historically': (0.0, 0.0, 1.0, 1),
+    'historicly': (0.0, 0.0, 1.0, 1),
+    'hit-and-miss': (-0.2, 0.0, 1.0, 0),
+    'hollow': (-0.1, 0.05, 1.0, 0),
+    'hollowly': (-0.2, 0.1, 1.0, 1),
+    'honest': (0.6, 0.9, 1.0, 0),
+    'honest-to-god': (-0.5, 0.9, 1.0, 0),
+    'honest-to-godly': (-0.5, 0.9, 1.0, 1),
+    'honestly': (0.6, 0.9, 1.0, 1),
+    'hopeless': (-0.8, 0.9, 1.0, 0),
+    'horrible': (-1.0, 1.0, 1.0, 0),
+    'horribly': (-1.0, 1.0, 1.0, 1),
+    'horrific': (-1.0, 1.0, 1.0, 0),
+    'horrificly': (-1.0, 1.0, 1.0, 1),
+    'horrifying': (-0.9, 1.0, 1.0, 0),
+    'horrifyingly': (-0.9, 1.0, 1.0, 1),
+    'hot': (0.25, 0.85, 1.0, 0),
+    'hotly': (0.25, 0.85, 1.0, 1),
+    'huge': (0.4, 0.9, 1.0, 0),
+    'hugely': (0.4, 0.9, 1.0, 1),
+    'human': (0.0, 0.1, 1.0, 0),
+    'humanly': (0.0, 0.1, 1.0, 1),
+    'humble': (-0.2, 0.4, 1.0, 0),
+    'humbly': (-0.2, 0.4, 1.0, 1),
+    'humorous': (0.5, 1.0, 1.0, 0),
+    'humorously': (0.5, 1.0, 1.0, 1),
+    'hysterical': (-1.0, 1.0, 1.0, 0),
+    'hysterically': (-1.0, 1.0, 1.0, 1),
+    'icily': (-0.1, 0.1, 1.0, 1),
+    'ickily': (-0.3, 0.6, 1.0, 1),
+    'icky': (-0.3, 0.6, 1.0, 0),
+    'iconic': (0.5, 0.5, 1.0, 0),
+    'iconicly': (0.5, 0.5, 1.0, 1),
+    'icy': (-0.1, 0.1, 1.0, 0),
+    'ideal': (0.9, 1.0, 1.0, 0),
+    'ideally': (0.9, 1.0, 1.0, 1),
+    'identifiable': (0.1, 0.5, 1.0, 0),
+    'identifiably': (0.1, 0.5, 1.0, 1),
+    'idiocy': (-0.3, 0.4, 1.0, 0),
+    'idiot': (-0.8, 0.8, 1.0, 0),
+    'idiotic': (-0.6667, 0.8333, 1.0, 0),
+    'idioticly': (-0.6667, 0.8333, 1.0, 1),
+    'idiots': (-0.8, 0.8, 1.0, 0),
+    'ill': (-0.5, 1.0, 1.0, 0),
+    'illegal': (-0.5, 0.5, 1.0, 0),
+    'illegally': (-0.5, 0.5, 1.0, 1),
+    'illly': (-0.5, 1.0, 1.0, 1),
+    'imaginative': (0.6, 0.7, 1.0, 0),
+    'imaginatively': (0.6, 0.7, 1.0, 1),
+    'imbecile': (-0.8, 1.0, 1.0, 0),
+    'imitation': (-0.1333, 0.0, 1.0, 0),
+    'immanent': (-0.1, 0.4, 1.0, 0),
+    'immanently': (-0.1, 0.4, 1.0, 1),
+    'immense': (0.0, 1.0, 1.0, 0),
+    'immensely': (0.0, 1.0, 1.0, 1),
+    'impassive': (-0.4, 0.8, 1.0, 0),
+    'impassively': (-0.4, 0.8, 1.0, 1),
+    'impatient': (-0.2, 0.9, 1.0, 0),
+    'impatiently': (-0.2, 0.9, 1.0, 1),
+    'impeccable': (0.75, 0.75, 1.0, 0),
+    'impeccably': (0.75, 0.75, 1.0, 1),
+    'imperceptible': (-0.2, 0.2, 1.0, 0),
+    'imperceptibly': (-0.2, 0.2, 1.0, 1),
+    'implicated': (-0.4, 0.5, 1.0, 0),
+    'implicatedly': (-0.4, 0.5, 1.0, 1),
+    'implicit in': (0.0, 0.1, 1.0, 0),
+    'implicit inly': (0.0, 0.1, 1.0, 1),
+    'important': (0.4, 1.0, 1.0, 0),
+    'importantly': (0.4, 1.0, 1.0, 1),
+    'impossible': (-0.6667, 1.0, 1.0, 0),
+    'impossibly': (-0.6667, 1.0, 1.0, 1),
+    'impressed': (1.0, 1.0, 1.0, 0),
+    'impressedly': (1.0, 1.0, 1.0, 1),
+    'impressive': (1.0, 1.0, 1.0, 0),
+    'impressively': (1.0, 1.0, 1.0, 1),
+    'in good taste': (0.9, 1.0, 1.0, 0),
+    'in good tastely': (0.9, 1.0, 1.0, 1),
+    'in stock': (0.1, 0.4, 1.0, 0),
+    'in stockly': (0.1, 0.4, 1.0, 1),
+    'inapposite': (-0.8, 1.0, 1.0, 0),
+    'inappositely': (-0.8, 1.0, 1.0, 1),
+    'inarticulate': (-0.1, 0.5, 1.0, 0),
+    'inarticulately': (-0.1, 0.5, 1.0, 1),
+    'inauspicious': (-0.5, 0.9, 1.0, 0),
+    'inauspiciously': (-0.5, 0.9, 1.0, 1),
+    'incalculable': (0.0, 0.7, 1.0, 0),
+    'incalculably': (0.0, 0.7, 1.0, 1),
+    'incoherent': (-0.2, 0.1667, 1.0, 0),
+    'incoherently': (-0.2, 0.1667, 1.0, 1),
+    'incomparable': (0.4, 0.6, 1.0, 0),
+    'incomparably': (0.4, 0.6, 1.0, 1),
+    'incompetent': (-0.35, 0.3667, 1.0, 0),
+    'incompetently': (-0.4, 0.4333, 1.0, 1),
+    'inconsistencies': (-0.1, 0.0, 1.0, 0),
+    'inconvenient': (-0.6, 1.0, 1.0, 0),
+    'inconveniently': (-0.6, 1.0, 1.0, 1),
+    'incorruptible': (0.5, 0.8, 1.0, 0),
+    'incorruptibly': (0.5, 0.8, 1.0, 1),
+    'incredible': (0.9, 0.9, 1.0, 0),
+    'incredibly': (0.9, 0.9, 1.0, 1),
+    'incurable': (-0.5, 0.6, 1.0, 0),
+    'incurably': (-0.5, 0.6, 1.0, 1),
+    'indecipherable': (-0.55, 0.75, 1.0, 0),
+    'indecipherably': (-0.55, 0.75, 1.0, 1),
+    'independent': (0.0, 0.125, 1.0, 0),
+    'independently': (0.0, 0.125, 1.0, 1),
+    'indie': (0.0, 0.0, 1.0, 0),
+    'indiely': (0.0, 0.0, 1.0, 1),
+    'indispensable': (0.4, 0.9, 1.0, 0),
+    'indispensably': (0.4, 0.9, 1.0, 1),
+    'individual': (0.0, 0.4, 1.0, 0),
+    'individually': (0.0, 0.4, 1.0, 1),
+    'indomitable': (0.0, 0.9, 1.0, 0),
+    'indomitably': (0.0, 0.9, 1.0, 1),
+    'ineluctable': (-0.1, 0.4, 1.0, 0),
+    'ineluctably': (-0.1, 0.4, 1.0, 1),
+    'inevitable': (0.0, 1.0, 1.0, 0),
+    'inevitably': (0.0, 1.0, 1.0, 1),
+    'inexpedient': (-0.5, 0.9, 1.0, 0),
+    'inexpediently': (-0.5, 0.9, 1.0, 1),
+    'inexperienced': (-0.1, 0.6, 1.0, 0),
+    'inexperiencedly': (-0.1, 0.6, 1.0, 1),
+    'inexplicable': (-0.6, 0.9, 1.0, 0),
+    'inexplicably': (-0.6, 0.9, 1.0, 1),
+    'inexpressible': (0.05, 0.7, 1.0, 0),
+    'inexpressibly': (0.05, 0.7, 1.0, 1),
+    'infamous': (-0.5, 1.0, 1.0, 0),
+    'infamously': (-0.5, 1.0, 1.0, 1),
+    'infantile': (-0.4, 0.35, 1.0, 0),
+    'infantily': (-0.4, 0.35, 1.0, 1),
+    'infatuated': (-0.2, 0.2, 1.0, 0),
+    'inflexible': (-0.4, 0.6, 1.0, 0),
+    'inflexibly': (-0.4, 0.6, 1.0, 1),
+    'infuriating': (-0.6, 0.8, 1.0, 0),
+    'ingenious': (0.5, 1.0, 1.0, 0),
+    'ingeniously': (0.5, 1.0, 1.0, 1),
+    'inhumane': (-0.9, 0.9, 1.0, 0),
+    'inhumanely': (-0.9, 0.9, 1.0, 1),
+    'initial': (0.0, 0.0, 1.0, 0),
+    'initially': (0.0, 0.0, 1.0, 1),
+    'inner': (0.0, 0.1667, 1.0, 0),
+    'innerly': (0.0, 0.1667, 1.0, 1),
+    'innocent': (0.5, 0.7, 1.0, 0),
+    'innocently': (0.5, 0.7, 1.0, 1),
+    'innovative': (0.5, 1.0, 1.0, 0),
+    'innovatively': (0.5, 1.0, 1.0, 1),
+    'insane': (-1.0, 1.0, 1.0, 0),
+    'insanely': (-1.0, 1.0, 1.0, 1),
+    'insecure': (-0.5, 0.875, 1.0, 0),
+    'insecurely': (-0.5, 0.875, 1.0, 1),
+    'inspirational': (0.5, 1.0, 1.0, 0),
+    'inspirationally': (0.5, 1.0, 1.0, 1),
+    'inspiring': (0.5, 1.0, 1.0, 0),
+    'inspiringly': (0.5, 1.0, 1.0, 1),
+    'instant': (0.0, 0.6667, 1.0, 0),
+    'instantly': (0.0, 0.6667, 1.0, 1),
+    'insulting': (-1.0, 1.0, 1.0, 0),
+    'insultingly': (-1.0, 1.0, 1.0, 1),
+    'intellectual': (0.3, 0.4, 1.0, 0),
+    'intellectually': (0.3, 0.4, 1.0, 1),
+    'intelligent': (0.8, 0.9, 1.0, 0),
+    'intelligently': (0.8, 0.9, 1.0, 1),
+    'intelligentsia': (-0.1, 0.2, 1.0, 0),
+    'intense': (0.2, 1.0, 1.0, 0),
+    'intensely': (0.2, 1.0, 1.0, 1),
+    'interested': (0.25, 0.5, 1.0, 0),
+    'interestedly': (0.25, 0.5, 1.0, 1),
+    'interesting': (0.5, 0.5, 1.0, 0),
+    'interestingly': (0.5, 0.5, 1.0, 1),
+    'internal': (0.0, 0.0, 1.0, 0),
+    'internally': (0.0, 0.0, 1.0, 1),
+    'international': (0.0, 0.0, 1.0, 0),
+    'internationally': (0.0, 0.0, 1.0, 1),
+    'intimate': (0.2, 0.6, 1.0, 0),
+    'intimately': (0.2, 0.6, 1.0, 1),
+    'intriguing': (0.3, 0.4, 1.0, 0),
+    'intriguingly': (0.3, 0.4, 1.0, 1),
+    'inventive': (0.5, 1.0, 1.0, 0),
+    'inventively': (0.5, 1.0, 1.0, 1),
+    'irish': (0.0, 0.0, 1.0, 0),
+    'irishly': (0.0, 0.0, 1.0, 1),
+    'ironic': (0.2, 0.9, 1.0, 0),
+    'ironicly': (0.2, 0.9, 1.0, 1),
+    'irrelevant': (-0.5, 1.0, 1.0, 0),
+    'irrelevantly': (-0.5, 1.0, 1.0, 1),
+    'irritated': (-0.4, 0.8, 1.0, 0),
+    'irritating': (-0.4, 0.8, 1.0, 0),
+    'irritatingly': (-0.4, 0.8, 1.0, 1),
+    "isn't": (-0.2, 0.1, 1.0, 0),
+    'italian': (0.0, 0.0, 1.0, 0),
+    'italianly': (0.0, 0.0, 1.0, 1),
+    'jackass': (-0.5, 0.9, 1.0, 0),
+    'jackasses': (-0.5, 0.9, 1.0, 0),
+    'jail': (-0.1, 0.0, 1.0, 0),
+    'jammed': (-0.1, 0.6, 1.0, 0),
+    'jammedly': (-0.1, 0.6, 1.0, 1),
+    'japanese': (0.0, 0.0, 1.0, 0),
+    'japanesely': (0.0, 0.0, 1.0, 1),
+    'jewish': (0.0, 0.0, 1.0, 0),
+    'jewishly': (0.0, 0.0, 1.0, 1),
+    'joy': (0.8, 0.2, 1.0, 0),
+    'justified': (0.4, 0.9, 1.0, 0),
+    'justifiedly': (0.4, 0.9, 1.0, 1),
+    'juvenile': (-0.25, 0.25, 1.0, 0),
+    'juvenily': (-0.25, 0.25, 1.0, 1),
+    'keily': (0.0, 1.0, 1.0, 1),
+    'key': (0.0, 1.0, 1.0, 0),
+    'killed': (-0.2, 0.0, 1.0, 0),
+    'kind': (0.6, 0.9, 1.0, 0),
+    'kindly': (0.6, 0.9, 1.0, 1),
+    'lame': (-0.5, 0.75, 1.0, 0),
+    'lamely': (-0.5, 0.75, 1.0, 1),
+    'large': (0.2143, 0.4286, 1.0, 0),
+    'largely': (0.2143, 0.4286, 1.0, 1),
+    'larger': (0.0, 0.5, 1.0, 0),
+    'largerly': (0.0, 0.5, 1.0, 1),
+    'last': (0.0, 0.0667, 1.0, 0),
+    'lasting': (0.0, 0.0, 1.0, 0),
+    'lastingly': (0.0, 0.0, 1.0, 1),
+    'lastly': (0.0, 0.0667, 1.0, 1),
+    'late': (-0.3, 0.6, 1.0, 0),
+    'lately': (-0.3, 0.6, 1.0, 1),
+    'later': (0.0, 0.0, 1.0, 0),
+    'laterly': (0.0, 0.0, 1.0, 1),
+    'latest': (0.5, 0.9, 1.0, 0),
+    'latestly': (0.5, 0.9, 1.0, 1),
+    'latter': (0.0, 0.0, 1.0, 0),
+    'latterly': (0.0, 0.0, 1.0, 1),
+    'laugh': (0.3, 0.1, 1.0, 0),
+    'laughable': (-0.5, 1.0, 1.0, 0),
+    'laughably': (-0.5, 1.0, 1.0, 1),
+    'laughed': (0.7, 0.2, 1.0, 0),
+    'lawful': (0.0, 0.0, 1.0, 0),
+    'lawfully': (0.0, 0.0, 1.0, 1),
+    'lazily': (-0.25, 1.0, 1.0, 1),
+    'lazy': (-0.25, 1.0, 1.0, 0),
+    'leaden': (-0.2, 0.2667, 1.0, 0),
+    'leadenly': (-0.2, 0.2667, 1.0, 1),
+    'least': (-0.3, 0.4, 1.0, 0),
+    'leastly': (-0.3, 0.4, 1.0, 1),
+    'left': (0.0, 0.0, 1.0, 0),
+    'leftist': (-0.05, 0.6, 1.0, 0),
+    'leftistly': (-0.05, 0.6, 1.0, 1),
+    'leftly': (0.0, 0.0, 1.0, 1),
+    'legal': (0.2, 0.2, 1.0, 0),
+    'legally': (0.2, 0.2, 1.0, 1),
+    'legendarily': (1.0, 1.0, 1.0, 1),
+    'legendary': (1.0, 1.0, 1.0, 0),
+    'legible': (0.2, 0.6, 1.0, 0),
+    'legibly': (0.2, 0.6, 1.0, 1),
+    'lenient': (0.5, 0.9, 1.0, 0),
+    'leniently': (0.5, 0.9, 1.0, 1),
+    'less': (-0.1667, 0.0667, 1.0, 0),
+    'lesser': (0.0, 0.5, 1.0, 0),
+    'lesserly': (0.0, 0.5, 1.0, 1),
+    'lessly': (-0.1667, 0.0667, 1.0, 1),
+    'liable': (-0.1, 0.5, 1.0, 0),
+    'liably': (-0.1, 0.5, 1.0, 1),
+    'licentious': (0.4, 0.9, 1.0, 0),
+    'licentiously': (0.4, 0.9, 1.0, 1),
+    'lifelike': (0.3, 0.6, 1.0, 0),
+    'lifelikely': (0.3, 0.6, 1.0, 1),
+    'lifelong': (-0.1, 0.6, 1.0, 0),
+    'lifelongly': (-0.1, 0.6, 1.0, 1),
+    'light': (0.4, 0.7, 1.0, 0),
+    'light-hearted': (0.5, 1.0, 1.0, 0),
+    'light-heartedly': (0.5, 1.0, 1.0, 1),
+    'lightly': (0.4, 0.7, 1.0, 1),
+    'likable': (0.5, 0.5, 1.0, 0),
+    'likably': (0.5, 0.5, 1.0, 1),
+    'liked': (0.6, 0.8, 1.0, 0),
+    'likedly': (0.6, 0.8, 1.0, 1),
+    'likelily': (0.0, 1.0, 1.0, 1),
+    'likely': (0.0, 1.0, 1.0, 0),
+    'limited': (-0.0714, 0.1429, 1.0, 0),
+    'limitedly': (-0.0714, 0.1429, 1.0, 1),
+    'limp': (-0.2, 0.5, 1.0, 0),
+    'limply': (-0.2, 0.5, 1.0, 1),
+    'linguistic': (0.1, 0.1, 1.0, 0),
+    'linguisticly': (0.1, 0.1, 1.0, 1),
+    'literarily': (0.1, 0.1, 1.0, 1),
+    'literary': (0.1, 0.1, 1.0, 0),
+    'little': (-0.1875, 0.5, 1.0, 0),
+    'littly': (-0.1875, 0.5, 1.0, 1),
+    'live': (0.1364, 0.5, 1.0, 0),
+    'livelily': (0.6667, 0.9333, 1.0, 1),
+    'lively': (0.1364, 0.5, 1.0, 1),
+    'lmao': (0.6, 1.0, 1.0, 0),
+    'local': (0.0, 0.0, 1.0, 0),
+    'locally': (0.0, 0.0, 1.0, 1),
+    'logical': (0.25, 0.25, 1.0, 0),
+    'logically': (0.25, 0.25, 1.0, 1),
+    'lol': (0.8, 0.7, 1.0, 0),
+    'lolol': (0.8, 0.8, 1.0, 0),
+    'lonelily': (-0.1, 0.7, 1.0, 1),
+    'lonely': (-0.1, 0.7, 1.0, 0),
+    'long': (-0.05, 0.4, 1.0, 0),
+    'long-winded': (-0.2, 0.9, 1.0, 0),
+    'long-windedly': (-0.2, 0.9, 1.0, 1),
+    'longly': (-0.05, 0.4, 1.0, 1),
+    'loose': (-0.0769, 0.2692, 1.0, 0),
+    'loosely': (-0.0769, 0.2692, 1.0, 1),
+    'losers': (-0.2, 0.2, 1.0, 0),
+    'loses': (-0.3, 0.1, 1.0, 0),
+    'loud': (0.1, 0.8, 1.0, 0),
+    'loudly': (0.1, 0.8, 1.0, 1),
+    'lousily': (-0.5, 0.5, 1.0, 1),
+    'lousy': (-0.5, 0.5, 1.0, 0),
+    'lovable': (0.5, 0.5, 1.0, 0),
+    'lovably': (0.5, 0.5, 1.0, 1),
+    'love': (0.5, 0.6, 1.0, 0),
+    'loved': (0.7, 0.8, 1.0, 0),
+    'lovedly': (0.7, 0.8, 1.0, 1),
+    'lovelily': (0.5, 0.75, 1.0, 1),
+    'lovely': (0.5, 0.75, 1.0, 0),
+    'loving': (0.6, 0.95, 1.0, 0),
+    'lovingly': (0.6, 0.95, 1.0, 1),
+    'low': (0.0, 0.3, 1.0, 0),
+    'lowly': (0.0, 0.3, 1.0, 1),
+    'loyal': (0.3333, 0.8333, 1.0, 0),
+    'loyally': (0.3333, 0.8333, 1.0, 1),
+    'luckily': (0.3333, 0.8333, 1.0, 1),
+    'lucky': (0.3333, 0.8333, 1.0, 0),
+    'lush': (0.1, 0.3, 1.0, 0),
+    'lushly': (0.1, 0.3, 1.0, 1),
+    'lyric': (0.25, 0.65, 1.0, 0),
+    'lyricly': (0.25, 0.65, 1.0, 1),
+    'mad': (-0.625, 1.0, 1.0, 0),
+    'madly': (-0.625, 1.0, 1.0, 1),
+    'magic': (0.5, 1.0, 1.0, 0),
+    'magical': (0.5, 1.0, 1.0, 0),
+    'magically': (0.5, 1.0, 1.0, 1),
+    'magicly': (0.5, 1.0, 1.0, 1),
+    'magnificent': (1.0, 1.0, 1.0, 0),
+    'magnificently': (1.0, 1.0, 1.0, 1),
+    'main': (0.1667, 0.3333, 1.0, 0),
+    'mainly': (0.1667, 0.3333, 1.0, 1),
+    'major': (0.0625, 0.5, 1.0, 0),
+    'majorly': (0.0625, 0.5, 1.0, 1),
+    'maladroit': (-0.4667, 0.8, 1.0, 0),
+    'maladroitly': (-0.4667, 0.8, 1.0, 1),
+    'male': (0.0, 0.1, 1.0, 0),
+    'malevolent': (-0.8, 1.0, 1.0, 0),
+    'malevolently': (-0.8, 1.0, 1.0, 1),
+    'maly': (0.0, 0.1, 1.0, 1),
+    'manily': (0.5, 0.5, 1.0, 1),
+    'mannerlily': (0.5, 0.9, 1.0, 1),
+    'mannerly': (0.5, 0.9, 1.0, 0),
+    'manorial': (0.0, 0.1, 1.0, 0),
+    'manorially': (0.0, 0.1, 1.0, 1),
+    'manque': (0.1, 0.4, 1.0, 0),
+    'manquely': (0.1, 0.4, 1.0, 1),
+    'many': (0.5, 0.5, 1.0, 0),
+    'many-sided': (0.0, 0.1, 1.0, 0),
+    'many-sidedly': (0.0, 0.1, 1.0, 1),
+    'marked': (0.1, 0.6, 1.0, 0),
+    'markedly': (0.1, 0.6, 1.0, 1),
+    'married': (0.25, 0.25, 1.0, 0),
+    'marriedly': (0.25, 0.25, 1.0, 1),
+    'martial': (0.0, 0.0, 1.0, 0),
+    'martially': (0.0, 0.0, 1.0, 1),
+    'marvelous': (1.0, 1.0, 1.0, 0),
+    'marvelously': (1.0, 1.0, 1.0, 1),
+    'masculine': (0.1, 0.3, 1.0, 0),
+    'masculinely': (0.1, 0.3, 1.0, 1),
+    'massive': (0.0, 1.0, 1.0, 0),
+    'massively': (0.0, 1.0, 1.0, 1),
+    'masterful': (1.0, 1.0, 1.0, 0),
+    'masterfully': (1.0, 1.0, 1.0, 1),
+    'mathematical': (0.0, 0.0, 1.0, 0),
+    'mathematically': (0.0, 0.0, 1.0, 1),
+    'mature': (0.1, 0.1, 1.0, 0),
+    'maturely': (0.1, 0.1, 1.0, 1),
+    'meager': (-0.6, 1.0, 1.0, 0),
+    'meagerly': (-0.6, 1.0, 1.0, 1),
+    'mean': (-0.3125, 0.6875, 1.0, 0),
+    'meaningful': (0.5, 0.5, 1.0, 0),
+    'meaningfully': (0.5, 0.5, 1.0, 1),
+    'meaningless': (-0.5, 1.0, 1.0, 0),
+    'meaninglessly': (-0.5, 1.0, 1.0, 1),
+    'meanly': (-0.3125, 0.6875, 1.0, 1),
+    'measlily': (-0.5667, 0.8667, 1.0, 1),
+    'measly': (-0.5667, 0.8667, 1.0, 0),
+    'medical': (0.0, 0.0, 1.0, 0),
+    'medically': (0.0, 0.0, 1.0, 1),
+    'medicative': (0.1, 0.1, 1.0, 0),
+    'medicatively': (0.1, 0.1, 1.0, 1),
+    'medieval': (0.0, 0.0, 1.0, 0),
+    'medievally': (0.0, 0.0, 1.0, 1),
+    'mediocre': (-0.5, 1.0, 1.0, 0),
+    'mediocrely': (-0.5, 1.0, 1.0, 1),
+    'mediocrity': (-0.2, 0.2, 1.0, 0),
+    'melodrama': (-0.3, 0.2, 1.0, 0),
+    'memorable': (0.5, 1.0, 1.0, 0),
+    'memorably': (0.5, 1.0, 1.0, 1),
+    'menacing': (-1.0, 1.0, 1.0, 0),
+    'menacingly': (-1.0, 1.0, 1.0, 1),
+    'mental': (-0.1, 0.2, 1.0, 0),
+    'mentally': (-0.1, 0.2, 1.0, 1),
+    'merciless': (-0.7, 1.0, 1.0, 0),
+    'mercilessly': (-0.7, 1.0, 1.0, 1),
+    'mere': (-0.5, 0.5, 1.0, 0),
+    'merely': (-0.5, 0.5, 1.0, 1),
+    'mesmerizing': (0.3, 0.7, 1.0, 0),
+    'mess': (-0.175, 0.175, 1.0, 0),
+    'messily': (-0.2, 0.4, 1.0, 1),
+    'messy': (-0.2, 0.4, 1.0, 0),
+    'metaphorical': (0.0, 0.2, 1.0, 0),
+    'metaphorically': (0.0, 0.2, 1.0, 1),
+    'mexican': (0.0, 0.0, 1.0, 0),
+    'mexicanly': (0.0, 0.0, 1.0, 1),
+    'mid': (0.0, 0.0, 1.0, 0),
+    'middle': (0.0, 0.0, 1.0, 0),
+    'middly': (0.0, 0.0, 1.0, 1),
+    'midly': (0.0, 0.0, 1.0, 1),
+    'mightily': (0.4, 0.9, 1.0, 1),
+    'mighty': (0.4, 0.9, 1.0, 0),
+    'mild': (0.3333, 0.5, 1.0, 0),
+    'mildly': (0.3333, 0.5, 1.0, 1),
+    'militarily': (-0.1, 0.1, 1.0, 1),
+    'military': (-0.1, 0.1, 1.0, 0),
+    'mind-boggling': (0.5, 1.0, 1.0, 0),
+    'mind-bogglingly': (0.5, 1.0, 1.0, 1),
+    'mindless': (-0.2, 0.9, 1.0, 0),
+    'mindlessly': (-0.2, 0.9, 1.0, 1),
+    'minimal': (-0.1, 0.6, 1.0, 0),
+    'minimally': (-0.1, 0.6, 1.0, 1),
+    'minor': (-0.05, 0.2, 1.0, 0),
+    'minorly': (-0.05, 0.2, 1.0, 1),
+    'minus': (-0.1, 0.1, 1.0, 0),
+    'minusly': (-0.1, 0.1, 1.0, 1),
+    'miserable': (-1.0, 1.0, 1.0, 0),
+    'miserably': (-1.0, 1.0, 1.0, 1),
+    'misfire': (-0.2, 0.2, 1.0, 0),
+    'misplaced': (-0.2, 0.2, 1.0, 0),
+    'misplacedly': (-0.2, 0.2, 1.0, 1),
+    'missing': (-0.2, 0.05, 1.0, 0),
+    'missingly': (-0.2, 0.05, 1.0, 1),
+    'mixed': (0.0, 0.25, 1.0, 0),
+    'mixedly': (0.0, 0.25, 1.0, 1),
+    'mod': (0.2, 0.4, 1.0, 0),
+    'moderate': (0.0, 0.7, 1.0, 0),
+    'moderately': (0.0, 0.7, 1.0, 1),
+    'modern': (0.2, 0.3, 1.0, 0),
+    'modernly': (0.2, 0.3, 1.0, 1),
+    'modest': (0.1, 0.9, 1.0, 0),
+    'modestly': (0.1, 0.9, 1.0, 1),
+    'modly': (0.2, 0.4, 1.0, 1),
+    'monkey': (-0.05, 0.0, 1.0, 0),
+    'monosyllabic': (-0.1, 0.0, 1.0, 0),
+    'monosyllabicly': (-0.1, 0.0, 1.0, 1),
+    'moral': (0.0, 0.25, 1.0, 0),
+    'moralizing': (-0.3, 0.4, 1.0, 0),
+    'morally': (0.0, 0.25, 1.0, 1),
+    'more': (0.5, 0.5, 1.0, 0),
+    'morely': (0.5, 0.5, 1.0, 1),
+    'moron': (-0.8, 1.0, 1.0, 0),
+    'morons': (-0.8, 1.0, 1.0, 0),
+    'most': (0.5, 0.5, 1.0, 0),
+    'mostly': (0.5, 0.5, 1.0, 1),
+    'motivated': (0.5, 0.7, 1.0, 0),
+    'motleily': (0.6, 0.9, 1.0, 1),
+    'motley': (0.6, 0.9, 1.0, 0),
+    'mouth-watering': (0.7, 0.95, 1.0, 0),
+    'mouth-wateringly': (0.7, 0.95, 1.0, 1),
+    'much': (0.2, 0.2, 1.0, 1),
+    'muggily': (-0.6, 0.8, 1.0, 1),
+    'muggy': (-0.6, 0.8, 1.0, 0),
+    'multilateral': (0.1, 0.2, 1.0, 0),
+    'multilaterally': (0.1, 0.2, 1.0, 1),
+    'multiple': (0.0, 0.0, 1.0, 0),
+    'multiply': (0.0, 0.0, 1.0, 1),
+    'mundane': (-0.1667, 0.1667, 1.0, 0),
+    'mundanely': (-0.1667, 0.1667, 1.0, 1),
+    'musical': (0.0, 0.0, 1.0, 0),
+    'musically': (0.0, 0.0, 1.0, 1),
+    'muzak': (-0.05, 0.0, 1.0, 0),
+    'mysterious': (0.0, 1.0, 1.0, 0),
+    'mysteriously': (0.0, 1.0, 1.0, 1),
+    'naive': (-0.3, 1.0, 1.0, 0),
+    'naively': (-0.3, 1.0, 1.0, 1),
+    'naked': (0.0, 0.4, 1.0, 0),
+    'nakedly': (0.0, 0.4, 1.0, 1),
+    'nameless': (-0.5, 0.9, 1.0, 0),
+    'namelessly': (-0.5, 0.9, 1.0, 1),
+    'narrow': (-0.2, 0.4, 1.0, 0),
+    'narrowly': (-0.2, 0.4, 1.0, 1),
+    'nastily': (-1.0, 1.0, 1.0, 1),
+    'nasty': (-1.0, 1.0, 1.0, 0),
+    'natural': (0.1, 0.4, 1.0, 0),
+    'naturalistic': (0.4, 0.6, 1.0, 0),
+    'naturalisticly': (0.4, 0.6, 1.0, 1),
+    'naturally': (0.1, 0.4, 1.0, 1),
+    'naughtily': (-0.15, 0.9, 1.0, 1),
+    'naughty': (-0.15, 0.9, 1.0, 0),
+    'nauseated': (-0.4, 0.6, 1.0, 0),
+    'nauseatedly': (-0.4, 0.6, 1.0, 1),
+    'near': (0.1, 0.4, 1.0, 0),
+    'nearly': (0.1, 0.4, 1.0, 1),
+    'necessarily': (0.0, 1.0, 1.0, 1),
+    'necessary': (0.0, 1.0, 1.0, 0),
+    'needless': (-0.5, 1.0, 1.0, 0),
+    'needlessly': (-0.5, 1.0, 1.0, 1),
+    'negative': (-0.3, 0.4, 1.0, 0),
+    'negatively': (-0.3, 0.4, 1.0, 1),
+    'nerve-racking': (-0.4, 1.0, 1.0, 0),
+    'nerve-rackingly': (-0.4, 1.0, 1.0, 1),
+    'nervous': (-0.3, 0.8, 1.0, 0),
+    'net': (0.0, 0.0, 1.0, 0),
+    'netly': (0.0, 0.0, 1.0, 1),
+    'new': (0.1364, 0.4545, 1.0, 0),
+    'newly': (0.1364, 0.4545, 1.0, 1),
+    'next': (0.0, 0.0, 1.0, 0),
+    'nextly': (0.0, 0.0, 1.0, 1),
+    'nice': (0.6, 1.0, 1.0, 0),
+    'nicely': (0.6, 1.0, 1.0, 1),
+    'noble': (0.6, 0.9, 1.0, 0),
+    'nobly': (0.6, 0.9, 1.0, 1),
+    'nonviolent': (0.4, 0.6, 1.0, 0),
+    'nonviolently': (0.4, 0.6, 1.0, 1),
+    'normal': (0.15, 0.65, 1.0, 0),
+    'normally': (0.15, 0.65, 1.0, 1),
+    'norwegian': (0.0, 0.0, 1.0, 0),
+    'norwegianly': (0.0, 0.0, 1.0, 1),
+    'nostalgic': (-0.5, 1.0, 1.0, 0),
+    'nostalgicly': (-0.5, 1.0, 1.0, 1),
+    'notable': (0.5, 0.5, 1.0, 0),
+    'notably': (0.5, 0.5, 1.0, 1),
+    'numb': (-0.6, 1.0, 1.0, 0),
+    'numbly': (-0.6, 1.0, 1.0, 1),
+    'numerous': (0.0, 0.5, 1.0, 0),
+    'numerously': (0.0, 0.5, 1.0, 1),
+    'obedient': (0.4, 0.9, 1.0, 0),
+    'obediently': (0.4, 0.9, 1.0, 1),
+    'objective': (0.0, 0.1, 1.0, 0),
+    'objectively': (0.0, 0.1, 1.0, 1),
+    'obsessed': (-0.5, 1.0, 1.0, 0),
+    'obsessedly': (-0.5, 1.0, 1.0, 1),
+    'obstacles': (-0.05, 0.0, 1.0, 0),
+    'obvious': (0.0, 0.5, 1.0, 0),
+    'obviously': (0.0, 0.5, 1.0, 1),
+    'occasional': (0.0, 0.125, 1.0, 0),
+    'occasionally': (0.0, 0.125, 1.0, 1),
+    'odd': (-0.1667, 0.25, 1.0, 0),
+    'oddly': (-0.1667, 0.25, 1.0, 1),
+    'offbeat': (-0.5, 0.5, 1.0, 0),
+    'offbeatly': (-0.5, 0.5, 1.0, 1),
+    'offers': (0.1, 0.0, 1.0, 0),
+    'ok': (0.5, 0.5, 1.0, 0),
+    'okaily': (0.5, 0.5, 1.0, 1),
+    'okay': (0.5, 0.5, 1.0, 0),
+    'okly': (0.5, 0.5, 1.0, 1),
+    'old': (0.1, 0.2, 1.0, 0),
+    'older': (0.1667, 0.3333, 1.0, 0),
+    'olderly': (0.1667, 0.3333, 1.0, 1),
+    'oldly': (0.1, 0.2, 1.0, 1),
+    'onlily': (0.0, 1.0, 1.0, 1),
+    'only': (0.0, 1.0, 1.0, 0),
+    'oozes': (-0.2, 0.2, 1.0, 0),
+    'open': (0.0, 0.5, 1.0, 0),
+    'open-minded': (0.4, 0.7, 1.0, 0),
+    'open-mindedly': (0.4, 0.7, 1.0, 1),
+    'openly': (0.0, 0.5, 1.0, 1),
+    'opposite': (0.0, 0.0, 1.0, 0),
+    'oppositely': (0.0, 0.0, 1.0, 1),
+    'optimum': (0.7, 0.9, 1.0, 0),
+    'optimumly': (0.7, 0.9, 1.0, 1),
+    'ordinarily': (-0.25, 0.5, 1.0, 1),
+    'ordinary': (-0.25, 0.5, 1.0, 0),
+    'original': (0.375, 0.75, 1.0, 0),
+    'originally': (0.375, 0.75, 1.0, 1),
+    'orthodox': (-0.2, 0.6, 1.0, 0),
+    'orthodoxly': (-0.2, 0.6, 1.0, 1),
+    'other': (-0.125, 0.375, 1.0, 0),
+    'otherly': (-0.125, 0.375, 1.0, 1),
+    'outdated': (-0.4, 0.6333, 1.0, 0),
+    'outdatedly': (-0.4, 0.6333, 1.0, 1),
+    'outraged': (-0.9, 1.0, 1.0, 0),
+    'outrageous': (-1.0, 1.0, 1.0, 0),
+    'outrageously': (-1.0, 1.0, 1.0, 1),
+    'outside': (0.0, 0.05, 1.0, 0),
+    'outsidely': (0.0, 0.05, 1.0, 1),
+    'outstanding': (0.5, 0.875, 1.0, 0),
+    'outstandingly': (0.5, 0.875, 1.0, 1),
+    'over-the-top': (-0.5, 1.0, 1.0, 0),
+    'over-the-toply': (-0.5, 1.0, 1.0, 1),
+    'overall': (0.0, 0.0, 1.0, 0),
+    'overallly': (0.0, 0.0, 1.0, 1),
+    'overboard': (-0.25, 0.15, 1.0, 1),
+    'overexcited': (-0.4, 0.9, 1.0, 0),
+    'overexcitedly': (-0.4, 0.9, 1.0, 1),
+    'overwhelmed': (-0.6, 0.9, 1.0, 0),
+    'overwhelming': (0.5, 1.0, 1.0, 0),
+    'overwhelmingly': (0.5, 1.0, 1.0, 1),
+    'own': (0.6, 1.0, 1.0, 0),
+    'ownly': (0.6, 1.0, 1.0, 1),
+    'painful': (-0.7, 0.9, 1.0, 0),
+    'painfully': (-0.7, 0.9, 1.0, 1),
+    'pale': (-0.21, 0.18, 1.0, 0),
+    'palpable': (0.0, 0.5, 1.0, 0),
+    'palpably': (0.0, 0.5, 1.0, 1),
+    'paly': (-0.12, 0.16, 1.0, 1),
+    'panic': (-0.6, 0.9, 1.0, 0),
+    'parade': (-0.25, 0.2333, 1.0, 0),
+    'parallel': (0.0, 0.0, 1.0, 0),
+    'parallelly': (0.0, 0.0, 1.0, 1),
+    'partial': (-0.1, 0.3, 1.0, 0),
+    'partially': (-0.1, 0.3, 1.0, 1),
+    'particular': (0.1667, 0.3333, 1.0, 0),
+    'particularly': (0.1667, 0.3333, 1.0, 1),
+    'passionate': (-0.05, 0.85, 1.0, 0),
+    'passionately': (-0.05, 0.85, 1.0, 1),
+    'past': (-0.25, 0.25, 1.0, 0),
+    'pastly': (-0.25, 0.25, 1.0, 1),
+    'pathetic': (-1.0, 1.0, 1.0, 0),
+    'patheticly': (-1.0, 1.0, 1.0, 1),
+    'peaceful': (0.25, 0.5, 1.0, 0),
+    'peacefully': (0.25, 0.5, 1.0, 1),
+    'peakily': (0.1, 0.4, 1.0, 1),
+    'peaky': (0.1, 0.4, 1.0, 0),
+    'peevish': (-0.4, 0.6, 1.0, 0),
+    'peevishly': (-0.4, 0.6, 1.0, 1),
+    'pepperily': (-0.1, 0.5, 1.0, 1),
+    'peppery': (-0.1, 0.5, 1.0, 0),
+    'perfect': (1.0, 1.0, 1.0, 0),
+    'perfectly': (1.0, 1.0, 1.0, 1),
+    'perpetually': (-0.05, 0.2, 1.0, 1),
+    'perplexed': (0.4, 0.9, 1.0, 0),
+    'perplexedly': (0.4, 0.9, 1.0, 1),
+    'personal': (0.0, 0.3, 1.0, 0),
+    'personally': (0.0, 0.3, 1.0, 1),
+    'phantasmagoric': (0.0, 0.1, 1.0, 0),
+    'phantasmagoricly': (0.0, 0.1, 1.0, 1),
+    'phenomenal': (0.5, 0.5, 1.0, 0),
+    'phenomenally': (0.5, 0.5, 1.0, 1),
+    'philosophic': (0.2, 0.3, 1.0, 0),
+    'philosophical': (0.0, 0.0, 1.0, 0),
+    'philosophically': (0.0, 0.0, 1.0, 1),
+    'philosophicly': (0.2, 0.3, 1.0, 1),
+    'physical': (0.0, 0.1429, 1.0, 0),
+    'physically': (0.0, 0.1429, 1.0, 1),
+    'pinheads': (-0.3, 0.5, 1.0, 0),
+    'pink': (-0.1, 0.3, 1.0, 0),
+    'pinkly': (-0.1, 0.3, 1.0, 1),
+    'pious': (0.0, 0.3, 1.0, 0),
+    'piously': (0.0, 0.3, 1.0, 1),
+    'pity': (-0.1, 0.2, 1.0, 0),
+    'pivotal': (0.5, 0.8, 1.0, 0),
+    'pivotally': (0.5, 0.8, 1.0, 1),
+    'placid': (-0.3, 0.7, 1.0, 0),
+    'placidly': (-0.3, 0.7, 1.0, 1),
+    'plain': (-0.2143, 0.3571, 1.0, 0),
+    'plainly': (-0.2143, 0.3571, 1.0, 1),
+    'platitudes': (-0.2, 0.2, 1.0, 0),
+    'plausible': (0.5, 0.5, 1.0, 0),
+    'plausibly': (0.5, 0.5, 1.0, 1),
+    'pleasant': (0.7333, 0.9667, 1.0, 0),
+    'pleasantly': (0.7333, 0.9667, 1.0, 1),
+    'pleased': (0.5, 1.0, 1.0, 0),
+    'pleasedly': (0.5, 1.0, 1.0, 1),
+    'pleonastic': (-0.5, 0.9, 1.0, 0),
+    'pleonasticly': (-0.5, 0.9, 1.0, 1),
+    'plod': (-0.2, 0.2, 1.0, 0),
+    'plodding': (-0.3, 0.6, 1.0, 0),
+    'poetic': (0.375, 0.75, 1.0, 0),
+    'poeticly': (0.375, 0.75, 1.0, 1),
+    'poignant': (0.0, 0.5, 1.0, 0),
+    'poignantly': (0.0, 0.5, 1.0, 1),
+    'pointless': (-0.25, 0.5, 1.0, 0),
+    'pointlessly': (-0.25, 0.5, 1.0, 1),
+    'polar': (-0.0833, 0.25, 1.0, 0),
+    'polarly': (-0.0833, 0.25, 1.0, 1),
+    'political': (0.0, 0.1, 1.0, 0),
+    'politically': (0.0, 0.1, 1.0, 1),
+    'poor': (-0.4, 0.6, 1.0, 0),
+    'poorly': (-0.4, 0.6, 1.0, 1),
+    'popular': (0.6, 0.9, 1.0, 0),
+    'popularly': (0.6, 0.9, 1.0, 1),
+    'positive': (0.2273, 0.5455, 1.0, 0),
+    'positively': (0.2273, 0.5455, 1.0, 1),
+    'possible': (0.0, 1.0, 1.0, 0),
+    'possibly': (0.0, 1.0, 1.0, 1),
+    'potent': (0.5, 0.5, 1.0, 0),
+    'potential': (0.0, 1.0, 1.0, 0),
+    'potentially': (0.0, 1.0, 1.0, 1),
+    'potently': (0.5, 0.5, 1.0, 1),
+    'powerful': (0.3, 1.0, 1.0, 0),
+    'powerfully': (0.3, 1.0, 1.0, 1),
+    'powerless': (-0.5, 0.9, 1.0, 0),
+    'powerlessly': (-0.5, 0.9, 1.0, 1),
+    'preachily': (-0.2, 0.3, 1.0, 1),
+    'preachy': (-0.2, 0.3, 1.0, 0),
+    'precious': (0.5, 1.0, 1.0, 0),
+    'preciously': (0.5, 1.0, 1.0, 1),
+    'precise': (0.4, 0.8, 1.0, 0),
+    'precisely': (0.4, 0.8, 1.0, 1),
+    'predictable': (-0.2, 0.5, 1.0, 0),
+    'predictably': (-0.2, 0.5, 1.0, 1),
+    'pregnant': (0.3333, 0.5, 1.0, 0),
+    'pregnantly': (0.3333, 0.5, 1.0, 1),
+    'present': (0.0, 0.0, 1.0, 0),
+    'presently': (0.0, 0.0, 1.0, 1),
+    'pretentious': (-0.3, 0.7, 1.0, 0),
+    'pretentiously': (-0.3, 0.7, 1.0, 1),
+    'prettily': (0.25, 1.0, 1.0, 1),
+    'pretty': (0.25, 1.0, 1.0, 0),
+    'previous': (-0.1667, 0.1667, 1.0, 0),
+    'previously': (-0.1667, 0.1667, 1.0, 1),
+    'priceless': (1.0, 1.0, 1.0, 0),
+    'pricelessly': (1.0, 1.0, 1.0, 1),
+    'primarily': (0.4, 0.5, 1.0, 1),
+    'primary': (0.4, 0.5, 1.0, 0),
+    'prior': (0.0, 0.0, 1.0, 0),
+    'priorly': (0.0, 0.0, 1.0, 1),
+    'prissy': (-0.3, 0.4, 1.0, 0),
+    'private': (0.0, 0.375, 1.0, 0),
+    'privately': (0.0, 0.375, 1.0, 1),
+    'productive': (0.4, 0.5, 1.0, 0),
+    'professional': (0.1, 0.1, 1.0, 0),
+    'professionally': (0.1, 0.1, 1.0, 1),
+    'profitering': (-0.3, 0.2, 1.0, 0),
+    'profound': (0.0833, 1.0, 1.0, 0),
+    'profoundly': (0.0833, 1.0, 1.0, 1),
+    'prolix': (-0.6, 0.9, 1.0, 0),
+    'prolixly': (-0.6, 0.9, 1.0, 1),
+    'prominent': (0.5, 1.0, 1.0, 0),
+    'prominently': (0.5, 1.0, 1.0, 1),
+    'promising': (0.2, 0.5, 1.0, 0),
+    'promisingly': (0.2, 0.5, 1.0, 1),
+    'propaganda': (-0.1, 0.1, 1.0, 0),
+    'proper': (0.0, 0.1, 1.0, 0),
+    'properly': (0.0, 0.1, 1.0, 1),
+    'proud': (0.8, 1.0, 1.0, 0),
+    'proudly': (0.8, 1.0, 1.0, 1),
+    'proves': (0.3, 0.0, 1.0, 0),
+    'psychological': (0.0, 0.1, 1.0, 0),
+    'psychologically': (0.0, 0.1, 1.0, 1),
+    'psychotic': (-0.5, 1.0, 1.0, 0),
+    'psychoticly': (-0.5, 1.0, 1.0, 1),
+    'public': (0.0, 0.0667, 1.0, 0),
+    'publicly': (0.0, 0.0667, 1.0, 1),
+    'pure': (0.2143, 0.5, 1.0, 0),
+    'purely': (0.2143, 0.5, 1.0, 1),
+    'putative': (-0.0667, 0.4, 1.0, 0),
+    'putatively': (-0.0667, 0.4, 1.0, 1),
+    'questionable': (-0.5, 1.0, 1.0, 0),
+    'questionably': (-0.5, 1.0, 1.0, 1),
+    'quick': (0.3333, 0.5, 1.0, 0),
+    'quickly': (0.3333, 0.5, 1.0, 1),
+    'quiet': (0.0, 0.3333, 1.0, 0),
+    'quietly': (0.0, 0.3333, 1.0, 1),
+    'quirkily': (0.0, 1.0, 1.0, 1),
+    'quirky': (0.0, 1.0, 1.0, 0),
+    'quixotic': (0.2, 0.5, 1.0, 0),
+    'quixoticly': (0.2, 0.5, 1.0, 1),
+    'rancorous': (-0.8, 1.0, 1.0, 0),
+    'rancorously': (-0.8, 1.0, 1.0, 1),
+    'random': (-0.5, 0.5, 1.0, 0),
+    'randomly': (-0.5, 0.5, 1.0, 1),
+    'rank': (-0.8, 0.9, 1.0, 0),
+    'rankly': (-0.8, 0.9, 1.0, 1),
+    'rare': (0.3, 0.9, 1.0, 0),
+    'rarely': (0.3, 0.9, 1.0, 1),
+    'raucous': (-0.3, 0.6, 1.0, 0),
+    'raucously': (-0.3, 0.6, 1.0, 1),
+    'raunchily': (-0.5, 1.0, 1.0, 1),
+    'raunchy': (-0.5, 1.0, 1.0, 0),
+    'raw': (-0.2308, 0.4615, 1.0, 0),
+    'rawly': (-0.2308, 0.4615, 1.0, 1),
+    'readily': (0.2, 0.5, 1.0, 1),
+    'ready': (0.2, 0.5, 1.0, 0),
+    'real': (0.2, 0.3, 1.5, 1),
+    'realistic': (0.1667, 0.3333, 1.0, 0),
+    'realisticly': (0.1667, 0.3333, 1.0, 1),
+    'really': (0.2, 0.2, 1.0, 1),
+    'reasonable': (0.2, 0.6, 1.0, 0),
+    'reasonably': (0.2, 0.6, 1.0, 1),
+    'recent': (0.0, 0.25, 1.0, 0),
+    'recently': (0.0, 0.25, 1.0, 1),
+    'recognizable': (0.25, 0.25, 1.0, 0),
+    'recognizably': (0.25, 0.25, 1.0, 1),
+    'red': (0.0, 0.0, 1.0, 0),
+    'redeeming': (0.5, 0.5, 1.0, 0),
+    'redeemingly': (0.5, 0.5, 1.0, 1),
+    'redly': (0.0, 0.0, 1.0, 1),
+    'redoubtable': (0.6, 0.9, 1.0, 0),
+    'redoubtably': (0.6, 0.9, 1.0, 1),
+    'redundant': (-0.2, 0.2, 1.0, 0),
+    'redundantly': (-0.2, 0.2, 1.0, 1),
+    'refreshed': (0.5, 0.7, 1.0, 0),
+    'refreshing': (0.5, 1.0, 1.0, 0),
+    'refreshingly': (0.5, 1.0, 1.0, 1),
+    'regrets': (-0.1, 0.2, 1.0, 0),
+    'regular': (0.0, 0.0769, 1.0, 0),
+    'regularly': (0.0, 0.0769, 1.0, 1),
+    'regurgitates': (-0.3, 0.3, 1.0, 0),
+    'rehash': (-0.05, 0.0, 1.0, 0),
+    'related': (0.0, 0.4, 1.0, 0),
+    'relatedly': (0.0, 0.4, 1.0, 1),
+    'relative': (0.0, 0.0, 1.0, 0),
+    'relatively': (0.0, 0.0, 1.0, 1),
+    'relaxed': (0.4, 0.7, 1.0, 0),
+    'relevant': (0.4, 0.9, 1.0, 0),
+    'relevantly': (0.4, 0.9, 1.0, 1),
+    'religious': (0.0, 0.25, 1.0, 0),
+    'religiously': (0.0, 0.25, 1.0, 1),
+    'remarkable': (0.75, 0.75, 1.0, 0),
+    'remarkably': (0.75, 0.75, 1.0, 1),
+    'reminiscent': (0.0, 0.5, 1.0, 0),
+    'reminiscently': (0.0, 0.5, 1.0, 1),
+    'remote': (-0.1, 0.2, 1.0, 0),
+    'remotely': (-0.1, 0.2, 1.0, 1),
+    'repellent': (-0.9, 1.0, 1.0, 0),
+    'repellently': (-0.9, 1.0, 1.0, 1),
+    'repetitive': (-0.25, 0.25, 1.0, 0),
+    'repetitively': (-0.25, 0.25, 1.0, 1),
+    'reputable': (0.5, 0.8, 1.0, 0),
+    'reputably': (0.5, 0.8, 1.0, 1),
+    'resourceful': (0.6, 0.9, 1.0, 0),
+    'resourcefully': (0.6, 0.9, 1.0, 1),
+    'respectable': (0.5, 0.5, 1.0, 0),
+    'respectably': (0.5, 0.5, 1.0, 1),
+    'respectful': (0.5, 0.7, 1.0, 0),
+    'respectfully': (0.5, 0.7, 1.0, 1),
+    'respective': (0.0, 0.1, 1.0, 0),
+    'respectively': (0.0, 0.1, 1.0, 1),
+    'responsible': (0.2, 0.55, 1.0, 0),
+    'responsibly': (0.2, 0.55, 1.0, 1),
+    'rested': (0.4, 0.6, 1.0, 0),
+    'restless': (-0.3, 0.7, 1.0, 0),
+    'retard': (-0.9, 1.0, 1.0, 0),
+    'retarded': (-0.8, 0.8, 1.0, 0),
+    'retardedly': (-0.8, 0.8, 1.0, 1),
+    'retards': (-0.9, 1.0, 1.0, 0),
+    'rewarding': (0.5, 1.0, 1.0, 0),
+    'rewardingly': (0.5, 1.0, 1.0, 1),
+    'rich': (0.375, 0.75, 1.0, 0),
+    'richly': (0.375, 0.75, 1.0, 1),
+    'ridiculous': (-0.3333, 1.0, 1.0, 0),
+    'ridiculously': (-0.3333, 1.0, 1.0, 1),
+    'right': (0.2857, 0.5357, 1.0, 0),
+    'right-minded': (0.1, 0.4, 1.0, 0),
+    'right-mindedly': (0.1, 0.4, 1.0, 1),
+    'rightist': (-0.2, 0.4, 1.0, 0),
+    'rightistly': (-0.2, 0.4, 1.0, 1),
+    'rightly': (0.2857, 0.5357, 1.0, 1),
+    'rip-off': (-0.4, 0.5, 1.0, 0),
+    'risk-free': (0.4, 0.6, 1.0, 0),
+    'risk-freely': (0.4, 0.6, 1.0, 1),
+    'riveting': (0.5, 1.0, 1.0, 0),
+    'rivetingly': (0.5, 1.0, 1.0, 1),
+    'robotic': (-0.1, 0.2, 1.0, 0),
+    'roboticly': (-0.1, 0.2, 1.0, 1),
+    'rofl': (0.8, 0.9, 1.0, 0),
+    'rohypnol': (-0.1, 0.0, 1.0, 0),
+    'romantic': (0.0, 0.5, 1.0, 0),
+    'romanticly': (0.0, 0.5, 1.0, 1),
+    'rose': (0.6, 0.95, 1.0, 0),
+    'rosely': (0.6, 0.95, 1.0, 1),
+    'rough': (-0.1, 0.4, 1.0, 0),
+    'roughage': (-0.1, 0.0, 1.0, 0),
+    'roughly': (-0.1, 0.4, 1.0, 1),
+    'round': (-0.2, 0.4, 1.0, 0),
+    'roundly': (-0.2, 0.4, 1.0, 1),
+    'rude': (-0.3, 0.6, 1.0, 0),
+    'rudely': (-0.3, 0.6, 1.0, 1),
+    'ruins': (-0.15, 0.2, 1.0, 0),
+    'rural': (0.0, 0.0, 1.0, 0),
+    'rurally': (0.0, 0.0, 1.0, 1),
+    'russian': (0.0, 0.0, 1.0, 0),
+    'russianly': (0.0, 0.0, 1.0, 1),
+    'ruthless': (-1.0, 1.0, 1.0, 0),
+    'ruthlessly': (-1.0, 1.0, 1.0, 1),
+    'sad': (-0.5, 1.0, 1.0, 0),
+    'sadism': (-0.05, 0.0, 1.0, 0),
+    'sadly': (-0.5, 1.0, 1.0, 1),
+    'safe': (0.5, 0.5, 1.0, 0),
+    'safely': (0.5, 0.5, 1.0, 1),
+    'same': (0.0, 0.125, 1.0, 0),
+    'samely': (0.0, 0.125, 1.0, 1),
+    'sarcastic': (0.1, 0.8, 1.0, 0),
+    'sarcasticly': (0.1, 0.8, 1.0, 1),
+    'satisfied': (0.5, 1.0, 1.0, 0),
+    'satisfiedly': (0.5, 1.0, 1.0, 1),
+    'satisfying': (0.5, 1.0, 1.0, 0),
+    'satisfyingly': (0.5, 1.0, 1.0, 1),
+    'satisyfing': (0.6, 0.4, 1.0, 0),
+    'satisyfingly': (0.6, 0.4, 1.0, 1),
+    'scared': (-0.5, 0.9, 1.0, 0),
+    'scareily': (-0.5, 1.0, 1.0, 1),
+    'scarey': (-0.5, 1.0, 1.0, 0),
+    'scarily': (-0.5, 1.0, 1.0, 1),
+    'scary': (-0.5, 1.0, 1.0, 0),
+    'scathing': (-0.6, 1.0, 1.0, 0),
+    'scathingly': (-0.6, 1.0, 1.0, 1),
+    'scum': (-0.3, 0.4, 1.0, 0),
+    'seamless': (0.1, 0.1, 1.0, 0),
+    'seamlessly': (0.1, 0.1, 1.0, 1),
+    'seasoned': (0.25, 0.25, 1.0, 0),
+    'seasonedly': (0.25, 0.25, 1.0, 1),
+    'sec': (-0.1, 0.6, 1.0, 0),
+    'secly': (-0.1, 0.6, 1.0, 1),
+    'second': (0.0, 0.0, 1.0, 0),
+    'secondarily': (-0.3, 0.3, 1.0, 1),
+    'secondary': (-0.3, 0.3, 1.0, 0),
+    'secondhand': (-0.1, 0.3, 1.0, 0),
+    'secondhandly': (-0.1, 0.3, 1.0, 1),
+    'secondly': (0.0, 0.0, 1.0, 1),
+    'secret': (-0.4, 0.7, 1.0, 0),
+    'secretly': (-0.4, 0.7, 1.0, 1),
+    'secure': (0.4, 0.6, 1.0, 0),
+    'securely': (0.4, 0.6, 1.0, 1),
+    'seizures': (-0.05, 0.0, 1.0, 0),
+    'self-acting': (0.0, 0.1, 1.0, 0),
+    'self-actingly': (0.0, 0.1, 1.0, 1),
+    'selfish': (-0.5, 1.0, 1.0, 0),
+    'selfishly': (-0.5, 1.0, 1.0, 1),
+    'sensational': (0.6667, 0.6667, 1.0, 0),
+    'sensationally': (0.6667, 0.6667, 1.0, 1),
+    'sensitive': (0.1, 0.9, 1.0, 0),
+    'sensitively': (0.1, 0.9, 1.0, 1),
+    'sentimental': (-0.25, 1.0, 1.0, 0),
+    'sentimentally': (-0.25, 1.0, 1.0, 1),
+    'serious': (-0.3333, 0.6667, 1.0, 0),
+    'seriously': (-0.3333, 0.6667, 1.0, 1),
+    'sermon': (-0.225, 0.3, 1.0, 0),
+    'several': (0.0, 0.0, 1.0, 0),
+    'severally': (0.0, 0.0, 1.0, 1),
+    'sexily': (0.5, 1.0, 1.0, 1),
+    'sexual': (0.5, 0.8333, 1.0, 0),
+    'sexually': (0.5, 0.8333, 1.0, 1),
+    'sexy': (0.5, 1.0, 1.0, 0),
+    'shadily': (-0.25, 0.625, 1.0, 1),
+    'shady': (-0.25, 0.625, 1.0, 0),
+    'shakily': (-0.3333, 0.5, 1.0, 1),
+    'shaky': (-0.3333, 0.5, 1.0, 0),
+    'shallow': (-0.3333, 0.5, 1.0, 0),
+    'shallowly': (-0.3333, 0.5, 1.0, 1),
+    'sham': (-0.2, 0.3, 1.0, 0),
+    'shapeless': (-0.2, 0.3, 1.0, 0),
+    'shapelessly': (-0.2, 0.3, 1.0, 1),
+    'sharp': (-0.125, 0.75, 1.0, 0),
+    'sharply': (-0.125, 0.75, 1.0, 1),
+    'sheer': (0.0, 0.75, 1.0, 0),
+    'sheerly': (0.0, 0.75, 1.0, 1),
+    'shily': (-0.5, 0.5, 1.0, 1),
+    'shit': (-0.2, 0.8, 1.0, 0),
+    'shocked': (-0.7, 0.8, 1.0, 0),
+    'shockedly': (-0.7, 0.8, 1.0, 1),
+    'shocking': (-1.0, 1.0, 1.0, 0),
+    'shockingly': (-1.0, 1.0, 1.0, 1),
+    'shoddily': (-0.3, 0.5, 1.0, 1),
+    'shoddy': (-0.3, 0.5, 1.0, 0),
+    'short': (0.0, 0.3, 1.0, 0),
+    'shortly': (0.0, 0.3, 1.0, 1),
+    "shouldn't": (-0.1, 0.3, 1.0, 0),
+    'showerily': (-0.2, 0.4, 1.0, 1),
+    'showery': (-0.2, 0.4, 1.0, 0),
+    'shriekily': (-0.4, 0.4, 1.0, 1),
+    'shrieky': (-0.4, 0.4, 1.0, 0),
+    'shrill': (-0.4, 0.6, 1.0, 0),
+    'shrillly': (-0.4, 0.6, 1.0, 1),
+    'shy': (-0.5, 0.5, 1.0, 0),
+    'sick': (-0.7143, 0.8571, 1.0, 0),
+    'sickening': (-0.9, 1.0, 1.0, 0),
+    'sickeningly': (-0.9, 1.0, 1.0, 1),
+    'sickly': (-0.7143, 0.8571, 1.0, 1),
+    'significant': (0.375, 0.875, 1.0, 0),
+    'significantly': (0.375, 0.875, 1.0, 1),
+    'silent': (0.0, 0.1, 1.0, 0),
+    'silently': (0.0, 0.1, 1.0, 1),
+    'sillily': (-0.5, 0.875, 1.0, 1),
+    'silly': (-0.5, 0.875, 1.0, 0),
+    'similar': (0.0, 0.4, 1.0, 0),
+    'similarly': (0.0, 0.4, 1.0, 1),
+    'simple': (0.0, 0.3571, 1.0, 0),
+    'simplistic': (-0.5, 0.5, 1.0, 0),
+    'simplisticly': (-0.5, 0.5, 1.0, 1),
+    'simply': (0.0, 0.3571, 1.0, 1),
+    'sincere': (0.5, 0.5, 1.0, 0),
+    'sincerely': (0.5, 0.5, 1.0, 1),
+    'single': (-0.0714, 0.2143, 1.0, 0),
+    'singly': (-0.0714, 0.2143, 1.0, 1),
+    'sinister': (-0.5, 1.0, 1.0, 0),
+    'sinisterly': (-0.5, 1.0, 1.0, 1),
+    'sinks': (-0.1, 0.0, 1.0, 0),
+    'sixth-grade': (-0.05, 0.0, 1.0, 0),
+    'sixth-gradely': (-0.05, 0.0, 1.0, 1),
+    'skeptical': (-0.5, 0.5, 1.0, 0),
+    'skeptically': (-0.5, 0.5, 1.0, 1),
+    'skilled': (0.5, 0.5, 1.0, 0),
+    'skilledly': (0.5, 0.5, 1.0, 1),
+    'skittish': (0.7, 0.8, 1.0, 0),
+    'skittishly': (0.7, 0.8, 1.0, 1),
+    'sleepy': (-0.2, 0.6, 1.0, 0),
+    'slick': (-0.25, 0.375, 1.0, 0),
+    'slickly': (-0.25, 0.375, 1.0, 1),
+    'slight': (-0.1667, 0.1667, 1.0, 0),
+    'slightly': (-0.1667, 0.1667, 1.0, 1),
+    'slipping': (-0.1, 0.1, 1.0, 0),
+    'slippingly': (-0.1, 0.1, 1.0, 1),
+    'sloppily': (-0.4167, 0.75, 1.0, 1),
+    'sloppy': (-0.4167, 0.75, 1.0, 0),
+    'slow': (-0.3, 0.4, 1.0, 0),
+    'slowly': (-0.3, 0.4, 1.0, 1),
+    'small': (-0.25, 0.4, 1.0, 0),
+    'smaller': (0.0, 0.5, 1.0, 0),
+    'smallerly': (0.0, 0.5, 1.0, 1),
+    'smallly': (-0.25, 0.4, 1.0, 1),
+    'smart': (0.2143, 0.6429, 1.0, 0),
+    'smartly': (0.2143, 0.6429, 1.0, 1),
+    'smile': (0.3, 0.1, 1.0, 0),
+    'smiled': (0.6, 0.2, 1.0, 0),
+    'smooth': (0.4, 0.5, 1.0, 0),
+    'smoothly': (0.4, 0.5, 1.0, 1),
+    'sober': (0.1, 0.2, 1.0, 0),
+    'soberly': (0.1, 0.2, 1.0, 1),
+    'social': (0.0333, 0.0667, 1.0, 0),
+    'socially': (0.0333, 0.0667, 1.0, 1),
+    'soft': (0.1, 0.35, 1.0, 0),
+    'soft-boiled': (-0.1, 1.0, 1.0, 0),
+    'soft-boiledly': (-0.1, 1.0, 1.0, 1),
+    'softly': (0.1, 0.35, 1.0, 1),
+    'sole': (0.0, 0.25, 1.0, 0),
+    'solicitous': (0.3, 0.85, 1.0, 0),
+    'solicitously': (0.3, 0.85, 1.0, 1),
+    'solid': (0.0, 0.1, 1.0, 0),
+    'solidly': (0.0, 0.1, 1.0, 1),
+    'soly': (0.0, 0.25, 1.0, 1),
+    'sophisticated': (0.5, 1.0, 1.0, 0),
+    'sophisticatedly': (0.5, 1.0, 1.0, 1),
+    'sophomoric': (-0.2, 0.4, 1.0, 0),
+    'sophomoricly': (-0.2, 0.4, 1.0, 1),
+    'sorrily': (-0.5, 1.0, 1.0, 1),
+    'sorry': (-0.5, 1.0, 1.0, 0),
+    'sound': (0.4, 0.4, 1.0, 0),
+    'soundly': (0.4, 0.4, 1.0, 1),
+    'sour': (-0.15, 0.1, 1.0, 0),
+    'soured': (-0.3, 0.1, 1.0, 0),
+    'souredly': (-0.3, 0.1, 1.0, 1),
+    'sourly': (-0.2, 0.2, 1.0, 1),
+    'southern': (0.0, 0.0, 1.0, 0),
+    'southernly': (0.0, 0.0, 1.0, 1),
+    'spanish': (0.0, 0.0, 1.0, 0),
+    'spanishly': (0.0, 0.0, 1.0, 1),
+    'special': (0.3571, 0.5714, 1.0, 0),
+    'specially': (0.3571, 0.5714, 1.0, 1),
+    'specific': (0.0, 0.125, 1.0, 0),
+    'specificly': (0.0, 0.125, 1.0, 1),
+    'spectacular': (0.6, 0.9, 1.0, 0),
+    'spectacularly': (0.6, 0.9, 1.0, 1),
+    'spent': (-0.1, 0.1, 1.0, 0),
+    'spirited': (0.5, 1.0, 1.0, 0),
+    'spiritedly': (0.5, 1.0, 1.0, 1),
+    'spiritual': (0.0, 0.1333, 1.0, 0),
+    'spiritually': (0.0, 0.1333, 1.0, 1),
+    'splendid': (0.8333, 1.0, 1.0, 0),
+    'splendidly': (0.8333, 1.0, 1.0, 1),
+    'spontaneous': (0.6, 0.9, 1.0, 0),
+    'spontaneously': (0.6, 0.9, 1.0, 1),
+    'spoof': (-0.1, 0.2, 1.0, 0),
+    'sprightlily': (0.4, 0.7, 1.0, 1),
+    'sprightly': (0.4, 0.7, 1.0, 0),
+    'stabbing': (-0.6, 0.8, 1.0, 0),
+    'stabbingly': (-0.6, 0.8, 1.0, 1),
+    'stainless': (0.2, 0.2, 1.0, 0),
+    'stainlessly': (0.2, 0.2, 1.0, 1),
+    'stale': (-0.5, 0.5, 1.0, 0),
+    'staly': (-0.5, 0.5, 1.0, 1),
+    'standard': (0.0, 0.0, 1.0, 0),
+    'standardly': (0.0, 0.0, 1.0, 1),
+    'stark': (-0.2, 0.6, 1.0, 0),
+    'starkly': (-0.2, 0.6, 1.0, 1),
+    'starting': (0.0, 0.1, 1.0, 0),
+    'startingly': (0.0, 0.1, 1.0, 1),
+    'startling': (-0.5, 0.5, 1.0, 0),
+    'startlingly': (-0.5, 0.5, 1.0, 1),
+    'state-supported': (0.1, 0.2, 1.0, 0),
+    'state-supportedly': (0.1, 0.2, 1.0, 1),
+    'static': (0.5, 0.9, 1.0, 0),
+    'staticly': (0.5, 0.9, 1.0, 1),
+    'steadfast': (0.4, 0.8, 1.0, 0),
+    'steadfastly': (0.4, 0.8, 1.0, 1),
+    'steadily': (0.1667, 0.5, 1.0, 1),
+    'steady': (0.1667, 0.5, 1.0, 0),
+    'stellar': (0.25, 0.25, 1.0, 0),
+    'stellarly': (0.25, 0.25, 1.0, 1),
+    'stereotyped': (-0.1, 0.9, 1.0, 0),
+    'stereotypedly': (-0.1, 0.9, 1.0, 1),
+    'stereotypical': (-0.5, 1.0, 1.0, 0),
+    'stereotypically': (-0.5, 1.0, 1.0, 1),
+    'stiff': (-0.2143, 0.5, 1.0, 0),
+    'stiffly': (-0.2143, 0.5, 1.0, 1),
+    'stinker': (-0.5, 0.6, 1.0, 0),
+    'stinks': (-0.6, 0.5, 1.0, 0),
+    'straight': (0.2, 0.4, 1.0, 0),
+    'straightforward': (0.375, 0.375, 1.0, 0),
+    'straightforwardly': (0.375, 0.375, 1.0, 1),
+    'straightly': (0.2, 0.4, 1.0, 1),
+    'strange': (-0.05, 0.15, 1.0, 0),
+    'strangely': (-0.05, 0.15, 1.0, 1),
+    'stress': (-0.4, 0.6, 1.0, 0),
+    'stressed': (-0.5, 0.8, 1.0, 0),
+    'stressful': (-0.5, 0.8, 1.0, 0),
+    'stretched': (-0.05, 0.0, 1.0, 0),
+    'stretchedly': (-0.05, 0.0, 1.0, 1),
+    'striking': (0.5, 1.0, 1.0, 0),
+    'strikingly': (0.5, 1.0, 1.0, 1),
+    'strong': (0.4333, 0.7333, 1.0, 0),
+    'strongly': (0.4333, 0.7333, 1.0, 1),
+    'strutting': (-0.3, 0.4, 1.0, 0),
+    'stumble': (-0.05, 0.1, 1.0, 0),
+    'stunning': (0.5, 1.0, 1.0, 0),
+    'stunningly': (0.5, 1.0, 1.0, 1),
+    'stupid': (-0.8, 1.0, 1.0, 0),
+    'stupidity': (-0.6, 1.0, 1.0, 0),
+    'stupidly': (-0.8, 1.0, 1.0, 1),
+    'stylish': (0.5, 1.0, 1.0, 0),
+    'stylishly': (0.5, 1.0, 1.0, 1),
+    'subconscious': (0.0, 0.55, 1.0, 0),
+    'subconsciously': (0.0, 0.55, 1.0, 1),
+    'subject': (-0.1667, 0.3333, 1.0, 0),
+    'subjectly': (-0.1667, 0.3333, 1.0, 1),
+    'subnormal': (-0.6, 0.9, 1.0, 0),
+    'subnormally': (-0.6, 0.9, 1.0, 1),
+    'subsequent': (0.0, 0.05, 1.0, 0),
+    'subsequently': (0.0, 0.05, 1.0, 1),
+    'subtle': (-0.3333, 0.5, 1.0, 0),
+    'subtly': (-0.3333, 0.5, 1.0, 1),
+    'suburban': (0.0, 0.0, 1.0, 0),
+    'suburbanly': (0.0, 0.0, 1.0, 1),
+    'succeeds': (0.7, 0.1, 1.0, 0),
+    'success': (0.3, 0.0, 1.0, 0),
+    'successful': (0.75, 0.95, 1.0, 0),
+    'successfully': (0.75, 0.95, 1.0, 1),
+    'such': (0.0, 0.5, 1.0, 0),
+    'suchly': (0.0, 0.5, 1.0, 1),
+    'sucker': (-0.3, 0.8, 1.0, 0),
+    'suckers': (-0.3, 0.8, 1.0, 0),
+    'sucks': (-0.3, 0.3, 1.0, 0),
+    'sudden': (0.0, 0.5, 1.0, 0),
+    'suddenly': (0.0, 0.5, 1.0, 1),
+    'suffers': (-0.6, 0.7, 1.0, 0),
+    'suffocating': (-0.5, 0.5, 1.0, 0),
+    'suitable': (0.55, 0.75, 1.0, 0),
+    'suitably': (0.55, 0.75, 1.0, 1),
+    'super': (0.3333, 0.6667, 1.0, 0),
+    'superb': (1.0, 1.0, 1.0, 0),
+    'superbly': (1.0, 1.0, 1.0, 1),
+    'superfine': (0.4, 0.9, 1.0, 0),
+    'superfinely': (0.4, 0.9, 1.0, 1),
+    'superior': (0.7, 0.9, 1.0, 0),
+    'superiorly': (0.7, 0.9, 1.0, 1),
+    'superly': (0.3333, 0.6667, 1.0, 1),
+    'supernatural': (0.1667, 0.5667, 1.0, 0),
+    'supernaturally': (0.1667, 0.5667, 1.0, 1),
+    'supporting': (0.25, 0.25, 1.0, 0),
+    'supportingly': (0.25, 0.25, 1.0, 1),
+    'supportive': (0.5, 1.0, 1.0, 0),
+    'supportively': (0.5, 1.0, 1.0, 1),
+    'sure': (0.5, 0.8889, 1.0, 0),
+    'surely': (0.5, 0.8889, 1.0, 1),
+    'surprised': (0.1, 0.9, 1.0, 0),
+    'surprisedly': (0.1, 0.9, 1.0, 1),
+    'surprising': (0.7, 0.5, 1.0, 0),
+    'surprisingly': (0.7, 0.5, 1.0, 1),
+    'surreal': (0.25, 1.0, 1.0, 0),
+    'surreally': (0.25, 1.0, 1.0, 1),
+    'suspenseful': (0.0, 1.0, 1.0, 0),
+    'suspensefully': (0.0, 1.0, 1.0, 1),
+    'sweet': (0.35, 0.65, 1.0, 0),
+    'sweetly': (0.35, 0.65, 1.0, 1),
+    'swill': (-0.1, 0.2, 1.0, 0),
+    'sympathetic': (0.5, 1.0, 1.0, 0),
+    'sympatheticly': (0.5, 1.0, 1.0, 1),
+    'talented': (0.7, 0.9, 1.0, 0),
+    'talentedly': (0.7, 0.9, 1.0, 1),
+    'tame': (-0.2167, 0.2167, 1.0, 0),
+    'tamely': (-0.2333, 0.2333, 1.0, 1),
+    'tasteless': (-0.6, 0.9, 1.0, 0),
+    'tastelessly': (-0.6, 0.9, 1.0, 1),
+    'technical': (0.0, 0.1, 1.0, 0),
+    'technically': (0.0, 0.1, 1.0, 1),
+    'tedious': (-0.5, 1.0, 1.0, 0),
+    'tediously': (-0.5, 1.0, 1.0, 1),
+    'teen': (0.0, 0.0, 1.0, 0),
+    'teenage': (0.0, 0.0, 1.0, 0),
+    'teenagely': (0.0, 0.0, 1.0, 1),
+    'teenly': (0.0, 0.0, 1.0, 1),
+    'ten': (0.0, 0.0, 1.0, 0),
+    'tenly': (0.0, 0.0, 1.0, 1),
+    'tense': (-0.3333, 0.5, 1.0, 0),
+    'tensely': (-0.3333, 0.5, 1.0, 1),
+    'terminally': (-0.4, 0.5, 1.0, 1),
+    'terrestrial': (0.0, 0.1, 1.0, 0),
+    'terrestrially': (0.0, 0.1, 1.0, 1),
+    'terrible': (-1.0, 1.0, 1.0, 0),
+    'terribly': (-1.0, 1.0, 1.0, 1),
+    'terrific': (0.0, 1.0, 1.0, 0),
+    'terrificly': (0.0, 1.0, 1.0, 1),
+    'terrifying': (-1.0, 1.0, 1.0, 0),
+    'terrifyingly': (-1.0, 1.0, 1.0, 1),
+    'thankful': (0.6, 0.8, 1.0, 0),
+    'thanks': (0.2, 0.2, 1.0, 0),
+    'theatrical': (0.0, 0.0, 1.0, 0),
+    'theatrically': (0.0, 0.0, 1.0, 1),
+    'thematic': (0.0, 0.0, 1.0, 0),
+    'thematicly': (0.0, 0.0, 1.0, 1),
+    'theoretical': (0.0, 0.1, 1.0, 0),
+    'theoretically': (0.0, 0.1, 1.0, 1),
+    'thick': (-0.3, 0.475, 1.0, 0),
+    'thickly': (-0.3, 0.475, 1.0, 1),
+    'thin': (-0.4, 0.85, 1.0, 0),
+    'thinly': (-0.4, 0.85, 1.0, 1),
+    'third': (0.0, 0.0, 1.0, 0),
+    'thirdly': (0.0, 0.0, 1.0, 1),
+    'thought-provoking': (0.4, 0.3, 1.0, 0),
+    'thought-provokingly': (0.4, 0.3, 1.0, 1),
+    'thoughtful': (0.4, 0.5, 1.0, 0),
+    'thoughtfully': (0.4, 0.5, 1.0, 1),
+    'thrilled': (0.6, 0.7, 1.0, 0),
+    'thrilledly': (0.6, 0.7, 1.0, 1),
+    'thrilling': (0.25, 1.0, 1.0, 0),
+    'thrillingly': (0.25, 1.0, 1.0, 1),
+    'tidily': (0.6, 0.8, 1.0, 1),
+    'tidy': (0.6, 0.8, 1.0, 0),
+    'tight': (-0.1786, 0.2857, 1.0, 0),
+    'tightly': (-0.1786, 0.2857, 1.0, 1),
+    'tinily': (0.0, 0.5, 1.0, 1),
+    'tiny': (0.0, 0.5, 1.0, 0),
+    'tired': (-0.4, 0.7, 1.0, 0),
+    'tiredly': (-0.4, 0.7, 1.0, 1),
+    'tiresome': (-0.5, 1.0, 1.0, 0),
+    'tiresomely': (-0.5, 1.0, 1.0, 1),
+    'titular': (0.1, 0.1, 1.0, 0),
+    'titularly': (0.1, 0.1, 1.0, 1),
+    'toilet': (-0.0333, 0.0, 1.0, 0),
+    'toneless': (-0.1, 0.2, 1.0, 0),
+    'tonelessly': (-0.1, 0.2, 1.0, 1),
+    'top': (0.5, 0.5, 1.0, 0),
+    'top-notch': (1.0, 1.0, 1.0, 0),
+    'top-notchly': (1.0, 1.0, 1.0, 1),
+    'topical': (0.0, 0.05, 1.0, 0),
+    'topically': (0.0, 0.05, 1.0, 1),
+    'toply': (0.5, 0.5, 1.0, 1),
+    'total': (0.0, 0.75, 1.0, 0),
+    'totally': (0.0, 0.75, 1.0, 1),
+    'touching': (0.5, 0.5, 1.0, 0),
+    'tough': (-0.3889, 0.8333, 1.0, 0),
+    'toughly': (-0.3889, 0.8333, 1.0, 1),
+    'traditional': (0.0, 0.75, 1.0, 0),
+    'traditionally': (0.0, 0.75, 1.0, 1),
+    'tragic': (-0.75, 0.75, 1.0, 0),
+    'tragicly': (-0.75, 0.75, 1.0, 1),
+    'trapped': (-0.2, 0.0, 1.0, 0),
+    'tremendous': (0.3333, 1.0, 1.0, 0),
+    'tremendously': (0.3333, 1.0, 1.0, 1),
+    'trendily': (0.6, 0.9, 1.0, 1),
+    'trendy': (0.6, 0.9, 1.0, 0),
+    'tries': (-0.1, 0.4, 1.0, 0),
+    'trouble': (-0.2, 0.2, 1.0, 0),
+    'troubled': (-0.5, 1.0, 1.0, 0),
+    'troubledly': (-0.5, 1.0, 1.0, 1),
+    'true': (0.35, 0.65, 1.0, 0),
+    'truely': (0.35, 0.65, 1.0, 1),
+    'truthful': (0.5, 0.5, 1.0, 0),
+    'truthfully': (0.5, 0.5, 1.0, 1),
+    'twisted': (-0.5, 1.0, 1.0, 0),
+    'twistedly': (-0.5, 1.0, 1.0, 1),
+    'two-dimensional': (-0.1, 0.1, 1.0, 0),
+    'two-dimensionally': (-0.1, 0.1, 1.0, 1),
+    'typical': (-0.1667, 0.5, 1.0, 0),
+    'typically': (-0.1667, 0.5, 1.0, 1),
+    'uglily': (-0.7, 1.0, 1.0, 1),
+    'ugliness': (-0.3, 0.4, 1.0, 0),
+    'ugly': (-0.7, 1.0, 1.0, 0),
+    'ugly-duckling': (-0.1, 0.2, 1.0, 0),
+    'ultimate': (0.0, 1.0, 1.0, 0),
+    'ultimately': (0.0, 1.0, 1.0, 1),
+    'unable': (-0.5, 0.5, 1.0, 0),
+    'unably': (-0.5, 0.5, 1.0, 1),
+    'unadulterated': (0.4, 0.7, 1.0, 0),
+    'unadulteratedly': (0.4, 0.7, 1.0, 1),
+    'unaffected': (-0.05, 0.1, 1.0, 0),
+    'unaffectedly': (-0.05, 0.1, 1.0, 1),
+    'unanswered': (-0.1, 0.2, 1.0, 0),
+    'unansweredly': (-0.1, 0.2, 1.0, 1),
+    'unappealing': (-0.4, 0.5, 1.0, 0),
+    'unappealingly': (-0.4, 0.5, 1.0, 1),
+    'unappetizing': (-0.8, 1.0, 1.0, 0),
+    'unappetizingly': (-0.8, 1.0, 1.0, 1),
+    'unashamed': (-0.5, 0.9, 1.0, 0),
+    'unashamedly': (-0.5, 0.9, 1.0, 1),
+    'unavowed': (0.0, 0.4, 1.0, 0),
+    'unavowedly': (0.0, 0.4, 1.0, 1),
+    'unaware': (0.0, 0.5, 1.0, 0),
+    'unawarely': (0.0, 0.5, 1.0, 1),
+    'unbefitting': (-0.6, 0.9, 1.0, 0),
+    'unbefittingly': (-0.6, 0.9, 1.0, 1),
+    'unbelievable': (-0.25, 1.0, 1.0, 0),
+    'unbelievably': (-0.25, 1.0, 1.0, 1),
+    'unblemished': (0.1, 0.5, 1.0, 0),
+    'unblemishedly': (0.1, 0.5, 1.0, 1),
+    'unblinking': (0.3, 0.8, 1.0, 0),
+    'unblinkingly': (0.3, 0.8, 1.0, 1),
+    'unbranded': (-0.1, 0.4, 1.0, 0),
+    'unbrandedly': (-0.1, 0.4, 1.0, 1),
+    'uncared-for': (-0.2, 0.8, 1.0, 0),
+    'uncared-forly': (-0.2, 0.8, 1.0, 1),
+    'unchaste': (-0.7, 0.9, 1.0, 0),
+    'unchastely': (-0.7, 0.9, 1.0, 1),
+    'uncivil': (-0.7333, 0.9333, 1.0, 0),
+    'uncivilly': (-0.7333, 0.9333, 1.0, 1),
+    'uncomfortable': (-0.5, 1.0, 1.0, 0),
+    'uncomfortably': (-0.5, 1.0, 1.0, 1),
+    'uncommon': (0.8, 1.0, 1.0, 0),
+    'uncommonly': (0.8, 1.0, 1.0, 1),
+    'uncontroversial': (0.3, 0.8, 1.0, 0),
+    'uncontroversially': (0.3, 0.8, 1.0, 1),
+    'uncooked': (-0.1, 0.1, 1.0, 0),
+    'uncookedly': (-0.1, 0.1, 1.0, 1),
+    'uncritical': (0.0, 0.7, 1.0, 0),
+    'uncritically': (0.0, 0.7, 1.0, 1),
+    'uncut': (-0.5, 0.8, 1.0, 0),
+    'uncutly': (-0.5, 0.8, 1.0, 1),
+    'undeserved': (-0.3, 0.3, 1.0, 0),
+    'undeservedly': (-0.3, 0.3, 1.0, 1),
+    'undignified': (-0.6, 0.9, 1.0, 0),
+    'undignifiedly': (-0.6, 0.9, 1.0, 1),
+    'unengaging': (-0.2, 0.2, 1.0, 0),
+    'uneven': (-0.2, 0.2, 1.0, 0),
+    'unevenly': (-0.2, 0.2, 1.0, 1),
+    'unexcelled': (0.5, 0.9, 1.0, 0),
+    'unexcelledly': (0.5, 0.9, 1.0, 1),
+    'unexpected': (0.1, 1.0, 1.0, 0),
+    'unexpectedly': (0.1, 1.0, 1.0, 1),
+    'unexplained': (-0.05, 0.0, 1.0, 0),
+    'unexplainedly': (-0.05, 0.0, 1.0, 1),
+    'unfair': (-0.5, 1.0, 1.0, 0),
+    'unfairly': (-0.5, 1.0, 1.0, 1),
+    'unfaithful': (-0.6, 0.9, 1.0, 0),
+    'unfaithfully': (-0.6, 0.9, 1.0, 1),
+    'unfocused': (-0.4, 0.8, 1.0, 0),
+    'unfocusedly': (-0.4, 0.8, 1.0, 1),
+    'unforgettable': (0.8, 1.0, 1.0, 0),
+    'unforgettably': (0.8, 1.0, 1.0, 1),
+    'unfortunate': (-0.5, 1.0, 1.0, 0),
+    'unfortunately': (-0.5, 1.0, 1.0, 1),
+    'unfruitful': (-0.6, 0.9, 1.0, 0),
+    'unfruitfully': (-0.6, 0.9, 1.0, 1),
+    'ungraded': (-0.4, 0.9, 1.0, 0),
+    'ungradedly': (-0.4, 0.9, 1.0, 1),
+    'unhampered': (0.6, 0.9, 1.0, 0),
+    'unhamperedly': (0.6, 0.9, 1.0, 1),
+    'unhappily': (-0.6, 0.9, 1.0, 1),
+    'unhappy': (-0.6, 0.9, 1.0, 0),
+    'unhealthily': (-0.4, 0.7, 1.0, 1),
+    'unhealthy': (-0.4, 0.7, 1.0, 0),
+    'unhesitating': (0.1, 0.6, 1.0, 0),
+    'unhesitatingly': (0.1, 0.6, 1.0, 1),
+    'unilateral': (-0.5, 0.7, 1.0, 0),
+    'unilaterally': (-0.5, 0.7, 1.0, 1),
+    'unimportant': (-0.4, 0.95, 1.0, 0),
+    'unimportantly': (-0.4, 0.95, 1.0, 1),
+    'uninspired': (-0.5, 1.0, 1.0, 0),
+    'uninspiredly': (-0.5, 1.0, 1.0, 1),
+    'unintelligent': (-0.65, 0.95, 1.0, 0),
+    'unintelligently': (-0.65, 0.95, 1.0, 1),
+    'uninterrupted': (0.0, 0.0, 1.0, 0),
+    'uninterruptedly': (0.0, 0.0, 1.0, 1),
+    'unique': (0.375, 1.0, 1.0, 0),
+    'uniquely': (0.375, 1.0, 1.0, 1),
+    'universal': (0.0, 0.0, 1.0, 0),
+    'universally': (0.0, 0.0, 1.0, 1),
+    'unknown': (-0.1, 0.6, 1.0, 0),
+    'unknownly': (-0.1, 0.6, 1.0, 1),
+    'unlikelily': (-0.5, 0.5, 1.0, 1),
+    'unlikely': (-0.5, 0.5, 1.0, 0),
+    'unnecessarily': (-0.4, 0.9, 1.0, 1),
+    'unnecessary': (-0.4, 0.9, 1.0, 0),
+    'unnoticed': (-0.2, 0.6, 1.0, 0),
+    'unnoticedly': (-0.2, 0.6, 1.0, 1),
+    'unoriginal': (-0.2, 0.1, 1.0, 0),
+    'unoriginally': (-0.2, 0.1, 1.0, 1),
+    'unpaid': (0.2, 0.4, 1.0, 0),
+    'unpaidly': (0.2, 0.4, 1.0, 1),
+    'unplayable': (-0.4, 0.7, 1.0, 0),
+    'unplayably': (-0.4, 0.7, 1.0, 1),
+    'unpleasant': (-0.65, 0.95, 1.0, 0),
+    'unpleasantly': (-0.65, 0.95, 1.0, 1),
+    'unprecedented': (0.6, 0.9, 1.0, 0),
+    'unprecedentedly': (0.6, 0.9, 1.0, 1),
+    'unpredictable': (-0.1667, 1.0, 1.0, 0),
+    'unpredictably': (-0.1667, 1.0, 1.0, 1),
+    'unprocessed': (-0.1, 0.1, 1.0, 0),
+    'unprocessedly': (-0.1, 0.1, 1.0, 1),
+    'unpropitious': (-0.6, 0.9, 1.0, 0),
+    'unpropitiously': (-0.6, 0.9, 1.0, 1),
+    'unread': (0.1, 0.4, 1.0, 0),
+    'unreadly': (0.1, 0.4, 1.0, 1),
+    'unrealistic': (-0.5, 1.0, 1.0, 0),
+    'unrealisticly': (-0.5, 1.0, 1.0, 1),
+    'unsalted': (0.4, 1.0, 1.0, 0),
+    'unsaltedly': (0.4, 1.0, 1.0, 1),
+    'unschooled': (-0.2, 0.4, 1.0, 0),
+    'unschooledly': (-0.2, 0.4, 1.0, 1),
+    'unsettling': (-0.5, 0.7, 1.0, 0),
+    'unsettlingly': (-0.5, 0.7, 1.0, 1),
+    'unstirred': (-0.4, 0.5, 1.0, 0),
+    'unstirredly': (-0.4, 0.5, 1.0, 1),
+    'unthinkable': (-0.05, 0.8, 1.0, 0),
+    'unthinkably': (-0.05, 0.8, 1.0, 1),
+    'untraceable': (-0.3, 0.7, 1.0, 0),
+    'untraceably': (-0.3, 0.7, 1.0, 1),
+    'unusual': (0.2, 1.0, 1.0, 0),
+    'unusually': (0.2, 1.0, 1.0, 1),
+    'unwed': (0.0, 0.1, 1.0, 0),
+    'unwedly': (0.0, 0.1, 1.0, 1),
+    'upper': (0.0, 0.0, 1.0, 0),
+    'upperly': (0.0, 0.0, 1.0, 1),
+    'upset': (-0.5, 0.8, 1.0, 0),
+    'urban': (0.0, 0.0, 1.0, 0),
+    'urbanly': (0.0, 0.0, 1.0, 1),
+    'urinates': (-0.1, 0.0, 1.0, 0),
+    'used to': (-0.1, 0.7, 1.0, 0),
+    'used toly': (-0.1, 0.7, 1.0, 1),
+    'useful': (0.3, 0.0, 1.0, 0),
+    'usefully': (0.3, 0.0, 1.0, 1),
+    'useless': (-0.5, 0.2, 1.0, 0),
+    'uselessly': (-0.5, 0.2, 1.0, 1),
+    'usual': (-0.25, 0.25, 1.0, 0),
+    'usually': (-0.25, 0.25, 1.0, 1),
+    'utter': (0.0, 1.0, 1.0, 0),
+    'utterly': (0.0, 1.0, 1.0, 1),
+    'vacuum': (-0.0083, 0.0, 1.0, 0),
+    'vague': (-0.5, 0.5, 1.0, 0),
+    'vaguely': (-0.5, 0.5, 1.0, 1),
+    'vapid': (-0.3, 0.3, 1.0, 0),
+    'vapidly': (-0.3, 0.3, 1.0, 1),
+    'vaporific': (0.0, 0.0, 1.0, 0),
+    'vaporificly': (0.0, 0.0, 1.0, 1),
+    'various': (0.0, 0.5, 1.0, 0),
+    'variously': (0.0, 0.5, 1.0, 1),
+    'vast': (0.0, 1.0, 1.0, 0),
+    'vastly': (0.0, 1.0, 1.0, 1),
+    'very': (0.2, 0.3, 1.3, 1),
+    'veteran': (0.0, 0.0, 1.0, 0),
+    'veteranly': (0.0, 0.0, 1.0, 1),
+    'vibrant': (0.1667, 0.3333, 1.0, 0),
+    'vibrantly': (0.1667, 0.3333, 1.0, 1),
+    'vicious': (-1.0, 1.0, 1.0, 0),
+    'viciously': (-1.0, 1.0, 1.0, 1),
+    'victim': (-0.075, 0.05, 1.0, 0),
+    'violent': (-0.8, 1.0, 1.0, 0),
+    'violently': (-0.8, 1.0, 1.0, 1),
+    'visual': (0.0, 0.0, 1.0, 0),
+    'visually': (0.0, 0.0, 1.0, 1),
+    'vital': (0.1, 0.4, 1.0, 0),
+    'vitally': (0.1, 0.4, 1.0, 1),
+    'vivid': (0.125, 0.75, 1.0, 0),
+    'vividly': (0.125, 0.75, 1.0, 1),
+    'vocational': (0.3, 0.4, 1.0, 0),
+    'vocationally': (0.3, 0.4, 1.0, 1),
+    'vulgar': (-0.7, 0.8, 1.0, 0),
+    'vulgarly': (-0.7, 0.8, 1.0, 1),
+    'vulnerable': (-0.5, 0.5, 1.0, 0),
+    'vulnerably': (-0.5, 0.5, 1.0, 1),
+    'wackily': (0.5, 1.0, 1.0, 1),
+    'wacky': (0.5, 1.0, 1.0, 0),
+    'wan': (-0.2, 0.15, 1.0, 0),
+    'wanly': (-0.2, 0.2, 1.0, 1),
+    'wants': (0.2, 0.1, 1.0, 0),
+    'warily': (-0.5, 0.7, 1.0, 1),
+    'warm': (0.6, 0.6, 1.0, 0),
+    'warmly': (0.6, 0.6, 1.0, 1),
+    'wary': (-0.5, 0.7, 1.0, 0),
+    'waste': (-0.2, 0.0, 1.0, 0),
+    'wasted': (-0.2, 0.0, 1.0, 0),
+    'wastes': (-0.2, 0.0, 1.0, 0),
+    'weak': (-0.375, 0.625, 1.0, 0),
+    'weakly': (-0.375, 0.625, 1.0, 1),
+    'wealthily': (0.5, 1.0, 1.0, 1),
+    'wealthy': (0.5, 1.0, 1.0, 0),
+    'weird': (-0.5, 1.0, 1.0, 0),
+    'weirdly': (-0.5, 1.0, 1.0, 1),
+    'welcome': (0.8, 0.9, 1.0, 0),
+    'welcomely': (0.8, 0.9, 1.0, 1),
+    'well-advised': (0.6, 0.8, 1.0, 0),
+    'well-advisedly': (0.6, 0.8, 1.0, 1),
+    'well-intentioned': (-0.05, 0.2, 1.0, 0),
+    'well-intentionedly': (-0.05, 0.2, 1.0, 1),
+    'well-off': (0.4, 0.6, 1.0, 0),
+    'well-offly': (0.4, 0.6, 1.0, 1),
+    'western': (0.0, 0.0, 1.0, 0),
+    'westernly': (0.0, 0.0, 1.0, 1),
+    'wet': (-0.1, 0.4, 1.0, 0),
+    'wetly': (-0.1, 0.4, 1.0, 1),
+    'whaddupwitdat': (-0.1, 0.3, 1.0, 0),
+    'whimsical': (-0.5, 0.5, 1.0, 0),
+    'whimsically': (-0.5, 0.5, 1.0, 1),
+    'white': (0.0, 0.0, 1.0, 0),
+    'whitely': (0.0, 0.0, 1.0, 1),
+    'whole': (0.2, 0.4, 1.0, 0),
+    'wholy': (0.2, 0.4, 1.0, 1),
+    'wide': (-0.1, 0.4, 1.0, 0),
+    'widely': (-0.1, 0.4, 1.0, 1),
+    'wild': (0.1, 0.4, 1.0, 0),
+    'wildly': (0.1, 0.4, 1.0, 1),
+    'willing': (0.25, 0.75, 1.0, 0),
+    'willingly': (0.25, 0.75, 1.0, 1),
+    'win': (0.8, 0.4, 1.0, 0),
+    'winning': (0.5, 0.75, 1.0, 0),
+    'winningly': (0.5, 0.75, 1.0, 1),
+    'wins': (0.3, 0.2, 1.0, 0),
+    'wise': (0.7, 0.9, 1.0, 0),
+    'wisely': (0.7, 0.9, 1.0, 1),
+    'wittily': (0.5, 1.0, 1.0, 1),
+    'witty': (0.5, 1.0, 1.0, 0),
+    'womanlily': (0.0, 0.6, 1.0, 1),
+    'womanly': (0.0, 0.6, 1.0, 0),
+    "won't": (-0.1, 0.2, 1.0, 0),
+    'wonderful': (1.0, 1.0, 1.0, 0),
+    'wonderfully': (1.0, 1.0, 1.0, 1),
+    'wonkily': (-0.3, 0.3, 1.0, 1),
+    'wonky': (-0.3, 0.3, 1.0, 0),
+    'wooden': (0.0, 0.0, 1.0, 0),
+    'woodenly': (0.0, 0.0, 1.0, 1),
+    'workmanlike': (0.5, 0.7, 1.0, 0),
+    'workmanlikely': (0.5, 0.7, 1.0, 1),
+    'worried': (-0.4, 0.8, 1.0, 0),
+    'worse': (-0.4, 0.6, 1.0, 0),
+    'worsely': (-0.4, 0.6, 1.0, 1),
+    'worst': (-1.0, 1.0, 1.0, 0),
+    'worstly': (-1.0, 1.0, 1.0, 1),
+    'worth': (0.3, 0.1, 1.0, 0),
+    'worthily': (0.3333, 1.0, 1.0, 1),
+    'worthless': (-0.8, 0.9, 1.0, 0),
+    'worthlessly': (-0.8, 0.9, 1.0, 1),
+    'worthly': (0.3, 0.1, 1.0, 1),
+    'worthwhile': (0.5, 0.5, 1.0, 0),
+    'worthwhily': (0.5, 0.5, 1.0, 1),
+    'worthy': (0.3333, 1.0, 1.0, 0),
+    'wow': (0.1, 1.0, 1.0, 0),
+    'wrong': (-0.5, 0.9, 1.0, 0),
+    'wrongly': (-0.5, 0.9, 1.0, 1),
+    'wtf': (-0.5, 1.0, 1.0, 0),
+    'yaaawwnnnn': (-0.5, 1.0, 1.0, 0),
+    'yarn': (-0.1, 0.2, 1.0, 0),
+    'yellow': (0.0, 0.0, 1.0, 0),
+    'yellowly': (0.0, 0.0, 1.0, 1),
+    'young': (0.1, 0.4, 1.0, 0),
+    'younger': (0.0, 0.0, 1.0, 0),
+    'youngerly': (0.0, 0.0, 1.0, 1),
+    'youngish': (0.4, 0.8, 1.0, 0),
+    'youngishly': (0.4, 0.8, 1.0, 1),
+    'youngly': (0.1, 0.4, 1.0, 1),
+}
+
+# emoticon -> polarity
+EMOTICONS = {
+    '*)': 0.25,
+    '*-)': 0.25,
+    '8)': 0.5,
+    '8-)': 0.5,
+    '8-d': 1.0,
+    ":'''(": -1.0,
+    ":'(": -1.0,
+    ':(': -0.75,
+    ':)': 0.5,
+    ':-(': -0.75,
+    ':-)': 0.5,
+    ':-.': -0.25,
+    ':-/': -0.25,
+    ':-<': -0.75,
+    ':-[': -0.75,
+    ':-b': 0.75,
+    ':-c': -0.75,
+    ':-d': 1.0,
+    ':-o': 0.05,
+    ':-p': 0.75,
+    ':-s': -0.25,
+    ':/': -0.25,
+    ':3': 0.5,
+    ':>': 0.5,
+    ':[': -0.75,
+    ':\\': -0.25,
+    ':]': 0.5,
+    ':^)': 0.75,
+    ':b': 0.75,
+    ':c': -0.75,
+    ':c)': 0.75,
+    ':d': 1.0,
+    ':o': 0.05,
+    ':o)': 0.75,
+    ':p': 0.75,
+    ':s': -0.25,
+    ':{': -0.75,
+    ':}': 0.5,
+    ";'(": -1.0,
+    ';)': 0.25,
+    ';-)': 0.25,
+    ';-]': 0.25,
+    ';]': 0.25,
+    ';^)': 0.25,
+    ';d': 0.25,
+    '<3': 1.0,
+    '=(': -0.75,
+    '=)': 0.5,
+    '=-d': 1.0,
+    '=/': -0.75,
+    '=]': 0.5,
+    '=d': 1.0,
+    '>.>': -0.25,
+    '>:)': 0.5,
+    '>:/': -0.25,
+    '>:[': -0.75,
+    '>:\\': -0.25,
+    '>:d': 1.0,
+    '>:o': 0.05,
+    '>:p': 0.75,
+    '>;]': 0.25,
+    'o.o': 0.05,
+    'o_o': 0.05,
+    'x-d': 1.0,
+    'xd': 1.0,
+    '°o°': 0.05,
+    '♥': 1.0,
+}
@@ -0,0 +1,210 @@
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import closing, contextmanager
+from datetime import datetime, timedelta
+from mysql.connector import Error
+from background import PeriodicTask
+from cache import TTLCache
+from db import get_db_connection
+
+# Session configuration
+SESSION_BACKEND = os.getenv('SESSION_BACKEND', 'mysql')  # 'mysql' or 'sqlite'
+SESSION_TTL = int(os.getenv('SESSION_TTL', 86400))  # 24 hours, matches the cookie max_age
+SESSION_CACHE_SIZE = int(os.getenv('SESSION_CACHE_SIZE', 10000))
+SESSION_CACHE_TTL = int(os.getenv('SESSION_CACHE_TTL', 60))  # bounds how long a logout in another worker can go unseen
+SESSION_SWEEP_INTERVAL = int(os.getenv('SESSION_SWEEP_INTERVAL', 900))
+SESSION_SQLITE_PATH = os.getenv('SESSION_SQLITE_PATH', 'sessions.sqlite3')
+
+SWEEP_BATCH_SIZE = 1000
+
+class MySQLSessionBackend:
+    """Sessions persisted in the MySQL `sessions` table"""
+
+    def save(self, token, session):
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO sessions (id, user_id, created_at, expires_at) VALUES (%s, %s, %s, %s)",
+            (token, session['user_id'], session['created_at'], session['expires_at'])
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+
+    def load(self, token):
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(
+            """SELECT s.user_id, u.username, s.created_at, s.expires_at
+               FROM sessions s JOIN users u ON u.id = s.user_id
+               WHERE s.id = %s AND s.expires_at > %s""",
+            (token, datetime.now())
+        )
+        session = cursor.fetchone()
+        cursor.close()
+        conn.close()
+        return session
+
+    def delete(self, token):
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM sessions WHERE id = %s", (token,))
+        conn.commit()
+        cursor.close()
+        conn.close()
+
+    def delete_expired(self):
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        removed = 0
+        while True:
+            # Small batches keep row locks short on a busy table
+            cursor.execute(
+                "DELETE FROM sessions WHERE expires_at <= %s LIMIT %s",
+                (datetime.now(), SWEEP_BATCH_SIZE)
+            )
+            conn.commit()
+            removed += cursor.rowcount
+            if cursor.rowcount < SWEEP_BATCH_SIZE:
+                break
+        cursor.close()
+        conn.close()
+        return removed
+
+class SQLiteSessionBackend:
+    """Local file-backed stand-in for development and tests"""
+
+    def __init__(self, path=SESSION_SQLITE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS sessions (
+                       id TEXT PRIMARY KEY,
+                       user_id INTEGER NOT NULL,
+                       username TEXT,
+                       created_at TEXT NOT NULL,
+                       expires_at TEXT NOT NULL
+                   )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_expires_at ON sessions (expires_at)")
+
+    @contextmanager
+    def _connect(self):
+        # A sqlite3 connection used with 'with' commits or rolls back but stays open, so close it too
+        with closing(sqlite3.connect(self.path, timeout=10)) as conn, conn:
+            yield conn
+
+    def save(self, token, session):
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sessions (id, user_id, username, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (token, session['user_id'], session['username'],
+                 session['created_at'].isoformat(), session['expires_at'].isoformat())
+            )
+
+    def load(self, token):
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT user_id, username, created_at, expires_at FROM sessions WHERE id = ? AND expires_at > ?",
+                (token, datetime.now().isoformat())
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            'user_id': row[0],
+            'username': row[1],
+            'created_at': datetime.fromisoformat(row[2]),
+            'expires_at': datetime.fromisoformat(row[3])
+        }
+
+    def delete(self, token):
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM sessions WHERE id = ?", (token,))
+
+    def delete_expired(self):
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (datetime.now().isoformat(),))
+            return cursor.rowcount
+
+SESSION_BACKENDS = {
+    'mysql': MySQLSessionBackend,
+    'sqlite': SQLiteSessionBackend
+}
+
+class SessionStore:
+    """Expiring session store with a write-through in-process cache"""
+
+    def __init__(self, backend, ttl=SESSION_TTL, cache_size=SESSION_CACHE_SIZE,
+                 cache_ttl=SESSION_CACHE_TTL, sweep_interval=SESSION_SWEEP_INTERVAL):
+        self.backend = backend
+        self.ttl = ttl
+        self.cache_ttl = cache_ttl
+        self.cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self.sweeper = PeriodicTask('session-sweeper', sweep_interval, self.sweep)
+
+    def create(self, user_id, username):
+        """Create a session and return its token"""
+        self.sweeper.start()
+
+        token = str(uuid.uuid4())
+        now = datetime.now()
+        session = {
+            'user_id': user_id,
+            'username': username,
+            'created_at': now,
+            'expires_at': now + timedelta(seconds=self.ttl)
+        }
+        self.backend.save(token, session)
+        self.cache.set(token, session, ttl=min(self.cache_ttl, self.ttl))
+        return token
+
+    def get(self, token):
+        """Return the session for token, or None if unknown or expired"""
+        if not token:
+            return None
+        self.sweeper.start()
+
+        session = self.cache.get(token)
+        if session is None:
+            session = self.backend.load(token)
+            if session is None:
+                return None
+            remaining = (session['expires_at'] - datetime.now()).total_seconds()
+            self.cache.set(token, session, ttl=max(1, min(self.cache_ttl, remaining)))
+        elif session['expires_at'] <= datetime.now():
+            self.cache.pop(token)
+            return None
+
+        return session
+
+    def delete(self, token):
+        """End a session"""
+        self.cache.pop(token)
+        self.backend.delete(token)
+
+    def sweep(self):
+        """Delete expired sessions from the backend"""
+        try:
+            removed = self.backend.delete_expired()
+            if removed:
+                print(f"✓ Swept {removed} expired sessions")
+        except Error as e:
+            print(f"Error sweeping expired sessions: {e}")
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_session_store():
+    """Return the process-wide session store for the configured backend"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                backend_cls = SESSION_BACKENDS.get(SESSION_BACKEND)
+                if backend_cls is None:
+                    raise Exception(f"Unknown SESSION_BACKEND: {SESSION_BACKEND}")
+                _store = SessionStore(backend_cls())
+    return _store
@@ -0,0 +1,98 @@
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+from background import PeriodicTask
+from db import get_db_connection
+
+# Subscription sweeper configuration
+SUBSCRIPTION_SWEEP_INTERVAL = int(os.getenv('SUBSCRIPTION_SWEEP_INTERVAL', 300))  # seconds, 0 = off
+SUBSCRIPTION_SWEEP_BATCH = int(os.getenv('SUBSCRIPTION_SWEEP_BATCH', 1000))
+
+PREMIUM_PERIOD_DAYS = 30  # 30-day subscription
+
+SWEEP_LOCK_NAME = 'mindease_subscription_sweep'
+
+def activate_premium(cursor, user_id, start_date=None):
+    """Put a user on an active premium subscription starting now (caller commits)
+
+    Also bumps cache_version so cached dashboard reads are revalidated.
+    Returns the number of users updated (0 if the user no longer exists).
+    """
+    start_date = start_date or datetime.now()
+    end_date = start_date + timedelta(days=PREMIUM_PERIOD_DAYS)
+
+    cursor.execute(
+        """UPDATE users SET
+           subscription_type = 'premium',
+           subscription_status = 'active',
+           subscription_start_date = %s,
+           subscription_end_date = %s,
+           cache_version = cache_version + 1
+           WHERE id = %s""",
+        (start_date, end_date, user_id)
+    )
+    return cursor.rowcount
+
+def expire_subscriptions(batch_size=SUBSCRIPTION_SWEEP_BATCH, now=None):
+    """Downgrade every premium user whose subscription has ended
+
+    Works through idx_subscription_end_date in bulk UPDATEs of batch_size
+    rows, committing after each so locks stay short. Runs are serialized
+    across processes with a MySQL named lock; returns None if another run
+    holds it, otherwise the number of users expired.
+    """
+    now = now or datetime.now()
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, 0)", (SWEEP_LOCK_NAME,))
+        if cursor.fetchone()[0] != 1:
+            return None
+
+        try:
+            expired = 0
+            while True:
+                cursor.execute(
+                    """UPDATE users SET
+                       subscription_type = 'free',
+                       subscription_status = 'expired',
+                       cache_version = cache_version + 1
+                       WHERE subscription_end_date <= %s AND subscription_type = 'premium'
+                       ORDER BY subscription_end_date
+                       LIMIT %s""",
+                    (now, batch_size)
+                )
+                updated = cursor.rowcount
+                conn.commit()
+                expired += updated
+                if updated < batch_size:
+                    break
+
+            if expired:
+                print(f"✓ Expired {expired} premium subscriptions")
+            return expired
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (SWEEP_LOCK_NAME,))
+            cursor.fetchone()
+    finally:
+        cursor.close()
+        conn.close()
+
+subscription_sweeper = PeriodicTask('subscription-sweeper', SUBSCRIPTION_SWEEP_INTERVAL, expire_subscriptions)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Expire premium subscriptions past their end date')
+    parser.add_argument('--batch-size', type=int, default=SUBSCRIPTION_SWEEP_BATCH)
+    args = parser.parse_args(argv)
+
+    expired = expire_subscriptions(args.batch_size)
+    if expired is None:
+        print("Subscription sweep already running elsewhere, skipping")
+        return 1
+    print(f"✓ {expired} subscriptions expired")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())